@@ -15,8 +15,9 @@
 # Imports
 import sys
 from types import ModuleType
-from typing import Optional
+from typing import Optional, Tuple
 import numpy as np
+from numpy.typing import NDArray
 # pylint: disable=invalid-name
 plt: Optional[ModuleType]
 try:
@@ -26,6 +27,130 @@ except ImportError:
     plt = None
 
 
+#: The most line segments drawn directly before the data is binned
+_MAX_LINE_POINTS = 100000
+
+#: The most neurons that are drawn as separate envelopes before all the
+#: values are binned into one image
+_MAX_ENVELOPES = 32
+
+
+def bin_edges(n_items: int, n_bins: int) -> NDArray[np.integer]:
+    """
+    Split a number of items into at most a number of bins of near-equal
+    size.
+
+    :param int n_items: The number of items to split
+    :param int n_bins: The most bins to split them into
+    :return: The index of the first item in each bin
+    :rtype: ~numpy.ndarray
+    """
+    n_bins = max(1, min(n_items, n_bins))
+    return (np.arange(n_bins) * n_items) // n_bins
+
+
+def bin_indices(
+        coords: NDArray, coord_range: Tuple[float, float],
+        n_bins: int) -> NDArray[np.integer]:
+    """
+    Find which of some equal-width bins coordinates are in.
+
+    :param ~numpy.ndarray coords: The coordinates to find the bins of
+    :param tuple(float,float) coord_range: The lowest and highest coordinate
+        of the bins; the highest is in the last bin
+    :param int n_bins: The number of bins
+    :return: The bin of each coordinate, or -1 if it is outside the range
+    :rtype: ~numpy.ndarray
+    """
+    low, high = coord_range
+    width = (high - low) / n_bins if high > low else 1.0
+    with np.errstate(invalid="ignore"):
+        indices = np.floor((coords - low) / width).astype(np.int64)
+    indices[coords == high] = n_bins - 1
+    indices[(indices < 0) | (indices >= n_bins) | np.isnan(coords)] = -1
+    return indices
+
+
+def bin_points(
+        xs: NDArray, ys: NDArray, x_range: Tuple[float, float],
+        y_range: Tuple[float, float], shape: Tuple[int, int],
+        values: Optional[NDArray] = None) -> NDArray:
+    """
+    Count (or sum the values of) points in each cell of a grid.
+    Points outside the ranges are left out; the top of each range is in the
+    last bin.
+
+    :param ~numpy.ndarray xs: The x coordinates of the points
+    :param ~numpy.ndarray ys: The y coordinates of the points
+    :param tuple(float,float) x_range: The lowest and highest x of the grid
+    :param tuple(float,float) y_range: The lowest and highest y of the grid
+    :param tuple(int,int) shape: The number of y bins and x bins
+    :param values: The value of each point to sum, or `None` to count
+    :type values: ~numpy.ndarray or None
+    :return: An array of the given shape, indexed by y bin then x bin
+    :rtype: ~numpy.ndarray
+    """
+    n_y, n_x = shape
+    x_bins = bin_indices(np.asarray(xs), x_range, n_x)
+    y_bins = bin_indices(np.asarray(ys), y_range, n_y)
+    inside = (x_bins >= 0) & (y_bins >= 0)
+    weights = None if values is None else np.asarray(values)[inside]
+    return np.bincount(
+        y_bins[inside] * n_x + x_bins[inside], weights=weights,
+        minlength=n_x * n_y).reshape(shape)
+
+
+def decimate(values: NDArray, shape: Tuple[int, int]) -> NDArray:
+    """
+    Reduce a 2D array to at most a given shape by taking the mean of each
+    block of values, ignoring NaN.
+
+    :param ~numpy.ndarray values: The 2D array to reduce
+    :param tuple(int,int) shape: The most rows and columns wanted
+    :rtype: ~numpy.ndarray
+    """
+    rows = bin_edges(values.shape[0], shape[0])
+    cols = bin_edges(values.shape[1], shape[1])
+    if len(rows) == values.shape[0] and len(cols) == values.shape[1]:
+        return values
+    present = ~np.isnan(values)
+    sums = np.add.reduceat(np.add.reduceat(
+        np.where(present, values, 0.0), rows, axis=0), cols, axis=1)
+    counts = np.add.reduceat(np.add.reduceat(
+        present.astype(np.int64), rows, axis=0), cols, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+
+def envelope(values: NDArray, n_bins: int) -> Tuple[
+        NDArray[np.integer], NDArray, NDArray]:
+    """
+    Reduce a signal to the lowest and highest values in each of at most a
+    number of bins along the first axis, ignoring NaN.
+
+    :param ~numpy.ndarray values: The signal, indexed by sample first
+    :param int n_bins: The most bins wanted
+    :return: The index of the first sample in each bin, and the lowest and
+        highest values in each bin
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+    """
+    starts = bin_edges(len(values), n_bins)
+    return (starts, np.fmin.reduceat(values, starts, axis=0),
+            np.fmax.reduceat(values, starts, axis=0))
+
+
+def axes_pixels(axes) -> Tuple[int, int]:
+    """
+    Get the size of an Axes in pixels.
+
+    :param ~matplotlib.axes.Axes axes: An Axes in a matplotlib figure
+    :return: The width and height
+    :rtype: tuple(int, int)
+    """
+    extent = axes.get_window_extent()
+    return max(1, int(round(extent.width))), max(1, int(round(extent.height)))
+
+
 def _precheck(data, title):
     if len(data) == 0:
         if title is None:
@@ -59,23 +184,52 @@ def line_plot(data_sets, title=None):
 
     print(f"Setting up {len(data_sets)} sets of line plots")
     (numrows, numcols) = _grid(len(data_sets))
-    for data, index in enumerate(data_sets):
-        plt.subplot(numrows, numcols, index+1)
-        for neuron in np.unique(data[:, 0]):
-            time = [i[1] for i in data if i[0] == neuron]
-            membrane_voltage = [i[2] for i in data if i[0] == neuron]
-            plt.plot(time, membrane_voltage)
-
-        min_data = min(data[:, 2])
-        max_data = max(data[:, 2])
+    for index, data in enumerate(data_sets):
+        axes = plt.subplot(numrows, numcols, index+1)
+        min_data = np.nanmin(data[:, 2])
+        max_data = np.nanmax(data[:, 2])
         adjust = (max_data - min_data) * 0.1
-        plt.axis([min(data[:, 1]), max(data[:, 1]), min_data - adjust,
-                  max_data + adjust])
+        limits = (np.min(data[:, 1]), np.max(data[:, 1]),
+                  min_data - adjust, max_data + adjust)
+        _line_plot_data(axes, data, limits)
+        plt.axis(limits)
     if title is not None:
         plt.title(title)
     plt.show()
 
 
+def _line_plot_data(axes, data: NDArray, limits: Tuple[float, ...]):
+    """
+    Plot the lines of each neuron, or if there is too much data to see,
+    the envelope of each neuron or an image of how many values are at
+    each pixel.
+
+    :param ~matplotlib.axes.Axes axes: An Axes in a matplotlib figure
+    :param ~numpy.ndarray data: Rows of neuron ID, time and value
+    :param tuple(float,float,float,float) limits: The range of the axes
+    """
+    width, height = axes_pixels(axes)
+    order = np.argsort(data[:, 0], kind="stable")
+    neurons, starts = np.unique(data[order, 0], return_index=True)
+    if len(data) > _MAX_LINE_POINTS and len(neurons) > _MAX_ENVELOPES:
+        counts = bin_points(
+            data[:, 1], data[:, 2], limits[0:2], limits[2:4],
+            (height, width))
+        axes.imshow(
+            np.ma.masked_equal(counts, 0), cmap="viridis",
+            interpolation="nearest", origin="lower", aspect="auto",
+            extent=limits)
+        return
+    for neuron_rows in np.split(order, starts[1:]):
+        time = data[neuron_rows, 1]
+        membrane_voltage = data[neuron_rows, 2]
+        if len(data) > _MAX_LINE_POINTS:
+            bins, lows, highs = envelope(membrane_voltage, width)
+            axes.fill_between(time[bins], lows, highs, step="post")
+        else:
+            axes.plot(time, membrane_voltage)
+
+
 def heat_plot(data_sets, ylabel=None, title=None):
     """
     Build a heat map plot or plots.
@@ -14,6 +14,7 @@
 
 from .ethernet_command_connection import EthernetCommandConnection
 from .ethernet_control_connection import EthernetControlConnection
+from .spike_schedule import SpikeSchedule
 from .spynnaker_live_spikes_connection import SpynnakerLiveSpikesConnection
 from .spynnaker_poisson_control_connection import (
     SpynnakerPoissonControlConnection)
@@ -22,5 +23,5 @@ from .spif_live_spikes_connection import SPIFLiveSpikesConnection
 __all__ = [
     "EthernetCommandConnection", "EthernetControlConnection",
     "SpynnakerLiveSpikesConnection", "SpynnakerPoissonControlConnection",
-    "SPIFLiveSpikesConnection"
+    "SPIFLiveSpikesConnection", "SpikeSchedule"
 ]
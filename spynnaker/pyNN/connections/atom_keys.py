@@ -0,0 +1,77 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict
+import numpy
+from numpy.typing import NDArray
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+# The key in the array of atoms which have no key
+_NO_KEY = -1
+
+# The most IDs of atoms without keys to list in an error
+_MAX_IDS_REPORTED = 10
+
+
+class AtomKeys(object):
+    """
+    The keys of the atoms of a population, as an array to look up the keys
+    of many atoms at once.
+    """
+    __slots__ = (
+        # The label of the population, for errors
+        "__label",
+        # The key of each atom ID, or _NO_KEY
+        "__keys")
+
+    def __init__(self, label: str, atom_id_to_key: Dict[int, int]):
+        """
+        :param str label: The label of the population
+        :param dict(int,int) atom_id_to_key: The key of each atom ID
+        """
+        self.__label = label
+        self.__keys = numpy.full(
+            max(atom_id_to_key.keys(), default=-1) + 1, _NO_KEY,
+            dtype=numpy.int64)
+        self.__keys[numpy.fromiter(
+            atom_id_to_key.keys(), dtype=numpy.int64,
+            count=len(atom_id_to_key))] = numpy.fromiter(
+                atom_id_to_key.values(), dtype=numpy.int64,
+                count=len(atom_id_to_key))
+
+    def keys_of(
+            self, atom_ids: NDArray[numpy.integer]) -> NDArray[numpy.uint32]:
+        """
+        Get the key of each of the given atoms.
+
+        :param ~numpy.ndarray atom_ids: The IDs of the atoms
+        :return: The key of each atom, as little-endian 32-bit values
+        :rtype: ~numpy.ndarray
+        :raises ConfigurationException:
+            If an ID is out of range or the atom has no key
+        """
+        if not len(atom_ids):
+            return numpy.zeros(0, dtype="<u4")
+        if atom_ids.min() < 0 or atom_ids.max() >= len(self.__keys):
+            raise ConfigurationException(
+                f"Neuron IDs must be in the range 0 to "
+                f"{len(self.__keys) - 1} for {self.__label}")
+        keys = self.__keys[atom_ids]
+        no_key = keys == _NO_KEY
+        if no_key.any():
+            ids = numpy.unique(atom_ids[no_key])
+            raise ConfigurationException(
+                f"Neurons {ids[:_MAX_IDS_REPORTED].tolist()} of "
+                f"{self.__label} have no keys")
+        return keys.astype("<u4")
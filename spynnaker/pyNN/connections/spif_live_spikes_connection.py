@@ -13,18 +13,23 @@
 # limitations under the License.
 
 import logging
+from queue import Queue
 import struct
 from threading import Thread
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from typing import (
+    Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple)
+import numpy
+from numpy.typing import NDArray
 from typing_extensions import TypeAlias
 from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
 from spinnman.connections import ConnectionListener
 from spinnman.connections.udp_packet_connections import UDPConnection
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.database import DatabaseConnection
 from spinn_front_end_common.utilities.database import DatabaseReader
 
-_EventCB: TypeAlias = Callable[[str, List[int]], None]
+_EventCB: TypeAlias = Callable[[str, Sequence[int]], None]
 _InitCB: TypeAlias = Callable[[str, int, float, float], None]
 _StartStopCB: TypeAlias = Callable[[str, 'SPIFLiveSpikesConnection'], None]
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -38,6 +43,9 @@ _ONE_INT = struct.Struct("<I")
 # The port that SPIF listens on by default
 _DEFAULT_SPIF_PORT = 3332
 
+# The key format of SPIF packets, for numpy
+_KEY_DTYPE = numpy.dtype("<u4")
+
 # The maximum number of events in each packet by default
 _EVENTS_PER_PACKET = 32
 
@@ -63,9 +71,12 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
     """
     # TODO: define SPIF
     __slots__ = (
+        "__callback_queue",
+        "__callback_thread",
         "__error_keys",
         "__init_callbacks",
         "__key_to_atom_id_and_label",
+        "__key_table",
         "__live_event_callbacks",
         "__pause_stop_callbacks",
         "__receive_labels",
@@ -75,14 +86,17 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         "__spif_host",
         "__spif_port",
         "__spif_packet_size",
-        "__spif_packet_time_us")
+        "__spif_packet_time_us",
+        "__use_numpy")
 
     def __init__(self, receive_labels: Optional[Iterable[str]],
                  spif_host: str, spif_port: int = _DEFAULT_SPIF_PORT,
                  events_per_packet: int = _EVENTS_PER_PACKET,
                  time_per_packet: int = _US_PER_PACKET,
                  local_host: Optional[str] = None,
-                 local_port: Optional[int] = None):
+                 local_port: Optional[int] = None,
+                 use_numpy: bool = False,
+                 use_callback_thread: bool = False):
         """
         :param iterable(str) receive_labels:
             Labels of vertices from which live events will be received.
@@ -103,6 +117,15 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
             Optional specification of the local port to listen on. Must match
             the port that the toolchain will send the notification on (19999
             by default)
+        :param bool use_numpy:
+            If True, keys are decoded and translated to atoms with numpy,
+            and the receive callbacks are given a numpy array of atom IDs
+            (or keys) rather than a list.  This is much faster at high event
+            rates.
+        :param bool use_callback_thread:
+            If True, the receive callbacks are called on a separate worker
+            thread, so that receiving packets is never blocked by a slow
+            callback
         """
         # pylint: disable=too-many-arguments
         super().__init__(
@@ -132,6 +155,20 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         self.__receiver_listener: Optional[ConnectionListener[bytes]] = None
         self.__receiver_connection: Optional[UDPConnection] = None
         self.__error_keys: Set[int] = set()
+        self.__use_numpy = use_numpy
+        # Sorted keys, with the atom ID and label index of each
+        self.__key_table: Optional[Tuple[
+            NDArray[numpy.uint32], NDArray[numpy.uint32],
+            NDArray[numpy.uint32]]] = None
+        self.__callback_queue: Optional[Queue] = None
+        self.__callback_thread: Optional[Thread] = None
+        if use_callback_thread:
+            self.__callback_queue = Queue()
+            self.__callback_thread = Thread(
+                target=self.__run_callbacks, daemon=True, name=(
+                    "receive callback thread for SPIF live spikes "
+                    f"connection {spif_host}:{spif_port}"))
+            self.__callback_thread.start()
 
     def add_receive_label(self, label: str):
         """
@@ -248,6 +285,8 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
             for key, atom_id in key_to_atom_id.items():
                 self.__key_to_atom_id_and_label[key] = (atom_id, label_id)
             vertex_sizes[label] = len(key_to_atom_id)
+        if self.__use_numpy:
+            self.__build_key_table()
 
         # Last of all, set up the listener for packets
         # NOTE: Has to be done last as otherwise will receive SCP messages
@@ -258,6 +297,19 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
             self.__receiver_listener.add_callback(self.__do_receive_packet)
             self.__receiver_listener.start()
 
+    def __build_key_table(self) -> None:
+        n_keys = len(self.__key_to_atom_id_and_label)
+        keys = numpy.fromiter(
+            self.__key_to_atom_id_and_label.keys(), dtype=numpy.uint32,
+            count=n_keys)
+        atoms_and_labels = numpy.array(
+            list(self.__key_to_atom_id_and_label.values()),
+            dtype=numpy.uint32).reshape(n_keys, 2)
+        order = numpy.argsort(keys)
+        self.__key_table = (
+            keys[order], atoms_and_labels[order, 0],
+            atoms_and_labels[order, 1])
+
     def __handle_possible_rerun_state(self) -> None:
         # reset from possible previous calls
         if self.__receiver_listener is not None:
@@ -303,6 +355,9 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
             logger.warning("problem handling received packet", exc_info=True)
 
     def __handle_packet(self, packet: bytes):
+        if self.__use_numpy:
+            self.__handle_packet_numpy(packet)
+            return
         key_labels: Dict[int, List[int]] = dict()
         atoms_labels: Dict[int, List[int]] = dict()
         n_events = len(packet) // BYTES_PER_WORD
@@ -319,14 +374,83 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
                 self.__handle_unknown_key(key)
 
         for label_id in key_labels:
-            label = self.__receive_labels[label_id]
-            for c_back, use_atom in self.__live_event_callbacks[label_id]:
-                if use_atom:
-                    c_back(label, atoms_labels[label_id])
-                else:
-                    c_back(label, key_labels[label_id])
+            self.__call_callbacks(
+                label_id, key_labels[label_id], atoms_labels[label_id])
+
+    def __handle_packet_numpy(self, packet: bytes):
+        if self.__key_table is None:
+            return
+        table_keys, table_atoms, table_labels = self.__key_table
+        keys = numpy.frombuffer(
+            packet, dtype=_KEY_DTYPE, count=len(packet) // BYTES_PER_WORD)
+        if not len(keys):
+            return
+        if not len(table_keys):
+            # No keys are known, so the packet can only be dropped
+            for key in numpy.unique(keys):
+                self.__handle_unknown_key(int(key))
+            return
+
+        # Find each key in the table, noting those that aren't there
+        index = numpy.searchsorted(table_keys, keys)
+        numpy.minimum(index, len(table_keys) - 1, out=index)
+        found = table_keys[index] == keys
+        if not found.all():
+            for key in numpy.unique(keys[~found]):
+                self.__handle_unknown_key(int(key))
+            keys = keys[found]
+            index = index[found]
+
+        labels = table_labels[index]
+        atoms = table_atoms[index]
+        label_ids = numpy.unique(labels)
+        if len(label_ids) == 1:
+            # All from one label, which is the common case
+            self.__call_callbacks(int(label_ids[0]), keys, atoms)
+            return
+        for label_id in label_ids:
+            in_label = labels == label_id
+            self.__call_callbacks(
+                int(label_id), keys[in_label], atoms[in_label])
+
+    def __call_callbacks(
+            self, label_id: int, keys: Sequence[int], atoms: Sequence[int]):
+        if self.__callback_queue is not None:
+            self.__callback_queue.put((label_id, keys, atoms))
+        else:
+            self.__do_call_callbacks(label_id, keys, atoms)
+
+    def __do_call_callbacks(
+            self, label_id: int, keys: Sequence[int], atoms: Sequence[int]):
+        label = self.__receive_labels[label_id]
+        for c_back, use_atom in self.__live_event_callbacks[label_id]:
+            if use_atom:
+                c_back(label, atoms)
+            else:
+                c_back(label, keys)
+
+    def __run_callbacks(self) -> None:
+        # pylint: disable=broad-except
+        assert self.__callback_queue is not None
+        while True:
+            item = self.__callback_queue.get()
+            if item is None:
+                return
+            try:
+                self.__do_call_callbacks(*item)
+            except Exception:
+                logger.warning("problem in receive callback", exc_info=True)
 
     def __handle_unknown_key(self, key: int):
         if key not in self.__error_keys:
             self.__error_keys.add(key)
             logger.warning("Received unexpected key {}", key)
+
+    @overrides(DatabaseConnection.close)
+    def close(self) -> None:
+        if self.__callback_thread is not None:
+            assert self.__callback_queue is not None
+            self.__callback_queue.put(None)
+            self.__callback_thread.join()
+            self.__callback_thread = None
+        super().close()
@@ -0,0 +1,243 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Condition
+from typing import List, Optional, Tuple
+import numpy
+from numpy.typing import NDArray
+
+
+class SpikeSchedule(object):
+    """
+    Spikes scheduled to be sent live by a
+    :py:class:`SpynnakerLiveSpikesConnection`, and a report of how they were
+    sent.  A batch is all the spikes of one timestep.
+    """
+    __slots__ = (
+        # The label of the population the spikes are sent to
+        "__label",
+        # The time of each spike in ms after the simulation starts
+        "__times",
+        # The ID of the neuron of each spike
+        "__neuron_ids",
+        # Whether to send 32-bit keys rather than 16-bit neuron IDs
+        "__send_full_keys",
+        # How late in ms a batch can be before it is dropped, or None
+        "__max_late_ms",
+        # The number of batches sent
+        "__n_sent",
+        # The time and lateness in ms of each batch sent late
+        "__late",
+        # The time in ms of each batch not sent
+        "__dropped",
+        # Whether the schedule has been finished or cancelled
+        "__finished",
+        "__cancelled",
+        # Guards the report and lets wait() be told of the finish
+        "__condition")
+
+    def __init__(
+            self, label: str, times: NDArray[numpy.floating],
+            neuron_ids: NDArray[numpy.integer], send_full_keys: bool,
+            max_late_ms: Optional[float]):
+        """
+        :param str label: The label of the population to send to
+        :param ~numpy.ndarray times: The time of each spike in ms
+        :param ~numpy.ndarray neuron_ids: The neuron ID of each spike
+        :param bool send_full_keys:
+            Whether to send 32-bit keys rather than 16-bit neuron IDs
+        :param max_late_ms:
+            How late in ms a batch can be before it is dropped, or `None` to
+            send batches however late they are
+        :type max_late_ms: float or None
+        """
+        # pylint: disable=too-many-arguments
+        self.__label = label
+        self.__times = times
+        self.__neuron_ids = neuron_ids
+        self.__send_full_keys = send_full_keys
+        self.__max_late_ms = max_late_ms
+        self.__n_sent = 0
+        self.__late: List[Tuple[float, float]] = list()
+        self.__dropped: List[float] = list()
+        self.__finished = False
+        self.__cancelled = False
+        self.__condition = Condition()
+
+    @property
+    def label(self) -> str:
+        """
+        The label of the population the spikes are sent to.
+
+        :rtype: str
+        """
+        return self.__label
+
+    @property
+    def times(self) -> NDArray[numpy.floating]:
+        """
+        The time of each spike in ms after the simulation starts.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times
+
+    @property
+    def neuron_ids(self) -> NDArray[numpy.integer]:
+        """
+        The ID of the neuron of each spike.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__neuron_ids
+
+    @property
+    def n_spikes(self) -> int:
+        """
+        The number of spikes scheduled.
+
+        :rtype: int
+        """
+        return len(self.__times)
+
+    @property
+    def send_full_keys(self) -> bool:
+        """
+        Whether 32-bit keys are sent rather than 16-bit neuron IDs.
+
+        :rtype: bool
+        """
+        return self.__send_full_keys
+
+    @property
+    def max_late_ms(self) -> Optional[float]:
+        """
+        How late in ms a batch can be before it is dropped, or `None` if
+        batches are sent however late they are.
+
+        :rtype: float or None
+        """
+        return self.__max_late_ms
+
+    @property
+    def n_sent(self) -> int:
+        """
+        The number of batches sent so far, including those sent late.
+
+        :rtype: int
+        """
+        with self.__condition:
+            return self.__n_sent
+
+    @property
+    def late_batches(self) -> List[Tuple[float, float]]:
+        """
+        The time of each batch that was sent after the end of its timestep,
+        and how many ms after the start of its timestep it was sent.
+
+        :rtype: list(tuple(float, float))
+        """
+        with self.__condition:
+            return list(self.__late)
+
+    @property
+    def dropped_batches(self) -> List[float]:
+        """
+        The time of each batch that was not sent, because it was too late,
+        the simulation stopped first or the schedule was cancelled.
+
+        :rtype: list(float)
+        """
+        with self.__condition:
+            return list(self.__dropped)
+
+    @property
+    def is_finished(self) -> bool:
+        """
+        Whether every batch has been sent or dropped.
+
+        :rtype: bool
+        """
+        with self.__condition:
+            return self.__finished
+
+    @property
+    def is_cancelled(self) -> bool:
+        """
+        Whether the schedule has been cancelled.
+
+        :rtype: bool
+        """
+        with self.__condition:
+            return self.__cancelled
+
+    def cancel(self) -> None:
+        """
+        Stop sending the spikes; any batches not yet sent are dropped.
+        """
+        with self.__condition:
+            self.__cancelled = True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every batch to be sent or dropped.
+
+        :param timeout: The most seconds to wait, or `None` to wait forever
+        :type timeout: float or None
+        :return: Whether the schedule finished
+        :rtype: bool
+        """
+        with self.__condition:
+            return self.__condition.wait_for(
+                lambda: self.__finished, timeout)
+
+    def _sent(self, time_ms: float, late_ms: Optional[float]) -> None:
+        """
+        Record that a batch was sent.
+
+        :param float time_ms: The time of the batch
+        :param late_ms: How late the batch was, if after its timestep
+        :type late_ms: float or None
+        """
+        with self.__condition:
+            self.__n_sent += 1
+            if late_ms is not None:
+                self.__late.append((time_ms, late_ms))
+
+    def _dropped(self, time_ms: float) -> None:
+        """
+        Record that a batch was not sent.
+
+        :param float time_ms: The time of the batch
+        """
+        with self.__condition:
+            self.__dropped.append(time_ms)
+
+    def _finish(self) -> None:
+        """
+        Record that every batch has been sent or dropped.
+        """
+        with self.__condition:
+            self.__finished = True
+            self.__condition.notify_all()
+
+    def __str__(self) -> str:
+        with self.__condition:
+            return (
+                f"SpikeSchedule({self.__label}: {self.n_spikes} spikes, "
+                f"{self.__n_sent} batches sent, {len(self.__late)} late, "
+                f"{len(self.__dropped)} dropped)")
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -12,14 +12,57 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Iterable, List, Optional
+import heapq
+import logging
+from threading import Event, Lock
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy
+from numpy.typing import ArrayLike, NDArray
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
+from spinnman.messages.eieio import AbstractEIEIOMessage, EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
+from spinn_front_end_common.utilities.database import DatabaseReader
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from .atom_keys import AtomKeys
+from .spike_schedule import SpikeSchedule
+
+logger = FormatAdapter(logging.getLogger(__name__))
 
 # The maximum number of 32-bit keys that will fit in a packet
 _MAX_FULL_KEYS_PER_PACKET = 63
 # The maximum number of 16-bit keys that will fit in a packet
 _MAX_HALF_KEYS_PER_PACKET = 127
+# The largest neuron ID that can be sent without using the full key
+_MAX_HALF_KEY = 0xFFFF
+
+
+class _KeyArrayMessage(AbstractEIEIOMessage):
+    """
+    An EIEIO key message made directly from an array of keys.
+    """
+    __slots__ = ("__header", "__elements")
+
+    def __init__(self, eieio_type: EIEIOType, keys: NDArray):
+        self.__header = EIEIODataHeader(eieio_type, count=len(keys))
+        self.__elements = keys.tobytes()
+
+    @property
+    @overrides(AbstractEIEIOMessage.eieio_header)
+    def eieio_header(self) -> EIEIODataHeader:
+        return self.__header
+
+    @property
+    @overrides(AbstractEIEIOMessage.bytestring)
+    def bytestring(self) -> bytes:
+        return self.__header.bytestring + self.__elements
+
+
+# The packets of each timestep that has spikes in a schedule
+_Batches = List[Tuple[int, List[_KeyArrayMessage]]]
 
 
 class SpynnakerLiveSpikesConnection(LiveEventConnection):
@@ -27,7 +70,19 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
     A connection for receiving and sending live spikes from and to
     SpiNNaker.
     """
-    __slots__ = ()
+    __slots__ = (
+        # Schedules waiting for the next start or resume, by label
+        "__schedules",
+        # The batches of each waiting schedule, once the database is read
+        "__batches",
+        # The simulation timestep in ms, once the database is read
+        "__timestep_ms",
+        # The wall-clock seconds taken by each timestep
+        "__timestep_wall_s",
+        # Set to stop sending scheduled spikes, by label
+        "__stop_sending",
+        # Guards the schedules and the timing
+        "__schedule_lock")
 
     def __init__(self, receive_labels: Optional[Iterable[str]] = None,
                  send_labels: Optional[Iterable[str]] = None,
@@ -48,9 +103,32 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             by default)
         """
         # pylint: disable=too-many-arguments
+        self.__schedules: Dict[str, List[SpikeSchedule]] = dict()
+        self.__batches: Dict[SpikeSchedule, _Batches] = dict()
+        self.__timestep_ms: Optional[float] = None
+        self.__timestep_wall_s = 0.0
+        self.__stop_sending: Dict[str, Event] = dict()
+        self.__schedule_lock = Lock()
         super().__init__(
             live_packet_gather_label, receive_labels, send_labels,
             local_host, local_port)
+        # Added after the callback of the superclass, so the keys are read
+        self.add_database_callback(self.__read_database_callback)
+        if send_labels is not None:
+            for label in send_labels:
+                self.__add_schedule_callbacks(label)
+
+    @overrides(LiveEventConnection.add_send_label)
+    def add_send_label(self, label: str):
+        super().add_send_label(label)
+        self.__add_schedule_callbacks(label)
+
+    def __add_schedule_callbacks(self, label: str):
+        if label in self.__stop_sending:
+            return
+        self.__stop_sending[label] = Event()
+        self.add_start_resume_callback(label, self.__send_schedules)
+        self.add_pause_stop_callback(label, self.__stop_schedules)
 
     def send_spike(
             self, label: str, neuron_id: int, send_full_keys: bool = False):
@@ -80,3 +158,166 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             whether to send 16-bit neuron IDs directly
         """
         self.send_events(label, neuron_ids, send_full_keys)
+
+    def schedule_spikes(
+            self, label: str, spikes: ArrayLike,
+            send_full_keys: bool = False,
+            max_late_ms: Optional[float] = None) -> SpikeSchedule:
+        """
+        Schedule spikes to be sent when the simulation next starts or
+        resumes.  The spikes of each timestep are packed into as few packets
+        as possible before the simulation starts, and each timestep's
+        packets are sent by a thread of their own at the start of that
+        timestep in wall-clock time, taking account of the time scale
+        factor.  For example::
+
+            schedule = connection.schedule_spikes(
+                "input", numpy.column_stack((times, neuron_ids)))
+            sim.run(1000)
+            print(schedule.late_batches, schedule.dropped_batches)
+
+        :param str label:
+            The label of the population from which the spikes will originate
+        :param ~numpy.ndarray spikes: An array with a row of (time in ms
+            after the simulation starts or resumes, neuron ID) for each spike
+        :param bool send_full_keys: Determines whether to send full 32-bit
+            keys, getting the key for each neuron from the database, or
+            whether to send 16-bit neuron IDs directly
+        :param max_late_ms: How many ms of wall-clock time after the start
+            of its timestep a batch may be sent before it is dropped instead,
+            or `None` to send batches however late they are
+        :type max_late_ms: float or None
+        :return: The schedule, which reports the batches sent late or
+            dropped, and can be waited for or cancelled
+        :rtype: SpikeSchedule
+        """
+        if label not in self.__stop_sending:
+            raise ConfigurationException(
+                f"{label} is not a label spikes are sent to")
+        time_ids = numpy.asarray(spikes, dtype=numpy.float64).reshape(-1, 2)
+        times = time_ids[:, 0]
+        neuron_ids = time_ids[:, 1].astype(numpy.int64)
+        if len(times) and (times.min() < 0 or neuron_ids.min() < 0):
+            raise ConfigurationException(
+                "Spike times and neuron IDs must not be negative")
+        if (not send_full_keys and len(neuron_ids) and
+                neuron_ids.max() > _MAX_HALF_KEY):
+            raise ConfigurationException(
+                f"Neuron IDs over {_MAX_HALF_KEY} need send_full_keys")
+        schedule = SpikeSchedule(
+            label, times, neuron_ids, send_full_keys, max_late_ms)
+        with self.__schedule_lock:
+            if self.__timestep_ms is not None:
+                self.__batches[schedule] = self.__pack(schedule)
+            self.__schedules.setdefault(label, list()).append(schedule)
+        return schedule
+
+    def __pack(self, schedule: SpikeSchedule) -> _Batches:
+        """
+        Sort the spikes of a schedule by timestep and pack each timestep
+        into packets.
+        """
+        assert self.__timestep_ms is not None
+        neuron_ids = schedule.neuron_ids
+        if schedule.send_full_keys:
+            atom_keys = AtomKeys(
+                schedule.label, self._atom_id_to_key[schedule.label])
+            keys: NDArray = atom_keys.keys_of(neuron_ids)
+            eieio_type = EIEIOType.KEY_32_BIT
+            max_keys = _MAX_FULL_KEYS_PER_PACKET
+        else:
+            keys = neuron_ids.astype("<u2")
+            eieio_type = EIEIOType.KEY_16_BIT
+            max_keys = _MAX_HALF_KEYS_PER_PACKET
+
+        steps = numpy.floor(
+            schedule.times / self.__timestep_ms).astype(numpy.int64)
+        order = numpy.argsort(steps, kind="stable")
+        steps = steps[order]
+        keys = keys[order]
+        unique_steps, starts = numpy.unique(steps, return_index=True)
+        ends = numpy.append(starts[1:], len(steps))
+        return [
+            (step, [_KeyArrayMessage(eieio_type, keys[pos:min(
+                pos + max_keys, end)]) for pos in range(start, end, max_keys)])
+            for step, start, end in zip(
+                unique_steps.tolist(), starts.tolist(), ends.tolist())]
+
+    def __read_database_callback(self, db_reader: DatabaseReader):
+        """
+        :param DatabaseReader db_reader:
+        """
+        machine_time_step = db_reader.get_configuration_parameter_value(
+            "machine_time_step")
+        time_scale_factor = db_reader.get_configuration_parameter_value(
+            "time_scale_factor")
+        assert machine_time_step is not None
+        assert time_scale_factor is not None
+        # pylint: disable=protected-access
+        with self.__schedule_lock:
+            self.__timestep_ms = machine_time_step / 1000.0
+            self.__timestep_wall_s = (
+                machine_time_step * time_scale_factor / 1000000.0)
+            # The keys might have changed, so pack everything again
+            self.__batches.clear()
+            for schedules in self.__schedules.values():
+                for schedule in list(schedules):
+                    try:
+                        self.__batches[schedule] = self.__pack(schedule)
+                    except ConfigurationException:
+                        logger.exception("Cannot send {}", schedule)
+                        schedules.remove(schedule)
+                        for time_ms in numpy.unique(schedule.times):
+                            schedule._dropped(float(time_ms))
+                        schedule._finish()
+
+    def __send_schedules(self, label: str, _connection: LiveEventConnection):
+        """
+        Send the batches of the schedules of a label at the start of each
+        of their timesteps, in the thread of the start or resume callback.
+        """
+        # pylint: disable=protected-access
+        start = perf_counter()
+        stop = self.__stop_sending[label]
+        stop.clear()
+        with self.__schedule_lock:
+            schedules = self.__schedules.pop(label, [])
+            batches = [
+                [(step, packets, schedule) for step, packets in
+                 self.__batches.pop(schedule, [])]
+                for schedule in schedules]
+            timestep_ms = self.__timestep_ms or 0.0
+            timestep_wall_s = self.__timestep_wall_s
+
+        for step, packets, schedule in heapq.merge(
+                *batches, key=lambda batch: batch[0]):
+            time_ms = step * timestep_ms
+            due = start + step * timestep_wall_s
+            if schedule.is_cancelled or stop.wait(
+                    max(0.0, due - perf_counter())):
+                schedule._dropped(time_ms)
+                continue
+            late_ms = (perf_counter() - due) * 1000.0
+            if schedule.max_late_ms is not None and (
+                    late_ms > schedule.max_late_ms):
+                schedule._dropped(time_ms)
+                continue
+            for packet in packets:
+                self.send_eieio_message(packet, label)
+            late_ms = (perf_counter() - due) * 1000.0
+            schedule._sent(time_ms, (
+                late_ms if late_ms > timestep_wall_s * 1000.0 else None))
+
+        for schedule in schedules:
+            schedule._finish()
+            if schedule.late_batches or schedule.dropped_batches:
+                logger.warning("{}", schedule)
+
+    def __stop_schedules(self, label: str, _connection: LiveEventConnection):
+        self.__stop_sending[label].set()
+
+    @overrides(LiveEventConnection.close)
+    def close(self) -> None:
+        for stop in self.__stop_sending.values():
+            stop.set()
+        super().close()
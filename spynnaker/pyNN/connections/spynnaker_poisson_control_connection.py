@@ -12,9 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from contextlib import contextmanager
 import functools
-from typing import Dict, Iterable, Optional, Tuple
+from time import sleep
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from spinn_utilities.overrides import overrides
+from spinnman.messages.eieio import AbstractEIEIOMessage, EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
 from spinn_front_end_common.interface.ds import DataType
 from spinn_front_end_common.utilities.connections.live_event_connection \
     import (
@@ -22,6 +28,39 @@ from spinn_front_end_common.utilities.connections.live_event_connection \
         _RcvTimeCallback)
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
+from .atom_keys import AtomKeys
+
+# The maximum number of key-payload pairs that fit in one packet
+_MAX_KEYS_PAYLOADS_PER_PACKET = 31
+
+# The number of packets to send before pausing, to avoid flooding the board
+_MAX_SEND_BEFORE_PAUSE = 6
+
+# A key and payload as sent in a packet
+_KEY_PAYLOAD_DTYPE = numpy.dtype([("key", "<u4"), ("payload", "<u4")])
+
+
+class _KeyPayloadArrayMessage(AbstractEIEIOMessage):
+    """
+    An EIEIO 32-bit key and payload message made directly from an array of
+    key-payload pairs.
+    """
+    __slots__ = ("__header", "__elements")
+
+    def __init__(self, keys_and_payloads: NDArray):
+        self.__header = EIEIODataHeader(
+            EIEIOType.KEY_PAYLOAD_32_BIT, count=len(keys_and_payloads))
+        self.__elements = keys_and_payloads.tobytes()
+
+    @property
+    @overrides(AbstractEIEIOMessage.eieio_header)
+    def eieio_header(self) -> EIEIODataHeader:
+        return self.__header
+
+    @property
+    @overrides(AbstractEIEIOMessage.bytestring)
+    def bytestring(self) -> bytes:
+        return self.__header.bytestring + self.__elements
 
 
 class SpynnakerPoissonControlConnection(LiveEventConnection):
@@ -30,9 +69,11 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
     firing rate at runtime.
     """
     __slots__ = (
+        "__atom_keys",
         "__control_label_extension",
         "__control_label_to_label",
-        "__label_to_control_label")
+        "__label_to_control_label",
+        "__pending_rates")
 
     def __init__(
             self, poisson_labels: Optional[Iterable[str]] = None,
@@ -52,6 +93,13 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
             The extra name added to the label of each Poisson source
         """
         self.__control_label_extension = control_label_extension
+        # The key of each atom by control label, and the dictionary it was
+        # made from
+        self.__atom_keys: Dict[
+            str, Tuple[Dict[int, int], AtomKeys]] = dict()
+        # Rates waiting to be sent at the end of a batch, by control label
+        self.__pending_rates: Optional[Dict[str, List[Tuple[
+            NDArray[numpy.integer], NDArray[numpy.floating]]]]] = None
 
         control_labels: Optional[Iterable[str]] = None
         self.__control_label_to_label: Dict[str, str] = dict()
@@ -155,16 +203,110 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
         self.set_rates(label, [(neuron_id, rate)])
 
     def set_rates(
-            self, label: str, neuron_id_rates: Iterable[Tuple[int, float]]):
+            self, label: str,
+            neuron_id_rates: Union[Iterable[Tuple[int, float]], NDArray]):
         """
         Set the rates of multiple Poisson neurons within a Poisson source.
 
         :param str label: The label of the Population to set the rates of
-        :param list(tuple(int,float)) neuron_id_rates:
-            A list of tuples of (neuron ID, rate) to be set
+        :param neuron_id_rates:
+            A list of tuples of (neuron ID, rate) to be set, or an array
+            with a row of (neuron ID, rate) for each neuron
+        :type neuron_id_rates: list(tuple(int,float)) or ~numpy.ndarray
+        """
+        id_rates = numpy.array(
+            neuron_id_rates if isinstance(neuron_id_rates, numpy.ndarray)
+            else list(neuron_id_rates), dtype=numpy.float64).reshape(-1, 2)
+        self.set_rates_array(
+            label, id_rates[:, 0].astype(numpy.int64), id_rates[:, 1])
+
+    def set_rates_array(
+            self, label: str, neuron_ids: ArrayLike, rates: ArrayLike):
         """
+        Set the rates of multiple Poisson neurons within a Poisson source
+        from arrays of neuron IDs and rates.  If a neuron ID appears more
+        than once, only the last rate given for it is sent.
+
+        :param str label: The label of the Population to set the rates of
+        :param ~numpy.ndarray neuron_ids: The IDs of the neurons to set
+        :param ~numpy.ndarray rates: The rate of each neuron in Hz
+        """
+        ids = numpy.asarray(neuron_ids, dtype=numpy.int64).reshape(-1)
+        rates_a = numpy.asarray(rates, dtype=numpy.float64).reshape(-1)
+        if len(ids) != len(rates_a):
+            raise ConfigurationException(
+                f"{len(ids)} neuron IDs given with {len(rates_a)} rates")
         control = self.__control_label(label)
-        datatype = DataType.S1615
-        atom_ids_and_payloads = [(nid, datatype.encode_as_int(rate))
-                                 for nid, rate in neuron_id_rates]
-        self.send_events_with_payloads(control, atom_ids_and_payloads)
+        if self.__pending_rates is not None:
+            self.__pending_rates.setdefault(control, list()).append(
+                (ids, rates_a))
+            return
+        self.__send_rates(control, ids, rates_a)
+
+    @contextmanager
+    def batched_rates(self) -> Iterator[None]:
+        """
+        Collect all the rates set within a ``with`` block and send them
+        when the block ends, with only the last rate set for each neuron
+        being sent.  For example::
+
+            with connection.batched_rates():
+                for neuron_id, rate in updates:
+                    connection.set_rate("poisson", neuron_id, rate)
+        """
+        if self.__pending_rates is not None:
+            # Already batching; the outer batch will send
+            yield
+            return
+        self.__pending_rates = dict()
+        try:
+            yield
+        finally:
+            pending, self.__pending_rates = self.__pending_rates, None
+            for control, updates in pending.items():
+                self.__send_rates(
+                    control, numpy.concatenate([u[0] for u in updates]),
+                    numpy.concatenate([u[1] for u in updates]))
+
+    def __keys_of_atoms(self, control: str) -> AtomKeys:
+        # The atom to key dictionary is replaced when the database is read,
+        # so rebuild the array when that happens
+        atom_to_key = self._atom_id_to_key[control]
+        cached = self.__atom_keys.get(control)
+        if cached is None or cached[0] is not atom_to_key:
+            cached = (atom_to_key, AtomKeys(
+                self.__label(control), atom_to_key))
+            self.__atom_keys[control] = cached
+        return cached[1]
+
+    def __send_rates(
+            self, control: str, neuron_ids: NDArray[numpy.integer],
+            rates: NDArray[numpy.floating]):
+        if not len(neuron_ids):
+            return
+        # Only the last update of each neuron matters; unique on the
+        # reversed IDs finds the last occurrence of each
+        _, last = numpy.unique(neuron_ids[::-1], return_index=True)
+        if len(last) < len(neuron_ids):
+            keep = numpy.sort(len(neuron_ids) - 1 - last)
+            neuron_ids = neuron_ids[keep]
+            rates = rates[keep]
+
+        keys_and_payloads = numpy.empty(
+            len(neuron_ids), dtype=_KEY_PAYLOAD_DTYPE)
+        keys_and_payloads["key"] = self.__keys_of_atoms(control).keys_of(
+            neuron_ids)
+        keys_and_payloads["payload"] = \
+            DataType.S1615.encode_as_numpy_int_array(rates)
+
+        packets_sent = 0
+        for start in range(
+                0, len(keys_and_payloads), _MAX_KEYS_PAYLOADS_PER_PACKET):
+            self.send_eieio_message(_KeyPayloadArrayMessage(
+                keys_and_payloads[
+                    start:start + _MAX_KEYS_PAYLOADS_PER_PACKET]), control)
+            packets_sent += 1
+            if (packets_sent % _MAX_SEND_BEFORE_PAUSE == 0 and
+                    start + _MAX_KEYS_PAYLOADS_PER_PACKET <
+                    len(keys_and_payloads)):
+                sleep(0.1)
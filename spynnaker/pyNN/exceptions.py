@@ -39,6 +39,13 @@ class SynapticConfigurationException(ConfigurationException):
     """
 
 
+class RemapRequiredException(SynapticConfigurationException):
+    """
+    Raised when changed synapses no longer fit in the space given to them
+    when the network was mapped, so it has to be mapped again.
+    """
+
+
 class SynapticBlockGenerationException(ConfigurationException):
     """
     Raised when the synaptic manager fails to generate a synaptic block.
@@ -13,21 +13,11 @@
 # limitations under the License.
 
 from threading import RLock
-import numpy
 from spinnman.connections import ConnectionListener
-from spinn_front_end_common.utilities.constants import BYTES_PER_SHORT
 from spynnaker.pyNN.connections import SpynnakerLiveSpikesConnection
 from spynnaker.pyNN.external_devices_models.push_bot.parameters import (
     PushBotRetinaResolution)
-
-# Each value is a 16-bit 1yyyyyyy.pxxxxxxx
-_RETINA_PACKET_SIZE = BYTES_PER_SHORT
-_MIN_PIXEL_VALUE = 32768
-_BITS_PER_PIXEL = 7
-_Y_SHIFT = 0
-_X_SHIFT = 8
-_P_SHIFT = 7
-_P_MASK = 0x1
+from .push_bot_retina_decoder import PushBotRetinaDecoder
 
 
 class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
@@ -39,18 +29,10 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
         This assumes a packet format of 16-bits per retina event.
     """
     __slots__ = (
+        "__decoder",
         "__lock",
-        "__p_shift",
-        "__pixel_shift",
         "__pushbot_listener",
         "__retina_injector_label",
-        "__x_shift",
-        "__y_shift",
-        "__orig_x_shift",
-        "__orig_y_shift",
-        "__x_mask",
-        "__y_mask",
-        "__next_data",
         "__ready")
 
     def __init__(
@@ -73,22 +55,12 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
         self.__retina_injector_label = retina_injector_label
         self.__pushbot_listener = ConnectionListener(
             pushbot_wifi_connection, n_processes=1)
-
-        add_shift = _BITS_PER_PIXEL - resolution.value.bits_per_coordinate
-        mask = (2 ** resolution.value.bits_per_coordinate) - 1
-        self.__y_shift = resolution.value.bits_per_coordinate
-        self.__orig_x_shift = add_shift + _X_SHIFT
-        self.__x_mask = mask
-        self.__x_shift = 0
-        self.__orig_y_shift = add_shift + _Y_SHIFT
-        self.__y_mask = mask
-        self.__p_shift = resolution.value.bits_per_coordinate * 2
+        self.__decoder = PushBotRetinaDecoder(resolution)
 
         self.__pushbot_listener.add_callback(self._receive_retina_data)
         self.__pushbot_listener.start()
         self.__lock = RLock()
 
-        self.__next_data = None
         self.__ready = False
 
         self.add_start_resume_callback(
@@ -99,6 +71,7 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
     # pylint: disable=unused-argument
     def __push_bot_start(self, label, connection):
         with self.__lock:
+            self.__decoder.reset()
             self.__ready = True
 
     # pylint: disable=unused-argument
@@ -117,29 +90,6 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
             if not self.__ready:
                 return
 
-            if self.__next_data is not None:
-                data = data + self.__next_data
-                self.__next_data = None
-
-            # Go through the data and find pairs where the first of the pair
-            # has a 1 in the most significant bit
-            data_all = b''
-            # pylint: disable=consider-using-enumerate
-            for i in range(len(data)):
-                if data[i] > 128:
-                    if i + 1 < len(data):
-                        data_all += data[i:i+2]
-                        i += 1
-                    else:
-                        self.__next_data = data[i:i+1]
-
-            # Filter out the usable data
-            data_filtered = numpy.fromstring(data_all, dtype=numpy.uint16)
-            y_values = (data_filtered >> self.__orig_y_shift) & self.__y_mask
-            x_values = (data_filtered >> self.__orig_x_shift) & self.__x_mask
-            polarity = (data_filtered >> _P_SHIFT) & _P_MASK
-            neuron_ids = (
-                (x_values << self.__x_shift) |
-                (y_values << self.__y_shift) |
-                (polarity << self.__p_shift))
-            self.send_spikes(self.__retina_injector_label, neuron_ids)
+            neuron_ids = self.__decoder.decode(data)
+            if len(neuron_ids):
+                self.send_spikes(self.__retina_injector_label, neuron_ids)
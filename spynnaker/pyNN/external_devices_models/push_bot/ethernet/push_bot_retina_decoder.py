@@ -0,0 +1,147 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Iterable, Optional, Union
+import numpy
+from numpy.typing import NDArray
+from spynnaker.pyNN.external_devices_models.push_bot.parameters import (
+    PushBotRetinaResolution)
+
+# Each value is a 16-bit 1yyyyyyy.pxxxxxxx
+_EVENT_START_BIT = 0x80
+_BITS_PER_PIXEL = 7
+_Y_SHIFT = 0
+_X_SHIFT = 8
+_P_SHIFT = 7
+_P_MASK = 0x1
+
+_Buffer = Union[bytes, bytearray, memoryview]
+
+
+class PushBotRetinaDecoder(object):
+    """
+    Decodes the stream of retina events sent by a PushBot into neuron IDs.
+
+    Each event is two bytes, the first of which has its most significant
+    bit set.  Events are found in whole packets at once with numpy, and an
+    event that is split across two packets is completed when the next
+    packet arrives.  This has no dependency on any connection, so can be
+    used to decode recorded packets offline.
+    """
+
+    __slots__ = (
+        "__orig_x_shift",
+        "__orig_y_shift",
+        "__x_mask",
+        "__y_mask",
+        "__x_shift",
+        "__y_shift",
+        "__p_shift",
+        "__partial")
+
+    def __init__(
+            self, resolution: PushBotRetinaResolution = (
+                PushBotRetinaResolution.NATIVE_128_X_128)):
+        """
+        :param PushBotRetinaResolution resolution:
+        """
+        bits = resolution.value.bits_per_coordinate
+        add_shift = _BITS_PER_PIXEL - bits
+        mask = (2 ** bits) - 1
+        self.__orig_x_shift = add_shift + _X_SHIFT
+        self.__orig_y_shift = add_shift + _Y_SHIFT
+        self.__x_mask = mask
+        self.__y_mask = mask
+        self.__x_shift = 0
+        self.__y_shift = bits
+        self.__p_shift = bits * 2
+
+        # The first byte of an event left at the end of the last packet
+        self.__partial: Optional[int] = None
+
+    def reset(self) -> None:
+        """
+        Forget any partial event left over from the last packet.
+        """
+        self.__partial = None
+
+    def decode(self, data: _Buffer) -> NDArray[numpy.uint32]:
+        """
+        Decode a packet of retina events.
+
+        :param data: The bytes of the packet
+        :type data: bytes or bytearray or memoryview
+        :return: The neuron ID of each complete event, in order
+        :rtype: ~numpy.ndarray
+        """
+        raw = numpy.frombuffer(data, dtype=numpy.uint8)
+        first_event = None
+        if self.__partial is not None and len(raw):
+            # The first byte completes the event from the last packet
+            first_event = numpy.array(
+                [self.__partial | (int(raw[0]) << 8)], dtype=numpy.uint16)
+            self.__partial = None
+            raw = raw[1:]
+
+        starts = self.__event_starts(raw)
+        if len(starts) and starts[-1] == len(raw) - 1:
+            self.__partial = int(raw[-1])
+            starts = starts[:-1]
+        events = raw[starts].astype(numpy.uint16)
+        events |= raw[starts + 1].astype(numpy.uint16) << 8
+        if first_event is not None:
+            events = numpy.concatenate((first_event, events))
+        return self.__neuron_ids(events)
+
+    def decode_packets(
+            self, packets: Iterable[_Buffer]) -> NDArray[numpy.uint32]:
+        """
+        Decode a sequence of packets, such as a recorded dump.
+
+        :param iterable(bytes) packets: The packets in the order received
+        :return: The neuron ID of each complete event, in order
+        :rtype: ~numpy.ndarray
+        """
+        ids = [self.decode(packet) for packet in packets]
+        if not ids:
+            return numpy.zeros(0, dtype=numpy.uint32)
+        return numpy.concatenate(ids)
+
+    @staticmethod
+    def __event_starts(raw: NDArray[numpy.uint8]) -> NDArray[numpy.intp]:
+        """
+        Find the index of the first byte of each event.
+
+        A byte with the top bit set starts an event unless it is the
+        second byte of the event before.  In a run of such bytes, this
+        means every other byte starts an event, counting from the start of
+        the run.
+        """
+        flagged = (raw & _EVENT_START_BIT) != 0
+        index = numpy.arange(len(raw))
+        run_start = numpy.where(
+            flagged & ~numpy.concatenate(([False], flagged[:-1])), index, 0)
+        numpy.maximum.accumulate(run_start, out=run_start)
+        return numpy.flatnonzero(flagged & ((index - run_start) % 2 == 0))
+
+    def __neuron_ids(
+            self, events: NDArray[numpy.uint16]) -> NDArray[numpy.uint32]:
+        events = events.astype(numpy.uint32)
+        y_values = (events >> self.__orig_y_shift) & self.__y_mask
+        x_values = (events >> self.__orig_x_shift) & self.__x_mask
+        polarity = (events >> _P_SHIFT) & _P_MASK
+        return (
+            (x_values << self.__x_shift) |
+            (y_values << self.__y_shift) |
+            (polarity << self.__p_shift))
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from .auto_atoms_per_core import auto_atoms_per_core
 from .connection_holder_finisher import finish_connection_holders
 from .redundant_packet_count_report import redundant_packet_count_report
 from .spynnaker_connection_holder_generations import (
@@ -18,12 +19,14 @@ from .spynnaker_connection_holder_generations import (
 from .spynnaker_neuron_network_specification_report import (
     spynnaker_neuron_graph_network_specification_report)
 from .spynnaker_synaptic_matrix_report import SpYNNakerSynapticMatrixReport
-from .synapse_expander import synapse_expander
+from .synapse_expander import emulate_synapse_expander, synapse_expander
 from .delay_support_adder import delay_support_adder
 from .neuron_expander import neuron_expander
 
 __all__ = [
+    "auto_atoms_per_core",
     "delay_support_adder",
+    "emulate_synapse_expander",
     "finish_connection_holders",
     "redundant_packet_count_report",
     "SpYNNakerConnectionHolderGenerator",
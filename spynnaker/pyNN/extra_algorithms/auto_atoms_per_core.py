@@ -0,0 +1,253 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import math
+import os
+from typing import List, Optional, TextIO, Tuple
+from spinn_utilities.config_holder import get_config_float
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.progress_bar import ProgressBar
+from pacman.utilities.utility_calls import get_n_bits
+from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    SplitterAbstractPopulationVertex)
+from spynnaker.pyNN.extra_algorithms.splitter_components.\
+    splitter_abstract_pop_vertex import MAX_RING_BUFFER_BITS
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+_FILE_NAME = "auto_atoms_per_core.rpt"
+
+#: The clock speed of the cores that the CPU estimates are made against
+_CPU_CLOCK_MHZ = 200
+
+#: Bytes of DTCM kept for the stack, input spike buffer and fixed data
+_DTCM_RESERVED_BYTES = 8 * 1024
+
+#: Bytes in each ring buffer entry
+_RING_BUFFER_ENTRY_BYTES = 2
+
+
+class _Candidate(object):
+    """
+    The estimated resources of one choice of atoms per core.
+    """
+    __slots__ = (
+        "atoms_per_core", "n_cores", "sdram", "sdram_budget", "dtcm",
+        "dtcm_budget", "cpu_cycles", "cpu_budget", "ring_buffer_bits",
+        "max_delay")
+
+    def __init__(self, atoms_per_core: int, n_cores: int):
+        self.atoms_per_core = atoms_per_core
+        self.n_cores = n_cores
+        self.sdram = 0
+        self.sdram_budget = 0
+        self.dtcm = 0
+        self.dtcm_budget = 0
+        self.cpu_cycles = 0.0
+        self.cpu_budget = 0.0
+        self.ring_buffer_bits = 0
+        self.max_delay = 0
+
+    def problems(self) -> List[str]:
+        """
+        The reasons that this candidate does not fit, if any.
+
+        :rtype: list(str)
+        """
+        problems = list()
+        if self.ring_buffer_bits > MAX_RING_BUFFER_BITS:
+            problems.append(
+                f"needs {self.ring_buffer_bits} ring buffer bits but only "
+                f"{MAX_RING_BUFFER_BITS} fit")
+        if self.sdram > self.sdram_budget:
+            problems.append(
+                f"SDRAM {self.sdram} > {self.sdram_budget} bytes")
+        if self.dtcm > self.dtcm_budget:
+            problems.append(f"DTCM {self.dtcm} > {self.dtcm_budget} bytes")
+        if self.cpu_cycles > self.cpu_budget:
+            problems.append(
+                f"CPU {self.cpu_cycles:.0f} > {self.cpu_budget:.0f} "
+                "cycles per timestep")
+        return problems
+
+    def describe(self) -> str:
+        """
+        A one line description of the candidate.
+
+        :rtype: str
+        """
+        problems = self.problems()
+        status = "fits" if not problems else "; ".join(problems)
+        return (
+            f"{self.atoms_per_core} atoms per core on {self.n_cores} cores: "
+            f"SDRAM {self.sdram} bytes, DTCM {self.dtcm} bytes, "
+            f"CPU {self.cpu_cycles:.0f} cycles, "
+            f"max delay per core {self.max_delay} steps: {status}")
+
+
+#: A vertex, the candidate chosen for it if any, all its candidates and
+#: its ring buffer shifts
+_Result = Tuple[AbstractPopulationVertex, Optional[_Candidate],
+                List[_Candidate], List[int]]
+
+
+def auto_atoms_per_core() -> None:
+    """
+    Chooses the number of atoms per core of each population vertex to use
+    the fewest cores that will fit in SDRAM and DTCM and will process each
+    timestep in time.
+
+    The number set by the user (or the model default) is treated as the
+    largest allowed.  The choices and the reasons for them are written to a
+    report.
+    """
+    vertices = [
+        vertex for vertex in SpynnakerDataView.get_vertices_by_type(
+            AbstractPopulationVertex)
+        if isinstance(vertex.splitter, SplitterAbstractPopulationVertex)]
+    progress = ProgressBar(vertices, "Choosing atoms per core")
+    results: List[_Result] = []
+    for vertex in progress.over(vertices):
+        vertex.set_auto_max_atoms_per_core(None)
+        if len(vertex.atoms_shape) != 1:
+            results.append((vertex, None, [], []))
+            continue
+        candidates = [
+            _evaluate(vertex, atoms_per_core)
+            for atoms_per_core in _candidate_atoms_per_core(vertex)]
+        chosen = _choose(candidates)
+        vertex.set_auto_max_atoms_per_core(
+            None if chosen is None else chosen.atoms_per_core)
+        vertex.splitter.reset_called()
+        # The shifts come from the weights and rates of the projections
+        # into the whole population, so are the same for every candidate
+        results.append(
+            (vertex, chosen, candidates, vertex.get_ring_buffer_shifts()))
+
+    # The sizes of some vertices depend on those of others, so forget
+    # anything cached during the search
+    for vertex in vertices:
+        vertex.splitter.reset_called()
+
+    for vertex, chosen, candidates, _shifts in results:
+        if chosen is not None:
+            logger.info(
+                "{} will use {} atoms per core on {} cores",
+                vertex.label, chosen.atoms_per_core, chosen.n_cores)
+        elif candidates:
+            logger.warning(
+                "{} does not fit the estimated resources with any number of "
+                "atoms per core; keeping {}.  See {} for details.",
+                vertex.label, candidates[-1].atoms_per_core, _FILE_NAME)
+
+    file_name = os.path.join(SpynnakerDataView.get_run_dir_path(), _FILE_NAME)
+    try:
+        with open(file_name, "w", encoding="utf-8") as f:
+            _write_report(f, results)
+    except IOError:
+        logger.exception(
+            "auto_atoms_per_core: Can't open file {} for writing.", file_name)
+
+
+def _candidate_atoms_per_core(vertex: AbstractPopulationVertex) -> List[int]:
+    """
+    The powers of two up to the user maximum, and the user maximum itself.
+    """
+    max_atoms = min(vertex.get_user_max_atoms_per_core(), vertex.n_atoms)
+    candidates = {max_atoms}
+    power = 1
+    while power < max_atoms:
+        candidates.add(power)
+        power *= 2
+    return sorted(candidates)
+
+
+def _evaluate(
+        vertex: AbstractPopulationVertex, atoms_per_core: int) -> _Candidate:
+    """
+    Estimate the resources used with a given number of atoms per core.
+    """
+    version = SpynnakerDataView.get_machine_version()
+    vertex.set_auto_max_atoms_per_core(atoms_per_core)
+    splitter = vertex.splitter
+    splitter.reset_called()
+
+    sdram_per_core = splitter.get_sdram_per_core(atoms_per_core)
+    n_slices = int(math.ceil(vertex.n_atoms / atoms_per_core))
+    candidate = _Candidate(atoms_per_core, n_slices * len(sdram_per_core))
+
+    # The cores of a slice may be placed on the same chip, so can share
+    # the SDRAM of that many cores between them
+    n_steps = SpynnakerDataView.get_plan_n_timestep() or 0
+    candidate.sdram = sum(
+        sdram.get_total_sdram(n_steps) for sdram in sdram_per_core)
+    n_usable_cores = version.max_cores_per_chip - version.n_scamp_cores
+    candidate.sdram_budget = (
+        version.max_sdram_per_chip * len(sdram_per_core) // n_usable_cores)
+
+    # The ring buffers and neuron state are held in DTCM
+    n_synapse_bits = get_n_bits(vertex.neuron_impl.get_n_synapse_types())
+    n_atom_bits = get_n_bits(atoms_per_core)
+    candidate.ring_buffer_bits = n_atom_bits + n_synapse_bits
+    if candidate.ring_buffer_bits <= MAX_RING_BUFFER_BITS:
+        candidate.max_delay = splitter.max_support_delay()
+        candidate.ring_buffer_bits += get_n_bits(candidate.max_delay)
+    candidate.dtcm = (
+        (2 ** candidate.ring_buffer_bits) * _RING_BUFFER_ENTRY_BYTES +
+        vertex.get_sdram_usage_for_neuron_params(atoms_per_core) +
+        vertex.get_synapse_dynamics_size(atoms_per_core))
+    candidate.dtcm_budget = version.dtcm_bytes - _DTCM_RESERVED_BYTES
+
+    candidate.cpu_cycles = splitter.get_cpu_cycles_per_core(atoms_per_core)
+    candidate.cpu_budget = (
+        _CPU_CLOCK_MHZ * SpynnakerDataView.get_simulation_time_step_us() *
+        SpynnakerDataView.get_time_scale_factor() *
+        get_config_float("Mapping", "auto_atoms_per_core_cpu_fraction"))
+    return candidate
+
+
+def _choose(candidates: List[_Candidate]) -> Optional[_Candidate]:
+    """
+    Pick the candidate that fits on the fewest cores, using the fewest
+    atoms per core between those with the same number of cores to leave
+    the most headroom.
+    """
+    fits = [candidate for candidate in candidates if not candidate.problems()]
+    if not fits:
+        return None
+    return min(fits, key=lambda c: (c.n_cores, c.atoms_per_core))
+
+
+def _write_report(output: TextIO, results: List[_Result]):
+    for vertex, chosen, candidates, shifts in results:
+        output.write(f"{vertex.label} ({vertex.n_atoms} atoms)\n")
+        if not candidates:
+            output.write(
+                "    Not tuned as it has more than one dimension\n\n")
+            continue
+        output.write(
+            f"    Ring buffer shifts {shifts} for any atoms per core, as "
+            "they only depend on the incoming projections\n")
+        for candidate in candidates:
+            output.write(f"    {candidate.describe()}\n")
+        if chosen is None:
+            output.write(
+                "    Nothing fits, so keeping "
+                f"{candidates[-1].atoms_per_core} atoms per core\n\n")
+        else:
+            output.write(
+                f"    Chose {chosen.atoms_per_core} atoms per core as this "
+                f"uses the fewest cores ({chosen.n_cores})\n\n")
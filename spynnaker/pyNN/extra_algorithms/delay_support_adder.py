@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
 import math
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+from spinn_utilities.log import FormatAdapter
 from spinn_utilities.progress_bar import ProgressBar
 from pacman.model.graphs.application import (
     ApplicationEdge, ApplicationEdgePartition)
@@ -26,6 +28,8 @@ from spynnaker.pyNN.models.neural_projections import (
 from spynnaker.pyNN.models.utility_models.delays import DelayExtensionVertex
 from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
 
+logger = FormatAdapter(logging.getLogger(__name__))
+
 
 def delay_support_adder() -> Tuple[
         Sequence[DelayExtensionVertex], Sequence[ApplicationEdge]]:
@@ -42,9 +46,45 @@ def delay_support_adder() -> Tuple[
     return adder.add_delays()
 
 
+class _DelayPlan(object):
+    """
+    The delay extension needed by the edges of one outgoing partition.
+    """
+    __slots__ = ("partition", "delay_per_stage", "n_delay_stages", "edges")
+
+    def __init__(self, partition: ApplicationEdgePartition,
+                 delay_per_stage: int):
+        self.partition = partition
+        self.delay_per_stage = delay_per_stage
+        self.n_delay_stages = 0
+        self.edges: List[ProjectionApplicationEdge] = list()
+
+    def add_edge(self, edge: ProjectionApplicationEdge, delay_per_stage: int,
+                 n_delay_stages: int):
+        """
+        Add an edge that needs the delay extension.
+
+        :param ProjectionApplicationEdge edge: The undelayed edge
+        :param int delay_per_stage: The delay per stage the edge needs
+        :param int n_delay_stages: The number of stages the edge needs
+        """
+        if delay_per_stage != self.delay_per_stage:
+            raise DelayExtensionException(
+                "The delay per stage is already set to "
+                f"{self.delay_per_stage}, and therefore {delay_per_stage} "
+                "is not yet feasible. "
+                "Please report it to Spinnaker user mail list.")
+        self.n_delay_stages = max(self.n_delay_stages, n_delay_stages)
+        self.edges.append(edge)
+
+
 class _DelaySupportAdder(object):
     """
     Adds delay extension vertices into the application graph as needed.
+
+    The delays needed by all the edges are planned first, so that each
+    delay extension vertex is made once with the number of stages needed
+    by all the edges that share it.
     """
 
     __slots__ = (
@@ -80,36 +120,71 @@ class _DelaySupportAdder(object):
                 self._delay_post_edge_map[vertex, edge.post_vertex] = edge
         progress.update(1)
 
-        # go through all partitions.
-        for app_outgoing_edge_partition in progress.over(
-                SpynnakerDataView.iterate_partitions()):
-            for app_edge in app_outgoing_edge_partition.edges:
-                if isinstance(app_edge, ProjectionApplicationEdge):
-                    self.__examine_edge_for_delays_to_add(
-                        app_edge, app_outgoing_edge_partition)
+        # Work out what is needed for all partitions before adding anything
+        plans: List[_DelayPlan] = list()
+        for partition in progress.over(
+                SpynnakerDataView.iterate_partitions(), finish_at_end=False):
+            plan = self.__plan_partition(partition)
+            if plan is not None:
+                plans.append(plan)
+
+        delay_vertices: List[DelayExtensionVertex] = list()
+        for plan in plans:
+            delay_app_vertex = self._create_delay_app_vertex_and_pre_edge(
+                plan.partition, plan.edges[0], plan.delay_per_stage,
+                plan.n_delay_stages)
+            for app_edge in plan.edges:
+                self._create_post_delay_edge(delay_app_vertex, app_edge)
+            delay_vertices.append(delay_app_vertex)
+        progress.end()
+
+        self.__report(delay_vertices)
         return self._new_vertices, self._new_edges
 
-    def __examine_edge_for_delays_to_add(
-            self, edge: ProjectionApplicationEdge,
-            partition: ApplicationEdgePartition):
+    def __plan_partition(
+            self, partition: ApplicationEdgePartition) -> Optional[_DelayPlan]:
         """
-        Look at a particular edge to see if it needs a delay vertex+edge
-        inserted, and add it in if it does.
+        Work out the delay extension needed by the edges of a partition.
 
-        :param ProjectionApplicationEdge edge:
         :param ApplicationEdgePartition partition:
+        :return: The plan, or `None` if no delay extension is needed
+        :rtype: _DelayPlan or None
         """
-        # figure the max delay and if we need a delay extension
-        n_stages, steps_per_stage, need_delay_ext = self._check_delay_values(
-            edge, edge.synapse_information)
+        plan = None
+        for app_edge in partition.edges:
+            if not isinstance(app_edge, ProjectionApplicationEdge):
+                continue
+            n_stages, steps_per_stage, need_delay_ext = (
+                self._check_delay_values(
+                    app_edge, app_edge.synapse_information))
+            if need_delay_ext:
+                if plan is None:
+                    plan = _DelayPlan(partition, steps_per_stage)
+                plan.add_edge(app_edge, steps_per_stage, n_stages)
+        return plan
 
-        # if we need a delay, add it to the app graph.
-        if need_delay_ext:
-            delay_app_vertex = self._create_delay_app_vertex_and_pre_edge(
-                partition, edge, steps_per_stage, n_stages)
+    def __report(self, delay_vertices: List[DelayExtensionVertex]):
+        """
+        Log the number of cores and the SDRAM that the delay extensions are
+        expected to use.
 
-            # add the edge from the delay extension to the dest vertex
-            self._create_post_delay_edge(delay_app_vertex, edge)
+        :param list(DelayExtensionVertex) delay_vertices:
+        """
+        if not delay_vertices:
+            return
+        n_steps = SpynnakerDataView.get_plan_n_timestep()
+        n_cores = 0
+        sdram = 0
+        for vertex in delay_vertices:
+            splitter = vertex.splitter
+            assert isinstance(splitter, SplitterDelayVertexSlice)
+            n_vertex_cores = len(splitter.get_out_going_slices())
+            n_cores += n_vertex_cores
+            sdram += n_vertex_cores * (
+                splitter.get_sdram_used_by_atoms().get_total_sdram(n_steps))
+        logger.info(
+            "{} delay extensions are expected to use {} cores and {} bytes "
+            "of SDRAM", len(delay_vertices), n_cores, sdram)
 
     def _create_post_delay_edge(
             self, delay_app_vertex: DelayExtensionVertex,
@@ -193,8 +268,7 @@ class _DelaySupportAdder(object):
         """
         # get max delay required
         max_delay_needed_ms = max(
-            synapse_info.synapse_dynamics.get_delay_maximum(
-                synapse_info.connector, synapse_info)
+            synapse_info.get_delay_maximum()
             for synapse_info in synapse_infos)
 
         # get if the post vertex needs a delay extension
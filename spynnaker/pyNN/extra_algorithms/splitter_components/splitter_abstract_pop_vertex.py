@@ -17,6 +17,7 @@ from spinn_utilities.abstract_base import abstractmethod
 from spinn_utilities.overrides import overrides
 from pacman.exceptions import PacmanConfigurationException
 from pacman.model.graphs.common import Slice
+from pacman.model.resources import AbstractSDRAM
 from pacman.model.partitioner_splitters import AbstractSplitterCommon
 from pacman.utilities.algorithm_utilities\
     .partition_algorithm_utilities import get_multidimensional_slices
@@ -67,6 +68,31 @@ class SplitterAbstractPopulationVertex(
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_sdram_per_core(self, n_atoms: int) -> List[AbstractSDRAM]:
+        """
+        Get the SDRAM of each of the cores that would be used for a slice
+        of the given number of atoms.  Used when choosing the number of atoms
+        per core automatically.
+
+        :param int n_atoms: The number of atoms in the slice
+        :rtype: list(~pacman.model.resources.AbstractSDRAM)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_cpu_cycles_per_core(self, n_atoms: int) -> float:
+        """
+        Get an estimate of the most CPU cycles used per timestep by any of
+        the cores that would be used for a slice of the given number of
+        atoms.  Used when choosing the number of atoms per core
+        automatically.
+
+        :param int n_atoms: The number of atoms in the slice
+        :rtype: float
+        """
+        raise NotImplementedError
+
     @final
     @overrides(AbstractSpynnakerSplitterDelay.max_support_delay)
     def max_support_delay(self) -> int:
@@ -185,6 +185,20 @@ class SplitterAbstractPopulationVertexFixed(SplitterAbstractPopulationVertex):
             weight_scales, structural_sz, max_atoms_per_core,
             synaptic_matrices, neuron_data)
 
+    @overrides(SplitterAbstractPopulationVertex.get_sdram_per_core)
+    def get_sdram_per_core(self, n_atoms: int) -> List[AbstractSDRAM]:
+        app_vertex = self.governed_app_vertex
+        return [self.get_sdram_used_by_atoms(
+            n_atoms, app_vertex.get_synapses_size(n_atoms),
+            app_vertex.get_structural_dynamics_size(n_atoms))]
+
+    @overrides(SplitterAbstractPopulationVertex.get_cpu_cycles_per_core)
+    def get_cpu_cycles_per_core(self, n_atoms: int) -> float:
+        # Neurons and synapses are processed on the same core
+        app_vertex = self.governed_app_vertex
+        return (app_vertex.get_neuron_cpu_cycles(n_atoms) +
+                app_vertex.get_synapse_cpu_cycles(n_atoms))
+
     def get_sdram_used_by_atoms(
             self, n_atoms: int, all_syn_block_sz: int,
             structural_sz: int) -> AbstractSDRAM:
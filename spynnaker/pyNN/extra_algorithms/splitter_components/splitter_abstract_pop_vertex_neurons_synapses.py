@@ -653,8 +653,43 @@ class SplitterAbstractPopulationVertexNeuronsSynapses(
             return self.__neuron_vertices
         return self.__synapse_vertices
 
+    @overrides(SplitterAbstractPopulationVertex.get_sdram_per_core)
+    def get_sdram_per_core(self, n_atoms: int) -> List[AbstractSDRAM]:
+        app_vertex = self.governed_app_vertex
+        n_synapse_types = app_vertex.neuron_impl.get_n_synapse_types()
+        n_direct_poisson = 0
+        if not self.__too_many_cores:
+            n_direct_poisson = sum(
+                1 for proj in app_vertex.incoming_poisson_projections
+                if self.handles_source_vertex(proj))
+        edge_sdram = PopulationNeuronsMachineVertex.get_n_bytes_for_transfer(
+            n_atoms, n_synapse_types)
+        neuron_sdram = self.__get_neuron_sdram(
+            n_atoms,
+            edge_sdram * (self.__n_synapse_vertices + n_direct_poisson))
+        structural_sz = max(
+            app_vertex.get_structural_dynamics_size(n_atoms), BYTES_PER_WORD)
+        all_syn_block_sz = max(
+            app_vertex.get_synapses_size(n_atoms), BYTES_PER_WORD)
+        lead_synapse_sdram = self.__get_synapse_sdram(
+            n_atoms, self.__get_shared_synapse_sdram(
+                n_atoms, all_syn_block_sz, structural_sz))
+        shared_synapse_sdram = self.__get_synapse_sdram(n_atoms)
+        return [neuron_sdram, lead_synapse_sdram] + [shared_synapse_sdram] * (
+            self.__n_synapse_vertices - 1)
+
+    @overrides(SplitterAbstractPopulationVertex.get_cpu_cycles_per_core)
+    def get_cpu_cycles_per_core(self, n_atoms: int) -> float:
+        # Incoming spikes are shared between the synapse cores
+        app_vertex = self.governed_app_vertex
+        return max(
+            app_vertex.get_neuron_cpu_cycles(n_atoms),
+            app_vertex.get_synapse_cpu_cycles(n_atoms) /
+            self.__n_synapse_vertices)
+
     @overrides(AbstractSplitterCommon.reset_called)
     def reset_called(self) -> None:
+        super().reset_called()
         self.__neuron_vertices = []
         self.__synapse_vertices = []
         self.__synapse_verts_by_neuron = {}
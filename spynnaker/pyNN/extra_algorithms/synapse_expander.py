@@ -23,6 +23,7 @@ from pacman.model.placements import Placement
 from spinn_front_end_common.utilities.system_control_logic import (
     run_system_application)
 from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.exceptions import SpynnakerException
 from spynnaker.pyNN.models.abstract_models import (
     AbstractSynapseExpandable, SYNAPSE_EXPANDER_APLX)
 
@@ -59,6 +60,27 @@ def synapse_expander() -> None:
                 vertex.read_generated_connection_holders(placement)
 
 
+def emulate_synapse_expander() -> None:
+    """
+    Fill in the connection data that would be generated by the synapse
+    expander by emulating it on host, for use without a machine.
+    """
+    placements = [
+        placement
+        for placement in SpynnakerDataView.iterate_placemements()
+        if isinstance(placement.vertex, AbstractSynapseExpandable) and
+        placement.vertex.gen_on_machine()]
+    progress = ProgressBar(placements, "Emulating the synapse expander")
+    for placement in progress.over(placements):
+        vertex = cast(AbstractSynapseExpandable, placement.vertex)
+        try:
+            vertex.read_generated_connection_holders(placement)
+        except SpynnakerException as e:
+            logger.warning(
+                "The connections of {} cannot be emulated: {}",
+                placement.vertex.label, e)
+
+
 def _plan_expansion() -> Tuple[ExecutableTargets, List[Placement], float]:
     """
     Plan the expansion of synapses and set up the regions using USER1.
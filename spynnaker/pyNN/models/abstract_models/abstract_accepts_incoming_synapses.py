@@ -19,6 +19,8 @@ from spinn_utilities.require_subclass import require_subclass
 from pacman.exceptions import PacmanConfigurationException
 from pacman.model.graphs.application import ApplicationVertex
 if TYPE_CHECKING:
+    from numpy import integer
+    from numpy.typing import NDArray
     from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
         ConnectionsArray)
     from spynnaker.pyNN.models.neuron.synapse_dynamics import (
@@ -62,7 +64,9 @@ class AbstractAcceptsIncomingSynapses(object, metaclass=AbstractBase):
     @abstractmethod
     def get_connections_from_machine(
             self, app_edge: ProjectionApplicationEdge,
-            synapse_info: SynapseInformation) -> ConnectionsArray:
+            synapse_info: SynapseInformation,
+            pre_indices: Optional[NDArray[integer]] = None
+            ) -> ConnectionsArray:
         """
         Get the connections from the machine post-run.
 
@@ -70,14 +74,23 @@ class AbstractAcceptsIncomingSynapses(object, metaclass=AbstractBase):
             The edge for which the data is being read
         :param SynapseInformation synapse_info:
             The specific projection within the edge
+        :param ~numpy.ndarray pre_indices:
+            The indices of the pre-neurons to get the connections from, or
+            `None` for all of them; only the synaptic rows of these neurons
+            are read from the machine
         :rtype: ~numpy.ndarray
         """
         raise NotImplementedError
 
     @abstractmethod
-    def clear_connection_cache(self) -> None:
+    def clear_connection_cache(
+            self, synapse_info: Optional[SynapseInformation] = None) -> None:
         """
         Clear the connection data stored in the vertex so far.
+
+        :param SynapseInformation synapse_info:
+            The projection to clear the connections of, or `None` to clear
+            the connections of all projections
         """
         raise NotImplementedError
 
@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from typing import Sequence, TYPE_CHECKING
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
 
+from numpy import integer, uint32
 from numpy.typing import NDArray
 
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
@@ -26,12 +27,14 @@ if TYPE_CHECKING:
 
 class HasSynapses(object, metaclass=AbstractBase):
     """
-    API for getting connections from the machine.
+    API for getting connections from the machine, and changing them there.
     """
     @abstractmethod
     def get_connections_from_machine(
             self, placement: Placement, app_edge: ProjectionApplicationEdge,
-            synapse_info: SynapseInformation) -> Sequence[NDArray]:
+            synapse_info: SynapseInformation,
+            pre_indices: Optional[NDArray[integer]] = None
+            ) -> Sequence[NDArray]:
         """
         Get the connections from the machine for this vertex.
 
@@ -41,6 +44,52 @@ class HasSynapses(object, metaclass=AbstractBase):
             The edge for which the data is being read
         :param SynapseInformation synapse_info:
             The specific projection within the edge
+        :param ~numpy.ndarray pre_indices:
+            The indices of the pre-neurons to get the connections from, or
+            `None` for all of them
         :rtype: list(~numpy.ndarray)
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def get_changed_rows(
+            self, app_edge: ProjectionApplicationEdge,
+            synapse_info: SynapseInformation, connections: NDArray,
+            new_connections: NDArray) -> List[Tuple[int, NDArray[uint32]]]:
+        """
+        Get the rows of the synaptic data of this vertex that change when
+        the weights and/or delays of the connections of a projection are
+        changed.
+
+        :param ProjectionApplicationEdge app_edge:
+            The edge of the projection
+        :param SynapseInformation synapse_info:
+            The specific projection within the edge
+        :param ~numpy.ndarray connections:
+            The connections of the projection as they are now
+        :param ~numpy.ndarray new_connections:
+            The same connections in the same order, with the new weights
+            and/or delays
+        :return: The offset of each run of changed rows in the synaptic
+            data, and the words to write there
+        :rtype: list(tuple(int, ~numpy.ndarray))
+        :raises RemapRequiredException:
+            If the new connections don't fit in the space of the data
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_changed_rows(
+            self, placement: Placement,
+            changed_rows: Sequence[Tuple[int, NDArray[uint32]]]):
+        """
+        Write rows of synaptic data from :py:meth:`get_changed_rows` to the
+        machine.
+
+        :param ~pacman.model.placements.Placement placement:
+            Where the synaptic data is on the machine
+        :param list(tuple(int, ~numpy.ndarray)) changed_rows:
+            The offset of each run of rows in the synaptic data, and the
+            words to write there
+        """
+        raise NotImplementedError
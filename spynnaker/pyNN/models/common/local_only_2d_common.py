@@ -13,6 +13,7 @@
 # limitations under the License.
 from math import ceil, log2, floor
 from collections import namedtuple, defaultdict
+import numpy
 from pacman.model.graphs.application import ApplicationVirtualVertex
 from pacman.model.graphs.common.slice import Slice
 from pacman.model.graphs.common.mdslice import MDSlice
@@ -33,6 +34,9 @@ N_COLOUR_BITS_BITS = 3
 #: Key info size in bytes
 KEY_INFO_SIZE = 4 * BYTES_PER_WORD
 
+#: The number of pre-neurons whose connections are expanded at once on host
+EXPAND_CHUNK_SIZE = 4096
+
 #: A source
 Source = namedtuple(
     "Source", ["projection", "local_delay", "delay_stage"])
@@ -54,6 +58,23 @@ def get_div_const(value):
             + (sh1 << BITS_PER_SHORT) + m)
 
 
+def get_machine_weights(
+        weights, pos_synapse_type, neg_synapse_type, weight_scales):
+    """ Get weights as they are seen on the machine i.e. scaled and rounded
+        to integers as they are when written, and then scaled back again
+
+    :param ~numpy.ndarray weights: The weights to convert
+    :param int pos_synapse_type: The synapse type of the positive weights
+    :param int neg_synapse_type: The synapse type of the negative weights
+    :param ~numpy.ndarray weight_scales: The scale of each synapse type
+    :rtype: ~numpy.ndarray
+    """
+    scales = numpy.where(
+        weights < 0, weight_scales[neg_synapse_type],
+        weight_scales[pos_synapse_type])
+    return numpy.round(weights * scales) / scales
+
+
 def get_delay_for_source(incoming):
     """ Get the vertex which will send data from a given source projection,
         along with the delay stage and locally-handled delay value
@@ -71,6 +71,7 @@ class NeuronRecorder(object):
     """
     __slots__ = (
         "__indexes",
+        "__index_arrays",
         "__n_neurons",
         "__sampling_rates",
         "__data_types",
@@ -155,6 +156,7 @@ class NeuronRecorder(object):
         """
         self.__sampling_rates: Dict[str, int] = dict()
         self.__indexes: Dict[str, Optional[Sequence[int]]] = dict()
+        self.__index_arrays: Dict[str, NDArray[numpy.integer]] = dict()
         self.__data_types = data_types
         self.__n_neurons = n_neurons
         self.__bitfield_variables = bitfield_variables
@@ -183,6 +185,53 @@ class NeuronRecorder(object):
 
         self.__offset_added = False
 
+    def __set_indexes(self, variable: str, indexes: Optional[Sequence[int]]):
+        """
+        :param str variable:
+        :param indexes: The sorted indexes to record, or `None` for all
+        :type indexes: list(int) or None
+        """
+        self.__indexes[variable] = indexes
+        self.__index_arrays.pop(variable, None)
+
+    def __get_index_array(
+            self, variable: str) -> Optional[NDArray[numpy.integer]]:
+        """
+        Get the sorted indexes to record as an array.
+
+        :param str variable:
+        :return: The indexes, or `None` if all neurons are recorded
+        :rtype: ~numpy.ndarray or None
+        """
+        indexes = self.__indexes.get(variable)
+        if indexes is None:
+            return None
+        if variable not in self.__index_arrays:
+            self.__index_arrays[variable] = numpy.array(
+                indexes, dtype=numpy.int64)
+        return self.__index_arrays[variable]
+
+    def __recording_mask(
+            self, variable: str,
+            vertex_slice: Slice) -> Optional[NDArray[numpy.bool_]]:
+        """
+        Find which of the neurons of a slice record a variable.
+
+        :param str variable:
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :return: Whether each of the raster ids of the slice is recorded,
+            or `None` if all neurons are recorded
+        :rtype: ~numpy.ndarray or None
+        """
+        indexes = self.__get_index_array(variable)
+        if indexes is None:
+            return None
+        raster_ids = vertex_slice.get_raster_ids()
+        positions = numpy.searchsorted(indexes, raster_ids)
+        found = positions < len(indexes)
+        found[found] = indexes[positions[found]] == raster_ids[found]
+        return found
+
     def add_region_offset(self, offset: int):
         """
         Add an offset to the regions.
@@ -219,8 +268,9 @@ class NeuronRecorder(object):
                 else vertex_slice.n_atoms
             return self.__sampling_rates[variable], n_atoms
         assert vertex_slice is not None
-        count = len(numpy.intersect1d(
-            vertex_slice.get_raster_ids(), indices))
+        mask = self.__recording_mask(variable, vertex_slice)
+        assert mask is not None
+        count = int(numpy.count_nonzero(mask))
         if count:
             return self.__sampling_rates[variable], count
         return 0, 0
@@ -235,15 +285,10 @@ class NeuronRecorder(object):
             return None
         if self.__sampling_rates[variable] == 0:
             return 0
-        indices = self.__indexes.get(variable)
+        indices = self.__get_index_array(variable)
         if indices is None:
             return n_atoms
-        max_index = numpy.amax(indices)
-        existence = numpy.zeros(max_index + 1, dtype=numpy.int32)
-        existence[indices] = 1
-        splits = numpy.arange(n_atoms, max_index + 1, n_atoms)
-        split_array = numpy.array_split(existence, splits)
-        return max([int(numpy.sum(s)) for s in split_array])
+        return int(numpy.bincount(indices // n_atoms).max())
 
     def neurons_recording(
             self, variable: str,
@@ -257,12 +302,10 @@ class NeuronRecorder(object):
             return None
         if self.__sampling_rates[variable] == 0:
             return []
-        indices = self.__indexes.get(variable)
-        if indices is None:
+        mask = self.__recording_mask(variable, vertex_slice)
+        if mask is None:
             return vertex_slice.get_raster_ids()
-        all_set = set(indices)
-        ids = set(map(int, vertex_slice.get_raster_ids()))
-        return sorted(all_set & ids)
+        return numpy.sort(vertex_slice.get_raster_ids()[mask]).tolist()
 
     def _convert_placement_matrix_data(
             self, row_data: NDArray[uint8], n_rows: int, data_row_length: int,
@@ -281,22 +324,27 @@ class NeuronRecorder(object):
             label: str, placement_data: NDArray[float64], region: int
             ) -> NDArray[float64]:
         missing_str += f"({placement.x}, {placement.y}, {placement.p}); "
-        # Start the fragment for this slice empty
-        fragment = numpy.empty((expected_rows, n_neurons))
-        for i in range(expected_rows):
-            time = i * sampling_rate
-            # Check if there is data for this time step
-            local_indexes = numpy.where(times == time)
-            if len(local_indexes[0]) == 1:
-                fragment[i] = placement_data[local_indexes[0]]
-            elif len(local_indexes[0]) > 1:
-                fragment[i] = placement_data[local_indexes[0][0]]
-                logger.warning(
-                    "Population {} has multiple recorded data for time {}"
-                    " in region {} ", label, time, region)
-            else:
-                # Set row to Nan
-                fragment[i] = numpy.full(n_neurons, numpy.nan)
+        times = numpy.asarray(times).reshape(-1)
+
+        # Find the row of the fragment that each recorded row belongs in;
+        # rows with times that were not expected are dropped
+        rows, offsets = numpy.divmod(times, sampling_rate)
+        valid = (offsets == 0) & (rows >= 0) & (rows < expected_rows)
+        sources = numpy.flatnonzero(valid)
+        rows, first, counts = numpy.unique(
+            rows[valid], return_index=True, return_counts=True)
+
+        # Start the fragment for this slice with all rows as NaN, then fill
+        # in the rows that have data, using the first if there are several
+        fragment = numpy.full((expected_rows, n_neurons), numpy.nan)
+        fragment[rows] = placement_data[sources[first]]
+
+        repeated = rows[counts > 1] * sampling_rate
+        if len(repeated):
+            logger.warning(
+                "Population {} has multiple recorded data for {} times "
+                "in region {} (first at time {})", label, len(repeated),
+                region, repeated[0])
         return fragment
 
     def _get_placement_matrix_data(
@@ -502,10 +550,10 @@ class NeuronRecorder(object):
             return True
         if self.__sampling_rates[variable] == 0:
             return False
-        indices = self.__indexes.get(variable)
-        if indices is None:
+        mask = self.__recording_mask(variable, vertex_slice)
+        if mask is None:
             return True
-        return any(numpy.isin(vertex_slice.get_raster_ids(), indices))
+        return bool(mask.any())
 
     def recorded_ids_by_slice(self, vertex_slice: Slice) -> List[int]:
         """
@@ -647,7 +695,7 @@ class NeuronRecorder(object):
         if remove_indexes is None:
             # turning all off so ignoring sampling interval
             self.__sampling_rates[variable] = 0
-            self.__indexes[variable] = None
+            self.__set_indexes(variable, None)
             return
 
         # No good reason to specify_interval when turning off
@@ -665,17 +713,18 @@ class NeuronRecorder(object):
             indexes = range(self.__n_neurons)
 
         # remove the indexes not recording
+        remove = set(remove_indexes)
         indexes = [
             index
             for index in indexes
-            if index not in remove_indexes]
+            if index not in remove]
 
         # Check is at least one index still recording
         if len(indexes) == 0:
             self.__sampling_rates[variable] = 0
-            self.__indexes[variable] = None
+            self.__set_indexes(variable, None)
         else:
-            self.__indexes[variable] = indexes
+            self.__set_indexes(variable, indexes)
 
     def _check_complete_overwrite(
             self, variable: str, indexes: Optional[Collection[int]]):
@@ -731,7 +780,7 @@ class NeuronRecorder(object):
 
         if indexes is None:
             # previous recording indexes does not matter as now all (None)
-            self.__indexes[variable] = None
+            self.__set_indexes(variable, None)
         else:
             # make sure indexes is not a generator like range
             indices = set(indexes)
@@ -741,7 +790,7 @@ class NeuronRecorder(object):
                 # merge the two indexes
                 indices.update(current)
             # Keep in numerical order
-            self.__indexes[variable] = sorted(indices)
+            self.__set_indexes(variable, sorted(indices))
 
     def set_recording(self, variable: str, new_state: bool,
                       sampling_interval: Optional[float] = None,
@@ -1090,27 +1139,18 @@ class NeuronRecorder(object):
         if rate == 0:
             # Not recording anything so all indices are 0
             data.append(numpy.zeros(n_indices, dtype=uint16).view(uint32))
-        elif (indexes := self.__indexes.get(variable)) is None:
+        elif (mask := self.__recording_mask(
+                variable, vertex_slice)) is None:
             # Recording everything so indices are identity
             data.append(numpy.arange(n_indices, dtype=uint16).view(uint32))
         else:
-            local_index = 0
-            local_indexes: List[int] = list()
-            # Add indices based on the raster ids
-            index = 0
-            for index in vertex_slice.get_raster_ids():
-                if index in indexes:
-                    # Recording so write the local index to record to
-                    local_indexes.append(local_index)
-                    local_index += 1
-                else:
-                    # Not recording so write to one beyond recording range
-                    local_indexes.append(n_recording)
-            # Any extra indices should be filled in
-            for _ in range(len(local_indexes), n_indices):
-                local_indexes.append(n_recording)
-            data.append(
-                numpy.array(local_indexes, dtype=uint16).view(uint32))
+            # Recording neurons write to the next local index to record to;
+            # others (and any extra indices) write to one beyond the
+            # recording range
+            local_indexes = numpy.full(n_indices, n_recording, dtype=uint16)
+            local_indexes[numpy.flatnonzero(mask)] = numpy.arange(
+                n_recording, dtype=uint16)
+            data.append(local_indexes.view(uint32))
 
     def _get_data(self, vertex_slice: Slice) -> NDArray[uint32]:
         """
@@ -1187,18 +1227,17 @@ class NeuronRecorder(object):
         """
         Get the indices of the variables to record in run-length-encoded form.
         """
-        index = self.__indexes.get(variable)
-
         # If there is no index, add that all variables are recorded
-        if index is None:
+        if self.__indexes.get(variable) is None:
             return [_REPEAT_PER_NEURON, 1,
                     _REPEAT_PER_NEURON_RECORDED | _RECORDED_FLAG]
 
         assert (vertex_slice is not None)
 
         # Find slice-relative indices in the index
-        indices = numpy.intersect1d(
-            vertex_slice.get_raster_ids(), index, return_indices=True)[1]
+        mask = self.__recording_mask(variable, vertex_slice)
+        assert mask is not None
+        indices = numpy.flatnonzero(mask)
 
         # If there is no overlap, nothing is recorded
         if len(indices) == 0:
@@ -1206,35 +1245,25 @@ class NeuronRecorder(object):
                     _REPEAT_PER_NEURON_RECORDED | _NOT_RECORDED_FLAG]
 
         # Split the indices into consecutive ranges
-        ranges = numpy.split(
-            indices, numpy.where(numpy.diff(indices) > 1)[0] + 1)
-
-        # Generate a run-length-encoded list
-        # Initially there are no items, but this will be updated
-        # Also keep track of the number recorded, also 0 initially
-        data = [0, 0]
-        n_items = 0
-
-        last_index = 0
-        n_recorded = 0
-        for r in ranges:
-            # Add the last non-recorded range
-            if r[0] > last_index:
-                data.append((r[0] - last_index) | _NOT_RECORDED_FLAG)
-                n_items += 1
-
-            # Add this recorded range
-            data.append(((r[-1] - r[0]) + 1) | _RECORDED_FLAG)
-            n_items += 1
-            n_recorded += (r[-1] - r[0]) + 1
-            last_index = r[-1] + 1
+        breaks = numpy.flatnonzero(numpy.diff(indices) > 1) + 1
+        starts = indices[numpy.concatenate(([0], breaks))]
+        stops = indices[numpy.concatenate((breaks - 1, [-1]))] + 1
+
+        # Make a run-length-encoded list of the non-recorded range before
+        # each recorded range, followed by the recorded range
+        gaps = starts - numpy.concatenate(([0], stops[:-1]))
+        items = numpy.column_stack((
+            gaps | _NOT_RECORDED_FLAG, (stops - starts) | _RECORDED_FLAG))
+        items = items.ravel()
+        if gaps[0] == 0:
+            # There is no non-recorded range before the first one
+            items = items[1:]
 
         # Add the final range if needed
-        if last_index < vertex_slice.n_atoms:
-            data.append((vertex_slice.n_atoms - last_index) |
-                        _NOT_RECORDED_FLAG)
-            n_items += 1
+        if stops[-1] < vertex_slice.n_atoms:
+            items = numpy.append(
+                items, (vertex_slice.n_atoms - stops[-1]) | _NOT_RECORDED_FLAG)
 
-        data[0] = n_recorded
-        data[1] = n_items
+        data = numpy.concatenate((
+            [numpy.count_nonzero(mask), len(items)], items))
         return numpy.array(data, dtype=uint32)
@@ -13,7 +13,8 @@
 # limitations under the License.
 from typing import Collection, Container, Iterable, List, Optional, Tuple
 from spinn_utilities.overrides import overrides
-from spinn_utilities.ranged.abstract_sized import Selector
+import numpy
+from spinn_utilities.ranged.abstract_sized import AbstractSized, Selector
 from pacman.model.graphs.application import ApplicationVertex
 from pacman.model.graphs.machine import MachineVertex
 from pacman.model.graphs.common import Slice
@@ -409,6 +410,25 @@ class PopulationApplicationVertex(ApplicationVertex, HasCustomAtomKeyMap):
         raise ConfigurationException(
             "This Population doesn't support injection")
 
+    def _get_machine_vertices_for_selector(
+            self, selector: Selector) -> Iterable[MachineVertex]:
+        """
+        Get the machine vertices that hold any of the selected atoms.
+
+        :param selector: The atoms to look for, or `None` for all of them
+        :rtype: iterable(~pacman.model.graphs.machine.MachineVertex)
+        """
+        if selector is None:
+            return self.machine_vertices
+        # One mask of the selected atoms, indexed by the atoms of each core
+        selected = numpy.zeros(self.n_atoms, dtype=bool)
+        selected[numpy.asarray(
+            AbstractSized(self.n_atoms).selector_to_ids(selector),
+            dtype=numpy.int64)] = True
+        return [m_vertex for m_vertex in self.machine_vertices
+                if selected[
+                    m_vertex.vertex_slice.get_ids_as_slice_or_list()].any()]
+
     @property
     def n_colour_bits(self) -> int:
         """
@@ -12,16 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+from contextlib import contextmanager
 import logging
 import math
 import re
-from typing import Dict, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+from typing import (
+    Dict, Iterator, Optional, Sequence, Tuple, Union, TYPE_CHECKING)
 
 import numpy
 from numpy import float64, uint32, uint16, uint8
 from numpy.typing import NDArray
 
-from pyNN.random import NumpyRNG, RandomDistribution
+from pyNN.random import AbstractRNG, NumpyRNG, RandomDistribution
 from pyNN.space import Space
 
 from spinn_utilities.log import FormatAdapter
@@ -416,6 +418,45 @@ class AbstractConnector(object, metaclass=AbstractBase):
             return numpy.array([copy_rd.next(1)], dtype=float64)
         return copy_rd.next(n_connections)
 
+    def _get_rngs(self) -> Sequence[AbstractRNG]:
+        """
+        Get the random number generators that the connector itself draws
+        from when making connections.
+
+        :rtype: list(~pyNN.random.AbstractRNG)
+        """
+        return ()
+
+    @contextmanager
+    def keep_random_state(
+            self, synapse_info: SynapseInformation) -> Iterator[None]:
+        """
+        Put the random number generators of the connector and of the weights
+        and delays back as they were on leaving the context, so connections
+        can be made without changing those made later.
+
+        :param SynapseInformation synapse_info: The synapse information
+        """
+        rngs = list(self._get_rngs())
+        for values in (synapse_info.weights, synapse_info.delays):
+            if isinstance(values, RandomDistribution):
+                rngs.append(values.rng)
+        states = list()
+        for rng in rngs:
+            if isinstance(rng, NumpyRNG):
+                states.append((rng, rng.rng.get_state()))
+            else:
+                warn_once(
+                    logger, f"The state of {rng} can't be kept, so making "
+                    "connections before run changes those made by run")
+        param_seeds = dict(self.__param_seeds)
+        try:
+            yield
+        finally:
+            for rng, state in states:
+                rng.rng.set_state(state)
+            self.__param_seeds = param_seeds
+
     def _no_space_exception(self, values: Weight_Delay_Types, synapse_info):
         """
         Returns a SpynnakerException about there being no space defined
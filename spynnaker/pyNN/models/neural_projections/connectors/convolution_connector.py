@@ -17,7 +17,7 @@
 from __future__ import annotations
 from collections.abc import (Iterable, Sequence)
 from typing import (
-    List, Optional, Sequence as TSequence, Tuple, Union,
+    Iterator, List, Optional, Sequence as TSequence, Tuple, Union,
     cast, overload, TYPE_CHECKING)
 
 import numpy
@@ -39,7 +39,8 @@ from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
 from spynnaker.pyNN.exceptions import SynapticConfigurationException
 from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
-from spynnaker.pyNN.models.common.local_only_2d_common import get_div_const
+from spynnaker.pyNN.models.common.local_only_2d_common import (
+    EXPAND_CHUNK_SIZE, get_div_const, get_machine_weights)
 
 from .abstract_connector import AbstractConnector
 
@@ -493,3 +494,87 @@ class ConvolutionConnector(AbstractConnector):
         encoded_kernel_weights[neg_weights] *= weight_scales[neg_synapse_type]
         encoded_kernel_weights[pos_weights] *= weight_scales[pos_synapse_type]
         return numpy.round(encoded_kernel_weights).astype(int16)
+
+    def expand_connections(
+            self, synapse_info: SynapseInformation, post_vertex_slice: Slice,
+            weight_scales: Optional[NDArray[floating]] = None,
+            pre_indices: Optional[NDArray[integer]] = None,
+            chunk_size: int = EXPAND_CHUNK_SIZE) -> Iterator[NDArray]:
+        """
+        Expand the kernel into the connections that it makes to a slice of
+        the post-population, following the same rules as the machine.
+        Negative weights are kept negative, with the synapse type of the
+        negative receptor.
+
+        :param SynapseInformation synapse_info: The projection to expand
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The post-neurons to expand the connections to
+        :param weight_scales:
+            The weight scales of the post-neurons; if given the weights are
+            rounded as they are when written to the machine, and any that
+            round to 0 are left out, as the machine ignores them
+        :type weight_scales: ~numpy.ndarray or None
+        :param ~numpy.ndarray pre_indices:
+            The pre-neurons to expand the connections of, or `None` for all
+        :param int chunk_size: How many pre-neurons to expand at once
+        :return:
+            The connections of each chunk of pre-neurons, with targets
+            relative to the slice, each with dtype
+            :py:attr:`~.AbstractConnector.NUMPY_SYNAPSES_DTYPE`
+        :rtype: iterable(~numpy.ndarray)
+        """
+        pre_shape = synapse_info.pre_vertex.atoms_shape
+        if pre_indices is None:
+            pre_indices = numpy.arange(synapse_info.n_pre_neurons)
+        delay = self.__delay(synapse_info)
+
+        k_width, k_height = self.__kernel_weights.shape
+        pos_synapse_type = synapse_info.post_vertex.get_synapse_id_by_target(
+            self.__positive_receptor_type)
+        neg_synapse_type = synapse_info.post_vertex.get_synapse_id_by_target(
+            self.__negative_receptor_type)
+        weights = self.__kernel_weights.flatten()
+        if weight_scales is not None:
+            weights = get_machine_weights(
+                weights, pos_synapse_type, neg_synapse_type, weight_scales)
+
+        # The offsets of each kernel position from the "centre" post-neuron;
+        # the machine indexes the flattened kernel with the row over the
+        # second dimension, and skips the weights that are 0
+        k_rows, k_cols = numpy.divmod(numpy.arange(weights.size), k_width)
+        used = weights != 0
+        weights = weights[used]
+        offset_x = k_cols[used] - (k_width // 2)
+        offset_y = k_rows[used] - (k_height // 2)
+
+        pool_x, pool_y = 1, 1
+        if self.__pool_stride is not None:
+            pool_x, pool_y = self.__pool_stride
+        stride_x, stride_y = self.__strides
+        pad_x, pad_y = self.__padding_shape
+        start_x, start_y = post_vertex_slice.start
+        width, height = post_vertex_slice.shape
+
+        for first in range(0, len(pre_indices), chunk_size):
+            pre_ids = pre_indices[first:first + chunk_size]
+            pre_y, pre_x = numpy.divmod(pre_ids, pre_shape[0])
+            post_x = ((pre_x // pool_x) - (k_width // 2) + pad_x) // stride_x
+            post_y = ((pre_y // pool_y) - (k_height // 2) + pad_y) // stride_y
+            # Targets relative to the slice, as the machine works them out
+            target_x = (post_x[:, None] - start_x) + offset_x
+            target_y = (post_y[:, None] - start_y) + offset_y
+            sources, kernel_index = numpy.nonzero(
+                (target_x >= 0) & (target_x < width) &
+                (target_y >= 0) & (target_y < height))
+
+            block = numpy.zeros(
+                len(sources), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+            block["source"] = pre_ids[sources]
+            block["target"] = (
+                target_x[sources, kernel_index] +
+                (target_y[sources, kernel_index] * width))
+            block["weight"] = weights[kernel_index]
+            block["delay"] = delay
+            block["synapse_type"] = numpy.where(
+                block["weight"] < 0, neg_synapse_type, pos_synapse_type)
+            yield block
@@ -100,6 +100,10 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
         self.__post_neurons_set = False
         self.__rng = rng
 
+    @overrides(AbstractConnector._get_rngs)
+    def _get_rngs(self) -> Sequence[NumpyRNG]:
+        return [] if self.__rng is None else [self.__rng]
+
     def set_projection_information(self, synapse_info: SynapseInformation):
         super().set_projection_information(synapse_info)
         if (not self.__with_replacement and
@@ -101,6 +101,10 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine,
         self.__allow_self_connections = allow_self_connections
         self.__rng = rng
 
+    @overrides(AbstractConnector._get_rngs)
+    def _get_rngs(self) -> Sequence[NumpyRNG]:
+        return [] if self.__rng is None else [self.__rng]
+
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info: SynapseInformation) -> float:
         n_connections = get_probable_maximum_selected(
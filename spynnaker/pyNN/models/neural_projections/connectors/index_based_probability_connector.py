@@ -98,6 +98,10 @@ class IndexBasedProbabilityConnector(AbstractConnector,
         self.__allow_self_connections = allow_self_connections
         self.__probs: Optional[NDArray] = None
 
+    @overrides(AbstractConnector._get_rngs)
+    def _get_rngs(self) -> Sequence[NumpyRNG]:
+        return [self.__rng]
+
     def _update_probs_from_index_expression(
             self, synapse_info: SynapseInformation) -> NDArray:
         """
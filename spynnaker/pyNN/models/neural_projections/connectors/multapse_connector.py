@@ -13,8 +13,9 @@
 # limitations under the License.
 
 from __future__ import annotations
+from contextlib import contextmanager
 import math
-from typing import Optional, Sequence, TYPE_CHECKING
+from typing import Iterator, Optional, Sequence, TYPE_CHECKING
 
 from numpy import uint32, integer
 from numpy.typing import NDArray
@@ -94,6 +95,28 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine,
         self.__synapses_per_edge: Optional[NDArray[integer]] = None
         self.__rng = rng
 
+    @overrides(AbstractConnector._get_rngs)
+    def _get_rngs(self) -> Sequence[NumpyRNG]:
+        return [] if self.__rng is None else [self.__rng]
+
+    @contextmanager
+    def keep_random_state(
+            self, synapse_info: SynapseInformation) -> Iterator[None]:
+        """
+        As :py:meth:`AbstractConnector.keep_random_state`, also keeping the
+        split of the synapses between the slices, which is drawn only once.
+
+        :param SynapseInformation synapse_info: The synapse information
+        """
+        post_slices = self.__post_slices
+        synapses_per_edge = self.__synapses_per_edge
+        try:
+            with super().keep_random_state(synapse_info):
+                yield
+        finally:
+            self.__post_slices = post_slices
+            self.__synapses_per_edge = synapses_per_edge
+
     def set_projection_information(self, synapse_info: SynapseInformation):
         super().set_projection_information(synapse_info)
         n_pairs = synapse_info.n_post_neurons * synapse_info.n_pre_neurons
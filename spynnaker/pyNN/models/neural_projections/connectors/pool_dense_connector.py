@@ -17,7 +17,7 @@
 from __future__ import annotations
 from collections.abc import Iterable, Sized
 from typing import (
-    Optional, Tuple, Union, cast, TYPE_CHECKING)
+    Iterator, Optional, Tuple, Union, cast, TYPE_CHECKING)
 
 import numpy
 from numpy import integer, floating, float64, uint16, uint32
@@ -34,7 +34,8 @@ from spinn_front_end_common.utilities.constants import (
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
 from spynnaker.pyNN.exceptions import SynapticConfigurationException
-from spynnaker.pyNN.models.common.local_only_2d_common import get_div_const
+from spynnaker.pyNN.models.common.local_only_2d_common import (
+    EXPAND_CHUNK_SIZE, get_div_const, get_machine_weights)
 
 from .abstract_connector import AbstractConnector
 
@@ -157,6 +158,19 @@ class PoolDenseConnector(AbstractConnector):
             raise SynapticConfigurationException(
                 f"Unknown weights ({self.__weights})")
 
+    def __get_slice_weights(
+            self, pre_shape: Tuple[int, ...], post_shape: Tuple[int, ...],
+            post_vertex_slice: Slice) -> NDArray[float64]:
+        weights = self.__decode_weights(
+            pre_shape, post_shape, post_vertex_slice)
+
+        # Divide weights by pooling area if needed
+        if self.__pool_shape is not None:
+            shape = self.__to_nd_shape(self.__pool_shape, len(pre_shape), "")
+            area = numpy.prod(shape)
+            weights = weights / area
+        return weights
+
     @staticmethod
     def __to_nd_shape_or_none(
             shape: Optional[Union[int, Tuple[int, ...]]], n_dims: int,
@@ -341,16 +355,10 @@ class PoolDenseConnector(AbstractConnector):
                 [get_div_const(1) for _ in range(n_dims)], dtype=uint32))
 
         # Work out which weights are for this connection
-        weights = self.__decode_weights(
+        weights = self.__get_slice_weights(
             app_edge.pre_vertex.atoms_shape, app_edge.post_vertex.atoms_shape,
             post_vertex_slice)
 
-        # Divide weights by pooling area if needed
-        if self.__pool_shape is not None:
-            shape = self.__to_nd_shape(self.__pool_shape, n_dims, "")
-            area = numpy.prod(shape)
-            weights = weights / area
-
         # Encode weights with weight scaling
         if len(weights) % 2 != 0:
             weights = numpy.concatenate((weights, numpy.zeros(1)))
@@ -360,3 +368,79 @@ class PoolDenseConnector(AbstractConnector):
         weights[pos_weights] *= weight_scales[pos_synapse_type]
         all_data.append(numpy.round(weights).astype(uint16).view(uint32))
         return numpy.concatenate(all_data)
+
+    def expand_connections(
+            self, synapse_info: SynapseInformation, post_vertex_slice: Slice,
+            weight_scales: Optional[NDArray[floating]] = None,
+            pre_indices: Optional[NDArray[integer]] = None,
+            chunk_size: int = EXPAND_CHUNK_SIZE) -> Iterator[NDArray]:
+        """
+        Expand the weights into the connections that they make to a slice of
+        the post-population, following the same rules as the machine.
+        Negative weights are kept negative, with the synapse type of the
+        negative receptor.
+
+        :param SynapseInformation synapse_info: The projection to expand
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The post-neurons to expand the connections to
+        :param weight_scales:
+            The weight scales of the post-neurons; if given the weights are
+            rounded as they are when written to the machine, and any that
+            round to 0 are left out, as the machine ignores them
+        :type weight_scales: ~numpy.ndarray or None
+        :param ~numpy.ndarray pre_indices:
+            The pre-neurons to expand the connections of, or `None` for all
+        :param int chunk_size: How many pre-neurons to expand at once
+        :return:
+            The connections of each chunk of pre-neurons, with targets
+            relative to the slice, each with dtype
+            :py:attr:`~.AbstractConnector.NUMPY_SYNAPSES_DTYPE`
+        :rtype: iterable(~numpy.ndarray)
+        """
+        pre_shape = synapse_info.pre_vertex.atoms_shape
+        n_dims = len(pre_shape)
+        if pre_indices is None:
+            pre_indices = numpy.arange(synapse_info.n_pre_neurons)
+        delay = self.__delay(synapse_info)
+
+        pos_synapse_type = synapse_info.post_vertex.get_synapse_id_by_target(
+            self.__positive_receptor_type)
+        neg_synapse_type = synapse_info.post_vertex.get_synapse_id_by_target(
+            self.__negative_receptor_type)
+        weights = self.__get_slice_weights(
+            pre_shape, synapse_info.post_vertex.atoms_shape, post_vertex_slice)
+        if weight_scales is not None:
+            weights = get_machine_weights(
+                weights, pos_synapse_type, neg_synapse_type, weight_scales)
+
+        # The machine has a row of weights for each position after pooling,
+        # with the last dimension changing fastest, and a weight in each row
+        # for each post-neuron in the slice
+        weights = weights.reshape(-1, post_vertex_slice.n_atoms)
+        pooled_shape = tuple(self.__get_pre_in_post_shape(pre_shape))
+        stride = numpy.ones(n_dims, dtype=int)
+        if self.__pool_stride is not None:
+            stride = self.__to_nd_shape(
+                self.__pool_stride, n_dims, "pool_stride")
+
+        for first in range(0, len(pre_indices), chunk_size):
+            pre_ids = pre_indices[first:first + chunk_size]
+            pooled = numpy.array(numpy.unravel_index(
+                pre_ids, pre_shape, order="F")) // stride[:, None]
+
+            # Neurons past the last whole pooling area have no weights
+            in_pool = numpy.all(
+                pooled < numpy.array(pooled_shape)[:, None], axis=0)
+            rows = numpy.ravel_multi_index(
+                tuple(pooled[:, in_pool]), pooled_shape)
+            sources, targets = numpy.nonzero(weights[rows])
+
+            block = numpy.zeros(
+                len(sources), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+            block["source"] = pre_ids[in_pool][sources]
+            block["target"] = targets
+            block["weight"] = weights[rows[sources], targets]
+            block["delay"] = delay
+            block["synapse_type"] = numpy.where(
+                block["weight"] < 0, neg_synapse_type, pos_synapse_type)
+            yield block
@@ -98,6 +98,10 @@ class SmallWorldConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
                 "n_connections is not implemented for"
                 " SmallWorldConnector on this platform")
 
+    @overrides(AbstractConnector._get_rngs)
+    def _get_rngs(self) -> Sequence[NumpyRNG]:
+        return [self.__rng]
+
     @overrides(AbstractConnector.set_projection_information)
     def set_projection_information(self, synapse_info: SynapseInformation):
         super().set_projection_information(synapse_info)
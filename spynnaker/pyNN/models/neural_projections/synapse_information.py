@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from __future__ import annotations
-from typing import List, Sequence, TYPE_CHECKING, Union
+from typing import List, Optional, Sequence, TYPE_CHECKING, Union
 from spinn_utilities.config_holder import get_config_bool
 from pacman.model.graphs.application import ApplicationVertex
 from spynnaker.pyNN.models.neural_projections.connectors import (
@@ -46,7 +46,8 @@ class SynapseInformation(object):
         "__weights",
         "__delays",
         "__pre_run_connection_holders",
-        "__synapse_type_from_dynamics")
+        "__synapse_type_from_dynamics",
+        "__delay_maximum")
 
     def __init__(self, connector: AbstractConnector,
                  pre_population: Union[Population, PopulationView],
@@ -95,6 +96,9 @@ class SynapseInformation(object):
         # Make a list of holders to be updated
         self.__pre_run_connection_holders: List[ConnectionHolder] = list()
 
+        # The maximum delay, once worked out
+        self.__delay_maximum: Optional[float] = None
+
     @property
     def connector(self) -> AbstractConnector:
         """
@@ -226,6 +230,26 @@ class SynapseInformation(object):
         """
         return self.__delays
 
+    def get_delay_maximum(self) -> float:
+        """
+        Get the maximum delay of the synapses, as given by the synapse
+        dynamics and connector.  This is worked out once and then remembered
+        until :py:meth:`clear_delay_maximum` is called.
+
+        :rtype: float
+        """
+        if self.__delay_maximum is None:
+            self.__delay_maximum = self.__synapse_dynamics.get_delay_maximum(
+                self.__connector, self)
+        return self.__delay_maximum
+
+    def clear_delay_maximum(self) -> None:
+        """
+        Forget the maximum delay, so that it is worked out again when next
+        needed.
+        """
+        self.__delay_maximum = None
+
     def may_generate_on_machine(self) -> bool:
         """
         Do we describe a collection of synapses whose synaptic matrix may
@@ -238,8 +262,11 @@ class SynapseInformation(object):
             may have already been so done)
         :rtype: bool
         """
-        # If we are using a virtual machine, we can't generate on the machine
-        if get_config_bool("Machine", "virtual_board"):
+        # If we are using a virtual machine, we can't generate on the machine,
+        # unless the synapse expander is to be emulated
+        if (get_config_bool("Machine", "virtual_board") and
+                not get_config_bool(
+                    "Simulation", "emulate_synapse_expander")):
             return False
         connector_gen = (
             isinstance(self.connector, AbstractGenerateConnectorOnMachine) and
@@ -14,6 +14,7 @@
 
 from .abstract_population_vertex import AbstractPopulationVertex
 from .connection_holder import ConnectionHolder
+from .connection_statistics import ConnectionStatistics
 from .population_machine_vertex import (
     PopulationMachineVertex, SpikeProcessingProvenance)
 from .population_neurons_machine_vertex import PopulationNeuronsMachineVertex
@@ -33,6 +34,7 @@ from .population_machine_local_only_combined_vertex import (
 
 __all__ = ["AbstractPopulationVertex", "AbstractPyNNNeuronModel",
            "AbstractPyNNNeuronModelStandard", "ConnectionHolder",
+           "ConnectionStatistics",
            "PopulationMachineVertex", "PopulationNeuronsMachineVertex",
            "NeuronProvenance", "PopulationSynapsesMachineVertexCommon",
            "PopulationSynapsesMachineVertexLead", "NeuronRegions",
@@ -22,6 +22,7 @@ from typing import (
     cast, TYPE_CHECKING)
 
 import numpy
+from numpy import integer
 from numpy.typing import NDArray
 from scipy import special  # @UnresolvedImport
 from typing_extensions import TypeGuard
@@ -40,6 +41,7 @@ from spinn_utilities.ranged.abstract_list import Selector
 
 from pacman.exceptions import PacmanConfigurationException
 from pacman.model.graphs.common import Slice
+from pacman.model.placements import Placement
 from pacman.model.resources import AbstractSDRAM, MultiRegionSDRAM
 from pacman.utilities.utility_calls import get_n_bits
 
@@ -76,8 +78,8 @@ from spynnaker.pyNN.models.neuron.population_machine_neurons import (
     NeuronRegions)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamics, AbstractSynapseDynamicsStructural,
-    AbstractSDRAMSynapseDynamics, AbstractSupportsSignedWeights,
-    SynapseDynamicsStatic)
+    AbstractPlasticSynapseDynamics, AbstractSDRAMSynapseDynamics,
+    AbstractSupportsSignedWeights, SynapseDynamicsStatic)
 from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
     NUMPY_CONNECTORS_DTYPE)
 from spynnaker.pyNN.models.spike_source import SpikeSourcePoissonVertex
@@ -88,9 +90,10 @@ from spynnaker.pyNN.utilities.constants import (
     POSSION_SIGMA_SUMMATION_LIMIT)
 from spynnaker.pyNN.utilities.utility_calls import (
     create_mars_kiss_seeds, check_rng)
-from spynnaker.pyNN.utilities.running_stats import RunningStats
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
 from spynnaker.pyNN.utilities.struct import StructRepeat
 
+from .connection_statistics import ConnectionStatistics
 from .generator_data import GeneratorData
 from .master_pop_table import MasterPopTableAsBinarySearch
 from .population_machine_neurons import PopulationMachineNeurons
@@ -117,6 +120,10 @@ logger = FormatAdapter(logging.getLogger(__name__))
 _NEURON_BASE_DTCM_USAGE_IN_BYTES = 9 * BYTES_PER_WORD
 _NEURON_BASE_N_CPU_CYCLES_PER_NEURON = 22
 _NEURON_BASE_N_CPU_CYCLES = 10
+_NEURON_N_CPU_CYCLES_PER_PARAM_WORD = 4
+_SYNAPSE_N_CPU_CYCLES_PER_ROW = 150
+_SYNAPSE_N_CPU_CYCLES_PER_STATIC_EVENT = 16
+_SYNAPSE_N_CPU_CYCLES_PER_PLASTIC_EVENT = 64
 
 _NEURON_GENERATOR_BASE_SDRAM = 12 * BYTES_PER_WORD
 _NEURON_GENERATOR_PER_STRUCT = 4 * BYTES_PER_WORD
@@ -132,6 +139,10 @@ _NEURON_GENERATOR_PER_ITEM = (2 * BYTES_PER_WORD) + MAX_PARAMS_BYTES
 # 1 for incoming spike buffer size
 _SYNAPSES_BASE_SDRAM_USAGE_IN_BYTES = 7 * BYTES_PER_WORD
 
+# The number of pre-neurons whose rows are read at a time when gathering
+# statistics of connections, which limits the memory used
+_N_PRE_NEURONS_PER_STATISTICS_READ = 1024
+
 _EXTRA_RECORDABLE_UNITS = {NeuronRecorder.SPIKES: "",
                            NeuronRecorder.PACKETS: "",
                            NeuronRecorder.REWIRING: ""}
@@ -222,6 +233,7 @@ class AbstractPopulationVertex(
         "__read_initial_values",
         "__have_read_initial_values",
         "__last_parameter_read_time",
+        "__auto_max_atoms_per_core",
         "__n_colour_bits")
 
     #: recording region IDs
@@ -310,10 +322,11 @@ class AbstractPopulationVertex(
 
         self.__neuron_impl = neuron_impl
         self.__pynn_model = pynn_model
-        self.__parameters: RangeDictionary[float] = RangeDictionary(n_neurons)
+        self.__parameters: RangeDictionary[float] = \
+            SpynnakerRangeDictionary(n_neurons)
         self.__neuron_impl.add_parameters(self.__parameters)
         self.__initial_state_variables: RangeDictionary[float] = \
-            RangeDictionary(n_neurons)
+            SpynnakerRangeDictionary(n_neurons)
         self.__neuron_impl.add_state_variables(self.__initial_state_variables)
         self.__state_variables = self.__initial_state_variables.copy()
         if n_colour_bits is None:
@@ -375,6 +388,9 @@ class AbstractPopulationVertex(
         self.__have_read_initial_values = False
         self.__last_parameter_read_time: Optional[float] = None
 
+        # A limit on the atoms per core chosen by auto-tuning, if any
+        self.__auto_max_atoms_per_core: Optional[int] = None
+
     @property  # type: ignore[override]
     @overrides(PopulationApplicationVertex.splitter)
     def splitter(self) -> SplitterAbstractPopulationVertex:
@@ -405,12 +421,51 @@ class AbstractPopulationVertex(
 
     @overrides(PopulationApplicationVertex.get_max_atoms_per_core)
     def get_max_atoms_per_core(self) -> int:
+        max_atoms = self.get_user_max_atoms_per_core()
+        if self.__auto_max_atoms_per_core is not None:
+            max_atoms = min(max_atoms, self.__auto_max_atoms_per_core)
+        return max_atoms
+
+    def get_user_max_atoms_per_core(self) -> int:
+        """
+        Get the maximum number of atoms per core as set by the user or the
+        model defaults, ignoring any value chosen by auto-tuning.
+
+        :rtype: int
+        """
         max_atoms = super().get_max_atoms_per_core()
 
         # Dynamically adjust depending on the needs of the synapse dynamics
         return min(
             max_atoms, self.__synapse_dynamics.absolute_max_atoms_per_core)
 
+    @property
+    def auto_max_atoms_per_core(self) -> Optional[int]:
+        """
+        The limit on the number of atoms per core chosen by auto-tuning,
+        or `None` if not tuned.
+
+        :rtype: int or None
+        """
+        return self.__auto_max_atoms_per_core
+
+    def set_auto_max_atoms_per_core(self, max_atoms: Optional[int]):
+        """
+        Set (or clear with `None`) the limit on the number of atoms per
+        core chosen by auto-tuning.
+
+        .. note::
+            The splitter must also be reset after this is called, as it may
+            have cached values computed from the old limit.
+
+        :param max_atoms: The new limit
+        :type max_atoms: int or None
+        """
+        self.__auto_max_atoms_per_core = max_atoms
+        # The row information depends on the delay stages, which depend on
+        # the number of atoms per core
+        self.__max_row_info.clear()
+
     @overrides(
         PopulationApplicationVertex.get_max_atoms_per_dimension_per_core)
     def get_max_atoms_per_dimension_per_core(self) -> Tuple[int, ...]:
@@ -744,20 +799,24 @@ class AbstractPopulationVertex(
             return
 
         self.__last_parameter_read_time = current_time
-        for m_vertex in self.machine_vertices:
-            placement = SpynnakerDataView.get_placement_of_vertex(m_vertex)
-            if isinstance(m_vertex, PopulationMachineNeurons):
-                m_vertex.read_parameters_from_machine(placement)
+        PopulationMachineNeurons.read_all_parameters_from_machine(
+            self.__neuron_placements())
 
     def __read_initial_parameters_now(self) -> None:
         # If we already read the initial parameters, don't do it again
         if self.__have_read_initial_values:
             return
 
-        for m_vertex in self.machine_vertices:
-            placement = SpynnakerDataView.get_placement_of_vertex(m_vertex)
-            if isinstance(m_vertex, PopulationMachineNeurons):
-                m_vertex.read_initial_parameters_from_machine(placement)
+        PopulationMachineNeurons.read_all_initial_parameters_from_machine(
+            self.__neuron_placements())
+
+    def __neuron_placements(self) -> List[Placement]:
+        """
+        Get the placements of the machine vertices that hold neurons.
+        """
+        return [SpynnakerDataView.get_placement_of_vertex(m_vertex)
+                for m_vertex in self.machine_vertices
+                if isinstance(m_vertex, PopulationMachineNeurons)]
 
     def __read_parameter(
             self, name: str, selector: Selector = None) -> Sequence[float]:
@@ -783,7 +842,7 @@ class AbstractPopulationVertex(
         # then make this a waste, but we can't see the future...
         if SpynnakerDataView.is_ran_last():
             self.__read_parameters_now()
-            self.__tell_neuron_vertices_to_regenerate()
+            self.__tell_neuron_vertices_to_regenerate(selector)
         self.__parameters[name].set_value_by_selector(selector, value)
 
     @overrides(PopulationApplicationVertex.get_parameters)
@@ -843,7 +902,7 @@ class AbstractPopulationVertex(
         # then make this a waste, but we can't see the future...
         if SpynnakerDataView.is_ran_last():
             self.__read_parameters_now()
-            self.__tell_neuron_vertices_to_regenerate()
+            self.__tell_neuron_vertices_to_regenerate(selector)
         self.__state_variables[name].set_value_by_selector(
             selector, value)
 
@@ -984,11 +1043,21 @@ class AbstractPopulationVertex(
         """
         self.synapse_dynamics = synapse_dynamics
 
-    def clear_connection_cache(self) -> None:
+    def clear_connection_cache(
+            self, synapse_info: Optional[SynapseInformation] = None) -> None:
         """
         Flush the cache of connection information; needed for a second run.
+
+        :param SynapseInformation synapse_info:
+            The projection to flush the connections of, or `None` to flush
+            all of them
         """
-        self.__connection_cache.clear()
+        if synapse_info is None:
+            self.__connection_cache.clear()
+            return
+        for key in [key for key in self.__connection_cache
+                    if key[1] is synapse_info]:
+            del self.__connection_cache[key]
 
     def describe(self):
         """
@@ -1166,10 +1235,7 @@ class AbstractPopulationVertex(
                 continue
             stats.add_projection(proj)
 
-        n_synapse_types = self.__neuron_impl.get_n_synapse_types()
-        max_weights = numpy.zeros(n_synapse_types)
-        for synapse_type in range(n_synapse_types):
-            max_weights[synapse_type] = stats.get_max_weight(synapse_type)
+        max_weights = stats.get_max_weights()
 
         # Convert these to powers; we could use int.bit_length() for this if
         # they were integers, but they aren't...
@@ -1216,10 +1282,16 @@ class AbstractPopulationVertex(
     @overrides(AbstractAcceptsIncomingSynapses.get_connections_from_machine)
     def get_connections_from_machine(
             self, app_edge: ProjectionApplicationEdge,
-            synapse_info: SynapseInformation) -> ConnectionsArray:
+            synapse_info: SynapseInformation,
+            pre_indices: Optional[NDArray[integer]] = None
+            ) -> ConnectionsArray:
         # If we already have connections cached, return them
         if (app_edge, synapse_info) in self.__connection_cache:
-            return self.__connection_cache[app_edge, synapse_info]
+            connections = self.__connection_cache[app_edge, synapse_info]
+            if pre_indices is None:
+                return connections
+            return connections[
+                numpy.isin(connections["source"], pre_indices)]
 
         # Start with something in the list so that concatenate works
         connections = [numpy.zeros(0, dtype=NUMPY_CONNECTORS_DTYPE)]
@@ -1231,11 +1303,93 @@ class AbstractPopulationVertex(
             placement = SpynnakerDataView.get_placement_of_vertex(post_vertex)
             if isinstance(post_vertex, HasSynapses):
                 connections.extend(post_vertex.get_connections_from_machine(
-                    placement, app_edge, synapse_info))
+                    placement, app_edge, synapse_info, pre_indices))
         all_connections = numpy.concatenate(connections)
-        self.__connection_cache[app_edge, synapse_info] = all_connections
+
+        # Only the connections of all the pre-neurons are kept
+        if pre_indices is None:
+            self.__connection_cache[app_edge, synapse_info] = all_connections
         return all_connections
 
+    def add_connection_statistics(
+            self, app_edge: ProjectionApplicationEdge,
+            synapse_info: SynapseInformation,
+            statistics: ConnectionStatistics) -> None:
+        """
+        Add the connections of an incoming projection on the machine to
+        statistics.  The rows of the synaptic matrices are read a block of
+        pre-neurons at a time, so the connections are never all held at
+        once.
+
+        :param ProjectionApplicationEdge app_edge:
+            The edge of the projection
+        :param SynapseInformation synapse_info:
+            The specific projection within the edge
+        :param ConnectionStatistics statistics:
+            The statistics to add the connections to
+        """
+        if (app_edge, synapse_info) in self.__connection_cache:
+            statistics.add_connections(
+                self.__connection_cache[app_edge, synapse_info])
+            return
+
+        n_pre_atoms = app_edge.pre_vertex.n_atoms
+        progress = ProgressBar(
+            len(self.machine_vertices),
+            f"Getting statistics of synapses between "
+            f"{app_edge.pre_vertex.label} and {app_edge.post_vertex.label}")
+        for post_vertex in progress.over(self.machine_vertices):
+            if not isinstance(post_vertex, HasSynapses):
+                continue
+            placement = SpynnakerDataView.get_placement_of_vertex(post_vertex)
+            for first in range(
+                    0, n_pre_atoms, _N_PRE_NEURONS_PER_STATISTICS_READ):
+                pre_indices = numpy.arange(first, min(
+                    first + _N_PRE_NEURONS_PER_STATISTICS_READ, n_pre_atoms))
+                for connections in post_vertex.get_connections_from_machine(
+                        placement, app_edge, synapse_info, pre_indices):
+                    statistics.add_connections(connections)
+
+    def set_connections_on_machine(
+            self, app_edge: ProjectionApplicationEdge,
+            synapse_info: SynapseInformation, connections: ConnectionsArray,
+            new_connections: ConnectionsArray) -> None:
+        """
+        Change the weights and/or delays of the connections of an incoming
+        projection, rewriting only the rows of the synaptic matrices that
+        change.  Every core is checked before any is written, so nothing is
+        changed if the new values don't fit.  The connections are read from
+        the machine again the next time they are asked for, as the machine
+        may round the values.
+
+        :param ProjectionApplicationEdge app_edge:
+            The edge of the projection
+        :param SynapseInformation synapse_info:
+            The specific projection within the edge
+        :param ~numpy.ndarray connections:
+            The connections of the projection as they are now
+        :param ~numpy.ndarray new_connections:
+            The same connections in the same order, with the new weights
+            and/or delays
+        :raises RemapRequiredException:
+            If the new values don't fit in the space the synaptic matrices
+            were given when the network was mapped
+        """
+        changes = [
+            (m_vertex, m_vertex.get_changed_rows(
+                app_edge, synapse_info, connections, new_connections))
+            for m_vertex in self.machine_vertices
+            if isinstance(m_vertex, HasSynapses)]
+
+        # There is nothing to write to on a virtual board
+        if not get_config_bool("Machine", "virtual_board"):
+            for m_vertex, changed_rows in changes:
+                if changed_rows:
+                    m_vertex.write_changed_rows(
+                        SpynnakerDataView.get_placement_of_vertex(m_vertex),
+                        changed_rows)
+        self.__connection_cache.pop((app_edge, synapse_info), None)
+
     def get_synapse_params_size(self) -> int:
         """
         Get the size of the synapse parameters, in bytes.
@@ -1353,6 +1507,67 @@ class AbstractPopulationVertex(
         self.__max_row_info[key] = max_row_info
         return max_row_info
 
+    def get_neuron_cpu_cycles(self, n_atoms: int) -> float:
+        """
+        Estimate the CPU cycles used per timestep to update the neurons
+        on a core.
+
+        :param int n_atoms: The number of atoms on the core
+        :rtype: float
+        """
+        n_param_words = (
+            self.get_sdram_usage_for_neuron_params(n_atoms) / BYTES_PER_WORD)
+        n_recorded = len(list(self.__neuron_recorder.recording_variables))
+        # pylint: disable=protected-access
+        return (
+            self._NEURON_BASE_N_CPU_CYCLES +
+            n_atoms * self._NEURON_BASE_N_CPU_CYCLES_PER_NEURON +
+            n_param_words * _NEURON_N_CPU_CYCLES_PER_PARAM_WORD +
+            n_atoms * n_recorded *
+            NeuronRecorder._N_CPU_CYCLES_PER_NEURON)
+
+    def get_synapse_cpu_cycles(self, n_atoms: int) -> float:
+        """
+        Estimate the CPU cycles used per timestep to process incoming spikes
+        on a core, from the fan-in and expected spike rate of each incoming
+        projection.
+
+        :param int n_atoms: The number of atoms on the core
+        :rtype: float
+        """
+        steps_per_second = SpynnakerDataView.get_simulation_time_step_per_s()
+        cycles = float(
+            self._SYNAPSE_BASE_N_CPU_CYCLES +
+            n_atoms * self._SYNAPSE_BASE_N_CPU_CYCLES_PER_NEURON)
+        for proj in self.incoming_projections:
+            # pylint: disable=protected-access
+            s_info = proj._synapse_information
+            pre_vertex = proj._projection_edge.pre_vertex
+            spikes_per_step = (
+                self.__pre_spikes_per_second(pre_vertex) / steps_per_second)
+            connector = s_info.connector
+            n_conns = connector.get_n_connections_to_post_vertex_maximum(
+                s_info)
+            n_events = n_atoms * n_conns * spikes_per_step
+            # Every row is at least one event, so there can't be more rows
+            n_rows = min(pre_vertex.n_atoms * spikes_per_step, n_events)
+            if isinstance(s_info.synapse_dynamics,
+                          AbstractPlasticSynapseDynamics):
+                per_event = _SYNAPSE_N_CPU_CYCLES_PER_PLASTIC_EVENT
+            else:
+                per_event = _SYNAPSE_N_CPU_CYCLES_PER_STATIC_EVENT
+            cycles += (
+                n_rows * _SYNAPSE_N_CPU_CYCLES_PER_ROW + n_events * per_event)
+        return cycles
+
+    def __pre_spikes_per_second(
+            self, pre_vertex: PopulationApplicationVertex) -> float:
+        if isinstance(pre_vertex, AbstractMaxSpikes):
+            rate = pre_vertex.max_spikes_per_second()
+            if rate > 0:
+                return rate
+        return self.__spikes_per_second
+
     def get_synapse_expander_size(self) -> int:
         """
         Get the size of the synapse expander region, in bytes.
@@ -1599,8 +1814,11 @@ class AbstractPopulationVertex(
         """
         return self.__read_initial_values
 
-    def __tell_neuron_vertices_to_regenerate(self) -> None:
-        for vertex in self.machine_vertices:
+    def __tell_neuron_vertices_to_regenerate(
+            self, selector: Selector = None) -> None:
+        # Only the cores with changed neurons are rewritten; the rest will
+        # still have the same state on the machine
+        for vertex in self._get_machine_vertices_for_selector(selector):
             if isinstance(vertex, PopulationMachineNeurons):
                 vertex.set_do_neuron_regeneration()
 
@@ -1626,9 +1844,7 @@ class AbstractPopulationVertex(
         max_delay_ms = 0
         for proj in self.incoming_projections:
             # pylint: disable=protected-access
-            s_info = proj._synapse_information
-            proj_max_delay = s_info.synapse_dynamics.get_delay_maximum(
-                s_info.connector, s_info)
+            proj_max_delay = proj._synapse_information.get_delay_maximum()
             max_delay_ms = max(max_delay_ms, proj_max_delay)
         max_delay_steps = math.ceil(
             max_delay_ms / SpynnakerDataView.get_simulation_time_step_ms())
@@ -1675,16 +1891,15 @@ class AbstractPopulationVertex(
 class _Stats(object):
     """
     Object to keep hold of and process statistics for ring buffer scaling.
+
+    The details of each projection are kept and then combined for all the
+    synapse types at once when the maximum weights are requested.
     """
     __slots__ = (
         "w_scale",
         "w_scale_sq",
         "n_synapse_types",
-        "running_totals",
-        "delay_running_totals",
-        "total_weights",
-        "biggest_weight",
-        "rate_stats",
+        "details",
         "steps_per_second",
         "default_spikes_per_second",
         "ring_buffer_sigma")
@@ -1694,15 +1909,13 @@ class _Stats(object):
             default_spikes_per_second: float, ring_buffer_sigma: float):
         self.w_scale = neuron_impl.get_global_weight_scale()
         self.w_scale_sq = self.w_scale ** 2
-        n_synapse_types = neuron_impl.get_n_synapse_types()
+        self.n_synapse_types = neuron_impl.get_n_synapse_types()
 
-        self.running_totals = [
-            RunningStats() for _ in range(n_synapse_types)]
-        self.delay_running_totals = [
-            RunningStats() for _ in range(n_synapse_types)]
-        self.total_weights = numpy.zeros(n_synapse_types)
-        self.biggest_weight = numpy.zeros(n_synapse_types, dtype=numpy.double)
-        self.rate_stats = [RunningStats() for _ in range(n_synapse_types)]
+        # (synapse type, n connections, weight mean, weight variance,
+        #  weight maximum, delay variance, spikes per tick,
+        #  spikes per second) for each projection and sign
+        self.details: List[Tuple[
+            int, int, float, float, float, float, float, float]] = list()
 
         self.steps_per_second = (
             SpynnakerDataView.get_simulation_time_step_per_s())
@@ -1763,15 +1976,10 @@ class _Stats(object):
     def __add_details(
             self, proj: Projection, s_type: int, n_conns: int, w_mean: float,
             w_var: float, w_max: float, d_var: float):
-        self.running_totals[s_type].add_items(
-            w_mean * self.w_scale, w_var * self.w_scale_sq, n_conns)
-        self.biggest_weight[s_type] = max(
-            self.biggest_weight[s_type], w_max * self.w_scale)
-        self.delay_running_totals[s_type].add_items(0.0, d_var, n_conns)
-
         spikes_per_tick, spikes_per_second = self.__pre_spike_stats(proj)
-        self.rate_stats[s_type].add_items(spikes_per_second, 0, n_conns)
-        self.total_weights[s_type] += spikes_per_tick * (w_max * n_conns)
+        self.details.append((
+            s_type, n_conns, w_mean, w_var, w_max, d_var, spikes_per_tick,
+            spikes_per_second))
 
     def __pre_spike_stats(self, proj: Projection) -> Tuple[float, float]:
         spikes_per_tick = max(
@@ -1786,22 +1994,66 @@ class _Stats(object):
             spikes_per_tick = pre_vertex.max_spikes_per_ts()
         return spikes_per_tick, spikes_per_second
 
-    def get_max_weight(self, s_type: int) -> float:
-        """
-        Get the max weight.
-
-        :param int s_type: synapse_type
-        :rtype: float
-        """
-        if self.delay_running_totals[s_type].variance == 0.0:
-            return max(self.total_weights[s_type], self.biggest_weight[s_type])
-
-        stats = self.running_totals[s_type]
-        rates = self.rate_stats[s_type]
-        # pylint: disable=protected-access
-        w_max = AbstractPopulationVertex._ring_buffer_expected_upper_bound(
-            stats.mean, stats.standard_deviation, rates.mean,
-            stats.n_items, self.ring_buffer_sigma)
-        w_max = min(w_max, self.total_weights[s_type])
-        w_max = max(w_max, self.biggest_weight[s_type])
-        return w_max
+    def __sum(self, s_types: NDArray[numpy.integer],
+              values: NDArray[numpy.floating]) -> NDArray[numpy.floating]:
+        """
+        Sum values by synapse type.
+        """
+        return numpy.bincount(
+            s_types, weights=values, minlength=self.n_synapse_types)
+
+    def get_max_weights(self) -> NDArray[numpy.floating]:
+        """
+        Get the max weight of each synapse type.
+
+        :rtype: ~numpy.ndarray
+        """
+        max_weights = numpy.zeros(self.n_synapse_types)
+        if not self.details:
+            return max_weights
+        (s_types, n_conns, w_means, w_vars, w_maxs, d_vars, spikes_per_tick,
+         spikes_per_second) = (
+            numpy.array(column) for column in zip(*self.details))
+        s_types = s_types.astype(numpy.intp)
+        n_conns = n_conns.astype(numpy.double)
+
+        # Projections with no connections only count towards the totals
+        counted = n_conns > 0
+        n_items = self.__sum(s_types[counted], n_conns[counted])
+        w_means = w_means[counted] * self.w_scale
+        w_vars = w_vars[counted] * self.w_scale_sq
+        safe_n_items = numpy.where(n_items > 0, n_items, 1.0)
+
+        # Combine the means and variances of all the projections
+        mean = self.__sum(
+            s_types[counted], n_conns[counted] * w_means) / safe_n_items
+        deltas = w_means - mean[s_types[counted]]
+        mean_2 = self.__sum(
+            s_types[counted],
+            w_vars * (n_conns[counted] - 1.0) +
+            n_conns[counted] * deltas * deltas)
+        variance = numpy.where(
+            n_items > 1, mean_2 / numpy.maximum(n_items - 1.0, 1.0), 0.0)
+        delay_variance = self.__sum(
+            s_types[counted], d_vars[counted] * (n_conns[counted] - 1.0))
+        rate_mean = self.__sum(
+            s_types[counted],
+            n_conns[counted] * spikes_per_second[counted]) / safe_n_items
+
+        total_weights = self.__sum(
+            s_types, spikes_per_tick * w_maxs * n_conns)
+        biggest_weights = numpy.zeros(self.n_synapse_types)
+        numpy.maximum.at(biggest_weights, s_types, w_maxs * self.w_scale)
+
+        for s_type in range(self.n_synapse_types):
+            if n_items[s_type] <= 1 or delay_variance[s_type] == 0.0:
+                max_weights[s_type] = max(
+                    total_weights[s_type], biggest_weights[s_type])
+                continue
+            # pylint: disable=protected-access
+            w_max = AbstractPopulationVertex._ring_buffer_expected_upper_bound(
+                mean[s_type], math.sqrt(variance[s_type]), rate_mean[s_type],
+                int(n_items[s_type]), self.ring_buffer_sigma)
+            w_max = min(w_max, total_weights[s_type])
+            max_weights[s_type] = max(w_max, biggest_weights[s_type])
+        return max_weights
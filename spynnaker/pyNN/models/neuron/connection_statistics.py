@@ -0,0 +1,223 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional, Sequence, Tuple
+
+import numpy
+from numpy import floating, int64
+from numpy.typing import NDArray
+
+from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
+    ConnectionsArray)
+
+
+class ConnectionStatistics(object):
+    """
+    Statistics of the connections of a projection, gathered a block of
+    connections at a time so that the connections are never all held at
+    once.
+    """
+
+    __slots__ = (
+        # The number of connections added
+        "__n_connections",
+
+        # The sum, minimum and maximum of the weights added
+        "__weight_sum",
+        "__weight_min",
+        "__weight_max",
+
+        # The sum, minimum and maximum of the delays added
+        "__delay_sum",
+        "__delay_min",
+        "__delay_max",
+
+        # The edges of the bins of the histograms, or None if not wanted
+        "__weight_bins",
+        "__delay_bins",
+
+        # The counts of each bin of the histograms
+        "__weight_counts",
+        "__delay_counts",
+
+        # The number of connections to each post-neuron
+        "__in_degree")
+
+    def __init__(
+            self, n_post_atoms: int,
+            weight_bins: Optional[Sequence[float]] = None,
+            delay_bins: Optional[Sequence[float]] = None):
+        """
+        :param int n_post_atoms: The number of atoms in the post-vertex
+        :param weight_bins:
+            The edges of the bins of the weight histogram, or `None` for no
+            weight histogram
+        :type weight_bins: list(float) or None
+        :param delay_bins:
+            The edges of the bins of the delay histogram, or `None` for no
+            delay histogram
+        :type delay_bins: list(float) or None
+        """
+        self.__n_connections = 0
+        self.__weight_sum = 0.0
+        self.__weight_min = numpy.inf
+        self.__weight_max = -numpy.inf
+        self.__delay_sum = 0.0
+        self.__delay_min = numpy.inf
+        self.__delay_max = -numpy.inf
+        self.__weight_bins: Optional[NDArray[floating]] = None
+        self.__weight_counts: Optional[NDArray[int64]] = None
+        if weight_bins is not None:
+            self.__weight_bins = numpy.asarray(weight_bins, dtype=float)
+            self.__weight_counts = numpy.zeros(
+                len(self.__weight_bins) - 1, dtype=int64)
+        self.__delay_bins: Optional[NDArray[floating]] = None
+        self.__delay_counts: Optional[NDArray[int64]] = None
+        if delay_bins is not None:
+            self.__delay_bins = numpy.asarray(delay_bins, dtype=float)
+            self.__delay_counts = numpy.zeros(
+                len(self.__delay_bins) - 1, dtype=int64)
+        self.__in_degree = numpy.zeros(n_post_atoms, dtype=int64)
+
+    def add_connections(self, connections: ConnectionsArray):
+        """
+        Add a block of connections to the statistics.
+
+        :param ~numpy.ndarray connections:
+            The connections to add, as a numpy structured array with at least
+            target, weight and delay
+        """
+        if not len(connections):
+            return
+        weights = connections["weight"]
+        delays = connections["delay"]
+        self.__n_connections += len(connections)
+        self.__weight_sum += float(numpy.sum(weights))
+        self.__weight_min = min(self.__weight_min, float(weights.min()))
+        self.__weight_max = max(self.__weight_max, float(weights.max()))
+        self.__delay_sum += float(numpy.sum(delays))
+        self.__delay_min = min(self.__delay_min, float(delays.min()))
+        self.__delay_max = max(self.__delay_max, float(delays.max()))
+        if self.__weight_counts is not None:
+            self.__weight_counts += numpy.histogram(
+                weights, self.__weight_bins)[0]
+        if self.__delay_counts is not None:
+            self.__delay_counts += numpy.histogram(
+                delays, self.__delay_bins)[0]
+        self.__in_degree += numpy.bincount(
+            connections["target"], minlength=len(self.__in_degree))
+
+    @property
+    def n_connections(self) -> int:
+        """
+        The number of connections.
+
+        :rtype: int
+        """
+        return self.__n_connections
+
+    @property
+    def weight_min(self) -> float:
+        """
+        The smallest weight, or NaN if there are no connections.
+
+        :rtype: float
+        """
+        return self.__weight_min if self.__n_connections else numpy.nan
+
+    @property
+    def weight_max(self) -> float:
+        """
+        The largest weight, or NaN if there are no connections.
+
+        :rtype: float
+        """
+        return self.__weight_max if self.__n_connections else numpy.nan
+
+    @property
+    def weight_mean(self) -> float:
+        """
+        The mean weight, or NaN if there are no connections.
+
+        :rtype: float
+        """
+        if not self.__n_connections:
+            return numpy.nan
+        return self.__weight_sum / self.__n_connections
+
+    @property
+    def delay_min(self) -> float:
+        """
+        The smallest delay, or NaN if there are no connections.
+
+        :rtype: float
+        """
+        return self.__delay_min if self.__n_connections else numpy.nan
+
+    @property
+    def delay_max(self) -> float:
+        """
+        The largest delay, or NaN if there are no connections.
+
+        :rtype: float
+        """
+        return self.__delay_max if self.__n_connections else numpy.nan
+
+    @property
+    def delay_mean(self) -> float:
+        """
+        The mean delay, or NaN if there are no connections.
+
+        :rtype: float
+        """
+        if not self.__n_connections:
+            return numpy.nan
+        return self.__delay_sum / self.__n_connections
+
+    @property
+    def weight_histogram(self) -> Optional[
+            Tuple[NDArray[int64], NDArray[floating]]]:
+        """
+        The number of weights in each bin and the edges of the bins, as
+        :py:func:`numpy.histogram` returns them, or `None` if no bins were
+        given.
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray) or None
+        """
+        if self.__weight_counts is None or self.__weight_bins is None:
+            return None
+        return self.__weight_counts, self.__weight_bins
+
+    @property
+    def delay_histogram(self) -> Optional[
+            Tuple[NDArray[int64], NDArray[floating]]]:
+        """
+        The number of delays in each bin and the edges of the bins, as
+        :py:func:`numpy.histogram` returns them, or `None` if no bins were
+        given.
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray) or None
+        """
+        if self.__delay_counts is None or self.__delay_bins is None:
+            return None
+        return self.__delay_counts, self.__delay_bins
+
+    @property
+    def in_degree(self) -> NDArray[int64]:
+        """
+        The number of connections to each post-neuron.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__in_degree
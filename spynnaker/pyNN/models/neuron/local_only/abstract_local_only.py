@@ -12,21 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from typing import Iterable, TYPE_CHECKING
+from typing import Iterable, List, Optional, TYPE_CHECKING
 
-from numpy import floating
+import numpy
+from numpy import floating, integer
 from numpy.typing import NDArray
 
 from spinn_utilities.abstract_base import abstractmethod
 from spinn_utilities.overrides import overrides
+from pacman.model.graphs.common import Slice
 from spinn_front_end_common.interface.ds import DataSpecificationGenerator
 
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamics)
+from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
+    ConnectionsArray)
 from spynnaker.pyNN.types import Weight_Delay_In_Types
 
 if TYPE_CHECKING:
     from spynnaker.pyNN.models.projection import Projection
+    from spynnaker.pyNN.models.neural_projections import SynapseInformation
     from spynnaker.pyNN.models.neuron import (
         PopulationMachineLocalOnlyCombinedVertex)
 
@@ -76,6 +81,59 @@ class AbstractLocalOnly(AbstractSynapseDynamics):
         """
         raise NotImplementedError
 
+    def get_connections(
+            self, synapse_info: SynapseInformation, post_vertex_slice: Slice,
+            weight_scales: NDArray[floating],
+            pre_indices: Optional[NDArray[integer]] = None
+            ) -> List[ConnectionsArray]:
+        """
+        Get the connections of a projection to a slice of the post-vertex.
+        These are not stored on the machine, so they are worked out from the
+        connector in the same way as the machine does when spikes arrive.
+
+        :param SynapseInformation synapse_info: The projection
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex to get the connections to
+        :param list(float) weight_scales: Scale factors applied to the weights
+        :param ~numpy.ndarray pre_indices:
+            The indices of the pre-neurons to get the connections from, or
+            `None` for all of them
+        :return: A list of arrays of connections, each with dtype
+            :py:const:`~.NUMPY_CONNECTORS_DTYPE`
+        :rtype: list(~numpy.ndarray)
+        """
+        post_ids = numpy.asarray(post_vertex_slice.get_raster_ids())
+        connections: List[ConnectionsArray] = list()
+        for block in self._expand_connections(
+                synapse_info, post_vertex_slice, weight_scales, pre_indices):
+            conns = numpy.zeros(len(block), dtype=self.NUMPY_CONNECTORS_DTYPE)
+            conns["source"] = block["source"]
+            conns["target"] = post_ids[block["target"]]
+            conns["weight"] = block["weight"]
+            conns["delay"] = block["delay"]
+            connections.append(conns)
+        return connections
+
+    @abstractmethod
+    def _expand_connections(
+            self, synapse_info: SynapseInformation, post_vertex_slice: Slice,
+            weight_scales: NDArray[floating],
+            pre_indices: Optional[NDArray[integer]]) -> Iterable[NDArray]:
+        """
+        Expand the connector of a projection into blocks of connections to a
+        slice of the post-vertex.
+
+        :param SynapseInformation synapse_info: The projection
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex to get the connections to
+        :param list(float) weight_scales: Scale factors applied to the weights
+        :param ~numpy.ndarray pre_indices:
+            The indices of the pre-neurons to expand, or `None` for all
+        :return: Blocks of connections, with targets relative to the slice
+        :rtype: iterable(~numpy.ndarray)
+        """
+        raise NotImplementedError
+
     @property
     def absolute_max_atoms_per_core(self) -> int:
         """
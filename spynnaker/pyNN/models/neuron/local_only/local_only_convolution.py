@@ -14,15 +14,16 @@
 from __future__ import annotations
 from math import ceil
 from typing import (
-    Dict, Iterable, List, cast, TYPE_CHECKING)
+    Dict, Iterable, List, Optional, cast, TYPE_CHECKING)
 
 import numpy
-from numpy import floating, uint32
+from numpy import floating, integer, uint32
 from numpy.typing import NDArray
 
 from spinn_utilities.overrides import overrides
 
 from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import Slice
 
 from spinn_front_end_common.interface.ds import (
     DataType, DataSpecificationGenerator)
@@ -46,6 +47,7 @@ if TYPE_CHECKING:
     from spynnaker.pyNN.models.neuron.abstract_population_vertex import (
         AbstractPopulationVertex)
     from spynnaker.pyNN.models.projection import Projection
+    from spynnaker.pyNN.models.neural_projections import SynapseInformation
     from spynnaker.pyNN.models.neuron import (
         PopulationMachineLocalOnlyCombinedVertex)
     from spynnaker.pyNN.models.neuron.synapse_dynamics import (
@@ -272,6 +274,15 @@ class LocalOnlyConvolution(AbstractLocalOnly, AbstractSupportsSignedWeights):
         return cast(ConvolutionConnector,
                     projection._synapse_information.connector)
 
+    @overrides(AbstractLocalOnly._expand_connections)
+    def _expand_connections(
+            self, synapse_info: SynapseInformation, post_vertex_slice: Slice,
+            weight_scales: NDArray[floating],
+            pre_indices: Optional[NDArray[integer]]) -> Iterable[NDArray]:
+        conn = cast(ConvolutionConnector, synapse_info.connector)
+        return conn.expand_connections(
+            synapse_info, post_vertex_slice, weight_scales, pre_indices)
+
     @staticmethod
     def __get_synapse_type(proj: Projection, target: str) -> int:
         edge = proj._projection_edge  # pylint: disable=protected-access
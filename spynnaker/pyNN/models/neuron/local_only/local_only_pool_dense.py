@@ -14,15 +14,16 @@
 from __future__ import annotations
 from math import ceil
 from typing import (
-    Dict, List, Iterable, cast, TYPE_CHECKING)
+    Dict, List, Iterable, Optional, cast, TYPE_CHECKING)
 
 import numpy
-from numpy import floating, uint32
+from numpy import floating, integer, uint32
 from numpy.typing import NDArray
 
 from spinn_utilities.overrides import overrides
 
 from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import Slice
 
 from spinn_front_end_common.interface.ds import (
     DataType, DataSpecificationGenerator)
@@ -43,6 +44,7 @@ from .abstract_local_only import AbstractLocalOnly
 
 if TYPE_CHECKING:
     from spynnaker.pyNN.models.projection import Projection
+    from spynnaker.pyNN.models.neural_projections import SynapseInformation
     from spynnaker.pyNN.models.neuron import (
         PopulationMachineLocalOnlyCombinedVertex)
     from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
@@ -240,6 +242,15 @@ class LocalOnlyPoolDense(AbstractLocalOnly, AbstractSupportsSignedWeights):
             self.__cached_sources[app_vertex] = sources
         return sources
 
+    @overrides(AbstractLocalOnly._expand_connections)
+    def _expand_connections(
+            self, synapse_info: SynapseInformation, post_vertex_slice: Slice,
+            weight_scales: NDArray[floating],
+            pre_indices: Optional[NDArray[integer]]) -> Iterable[NDArray]:
+        conn = cast(PoolDenseConnector, synapse_info.connector)
+        return conn.expand_connections(
+            synapse_info, post_vertex_slice, weight_scales, pre_indices)
+
     @staticmethod
     def __get_synapse_type(proj: Projection, target: str) -> int:
         edge = proj._projection_edge  # pylint: disable=protected-access
@@ -13,9 +13,7 @@
 # limitations under the License.
 from __future__ import annotations
 import ctypes
-import math
-from typing import (
-    Dict, Iterable, List, Sequence, Tuple, Type, TypeVar, TYPE_CHECKING)
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
 
 import numpy
 from numpy import uint32
@@ -23,7 +21,6 @@ from numpy.typing import NDArray
 
 from pacman.model.routing_info import BaseKeyAndMask
 
-from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
 from spynnaker.pyNN.exceptions import (
     SynapseRowTooBigException, SynapticConfigurationException)
@@ -32,8 +29,6 @@ from spynnaker.pyNN.utilities.bit_field_utilities import BIT_IN_A_WORD
 
 if TYPE_CHECKING:
     from spynnaker.pyNN.models.projection import Projection
-    # pylint: disable=no-member, protected-access
-    _T = TypeVar("_T", bound=ctypes._CData)
 
 
 # Scale factor for an address; allows more addresses to be represented, but
@@ -69,18 +64,16 @@ def _n_bits(field) -> int:
     return _BITS_PER_BYTES * field.size
 
 
-def _make_array(ctype: Type[_T], n_items: int) -> ctypes.Array[_T]:
+def _shift_of(field) -> int:
     """
-    Make an array of ctype items; done separately as the syntax is a
-    little odd!
+    Get the position of the lowest bit of a bit field within its word.
 
-    :param _ctypes.PyCSimpleType ctype: A ctype
-    :param int n_items: The number of items in the array
-    :return: a ctype array
-    :rtype: _ctypes.PyCArrayType
+    :param _ctypes.CField field: a ctype bit field from a structure
+    :return: the shift
+    :rtype: int
     """
-    array_type = ctype * n_items
-    return array_type()
+    # ctypes stores the offset of a bitfield in the bottom 16 bits
+    return field.size & ((1 << _CTYPES_N_BITS_SHIFT) - 1)
 
 
 class _MasterPopEntryCType(ctypes.LittleEndianStructure):
@@ -137,6 +130,11 @@ _INVALID_ADDDRESS = (1 << _n_bits(_AddressListEntryCType.address)) - 1
 # Address is 23 bits, but maximum value means invalid
 _MAX_ADDRESS = (1 << _n_bits(_AddressListEntryCType.address)) - 2
 
+# The maximum value of the row length in an address list entry
+_MAX_ROW_LENGTH_VALUE = (1 << _n_bits(_AddressListEntryCType.row_length)) - 1
+# The position of the address in an address list entry
+_ADDRESS_SHIFT = _shift_of(_AddressListEntryCType.address)
+
 # Sizes of structs
 _MASTER_POP_ENTRY_SIZE_BYTES = ctypes.sizeof(_MasterPopEntryCType)
 _ADDRESS_LIST_ENTRY_SIZE_BYTES = ctypes.sizeof(_AddressListEntryCType)
@@ -147,194 +145,59 @@ _BASE_SIZE_BYTES = 8
 # Number of times to multiply for delays
 _DELAY_SCALE = 2
 
-# A ctypes pointer to a uint32
-_UINT32_PTR = ctypes.POINTER(ctypes.c_uint32)
-
-
-def _to_numpy(array) -> NDArray[uint32]:
+#: The master population table entries as words, matching
+#: :py:class:`_MasterPopEntryCType`
+_MASTER_POP_ENTRY_DTYPE = numpy.dtype([
+    ("key", "<u4"), ("mask", "<u4"),
+    # start, n_colour_bits and count
+    ("start_count", "<u4"),
+    # core_mask and mask_shift
+    ("core_mask_shift", "<u4"),
+    # n_neurons and n_words
+    ("n_neurons_words", "<u4")])
+assert _MASTER_POP_ENTRY_DTYPE.itemsize == _MASTER_POP_ENTRY_SIZE_BYTES
+
+#: The details of an entry in the master population table collected as it
+#: is built
+_ENTRY_INFO_DTYPE = numpy.dtype([
+    ("key", "<u4"), ("mask", "<u4"), ("core_mask", "<u4"),
+    ("core_shift", "<u4"), ("n_neurons", "<u4"), ("n_colour_bits", "<u4")])
+
+
+def _bits(values: NDArray, field) -> NDArray[uint32]:
     """
-    Convert a ctypes array to a numpy array of uint32.
-
-    .. note::
-        No data copying is done; it is pure type conversion.  Editing
-        the returned array will result in changes to the original.
+    Put values into a bit field of a word, dropping any bits that don't fit
+    as ctypes does.
 
-    :param _ctypes.PyCArrayType array: The array to convert
-    :rtype: numpy.ndarray
+    :param ~numpy.ndarray values: The values to put in the field
+    :param _ctypes.CField field: a ctype bit field from a structure
+    :rtype: ~numpy.ndarray
     """
-    # Nothing to do if the array is 0 sized
-    if len(array) == 0:
-        return numpy.zeros(0, dtype=uint32)
+    mask = uint32((1 << _n_bits(field)) - 1)
+    return (values.astype(uint32) & mask) << uint32(_shift_of(field))
 
-    uint32_array = ctypes.cast(array, _UINT32_PTR)
-    n_words = (len(array) * ctypes.sizeof(array[0])) // BYTES_PER_WORD
-    return numpy.ctypeslib.as_array(uint32_array, (n_words,))
 
-
-class _MasterPopEntry(object):
-    """
-    Internal class that contains a master population table entry.
+def _search_depths(n_entries: int) -> NDArray[numpy.integer]:
     """
-    __slots__ = (
-        "__addresses_and_row_lengths",
-        # The mask to match this entry on
-        "__mask",
-        # The routing key to match this entry on
-        "__routing_key",
-        # The part of the key where the core id is held after shifting (below)
-        "__core_mask",
-        # Where in the key that the core id is held
-        "__core_shift",
-        # The number of neurons on every core except the last
-        "__n_neurons",
-        # The number of bits reserved for the colour
-        "__n_colour_bits")
-
-    def __init__(self, routing_key: int, mask: int, core_mask: int,
-                 core_shift: int, n_neurons: int, n_colour_bits: int):
-        """
-        :param int routing_key: The key to match for this entry
-        :param int mask: The mask to match for this entry
-        :param int core_mask:
-            The part of the routing_key where the core id is held
-        :param int core_shift: Where in the routing_key the core_id is held
-        :param int n_neurons:
-            The number of neurons on each core, except the last
-        """
-        self.__routing_key = routing_key
-        self.__mask = mask
-        self.__core_mask = core_mask
-        self.__core_shift = core_shift
-        self.__n_neurons = n_neurons
-        self.__n_colour_bits = n_colour_bits
-        self.__addresses_and_row_lengths: List[Tuple[int, int, bool]] = list()
-
-    def append(self, address: int, row_length: int) -> int:
-        """
-        Add a synaptic matrix pointer to the entry.
-
-        :param int address: The address of the synaptic matrix
-        :param int row_length: The length of each row in the matrix
-        :return: The index of the pointer within the entry
-        :rtype: int
-        """
-        index = len(self.__addresses_and_row_lengths)
-        if index > _MAX_ADDRESS_COUNT:
-            raise SynapticConfigurationException(
-                f"{index} connections for the same source key "
-                f"(maximum {_MAX_ADDRESS_COUNT})")
-        self.__addresses_and_row_lengths.append(
-            (address, row_length, True))
-        return index
-
-    def append_invalid(self) -> int:
-        """
-        Add an invalid marker to the entry; used to ensure index alignment
-        between multiple entries when necessary.
-
-        :return: The index of the marker within the entry
-        :rtype: int
-        """
-        index = len(self.__addresses_and_row_lengths)
-        self.__addresses_and_row_lengths.append((0, 0, False))
-        return index
-
-    @property
-    def routing_key(self) -> int:
-        """
-        The key combo of this entry.
+    Get the number of entries looked at by the binary search on the machine
+    to find each entry of a table.
 
-        :rtype: int
-        """
-        return self.__routing_key
-
-    @property
-    def mask(self) -> int:
-        """
-        The mask of the key for this entry.
-
-        :rtype: int
-        """
-        return self.__mask
-
-    @property
-    def core_mask(self) -> int:
-        """
-        The mask of the key once shifted to get the source core ID.
-
-        :rtype: int
-        """
-        return self.__core_mask
-
-    @property
-    def core_shift(self) -> int:
-        """
-        The shift of the key to get the source core ID.
-
-        :rtype: int
-        """
-        return self.__core_shift
-
-    @property
-    def n_neurons(self) -> int:
-        """
-        The number of neurons per source core.
-
-        :rtype: int
-        """
-        return self.__n_neurons
-
-    @property
-    def addresses_and_row_lengths(self) -> Sequence[Tuple[int, int, bool]]:
-        """
-        The memory address that this master pop entry points at
-        (in the synaptic matrix).
-
-        :rtype: list(tuple(int,int,bool))
-        """
-        return self.__addresses_and_row_lengths
-
-    def write_to_table(
-            self, entry: _MasterPopEntryCType,
-            address_list: ctypes.Array[_AddressListEntryCType],
-            start: int) -> int:
-        """
-        Write entries to the master population table.
-
-        :param _MasterPopEntryCType entry: The entry to write to
-        :param _AddressListEntryCType_Array address_list:
-            The address_list to write to
-        :param int start:
-            The index of the entry of the address list to start at
-        :return: The number of entries written to the address list
-        :rtype: int
-        """
-        entry.key = self.__routing_key
-        entry.mask = self.__mask
-        entry.start = start
-        count = len(self.__addresses_and_row_lengths)
-        entry.count = count
-
-        # Mark where the next entry starts and the number added; this might
-        # change if there is extra info
-        next_addr = start
-        n_entries = count
-
-        entry.n_colour_bits = self.__n_colour_bits
-        entry.core_mask = self.__core_mask
-        entry.n_words = int(math.ceil(self.__n_neurons / BIT_IN_A_WORD))
-        entry.n_neurons = self.__n_neurons
-        entry.mask_shift = self.__core_shift
-
-        for j, (address, row_length, is_valid) in enumerate(
-                self.__addresses_and_row_lengths):
-            address_entry = address_list[next_addr + j]
-            if not is_valid:
-                address_entry.address = _INVALID_ADDDRESS
-            else:
-                address_entry.row_length = row_length
-                address_entry.address = address
-        return n_entries
+    :param int n_entries: The number of entries in the table
+    :rtype: ~numpy.ndarray
+    """
+    # All the searches are done together, following the search in the C code
+    target = numpy.arange(n_entries)
+    imin = numpy.zeros(n_entries, dtype=int)
+    imax = numpy.full(n_entries, n_entries)
+    depths = numpy.zeros(n_entries, dtype=int)
+    searching = numpy.ones(n_entries, dtype=bool)
+    while searching.any():
+        imid = (imin + imax) >> 1
+        depths += searching
+        searching &= imid != target
+        imin = numpy.where(searching & (imid < target), imid + 1, imin)
+        imax = numpy.where(searching & (imid > target), imid, imax)
+    return depths
 
 
 class MasterPopTableAsBinarySearch(object):
@@ -342,12 +205,23 @@ class MasterPopTableAsBinarySearch(object):
     Master population table, implemented as binary search master.
     """
     __slots__ = (
+        # The index of the entry for each key
         "__entries",
-        "__n_addresses")
+        # The details of each entry, in the order they were added
+        "__entry_info",
+        # The number of addresses of each entry
+        "__entry_counts",
+        # The entry of each address, in the order they were added
+        "__address_entries",
+        # The address list word of each address, in the order they were added
+        "__address_words")
 
     def __init__(self) -> None:
-        self.__entries: Dict[int, _MasterPopEntry] = {}
-        self.__n_addresses = 0
+        self.__entries: Dict[int, int] = {}
+        self.__entry_info: List[Tuple[int, int, int, int, int, int]] = []
+        self.__entry_counts: List[int] = []
+        self.__address_entries: List[int] = []
+        self.__address_words: List[int] = []
 
     @staticmethod
     def get_master_population_table_size(
@@ -429,7 +303,10 @@ class MasterPopTableAsBinarySearch(object):
         Initialise the master pop data structure.
         """
         self.__entries = dict()
-        self.__n_addresses = 0
+        self.__entry_info = list()
+        self.__entry_counts = list()
+        self.__address_entries = list()
+        self.__address_words = list()
 
     def add_application_entry(
             self, block_start_addr: int, row_length: int,
@@ -505,8 +382,14 @@ class MasterPopTableAsBinarySearch(object):
 
         entry = self.__add_entry(
             key_and_mask, core_mask, core_shift, n_neurons, n_colour_bits)
-        index = entry.append(start_addr, row_length - 1)
-        self.__n_addresses += 1
+        index = self.__entry_counts[entry]
+        if index > _MAX_ADDRESS_COUNT:
+            raise SynapticConfigurationException(
+                f"{index} connections for the same source key "
+                f"(maximum {_MAX_ADDRESS_COUNT})")
+        self.__add_address(entry, (
+            ((row_length - 1) & _MAX_ROW_LENGTH_VALUE) |
+            (start_addr << _ADDRESS_SHIFT)))
         return index
 
     def add_invalid_application_entry(
@@ -571,61 +454,114 @@ class MasterPopTableAsBinarySearch(object):
         """
         entry = self.__add_entry(
             key_and_mask, core_mask, core_shift, n_neurons, n_colour_bits)
-        index = entry.append_invalid()
-        self.__n_addresses += 1
+        index = self.__entry_counts[entry]
+        self.__add_address(entry, _INVALID_ADDDRESS << _ADDRESS_SHIFT)
         return index
 
     def __add_entry(
             self, key_and_mask: BaseKeyAndMask, core_mask: int,
-            core_shift: int, n_neurons: int,
-            n_colour_bits: int) -> _MasterPopEntry:
-        if self.__n_addresses >= _MAX_ADDRESS_START:
+            core_shift: int, n_neurons: int, n_colour_bits: int) -> int:
+        """
+        Find or make the entry for a key.
+
+        :return: The index of the entry
+        :rtype: int
+        """
+        n_addresses = len(self.__address_words)
+        if n_addresses >= _MAX_ADDRESS_START:
             raise SynapticConfigurationException(
-                f"The table already contains {self.__n_addresses} entries;"
+                f"The table already contains {n_addresses} entries;"
                 " adding another is too many")
         if key_and_mask.key not in self.__entries:
-            entry = _MasterPopEntry(
+            entry = len(self.__entry_info)
+            self.__entry_info.append((
                 key_and_mask.key, key_and_mask.mask, core_mask, core_shift,
-                n_neurons, n_colour_bits)
+                n_neurons, n_colour_bits))
+            self.__entry_counts.append(0)
             self.__entries[key_and_mask.key] = entry
             return entry
         entry = self.__entries[key_and_mask.key]
-        if (key_and_mask.mask != entry.mask or
-                core_mask != entry.core_mask or
-                core_shift != entry.core_shift or
-                n_neurons != entry.n_neurons):
+        _, e_mask, e_core_mask, e_core_shift, e_n_neurons, _ = \
+            self.__entry_info[entry]
+        if (key_and_mask.mask != e_mask or
+                core_mask != e_core_mask or
+                core_shift != e_core_shift or
+                n_neurons != e_n_neurons):
             raise SynapticConfigurationException(
                 f"Existing entry for key {key_and_mask.key} doesn't match one "
-                f"being added: Existing mask: {entry.mask} "
-                f"core_mask: {entry.core_mask} core_shift: {entry.core_shift} "
-                f"n_neurons: {entry.n_neurons} "
+                f"being added: Existing mask: {e_mask} "
+                f"core_mask: {e_core_mask} core_shift: {e_core_shift} "
+                f"n_neurons: {e_n_neurons} "
                 f"Adding mask: {key_and_mask.mask} core_mask: {core_mask} "
                 f"core_shift: {core_shift} n_neurons: {n_neurons}")
         return entry
 
+    def __add_address(self, entry: int, word: int) -> None:
+        """
+        Add a word to the address list of an entry.
+
+        :param int entry: The index of the entry
+        :param int word: The address list word
+        """
+        self.__entry_counts[entry] += 1
+        self.__address_entries.append(entry)
+        self.__address_words.append(word)
+
     def get_pop_table_data(self) -> NDArray[uint32]:
         """
         Get the master pop table data as a numpy array.
 
         :rtype: ~numpy.ndarray
         """
-        # sort entries by key
-        entries = sorted(
-            self.__entries.values(),
-            key=lambda a_entry: a_entry.routing_key)
-        n_entries = len(entries)
-        data = [numpy.array([n_entries, self.__n_addresses], dtype=uint32)]
-        # Generate the table and list as arrays
-        pop_table = _make_array(_MasterPopEntryCType, n_entries)
-        address_list = _make_array(_AddressListEntryCType, self.__n_addresses)
-        start = 0
-        for i, entry in enumerate(entries):
-            start += entry.write_to_table(pop_table[i], address_list, start)
-
-        # Add the arrays
-        data.append(_to_numpy(pop_table))
-        data.append(_to_numpy(address_list))
-        return numpy.concatenate(data)
+        info = numpy.array(self.__entry_info, dtype=_ENTRY_INFO_DTYPE)
+        n_entries = len(info)
+        n_addresses = len(self.__address_words)
+
+        # Sort the entries by key, and the addresses by entry (keeping the
+        # order in which the addresses of an entry were added)
+        order = numpy.argsort(info["key"], kind="stable")
+        info = info[order]
+        counts = numpy.array(self.__entry_counts, dtype=uint32)[order]
+        entry_rank = numpy.empty(n_entries, dtype=uint32)
+        entry_rank[order] = numpy.arange(n_entries, dtype=uint32)
+        address_order = numpy.argsort(
+            entry_rank[numpy.array(self.__address_entries, dtype=int)],
+            kind="stable")
+        address_list = numpy.array(
+            self.__address_words, dtype=uint32)[address_order]
+        starts = numpy.cumsum(counts) - counts
+
+        # Make the table words
+        n_words = -(-info["n_neurons"] // BIT_IN_A_WORD)
+        pop_table = numpy.zeros(n_entries, dtype=_MASTER_POP_ENTRY_DTYPE)
+        pop_table["key"] = info["key"]
+        pop_table["mask"] = info["mask"]
+        pop_table["start_count"] = (
+            _bits(starts, _MasterPopEntryCType.start) |
+            _bits(info["n_colour_bits"], _MasterPopEntryCType.n_colour_bits) |
+            _bits(counts, _MasterPopEntryCType.count))
+        pop_table["core_mask_shift"] = (
+            _bits(info["core_mask"], _MasterPopEntryCType.core_mask) |
+            _bits(info["core_shift"], _MasterPopEntryCType.mask_shift))
+        pop_table["n_neurons_words"] = (
+            _bits(info["n_neurons"], _MasterPopEntryCType.n_neurons) |
+            _bits(n_words, _MasterPopEntryCType.n_words))
+
+        return numpy.concatenate((
+            numpy.array([n_entries, n_addresses], dtype=uint32),
+            pop_table.view(uint32), address_list))
+
+    def get_mean_search_depth(self) -> float:
+        """
+        Get the mean number of entries of the table that the binary search
+        on the machine looks at to find the entry for a key, with the key of
+        each entry taken to be as likely as any other.
+
+        :rtype: float
+        """
+        if not self.__entry_info:
+            return 0.0
+        return float(numpy.mean(_search_depths(len(self.__entry_info))))
 
     @property
     def max_n_neurons_per_core(self) -> int:
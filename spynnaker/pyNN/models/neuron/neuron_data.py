@@ -11,7 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator, MutableMapping, Optional, Tuple, cast
+from typing import (
+    Iterator, MutableMapping, Optional, Sequence, Tuple, cast)
 
 import numpy
 from numpy import uint32
@@ -281,10 +282,25 @@ class NeuronData(object):
             The placement of the vertex to read
         :param NeuronRegions neuron_regions: The regions to read from
         """
+        self.read_all_data([(placement, neuron_regions)])
+
+    def read_all_data(
+            self, placements: Sequence[Tuple[Placement, NeuronRegions]]):
+        """
+        Read the current state of the data of several vertices from the
+        machine into the application vertex, all together.
+
+        :param placements:
+            The placements of the vertices to read and the regions to read
+            from for each
+        :type placements: list(tuple(~pacman.model.placements.Placement,
+            NeuronRegions))
+        """
         merged_dict = _MergedDict(self.__app_vertex.parameters,
                                   self.__app_vertex.state_variables)
         self.__do_read_data(
-            placement, neuron_regions.neuron_params, merged_dict)
+            [(placement, regions.neuron_params)
+             for placement, regions in placements], merged_dict)
 
     def read_initial_data(
             self, placement: Placement, neuron_regions: NeuronRegions):
@@ -296,38 +312,68 @@ class NeuronData(object):
             The placement of the vertex to read
         :param NeuronRegions neuron_regions: The regions to read from
         """
+        self.read_all_initial_data([(placement, neuron_regions)])
+
+    def read_all_initial_data(
+            self, placements: Sequence[Tuple[Placement, NeuronRegions]]):
+        """
+        Read the initial state of the data of several vertices from the
+        machine into the application vertex, all together.
+
+        :param placements:
+            The placements of the vertices to read and the regions to read
+            from for each
+        :type placements: list(tuple(~pacman.model.placements.Placement,
+            NeuronRegions))
+        """
         merged_dict = _MergedDict(self.__app_vertex.parameters,
                                   self.__app_vertex.initial_state_variables)
         self.__do_read_data(
-            placement, neuron_regions.initial_values, merged_dict)
+            [(placement, regions.initial_values)
+             for placement, regions in placements], merged_dict)
 
     def __do_read_data(
-            self, placement: Placement, region: int, results: '_MergedDict'):
+            self, placements: Sequence[Tuple[Placement, int]],
+            results: '_MergedDict'):
         """
         Perform the reading of data.
 
-        :param ~pacman.model.placements.Placement placement:
-            Where the vertex is on the machine
-        :param int region: The region to read from
+        :param list(tuple(~pacman.model.placements.Placement, int)) placements:
+            Where the vertices are on the machine and the region to read from
+            for each
         :param MergedDict results: Where to write the results to
         """
-        address = locate_memory_region_for_placement(placement, region)
-        vertex_slice = placement.vertex.vertex_slice
-        data_size = self.__app_vertex.get_sdram_usage_for_neuron_params(
-            vertex_slice.n_atoms)
-        block = SpynnakerDataView.read_memory(
-            placement.x, placement.y, address, data_size)
-        offset = 0
+        if not placements:
+            return
+
+        # Read all the data before decoding any of it
+        blocks = list()
+        slices = list()
+        for placement, region in placements:
+            address = locate_memory_region_for_placement(placement, region)
+            vertex_slice = placement.vertex.vertex_slice
+            data_size = self.__app_vertex.get_sdram_usage_for_neuron_params(
+                vertex_slice.n_atoms)
+            blocks.append(SpynnakerDataView.read_memory(
+                placement.x, placement.y, address, data_size))
+            slices.append(vertex_slice)
+
+        # Decode each struct for all the vertices together
+        values = cast(RangeDictionary, results)
+        offsets = [0] * len(blocks)
         for struct in self.__app_vertex.neuron_impl.structs:
             if struct.repeat_type == StructRepeat.GLOBAL:
-                struct.read_data(block, cast(RangeDictionary, results), offset)
-                offset += struct.get_size_in_whole_words() * BYTES_PER_WORD
+                # The global values are the same on every core
+                struct.read_data(blocks[-1], values, offsets[-1])
+                size = struct.get_size_in_whole_words() * BYTES_PER_WORD
+                offsets = [offset + size for offset in offsets]
             else:
-                struct.read_data(block, cast(RangeDictionary, results), offset,
-                                 vertex_slice)
-                offset += (
-                    struct.get_size_in_whole_words(vertex_slice.n_atoms) *
-                    BYTES_PER_WORD)
+                struct.read_slices_data(
+                    list(zip(blocks, offsets, slices)), values)
+                offsets = [
+                    offset + struct.get_size_in_whole_words(
+                        vertex_slice.n_atoms) * BYTES_PER_WORD
+                    for offset, vertex_slice in zip(offsets, slices)]
 
     def reset_generation(self) -> None:
         """
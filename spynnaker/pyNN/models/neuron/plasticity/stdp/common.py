@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 import math
+from typing import Tuple
 import numpy
 from numpy import uint16, uint32
 from numpy.typing import NDArray
+from spinn_front_end_common.interface.ds import DataType
 
 # Default value of fixed-point one for STDP
 STDP_FIXED_POINT_ONE = (1 << 11)
@@ -29,9 +32,16 @@ def float_to_fixed(value: float) -> int:
     return int(round(float(value) * STDP_FIXED_POINT_ONE))
 
 
+@lru_cache(maxsize=256)
 def get_exp_lut_array(time_step: float, time_constant: float,
                       shift: int = 0) -> NDArray[uint32]:
     """
+    Get an exponential decay lookup table with its header.
+
+    .. note::
+        The tables are kept and shared between all callers with the same
+        arguments, so the array returned is read-only.
+
     :param float time_step:
     :param float time_constant:
     :param int shift:
@@ -52,4 +62,52 @@ def get_exp_lut_array(time_step: float, time_constant: float,
 
     # Concatenate with the header
     header = numpy.array([len(a), shift], dtype=uint16)
-    return numpy.concatenate((header, a.astype(uint16))).view(uint32)
+    lut = numpy.concatenate((header, a.astype(uint16))).view(uint32)
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=256)
+def get_exp_dist_lut_array(mean: float) -> NDArray[uint16]:
+    """
+    Get a lookup table of the inverse of the cumulative distribution
+    function of an exponential distribution.
+
+    .. note::
+        The tables are kept and shared between all callers with the same
+        mean, so the array returned is read-only.
+
+    :param float mean: The mean of the distribution
+    :rtype: ~numpy.ndarray
+    """
+    indices = numpy.arange(STDP_FIXED_POINT_ONE)
+    inv_cdf = numpy.log(1.0 - indices/float(STDP_FIXED_POINT_ONE)) * -mean
+    lut = inv_cdf.astype(uint16)
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=256)
+def get_s1615_array(
+        values: Tuple[float, ...], repeats: int = 1) -> NDArray[uint32]:
+    """
+    Get values encoded as S1615 words, as would be written by
+    ``spec.write_value(value, data_type=DataType.S1615)``, repeated a number
+    of times (e.g. once per synapse type).
+
+    .. note::
+        The words are kept and shared between all callers with the same
+        arguments, so the array returned is read-only.
+
+    :param tuple(float) values: The values to encode
+    :param int repeats: The number of times to repeat the values
+    :rtype: ~numpy.ndarray
+    """
+    for value in values:
+        DataType.S1615.check_value(value)
+    words = numpy.array(
+        [DataType.S1615.encode_as_int(value) for value in values],
+        dtype=numpy.int32).view(uint32)
+    words = numpy.tile(words, repeats)
+    words.setflags(write=False)
+    return words
@@ -14,7 +14,6 @@
 
 from typing import cast, Iterable
 
-import numpy
 from numpy import floating
 from numpy.typing import NDArray
 
@@ -29,7 +28,7 @@ from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.models.neuron.plasticity.stdp.synapse_structure import (
     SynapseStructureWeightAccumulator)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.common import (
-    STDP_FIXED_POINT_ONE)
+    STDP_FIXED_POINT_ONE, get_exp_dist_lut_array)
 
 from .abstract_timing_dependence import AbstractTimingDependence
 
@@ -190,10 +189,8 @@ class TimingDependenceRecurrent(AbstractTimingDependence):
         :param .DataSpecificationGenerator spec:
         :param float mean:
         """
-        indices = numpy.arange(STDP_FIXED_POINT_ONE)
-        inv_cdf = numpy.log(1.0 - indices/float(STDP_FIXED_POINT_ONE)) * -mean
         spec.write_array(
-            inv_cdf.astype(numpy.uint16), data_type=DataType.UINT16)
+            get_exp_dist_lut_array(mean), data_type=DataType.UINT16)
 
     @overrides(AbstractTimingDependence.get_parameter_names)
     def get_parameter_names(self) -> Iterable[str]:
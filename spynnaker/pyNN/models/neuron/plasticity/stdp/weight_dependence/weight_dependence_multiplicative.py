@@ -18,10 +18,12 @@ from numpy.typing import NDArray
 
 from spinn_utilities.overrides import overrides
 
-from spinn_front_end_common.interface.ds import (
-    DataType, DataSpecificationBase)
+from spinn_front_end_common.interface.ds import DataSpecificationBase
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
+from spynnaker.pyNN.models.neuron.plasticity.stdp.common import (
+    get_s1615_array)
+
 from .abstract_has_a_plus_a_minus import AbstractHasAPlusAMinus
 from .abstract_weight_dependence import AbstractWeightDependence
 
@@ -102,15 +104,11 @@ class WeightDependenceMultiplicative(
             raise NotImplementedError(
                 "Multiplicative weight dependence only supports single terms")
 
-        # Loop through each synapse type
-        for _ in synapse_weight_scales:
-            spec.write_value(data=self.__w_min * global_weight_scale,
-                             data_type=DataType.S1615)
-            spec.write_value(data=self.__w_max * global_weight_scale,
-                             data_type=DataType.S1615)
-
-            spec.write_value(data=self.A_plus, data_type=DataType.S1615)
-            spec.write_value(data=self.A_minus, data_type=DataType.S1615)
+        # The same parameters are written for each synapse type
+        spec.write_array(get_s1615_array((
+            self.__w_min * global_weight_scale,
+            self.__w_max * global_weight_scale,
+            self.A_plus, self.A_minus), len(synapse_weight_scales)))
 
     @property
     def weight_maximum(self) -> float:
@@ -15,9 +15,10 @@ from __future__ import annotations
 import ctypes
 from enum import IntEnum
 import os
-from typing import List, Optional, Sequence, cast
+from typing import List, Optional, Sequence, Tuple, cast, TYPE_CHECKING
 
-from numpy import floating
+import numpy
+from numpy import floating, integer, uint32
 from numpy.typing import NDArray
 
 from spinn_utilities.overrides import overrides
@@ -33,6 +34,8 @@ from spinn_front_end_common.interface.ds import (
     DataSpecificationGenerator, DataSpecificationReloader)
 from spinn_front_end_common.interface.provenance import ProvenanceWriter
 
+from spynnaker.pyNN.exceptions import SynapticConfigurationException
+from spynnaker.pyNN.models.abstract_models import HasSynapses
 from spynnaker.pyNN.utilities.utility_calls import get_n_bits
 from spynnaker.pyNN.models.neuron.local_only import AbstractLocalOnly
 from spynnaker.pyNN.models.neuron.neuron_data import NeuronData
@@ -42,6 +45,10 @@ from .population_machine_neurons import (
     NeuronRegions, PopulationMachineNeurons, NeuronProvenance)
 from .abstract_population_vertex import AbstractPopulationVertex
 
+if TYPE_CHECKING:
+    from spynnaker.pyNN.models.neural_projections import (
+        ProjectionApplicationEdge, SynapseInformation)
+
 
 class LocalOnlyProvenance(ctypes.LittleEndianStructure):
     """
@@ -80,7 +87,8 @@ class PopulationMachineLocalOnlyCombinedVertex(
         PopulationMachineCommon,
         PopulationMachineNeurons,
         AbstractGeneratesDataSpecification,
-        AbstractRewritesDataSpecification):
+        AbstractRewritesDataSpecification,
+        HasSynapses):
     """
     A machine vertex for PyNN Populations.
     """
@@ -92,7 +100,8 @@ class PopulationMachineLocalOnlyCombinedVertex(
         "__slice_index",
         "__neuron_data",
         "__max_atoms_per_core",
-        "__regenerate_data")
+        "__regenerate_neuron_data",
+        "__regenerate_current_source_data")
 
     # log_n_neurons, log_n_synapse_types, log_max_delay, input_buffer_size,
     # clear_input_buffer
@@ -182,7 +191,8 @@ class PopulationMachineLocalOnlyCombinedVertex(
         self.__weight_scales = weight_scales
         self.__neuron_data = neuron_data
         self.__max_atoms_per_core = max_atoms_per_core
-        self.__regenerate_data = False
+        self.__regenerate_neuron_data = False
+        self.__regenerate_current_source_data = False
 
     @property
     def _vertex_slice(self) -> Slice:
@@ -302,10 +312,56 @@ class PopulationMachineLocalOnlyCombinedVertex(
         self.__synapse_dynamics.write_parameters(
             spec, self.REGIONS.LOCAL_ONLY_PARAMS, self,
             self.__weight_scales)
+        self.__fill_pre_run_connection_holders()
 
         # End the writing of this specification:
         spec.end_specification()
 
+    def __fill_pre_run_connection_holders(self) -> None:
+        """
+        Fill in the connections of the pre-run connection holders, as the
+        data of the local-only synapses is written.
+        """
+        for proj in self._pop_vertex.incoming_projections:
+            # pylint: disable=protected-access
+            synapse_info = proj._synapse_information
+            if not synapse_info.pre_run_connection_holders:
+                continue
+            connections = self.__synapse_dynamics.get_connections(
+                synapse_info, self.vertex_slice, self.__weight_scales)
+            if connections:
+                conns = numpy.concatenate(connections)
+                for holder in synapse_info.pre_run_connection_holders:
+                    holder.add_connections(conns)
+
+    @overrides(HasSynapses.get_connections_from_machine)
+    def get_connections_from_machine(
+            self, placement: Placement, app_edge: ProjectionApplicationEdge,
+            synapse_info: SynapseInformation,
+            pre_indices: Optional[NDArray[integer]] = None
+            ) -> Sequence[NDArray]:
+        # The connections are not stored on the machine, but are worked out
+        # in the same way as the machine does
+        return self.__synapse_dynamics.get_connections(
+            synapse_info, self.vertex_slice, self.__weight_scales,
+            pre_indices)
+
+    @overrides(HasSynapses.get_changed_rows)
+    def get_changed_rows(
+            self, app_edge: ProjectionApplicationEdge,
+            synapse_info: SynapseInformation, connections: NDArray,
+            new_connections: NDArray) -> List[Tuple[int, NDArray[uint32]]]:
+        raise SynapticConfigurationException(
+            "The connections of local-only synapses are worked out from the "
+            "connector, so they cannot be changed")
+
+    @overrides(HasSynapses.write_changed_rows)
+    def write_changed_rows(
+            self, placement: Placement,
+            changed_rows: Sequence[Tuple[int, NDArray[uint32]]]):
+        raise SynapticConfigurationException(
+            "Local-only synapses have no rows to write")
+
     def __write_local_only_data(self, spec: DataSpecificationGenerator):
         spec.reserve_memory_region(
             self.REGIONS.LOCAL_ONLY, self.LOCAL_ONLY_SIZE, "local_only")
@@ -325,18 +381,27 @@ class PopulationMachineLocalOnlyCombinedVertex(
     @overrides(AbstractRewritesDataSpecification.regenerate_data_specification)
     def regenerate_data_specification(
             self, spec: DataSpecificationReloader, placement: Placement):
-        self._rewrite_neuron_data_spec(spec)
+        self._rewrite_neuron_data_spec(
+            spec, self.__regenerate_neuron_data,
+            self.__regenerate_current_source_data)
+        self.__regenerate_neuron_data = False
+        self.__regenerate_current_source_data = False
 
         # close spec
         spec.end_specification()
 
     @overrides(AbstractRewritesDataSpecification.reload_required)
     def reload_required(self) -> bool:
-        return self.__regenerate_data
+        return (self.__regenerate_neuron_data or
+                self.__regenerate_current_source_data)
 
     @overrides(AbstractRewritesDataSpecification.set_reload_required)
     def set_reload_required(self, new_value: bool):
-        self.__regenerate_data = new_value
+        # Only changes to the current sources are marked this way; the
+        # neuron data is marked by set_do_neuron_regeneration
+        self.__regenerate_current_source_data = new_value
+        if not new_value:
+            self.__regenerate_neuron_data = False
 
     def _parse_local_only_provenance(
             self, label: str, x: int, y: int, p: int,
@@ -394,4 +459,4 @@ class PopulationMachineLocalOnlyCombinedVertex(
 
     @overrides(PopulationMachineNeurons.set_do_neuron_regeneration)
     def set_do_neuron_regeneration(self) -> None:
-        self.__regenerate_data = True
+        self.__regenerate_neuron_data = True
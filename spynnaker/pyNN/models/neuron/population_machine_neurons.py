@@ -14,9 +14,12 @@
 from __future__ import annotations
 from collections.abc import Container
 import ctypes
-from typing import List, NamedTuple, Sequence, Set, Union, cast, TYPE_CHECKING
+from typing import (
+    List, NamedTuple, Sequence, Tuple, Union, cast, TYPE_CHECKING)
 
 import numpy
+from numpy import integer, uint32
+from numpy.typing import NDArray
 
 from spinn_utilities.abstract_base import abstractmethod
 from spinn_utilities.overrides import overrides
@@ -29,21 +32,41 @@ from pacman.utilities.utility_calls import get_keys
 
 from spinn_front_end_common.interface.ds import (
     DataSpecificationBase, DataSpecificationGenerator,
-    DataSpecificationReloader)
+    DataSpecificationReloader, DataType)
 from spinn_front_end_common.interface.provenance import ProvenanceWriter
 
 from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
-from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to_array, get_n_bits)
 from spynnaker.pyNN.models.abstract_models import AbstractNeuronExpandable
 from spynnaker.pyNN.models.current_sources import CurrentSourceIDs
-from spynnaker.pyNN.utilities.utility_calls import convert_to
 if TYPE_CHECKING:
     from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
     from spynnaker.pyNN.models.neuron.neuron_data import NeuronData
     from spynnaker.pyNN.models.current_sources import AbstractCurrentSource
 
 
+def _convert_to_words(
+        values: Union[Sequence[float], NDArray], data_type: DataType
+        ) -> NDArray[uint32]:
+    """
+    Convert values to a given data type, with each value written as a whole
+    word; this gives the same words as using
+    :py:func:`~spynnaker.pyNN.utilities.utility_calls.convert_to` on each
+    value.
+
+    :param values: The values to convert
+    :param ~data_specification.enums.DataType data_type:
+        The data type to convert to
+    :rtype: ~numpy.ndarray
+    """
+    converted = convert_to_array(values, data_type)
+    if converted.dtype.kind == "f":
+        return converted.view(uint32)
+    return converted.astype(uint32)
+
+
 class NeuronProvenance(ctypes.LittleEndianStructure):
     """
     Provenance items from neuron processing.
@@ -234,21 +257,27 @@ class PopulationMachineNeurons(
         self._neuron_data.write_data(
             spec, self._vertex_slice, self._neuron_regions)
 
-    def _rewrite_neuron_data_spec(self, spec: DataSpecificationReloader):
+    def _rewrite_neuron_data_spec(
+            self, spec: DataSpecificationReloader, neuron_data: bool = True,
+            current_sources: bool = True):
         """
         Re-Write the data specification of the neuron data.
 
         :param ~data_specification.DataSpecificationGenerator spec:
             The data specification to write to
-        :param list(int) ring_buffer_shifts:
-            The shifts to apply to convert ring buffer values to S1615 values
+        :param bool neuron_data:
+            Whether to rewrite the neuron parameters and state
+        :param bool current_sources:
+            Whether to rewrite the current source parameters
         """
         # Write the current source parameters
-        self._write_current_source_parameters(spec)
+        if current_sources:
+            self._write_current_source_parameters(spec)
 
         # Write the other parameters after forcing a regeneration
-        self._neuron_data.write_data(
-            spec, self._vertex_slice, self._neuron_regions, False)
+        if neuron_data:
+            self._neuron_data.write_data(
+                spec, self._vertex_slice, self._neuron_regions, False)
 
     def _write_neuron_core_parameters(
             self, spec: DataSpecificationGenerator,
@@ -302,10 +331,19 @@ class PopulationMachineNeurons(
         # Write the keys
         spec.write_array(keys)
 
-    def __in_selector(self, n: int, selector: Selector) -> bool:
+    def __selector_mask(
+            self, raster_ids: NDArray[integer],
+            selector: Selector) -> NDArray[numpy.bool_]:
+        """
+        Work out which of the given neurons are selected.
+
+        :param ~numpy.ndarray raster_ids: The neurons to check
+        :param selector: The selector of a current source
+        :rtype: ~numpy.ndarray
+        """
         if isinstance(selector, Container):
-            return n in selector
-        return n == selector
+            return numpy.isin(raster_ids, list(selector))
+        return raster_ids == selector
 
     def _write_current_source_parameters(
             self, spec: DataSpecificationBase):
@@ -322,100 +360,94 @@ class PopulationMachineNeurons(
             size=params_size, label='CurrentSourceParams')
         spec.switch_write_focus(self._neuron_regions.current_source_params)
 
-        # Get the current sources from the app vertex
-        current_source_id_list = self._pop_vertex.current_source_id_list
-
-        # Work out which current sources are on this core
-        current_sources = self.__get_current_sources_sorted()
+        # Work out which current sources are on this core, and which
+        # neurons on the core each applies to
+        current_sources, masks = self.__get_current_sources_sorted()
 
         # Write the number of sources
         spec.write_value(len(current_sources))
 
         # Don't write anything else if there are no current sources
-        if current_sources:
-            # Array to keep track of the number of each type of current source
-            # (there are four, but they are numbered 1 to 4, so five elements)
-            cs_index_array = [0, 0, 0, 0, 0]
-
-            # Data sent to the machine will be current sources per neuron
-            # This array will have the first entry indicating the number of
-            # sources for each neuron, then if this is non-zero, follow it with
-            # the IDs indicating the current source ID value, and then the
-            # index within that type of current source
-            neuron_current_sources = [[0] for n in range(n_atoms)]
-            for current_source in current_sources:
-                # Get the ID of the current source
-                cs_id = current_source.current_source_id
-
-                # Only use IDs that are on this core
-                for i, n in enumerate(self._vertex_slice.get_raster_ids()):
-                    if self.__in_selector(
-                            n, current_source_id_list[current_source]):
-                        # I think this is now right, but test it more...
-                        neuron_current_sources[i][0] += 1
-                        neuron_current_sources[i].append(cs_id)
-                        neuron_current_sources[i].append(
-                            cs_index_array[cs_id])
-
-                # Increase the ID value in case a (different) current source
-                # of the same type is also used
-                cs_index_array[cs_id] += 1
-
-            # Now loop over the neurons on this core and write the current
-            # source ID and index for sources attached to each neuron
-            for n in range(n_atoms):
-                n_current_sources = neuron_current_sources[n][0]
-                spec.write_value(n_current_sources)
-                if n_current_sources != 0:
-                    for csid in range(n_current_sources * 2):
-                        spec.write_value(neuron_current_sources[n][csid+1])
-
-            # Write the number of each type of current source
-            for n in range(1, len(cs_index_array)):
-                spec.write_value(cs_index_array[n])
-
-            # Now loop over the current sources and write the data required
-            # for each type of current source
-            for current_source in current_sources:
-                cs_data_types = current_source.parameter_types
-                cs_id = current_source.current_source_id
-                for key, value in current_source.parameters.items():
-                    # StepCurrentSource currently handled with arrays
-                    if cs_id == CurrentSourceIDs.STEP_CURRENT_SOURCE.value:
-                        assert isinstance(value, Sequence)
-                        n_params = len(value)
-                        spec.write_value(n_params)
-                        for n_p in range(n_params):
-                            value_convert = convert_to(
-                                value[n_p], cs_data_types[key]).view("uint32")
-                            spec.write_value(data=value_convert)
-                    # All other sources have single-valued params
-                    else:
-                        if isinstance(value, Sequence):
-                            for a_value in value:
-                                value_convert = convert_to(
-                                    a_value,
-                                    cs_data_types[key]).item()
-                                spec.write_value(data=value_convert)
-                        else:
-                            value_convert = convert_to(
-                                value, cs_data_types[key]).item()
-                            spec.write_value(data=value_convert)
-
-    def __get_current_sources_sorted(self) -> List[AbstractCurrentSource]:
-        app_current_sources = self._pop_vertex.current_sources
+        if not current_sources:
+            return
+
+        # The number of each type of current source (there are four, but
+        # they are numbered 1 to 4, so five elements), and the index of each
+        # source within those of its type
+        cs_ids = numpy.array(
+            [cs.current_source_id for cs in current_sources], dtype=uint32)
+        cs_index_array = numpy.zeros(5, dtype=uint32)
+        cs_indices = numpy.zeros(len(current_sources), dtype=uint32)
+        for i, cs_id in enumerate(cs_ids):
+            cs_indices[i] = cs_index_array[cs_id]
+            cs_index_array[cs_id] += 1
+
+        # Data sent to the machine will be current sources per neuron
+        # This will have the first entry indicating the number of
+        # sources for each neuron, then if this is non-zero, follow it with
+        # the IDs indicating the current source ID value, and then the
+        # index within that type of current source
+        n_sources = masks.sum(axis=0)
+        neuron_starts = numpy.concatenate(
+            ([0], numpy.cumsum(1 + 2 * n_sources)[:-1]))
+        neurons, sources = numpy.nonzero(masks.T)
+        first_of_neuron = numpy.concatenate(
+            ([0], numpy.cumsum(n_sources)[:-1]))
+        source_pos = (neuron_starts[neurons] + 1 +
+                      2 * (numpy.arange(len(neurons)) -
+                           first_of_neuron[neurons]))
+        neuron_current_sources = numpy.zeros(
+            n_atoms + 2 * len(neurons), dtype=uint32)
+        neuron_current_sources[neuron_starts] = n_sources
+        neuron_current_sources[source_pos] = cs_ids[sources]
+        neuron_current_sources[source_pos + 1] = cs_indices[sources]
+
+        # Then the number of each type of current source, and the data
+        # required for each current source
+        data = [neuron_current_sources, cs_index_array[1:]]
+        for current_source in current_sources:
+            cs_data_types = current_source.parameter_types
+            cs_id = current_source.current_source_id
+            for key, value in current_source.parameters.items():
+                # StepCurrentSource currently handled with arrays
+                if cs_id == CurrentSourceIDs.STEP_CURRENT_SOURCE.value:
+                    assert isinstance(value, Sequence)
+                    data.append(numpy.array([len(value)], dtype=uint32))
+                    data.append(_convert_to_words(value, cs_data_types[key]))
+                # All other sources have single-valued params
+                else:
+                    data.append(_convert_to_words(
+                        numpy.ravel(value), cs_data_types[key]))
+        spec.write_array(numpy.concatenate(data))
+
+    def __get_current_sources_sorted(self) -> Tuple[
+            List[AbstractCurrentSource], NDArray[numpy.bool_]]:
+        """
+        Get the current sources that apply to neurons on this core, sorted
+        into current_source_id order, and for each of these which of the
+        neurons on the core it applies to.
+
+        :rtype: tuple(list(AbstractCurrentSource), ~numpy.ndarray)
+        """
         current_source_id_list = self._pop_vertex.current_source_id_list
+        raster_ids = self._vertex_slice.get_raster_ids()
 
-        current_sources: Set[AbstractCurrentSource] = set()
-        for app_current_source in app_current_sources:
-            for n in self._vertex_slice.get_raster_ids():
-                if self.__in_selector(
-                        n, current_source_id_list[app_current_source]):
-                    current_sources.add(app_current_source)
+        current_sources: List[AbstractCurrentSource] = list()
+        masks: List[NDArray[numpy.bool_]] = list()
+        for app_current_source in self._pop_vertex.current_sources:
+            mask = self.__selector_mask(
+                raster_ids, current_source_id_list[app_current_source])
+            if mask.any() and app_current_source not in current_sources:
+                current_sources.append(app_current_source)
+                masks.append(mask)
 
         # Sort the current sources into current_source_id order
-        return sorted(
-            current_sources, key=lambda x: x.current_source_id)
+        order = sorted(
+            range(len(current_sources)),
+            key=lambda i: current_sources[i].current_source_id)
+        return ([current_sources[i] for i in order],
+                numpy.array([masks[i] for i in order], dtype=bool).reshape(
+                    len(order), len(raster_ids)))
 
     def read_parameters_from_machine(self, placement: Placement):
         """
@@ -437,6 +469,55 @@ class PopulationMachineNeurons(
         """
         self._neuron_data.read_initial_data(placement, self._neuron_regions)
 
+    @staticmethod
+    def read_all_parameters_from_machine(placements: Sequence[Placement]):
+        """
+        Read the parameters and state of the neurons of several vertices
+        of the same population from the machine at the current time, all
+        together.
+
+        :param list(~pacman.model.placements.Placement) placements:
+            Where to read the data from; the vertices must all be
+            :py:class:`PopulationMachineNeurons` of the same population
+        """
+        if placements:
+            neuron_data, to_read = PopulationMachineNeurons.__to_read(
+                placements)
+            neuron_data.read_all_data(to_read)
+
+    @staticmethod
+    def read_all_initial_parameters_from_machine(
+            placements: Sequence[Placement]):
+        """
+        Read the parameters and state of the neurons of several vertices
+        of the same population from the machine as they were at the last
+        time 0, all together.
+
+        :param list(~pacman.model.placements.Placement) placements:
+            Where to read the data from; the vertices must all be
+            :py:class:`PopulationMachineNeurons` of the same population
+        """
+        if placements:
+            neuron_data, to_read = PopulationMachineNeurons.__to_read(
+                placements)
+            neuron_data.read_all_initial_data(to_read)
+
+    @staticmethod
+    def __to_read(placements: Sequence[Placement]) -> Tuple[
+            NeuronData, List[Tuple[Placement, NeuronRegions]]]:
+        """
+        Get the neuron data shared by the vertices of the placements, and
+        the regions to read for each placement.
+        """
+        # pylint: disable=protected-access
+        to_read = list()
+        for placement in placements:
+            vertex = placement.vertex
+            assert isinstance(vertex, PopulationMachineNeurons)
+            to_read.append((placement, vertex._neuron_regions))
+        vertex = cast(PopulationMachineNeurons, placements[0].vertex)
+        return vertex._neuron_data, to_read
+
     @overrides(AbstractNeuronExpandable.gen_neurons_on_machine)
     def gen_neurons_on_machine(self) -> bool:
         return self._neuron_data.gen_on_machine
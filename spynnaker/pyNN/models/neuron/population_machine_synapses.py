@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from typing import List, Sequence, Tuple, TYPE_CHECKING
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
 
-from numpy import floating
+from numpy import floating, integer, uint32
 from numpy.typing import NDArray
 
 from spinn_utilities.overrides import overrides
@@ -29,6 +29,7 @@ from spinn_front_end_common.utilities.helpful_functions import (
 from spinn_front_end_common.abstract_models import (
     AbstractSupportsBitFieldRoutingCompression)
 from spinn_front_end_common.interface.ds import DataSpecificationBase
+from spinn_front_end_common.interface.provenance import ProvenanceWriter
 
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamicsStructural, AbstractSDRAMSynapseDynamics)
@@ -253,9 +254,36 @@ class PopulationMachineSynapses(
     @overrides(HasSynapses.get_connections_from_machine)
     def get_connections_from_machine(
             self, placement: Placement, app_edge: ProjectionApplicationEdge,
-            synapse_info: SynapseInformation) -> Sequence[NDArray]:
+            synapse_info: SynapseInformation,
+            pre_indices: Optional[NDArray[integer]] = None
+            ) -> Sequence[NDArray]:
         return self._synaptic_matrices.get_connections_from_machine(
-            placement, app_edge, synapse_info)
+            placement, app_edge, synapse_info, pre_indices)
+
+    @overrides(HasSynapses.get_changed_rows)
+    def get_changed_rows(
+            self, app_edge: ProjectionApplicationEdge,
+            synapse_info: SynapseInformation, connections: NDArray,
+            new_connections: NDArray) -> List[Tuple[int, NDArray[uint32]]]:
+        return self._synaptic_matrices.get_changed_rows(
+            self.vertex_slice, app_edge, synapse_info, connections,
+            new_connections)
+
+    @overrides(HasSynapses.write_changed_rows)
+    def write_changed_rows(
+            self, placement: Placement,
+            changed_rows: Sequence[Tuple[int, NDArray[uint32]]]):
+        self._synaptic_matrices.write_changed_rows(placement, changed_rows)
+
+    @overrides(PopulationMachineSynapsesProvenance._parse_synapse_provenance)
+    def _parse_synapse_provenance(
+            self, label: str, x: int, y: int, p: int,
+            provenance_data: Sequence[int]):
+        super()._parse_synapse_provenance(label, x, y, p, provenance_data)
+        with ProvenanceWriter() as db:
+            db.insert_core(
+                x, y, p, self.POP_TABLE_SEARCH_DEPTH,
+                self._synaptic_matrices.pop_table_search_depth)
 
     @property
     @overrides(AbstractSynapseExpandable.max_gen_data)
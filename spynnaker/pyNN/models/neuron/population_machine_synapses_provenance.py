@@ -66,6 +66,7 @@ class PopulationMachineSynapsesProvenance(object):
     SYNAPSES_SKIPPED = "Skipped synapses"
     LATE_SPIKES = "Late spikes"
     MAX_LATE_SPIKE = "Max late spike"
+    POP_TABLE_SEARCH_DEPTH = "Mean master pop table search depth"
 
     def _parse_synapse_provenance(
             self, label: str, x: int, y: int, p: int,
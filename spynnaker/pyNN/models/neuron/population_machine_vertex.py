@@ -101,6 +101,7 @@ class PopulationMachineVertex(
         "__slice_index",
         "__max_atoms_per_core",
         "__regenerate_neuron_data",
+        "__regenerate_current_source_data",
         "__regenerate_synapse_data")
 
     INPUT_BUFFER_FULL_NAME = "Times_the_input_buffer_lost_packets"
@@ -208,6 +209,7 @@ class PopulationMachineVertex(
         self.__synaptic_matrices = synaptic_matrices
         self.__neuron_data = neuron_data
         self.__regenerate_neuron_data = False
+        self.__regenerate_current_source_data = False
         self.__regenerate_synapse_data = False
 
     @property
@@ -342,9 +344,11 @@ class PopulationMachineVertex(
         AbstractRewritesDataSpecification.regenerate_data_specification)
     def regenerate_data_specification(
             self, spec: DataSpecificationReloader, placement: Placement):
-        if self.__regenerate_neuron_data:
-            self._rewrite_neuron_data_spec(spec)
-            self.__regenerate_neuron_data = False
+        self._rewrite_neuron_data_spec(
+            spec, self.__regenerate_neuron_data,
+            self.__regenerate_current_source_data)
+        self.__regenerate_neuron_data = False
+        self.__regenerate_current_source_data = False
 
         if self.__regenerate_synapse_data:
             self._write_synapse_data_spec(
@@ -357,12 +361,19 @@ class PopulationMachineVertex(
 
     @overrides(AbstractRewritesDataSpecification.reload_required)
     def reload_required(self) -> bool:
-        return self.__regenerate_neuron_data or self.__regenerate_synapse_data
+        return (self.__regenerate_neuron_data or
+                self.__regenerate_current_source_data or
+                self.__regenerate_synapse_data)
 
     @overrides(AbstractRewritesDataSpecification.set_reload_required)
     def set_reload_required(self, new_value: bool):
-        # These are set elsewhere once data is generated
-        pass
+        # Only changes to the current sources are marked this way; the
+        # neuron and synapse data are marked by set_do_neuron_regeneration
+        # and set_do_synapse_regeneration
+        self.__regenerate_current_source_data = new_value
+        if not new_value:
+            self.__regenerate_neuron_data = False
+            self.__regenerate_synapse_data = False
 
     def _parse_spike_processing_provenance(
             self, label: str, x: int, y: int, p: int,
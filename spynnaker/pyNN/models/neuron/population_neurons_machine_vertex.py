@@ -82,7 +82,8 @@ class PopulationNeuronsMachineVertex(
         "__slice_index",
         "__neuron_data",
         "__max_atoms_per_core",
-        "__regenerate_data")
+        "__regenerate_neuron_data",
+        "__regenerate_current_source_data")
 
     class REGIONS(IntEnum):
         """
@@ -156,7 +157,8 @@ class PopulationNeuronsMachineVertex(
         self.__weight_scales = weight_scales
         self.__neuron_data = neuron_data
         self.__max_atoms_per_core = max_atoms_per_core
-        self.__regenerate_data = False
+        self.__regenerate_neuron_data = False
+        self.__regenerate_current_source_data = False
 
     @property
     def _vertex_slice(self) -> Slice:
@@ -283,19 +285,27 @@ class PopulationNeuronsMachineVertex(
         AbstractRewritesDataSpecification.regenerate_data_specification)
     def regenerate_data_specification(
             self, spec: DataSpecificationReloader, placement: Placement):
-        # Write the other parameters
-        self._rewrite_neuron_data_spec(spec)
+        self._rewrite_neuron_data_spec(
+            spec, self.__regenerate_neuron_data,
+            self.__regenerate_current_source_data)
+        self.__regenerate_neuron_data = False
+        self.__regenerate_current_source_data = False
 
         # close spec
         spec.end_specification()
 
     @overrides(AbstractRewritesDataSpecification.reload_required)
     def reload_required(self) -> bool:
-        return self.__regenerate_data
+        return (self.__regenerate_neuron_data or
+                self.__regenerate_current_source_data)
 
     @overrides(AbstractRewritesDataSpecification.set_reload_required)
     def set_reload_required(self, new_value: bool):
-        self.__regenerate_data = new_value
+        # Only changes to the current sources are marked this way; the
+        # neuron data is marked by set_do_neuron_regeneration
+        self.__regenerate_current_source_data = new_value
+        if not new_value:
+            self.__regenerate_neuron_data = False
 
     @property
     @overrides(ReceivesSynapticInputsOverSDRAM.weight_scales)
@@ -337,7 +347,7 @@ class PopulationNeuronsMachineVertex(
 
     @overrides(PopulationMachineNeurons.set_do_neuron_regeneration)
     def set_do_neuron_regeneration(self) -> None:
-        self.__regenerate_data = True
+        self.__regenerate_neuron_data = True
         self.__neuron_data.reset_generation()
 
     @overrides(MachineVertex.get_n_keys_for_partition)
@@ -22,7 +22,7 @@ from pyNN.standardmodels.synapses import StaticSynapse
 
 from spinn_utilities.overrides import overrides
 
-from spinn_front_end_common.interface.ds import DataType, DataSpecificationBase
+from spinn_front_end_common.interface.ds import DataSpecificationBase
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
 from spynnaker.pyNN.data import SpynnakerDataView
@@ -31,7 +31,7 @@ from spynnaker.pyNN.exceptions import (
 from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
     NUMPY_CONNECTORS_DTYPE)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.common import (
-    STDP_FIXED_POINT_ONE, get_exp_lut_array)
+    STDP_FIXED_POINT_ONE, get_exp_lut_array, get_s1615_array)
 from spynnaker.pyNN.types import Weight_Delay_In_Types as _Weight
 
 from .abstract_plastic_synapse_dynamics import AbstractPlasticSynapseDynamics
@@ -172,17 +172,12 @@ class SynapseDynamicsNeuromodulation(
             global_weight_scale: float,
             synapse_weight_scales: NDArray[floating]):
         # Calculate constant component in Izhikevich's model weight update
-        # function and write to SDRAM.
+        # function and write to SDRAM, followed by the max and min weight
         weight_update_component = \
             1 / (-((1.0/self.__tau_c) + (1.0/self.__tau_d)))
-        spec.write_value(data=weight_update_component,
-                         data_type=DataType.S1615)
-
-        # Write min and max weight
-        spec.write_value(data=self.__w_max * global_weight_scale,
-                         data_type=DataType.S1615)
-        spec.write_value(data=self.__w_min * global_weight_scale,
-                         data_type=DataType.S1615)
+        spec.write_array(get_s1615_array((
+            weight_update_component, self.__w_max * global_weight_scale,
+            self.__w_min * global_weight_scale)))
 
         # Write the LUT arrays
         spec.write_array(self.__tau_c_data)
@@ -0,0 +1,1097 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A host emulation of the synapse expander binary, so that connections which
+would be generated on the machine can be seen without one.
+
+The data written for the expander is read in the same way as the binary
+reads it, and the same random number streams are used in the same order.
+Constant, uniform and fixed-probability generation therefore builds exactly
+the same matrices as the machine.  The normal and exponential distributions
+of the machine use approximations that are not available here, so the values
+drawn from these will differ slightly; an exponential distribution also
+uses a variable number of random values on the machine, so anything drawn
+after it from the same stream will differ.
+"""
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy
+from numpy import int64, uint16, uint32, uint64
+from numpy.typing import NDArray
+from scipy.special import ndtri
+
+from spinn_utilities.log import FormatAdapter
+
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.models.neural_projections.connectors.\
+    abstract_generate_connector_on_machine import ConnectorIDs
+from spynnaker.pyNN.models.neuron.synapse_dynamics.\
+    abstract_generate_on_machine import MatrixGeneratorID
+from spynnaker.pyNN.utilities.mars_kiss_64 import MarsKiss64
+from .generator_data import SYN_REGION_UNUSED
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The header words of the expander data before the weight scales
+_N_CONFIG_WORDS = 18
+
+#: The index in the header of the first random seed word
+_POP_SEED_INDEX = 10
+_CORE_SEED_INDEX = 14
+
+#: The words of each connection before the generator parameters
+_N_CONNECTION_WORDS = 9
+
+#: The header words of each row of a synaptic matrix
+_N_ROW_HEADER_WORDS = 3
+
+#: Fractional bits of the S1615 (accum) values of the generators
+_S1615_SHIFT = 15
+_S1615_ONE = 1 << _S1615_SHIFT
+
+#: The range of a random value as an unsigned fraction
+_FRACT_ONE = float(1 << 32)
+
+#: The weight part of a synaptic word
+_WEIGHT_SHIFT = 16
+_WEIGHT_MASK = 0xFFFF
+
+#: The machine gives up a clipped distribution after this many redraws
+_MAX_REDRAWS = 1000
+
+#: The mask and shift used to get a small random integer in a range
+_SMALL_RANGE_MASK = 0x7FFF
+_SMALL_RANGE_SHIFT = 15
+
+_MASK_32 = 0xFFFFFFFF
+
+#: The most random values to hold at once when a lot are needed
+_MAX_CHUNK = 1 << 20
+
+_Synapses = Tuple[NDArray[int64], NDArray[int64], NDArray[int64],
+                  NDArray[int64]]
+
+
+class _Words(object):
+    """
+    Reads words from the data in turn.
+    """
+    __slots__ = ("__data", "__pos")
+
+    def __init__(self, data: NDArray[uint32], pos: int = 0):
+        self.__data = data
+        self.__pos = pos
+
+    def next(self) -> int:
+        """ The next word as an unsigned integer. """
+        value = int(self.__data[self.__pos])
+        self.__pos += 1
+        return value
+
+    def next_s1615(self) -> int:
+        """ The next word as the raw value of a signed accum. """
+        value = self.next()
+        return value - (1 << 32) if value & 0x80000000 else value
+
+    def next_array(self, n_words: int) -> NDArray[uint32]:
+        """ The next words as an array. """
+        values = self.__data[self.__pos:self.__pos + n_words]
+        self.__pos += n_words
+        return values
+
+
+def _mul_fract(draws: NDArray[uint32], value: int) -> NDArray[int64]:
+    """
+    Multiply a signed fixed-point value by random unsigned fractions,
+    truncating as the machine does, without overflowing 64 bits.
+    """
+    draws_64 = draws.astype(int64)
+    high = (draws_64 >> 16) * value
+    low = (draws_64 & 0xFFFF) * value
+    return (high + (low >> 16)) >> 16
+
+
+def _to_s1615(values: NDArray) -> NDArray[int64]:
+    return numpy.floor(values * _S1615_ONE).astype(int64)
+
+
+def _normal(draws: NDArray[uint32]) -> NDArray[numpy.float64]:
+    """
+    Convert random values to normally distributed values.  The machine
+    uses a table-based approximation of the inverse distribution.
+    """
+    return ndtri((draws.astype(numpy.float64) + 0.5) / _FRACT_ONE)
+
+
+class _ParamGenerator(object):
+    """
+    Generates the S1615 values of a weight or delay.
+    """
+    __slots__ = ()
+
+    #: The random values used for each value, or None if this varies
+    n_draws: Optional[int] = 1
+
+    def from_draws(self, draws: NDArray[uint32]) -> NDArray[int64]:
+        """
+        The values generated from random values.  When the number of draws
+        varies, the values must still be checked with :py:meth:`accepts`.
+        """
+        raise NotImplementedError
+
+    def accepts(self, values: NDArray[int64]) -> NDArray[numpy.bool_]:
+        """
+        Whether each value drawn is kept or drawn again.
+        """
+        return numpy.ones(len(values), dtype=numpy.bool_)
+
+    def generate(self, rng: MarsKiss64, n_values: int) -> NDArray[int64]:
+        """
+        Generate values when nothing else uses the random values between.
+        """
+        if self.n_draws is not None:
+            return self.from_draws(rng.take(n_values))
+        values: List[NDArray[int64]] = []
+        n_needed = n_values
+        while n_needed:
+            draws = rng.peek(max(2 * n_needed, 64))
+            drawn = self.from_draws(draws)
+            kept = numpy.flatnonzero(self.accepts(drawn))
+            if len(kept) >= n_needed:
+                values.append(drawn[kept[:n_needed]])
+                rng.skip(int(kept[n_needed - 1]) + 1)
+                break
+            if not len(kept) and len(draws) >= _MAX_REDRAWS:
+                raise SpynnakerException(
+                    f"Maximum number of redraws ({_MAX_REDRAWS}) exceeded "
+                    f"by {self}")
+            values.append(drawn[kept])
+            rng.skip(len(draws))
+            n_needed -= len(kept)
+        if not values:
+            return numpy.zeros(0, dtype=int64)
+        return numpy.concatenate(values)
+
+    def next_value(self, rng: MarsKiss64) -> int:
+        """
+        Generate a single value.
+        """
+        for _ in range(_MAX_REDRAWS):
+            value = self.from_draws(numpy.array([rng.next()], dtype=uint32))
+            if self.accepts(value)[0]:
+                return int(value[0])
+        raise SpynnakerException(
+            f"Maximum number of redraws ({_MAX_REDRAWS}) exceeded by {self}")
+
+
+class _Constant(_ParamGenerator):
+    __slots__ = ("__value", )
+    n_draws = 0
+
+    def __init__(self, words: _Words):
+        self.__value = words.next_s1615()
+
+    def from_draws(self, draws: NDArray[uint32]) -> NDArray[int64]:
+        return numpy.full(len(draws), self.__value, dtype=int64)
+
+    def generate(self, rng: MarsKiss64, n_values: int) -> NDArray[int64]:
+        return numpy.full(n_values, self.__value, dtype=int64)
+
+    def next_value(self, rng: MarsKiss64) -> int:
+        return self.__value
+
+
+class _Uniform(_ParamGenerator):
+    __slots__ = ("__low", "__range")
+
+    def __init__(self, words: _Words):
+        self.__low = words.next_s1615()
+        self.__range = words.next_s1615() - self.__low
+
+    def from_draws(self, draws: NDArray[uint32]) -> NDArray[int64]:
+        return self.__low + _mul_fract(draws, self.__range)
+
+
+class _Normal(_ParamGenerator):
+    __slots__ = ("__mu", "__sigma")
+
+    def __init__(self, words: _Words):
+        self.__mu = words.next_s1615() / _S1615_ONE
+        self.__sigma = words.next_s1615() / _S1615_ONE
+
+    def from_draws(self, draws: NDArray[uint32]) -> NDArray[int64]:
+        return _to_s1615(_normal(draws) * self.__sigma + self.__mu)
+
+
+class _NormalClipped(_Normal):
+    __slots__ = ("__low", "__high")
+    n_draws = None
+
+    def __init__(self, words: _Words):
+        super().__init__(words)
+        self.__low = words.next_s1615()
+        self.__high = words.next_s1615()
+
+    def accepts(self, values: NDArray[int64]) -> NDArray[numpy.bool_]:
+        return (values >= self.__low) & (values <= self.__high)
+
+
+class _NormalClippedToBoundary(_Normal):
+    __slots__ = ("__low", "__high")
+
+    def __init__(self, words: _Words):
+        super().__init__(words)
+        self.__low = words.next_s1615()
+        self.__high = words.next_s1615()
+
+    def from_draws(self, draws: NDArray[uint32]) -> NDArray[int64]:
+        return numpy.clip(super().from_draws(draws), self.__low, self.__high)
+
+
+class _Exponential(_ParamGenerator):
+    __slots__ = ("__beta", )
+
+    def __init__(self, words: _Words):
+        self.__beta = words.next_s1615() / _S1615_ONE
+
+    def from_draws(self, draws: NDArray[uint32]) -> NDArray[int64]:
+        uniform = (draws.astype(numpy.float64) + 0.5) / _FRACT_ONE
+        return _to_s1615(-numpy.log(uniform) * self.__beta)
+
+
+class _ExponentialClipped(_ParamGenerator):
+    # The machine draws these from a normal distribution
+    __slots__ = ("__beta", "__low", "__high")
+    n_draws = None
+
+    def __init__(self, words: _Words):
+        self.__beta = words.next_s1615() / _S1615_ONE
+        self.__low = words.next_s1615()
+        self.__high = words.next_s1615()
+
+    def from_draws(self, draws: NDArray[uint32]) -> NDArray[int64]:
+        return _to_s1615(_normal(draws) * self.__beta)
+
+    def accepts(self, values: NDArray[int64]) -> NDArray[numpy.bool_]:
+        return (values >= self.__low) & (values <= self.__high)
+
+
+#: The parameter generators by ID; see param_generator_data.py
+_PARAM_GENERATORS: Dict[int, Callable[[_Words], _ParamGenerator]] = {
+    0: _Constant,
+    1: _Uniform,
+    2: _Normal,
+    3: _NormalClipped,
+    4: _NormalClippedToBoundary,
+    5: _Exponential,
+    6: _ExponentialClipped
+}
+
+
+def _read_param_generator(param_type: int, words: _Words) -> _ParamGenerator:
+    if param_type not in _PARAM_GENERATORS:
+        raise SpynnakerException(
+            f"Parameter generator {param_type} cannot be emulated")
+    return _PARAM_GENERATORS[param_type](words)
+
+
+class _Connection(object):
+    """
+    The details of one incoming connection, as read by the expander.
+    """
+    __slots__ = (
+        "pre_lo", "pre_hi", "post_lo", "post_hi", "post_slice_start",
+        "post_slice_count", "population_rng", "core_rng", "weights", "delays")
+
+    def __init__(
+            self, pre_lo: int, pre_hi: int, post_lo: int, post_hi: int,
+            post_slice_start: int, post_slice_count: int,
+            population_rng: MarsKiss64, core_rng: MarsKiss64,
+            weights: _ParamGenerator, delays: _ParamGenerator):
+        self.pre_lo = pre_lo
+        self.pre_hi = pre_hi
+        self.post_lo = post_lo
+        self.post_hi = post_hi
+        self.post_slice_start = post_slice_start
+        self.post_slice_count = post_slice_count
+        self.population_rng = population_rng
+        self.core_rng = core_rng
+        self.weights = weights
+        self.delays = delays
+
+    @property
+    def post_range(self) -> Tuple[int, int]:
+        """ The first and last post-neuron on this core, inclusive. """
+        return (max(self.post_slice_start, self.post_lo),
+                min(self.post_slice_start + self.post_slice_count - 1,
+                    self.post_hi))
+
+    @property
+    def fixed_draws(self) -> Optional[int]:
+        """
+        The random values used by the weight and delay of each synapse, or
+        None if this varies.
+        """
+        if self.weights.n_draws is None or self.delays.n_draws is None:
+            return None
+        return self.weights.n_draws + self.delays.n_draws
+
+    def from_draws(
+            self, draws: NDArray[uint32]) -> Tuple[
+                NDArray[int64], NDArray[int64]]:
+        """
+        The weights and delays from the random values drawn for each
+        synapse in the columns of a 2D array, when the number is fixed.
+        """
+        n_weight = self.weights.n_draws or 0
+        n_delay = self.delays.n_draws or 0
+        n_synapses = draws.shape[0]
+        weights = (
+            self.weights.from_draws(draws[:, 0]) if n_weight
+            else self.weights.generate(self.core_rng, n_synapses))
+        delays = (
+            self.delays.from_draws(draws[:, n_weight]) if n_delay
+            else self.delays.generate(self.core_rng, n_synapses))
+        return weights, delays
+
+    def weights_and_delays(
+            self, n_synapses: int, n_extra: int = 0) -> Tuple[
+                NDArray[int64], NDArray[int64], NDArray[uint32]]:
+        """
+        Generate the weight then the delay of each synapse in turn from the
+        core random numbers, followed by some extra random values.
+
+        :return: The weights, the delays, and the extra values of each
+            synapse in the columns of a 2D array
+        """
+        n_draws = self.fixed_draws
+        if n_draws is not None:
+            draws = self.core_rng.take(
+                n_synapses * (n_draws + n_extra)).reshape(
+                    n_synapses, n_draws + n_extra)
+            weights, delays = self.from_draws(draws)
+            return weights, delays, draws[:, n_draws:]
+        if not n_extra and (
+                self.weights.n_draws == 0 or self.delays.n_draws == 0):
+            return (self.weights.generate(self.core_rng, n_synapses),
+                    self.delays.generate(self.core_rng, n_synapses),
+                    numpy.zeros((n_synapses, 0), dtype=uint32))
+        weights = numpy.zeros(n_synapses, dtype=int64)
+        delays = numpy.zeros(n_synapses, dtype=int64)
+        extra = numpy.zeros((n_synapses, n_extra), dtype=uint32)
+        for i in range(n_synapses):
+            weights[i] = self.weights.next_value(self.core_rng)
+            delays[i] = self.delays.next_value(self.core_rng)
+            for j in range(n_extra):
+                extra[i, j] = self.core_rng.next()
+        return weights, delays, extra
+
+
+def _all_pairs(
+        connection: _Connection, allow_self: bool) -> Tuple[
+            NDArray[int64], NDArray[int64]]:
+    """
+    The pre- and post-neurons of every pair on this core, in the order
+    tried by the machine.
+    """
+    post_start, post_end = connection.post_range
+    pres = numpy.arange(connection.pre_lo, connection.pre_hi + 1, dtype=int64)
+    posts = numpy.arange(post_start, post_end + 1, dtype=int64)
+    pre = numpy.repeat(pres, len(posts))
+    post = numpy.tile(posts, len(pres))
+    if not allow_self:
+        keep = pre != post
+        pre = pre[keep]
+        post = post[keep]
+    return pre, post
+
+
+def _range_value(draws: NDArray[uint32], n_values) -> NDArray[int64]:
+    """ Random integers in a range from full random values. """
+    return ((draws.astype(uint64) * uint64(n_values)) >> uint64(32)).astype(
+        int64)
+
+
+def _small_range_value(draws: NDArray[uint32], n_values) -> NDArray[int64]:
+    """ Random integers in a range from the bottom 15 bits of values. """
+    product = (draws.astype(uint64) & uint64(_SMALL_RANGE_MASK)) * uint64(
+        n_values)
+    return ((product & uint64(_MASK_32)) >> uint64(_SMALL_RANGE_SHIFT)).astype(
+        int64)
+
+
+def _reservoir(
+        values: NDArray[int64], slots: NDArray[int64],
+        replacements: NDArray[int64]) -> None:
+    """
+    Replace values at the given slots in turn, so the last replacement of
+    each slot is the one that remains; slots out of range are ignored.
+    """
+    in_range = numpy.flatnonzero(slots < len(values))[::-1]
+    last_slots, last = numpy.unique(slots[in_range], return_index=True)
+    values[last_slots] = replacements[in_range[last]]
+
+
+def _one_to_one(connection: _Connection, _words: _Words) -> _Synapses:
+    post_slice_end = (
+        connection.post_slice_start + connection.post_slice_count - 1)
+    if (connection.post_lo > post_slice_end or
+            connection.post_hi < connection.post_slice_start):
+        return _no_synapses()
+    post_start, post_end = connection.post_range
+    pre_start = connection.pre_lo + post_start - connection.post_lo
+    pre_end = min(pre_start + post_end - post_start, connection.pre_hi)
+    pre = numpy.arange(pre_start, pre_end + 1, dtype=int64)
+    post = numpy.arange(post_start, post_start + len(pre), dtype=int64)
+    weights, delays, _ = connection.weights_and_delays(len(pre))
+    return pre, post - connection.post_slice_start, weights, delays
+
+
+def _all_to_all(connection: _Connection, words: _Words) -> _Synapses:
+    allow_self = bool(words.next())
+    pre, post = _all_pairs(connection, allow_self)
+    weights, delays, _ = connection.weights_and_delays(len(pre))
+    return pre, post - connection.post_slice_start, weights, delays
+
+
+def _fixed_probability(connection: _Connection, words: _Words) -> _Synapses:
+    allow_self = bool(words.next())
+    probability = words.next()
+    pre, post = _all_pairs(connection, allow_self)
+    n_pairs = len(pre)
+    n_draws = connection.fixed_draws
+    rng = connection.core_rng
+
+    if n_draws is None:
+        chosen = []
+        weights_list = []
+        delays_list = []
+        for pair in range(n_pairs):
+            if rng.next() < probability:
+                chosen.append(pair)
+                weights_list.append(connection.weights.next_value(rng))
+                delays_list.append(connection.delays.next_value(rng))
+        index = numpy.array(chosen, dtype=int64)
+        return (pre[index], post[index] - connection.post_slice_start,
+                numpy.array(weights_list, dtype=int64),
+                numpy.array(delays_list, dtype=int64))
+
+    # Each pair uses one value, and each synapse made uses n_draws more;
+    # work out which values are the ones tested from the values taken
+    n_expected = n_pairs * (1 + n_draws * probability / _FRACT_ONE)
+    n_values = int(n_expected * 1.1) + 64
+    while True:
+        draws = rng.peek(n_values)
+        positions = numpy.flatnonzero(draws < probability)
+        positions = positions[_first_of_runs(positions, n_draws)]
+
+        # The pair tested by each chosen value, and the values used up
+        pairs = positions - n_draws * numpy.arange(len(positions))
+        n_chosen = int(numpy.searchsorted(pairs, n_pairs))
+        n_used = n_pairs + n_draws * n_chosen
+        if n_used <= n_values:
+            break
+        n_values = n_used + 64
+
+    positions = positions[:n_chosen]
+    pairs = pairs[:n_chosen]
+    draw_index = positions[:, None] + 1 + numpy.arange(n_draws)
+    weights, delays = connection.from_draws(
+        draws[draw_index].reshape(n_chosen, n_draws))
+    rng.skip(n_used)
+    return (pre[pairs], post[pairs] - connection.post_slice_start,
+            weights, delays)
+
+
+def _first_of_runs(
+        positions: NDArray[numpy.intp], n_skip: int) -> NDArray[numpy.bool_]:
+    """
+    Find which of the positions are tested, given that each one that is
+    causes the next n_skip values to be used for something else.
+    """
+    tested = numpy.ones(len(positions), dtype=numpy.bool_)
+    if not n_skip or len(positions) < 2:
+        return tested
+    # A position that is far enough after the one before is always tested
+    close = numpy.flatnonzero(numpy.diff(positions) <= n_skip) + 1
+    for i in close:
+        j = i - 1
+        while j >= 0 and positions[i] - positions[j] <= n_skip:
+            if tested[j]:
+                tested[i] = False
+                break
+            j -= 1
+    return tested
+
+
+def _fixed_total(connection: _Connection, words: _Words) -> _Synapses:
+    allow_self = bool(words.next())
+    with_replacement = bool(words.next())
+    n_conns = words.next()
+    n_pre = connection.pre_hi - connection.pre_lo + 1
+    n_post = connection.post_hi - connection.post_lo + 1
+    slice_start = connection.post_slice_start
+    slice_end = slice_start + connection.post_slice_count
+
+    if with_replacement:
+        post = _range_value(
+            connection.population_rng.take(n_conns), n_post) + (
+                connection.post_lo)
+        post = post[(post >= slice_start) & (post < slice_end)]
+        if allow_self:
+            weights, delays, extra = connection.weights_and_delays(
+                len(post), 1)
+            pre = _range_value(extra[:, 0], n_pre) + connection.pre_lo
+            return pre, post - slice_start, weights, delays
+        rng = connection.core_rng
+        pre = numpy.zeros(len(post), dtype=int64)
+        weights = numpy.zeros(len(post), dtype=int64)
+        delays = numpy.zeros(len(post), dtype=int64)
+        for i, post_i in enumerate(post):
+            weights[i] = connection.weights.next_value(rng)
+            delays[i] = connection.delays.next_value(rng)
+            pre_i = post_i
+            while pre_i == post_i:
+                pre_i = int(_range_value(
+                    numpy.array([rng.next()], dtype=uint32), n_pre)[0]) + (
+                        connection.pre_lo)
+            pre[i] = pre_i
+        return pre, post - slice_start, weights, delays
+
+    # Choose from the pairs in the order they are tried, by index
+    pairs = _FixedTotalPairs(connection, allow_self)
+    n_conns = min(n_conns, pairs.n_pairs)
+    chosen = numpy.arange(n_conns, dtype=int64)
+    for first in range(n_conns, pairs.n_pairs, _MAX_CHUNK):
+        others = numpy.arange(
+            first, min(first + _MAX_CHUNK, pairs.n_pairs), dtype=int64)
+        slots = _range_value(
+            connection.population_rng.take(len(others)), others + 1)
+        _reservoir(chosen, slots, others)
+    pre, post = pairs.pair(chosen)
+    in_slice = (post >= slice_start) & (post < slice_end)
+    weights, delays, _ = connection.weights_and_delays(
+        int(numpy.count_nonzero(in_slice)))
+    return pre[in_slice], post[in_slice] - slice_start, weights, delays
+
+
+class _FixedTotalPairs(object):
+    """
+    The pairs tried by the fixed total connector without replacement, with
+    the pre-neuron changing fastest.  When self-connections are not allowed,
+    these are left out, except for the first pair which is not checked.
+    """
+    __slots__ = ("__pre_lo", "__post", "__skips", "__starts", "n_pairs")
+
+    def __init__(self, connection: _Connection, allow_self: bool):
+        n_pre = connection.pre_hi - connection.pre_lo + 1
+        self.__pre_lo = connection.pre_lo
+        self.__post = numpy.arange(
+            connection.post_lo, connection.post_hi + 1, dtype=int64)
+        self.__skips = numpy.zeros(len(self.__post), dtype=numpy.bool_)
+        if not allow_self:
+            self.__skips = (
+                (self.__post >= connection.pre_lo) &
+                (self.__post <= connection.pre_hi))
+            if connection.pre_lo == connection.post_lo:
+                self.__skips[0] = False
+        n_per_post = n_pre - self.__skips
+        self.__starts = numpy.concatenate(([0], numpy.cumsum(n_per_post)))
+        self.n_pairs = int(self.__starts[-1])
+
+    def pair(self, index: NDArray[int64]) -> Tuple[
+            NDArray[int64], NDArray[int64]]:
+        """ The pre- and post-neurons of the pairs with the given indices. """
+        column = numpy.searchsorted(self.__starts, index, side="right") - 1
+        post = self.__post[column]
+        pre = self.__pre_lo + index - self.__starts[column]
+        pre += self.__skips[column] & (pre >= post)
+        return pre, post
+
+
+def _fixed_pre(connection: _Connection, words: _Words) -> _Synapses:
+    allow_self = bool(words.next())
+    with_replacement = bool(words.next())
+    n_conns = words.next()
+    post_start, post_end = connection.post_range
+    n_values = connection.pre_hi - connection.pre_lo + 1
+    rng = connection.core_rng
+    synapses: List[_Synapses] = []
+    for post in range(post_start, post_end + 1):
+        local_post = numpy.full(
+            n_conns, post - connection.post_slice_start, dtype=int64)
+        if with_replacement and allow_self:
+            weights, delays, extra = connection.weights_and_delays(n_conns, 1)
+            pre = _small_range_value(extra[:, 0], n_values) + (
+                connection.pre_lo)
+        elif with_replacement:
+            pre = numpy.zeros(n_conns, dtype=int64)
+            weights = numpy.zeros(n_conns, dtype=int64)
+            delays = numpy.zeros(n_conns, dtype=int64)
+            for j in range(n_conns):
+                weights[j] = connection.weights.next_value(rng)
+                delays[j] = connection.delays.next_value(rng)
+                pre_j = post
+                while pre_j == post:
+                    pre_j = int(_small_range_value(
+                        numpy.array([rng.next()], dtype=uint32),
+                        n_values)[0]) + connection.pre_lo
+                pre[j] = pre_j
+        else:
+            pre = _reservoir_sample(
+                rng, n_conns, n_values, connection.pre_lo, post, allow_self)
+            weights, delays, _ = connection.weights_and_delays(n_conns)
+        synapses.append((pre, local_post, weights, delays))
+    return _join(synapses)
+
+
+def _reservoir_sample(
+        rng: MarsKiss64, n_conns: int, n_values: int, lo: int, other: int,
+        allow_self: bool) -> NDArray[int64]:
+    """
+    Choose values without replacement as the machine does, which compares
+    the index of each value (not the value itself) with the other neuron
+    when avoiding self-connections.
+    """
+    values = numpy.arange(lo, lo + n_conns, dtype=int64)
+    replace_start = n_conns
+    if not allow_self and other < n_conns:
+        values[other] = n_conns
+        replace_start = n_conns + 1
+    indices = numpy.arange(replace_start, n_values, dtype=int64)
+    if not allow_self:
+        indices = indices[indices != other]
+    slots = _small_range_value(rng.take(len(indices)), indices + 1)
+    _reservoir(values, slots, indices + lo)
+    # The machine holds these in 16 bits
+    return values & 0xFFFF
+
+
+def _fixed_post(connection: _Connection, words: _Words) -> _Synapses:
+    allow_self = bool(words.next())
+    with_replacement = bool(words.next())
+    n_conns = words.next()
+    n_values = connection.post_hi - connection.post_lo + 1
+    slice_start = connection.post_slice_start
+    slice_end = slice_start + connection.post_slice_count
+    rng = connection.population_rng
+    pres: List[NDArray[int64]] = []
+    posts: List[NDArray[int64]] = []
+    for pre in range(connection.pre_lo, connection.pre_hi + 1):
+        if with_replacement:
+            post = numpy.zeros(0, dtype=int64)
+            while len(post) < n_conns:
+                n_needed = n_conns - len(post)
+                draws = rng.peek(n_needed if allow_self else 2 * n_needed)
+                drawn = _small_range_value(draws, n_values) + (
+                    connection.post_lo)
+                kept = numpy.flatnonzero(allow_self | (drawn != pre))
+                kept = kept[:n_needed]
+                post = numpy.concatenate((post, drawn[kept]))
+                rng.skip(int(kept[-1]) + 1 if len(kept) == n_needed
+                         else len(draws))
+        else:
+            post = _reservoir_sample(
+                rng, n_conns, n_values, connection.post_lo, pre, allow_self)
+        post = post[(post >= slice_start) & (post < slice_end)]
+        posts.append(post - slice_start)
+        pres.append(numpy.full(len(post), pre, dtype=int64))
+    pre_all = numpy.concatenate(pres) if pres else numpy.zeros(0, int64)
+    post_all = numpy.concatenate(posts) if posts else numpy.zeros(0, int64)
+    weights, delays, _ = connection.weights_and_delays(len(pre_all))
+    return pre_all, post_all, weights, delays
+
+
+def _no_synapses() -> _Synapses:
+    empty = numpy.zeros(0, dtype=int64)
+    return empty, empty, empty, empty
+
+
+def _join(synapses: List[_Synapses]) -> _Synapses:
+    if not synapses:
+        return _no_synapses()
+    pre, post, weights, delays = zip(*synapses)
+    return (numpy.concatenate(pre), numpy.concatenate(post),
+            numpy.concatenate(weights), numpy.concatenate(delays))
+
+
+#: The connection generators by ID
+_CONNECTION_GENERATORS: Dict[
+        int, Callable[[_Connection, _Words], _Synapses]] = {
+    ConnectorIDs.ONE_TO_ONE_CONNECTOR.value: _one_to_one,
+    ConnectorIDs.ALL_TO_ALL_CONNECTOR.value: _all_to_all,
+    ConnectorIDs.FIXED_PROBABILITY_CONNECTOR.value: _fixed_probability,
+    ConnectorIDs.FIXED_TOTAL_NUMBER_CONNECTOR.value: _fixed_total,
+    ConnectorIDs.FIXED_NUMBER_PRE_CONNECTOR.value: _fixed_pre,
+    ConnectorIDs.FIXED_NUMBER_POST_CONNECTOR.value: _fixed_post
+}
+
+#: The words of parameters of each connection generator
+_N_CONNECTOR_WORDS: Dict[int, int] = {
+    ConnectorIDs.ONE_TO_ONE_CONNECTOR.value: 0,
+    ConnectorIDs.ALL_TO_ALL_CONNECTOR.value: 1,
+    ConnectorIDs.FIXED_PROBABILITY_CONNECTOR.value: 2,
+    ConnectorIDs.FIXED_TOTAL_NUMBER_CONNECTOR.value: 3,
+    ConnectorIDs.FIXED_NUMBER_PRE_CONNECTOR.value: 3,
+    ConnectorIDs.FIXED_NUMBER_POST_CONNECTOR.value: 3
+}
+
+
+class _MatrixGenerator(object):
+    """
+    Writes synapses into the rows of the undelayed and delayed matrices.
+    """
+    __slots__ = (
+        "_region", "_offset", "_delayed_offset", "_max_row_n_words",
+        "_max_delayed_row_n_words", "_synapse_type", "_synapse_type_bits",
+        "_synapse_index_bits", "_max_stage", "_max_delay_per_stage",
+        "_delay_bits", "_n_pre_neurons", "_n_pre_neurons_per_core")
+
+    def __init__(self, region: NDArray[uint32]):
+        self._region = region
+        self._offset = 0
+        self._delayed_offset = 0
+        self._max_row_n_words = 0
+        self._max_delayed_row_n_words = 0
+        self._synapse_type = 0
+        self._synapse_type_bits = 0
+        self._synapse_index_bits = 0
+        self._max_stage = 0
+        self._max_delay_per_stage = 0
+        self._delay_bits = 0
+        self._n_pre_neurons = 0
+        self._n_pre_neurons_per_core = 0
+
+    def write(
+            self, pre: NDArray[int64], post: NDArray[int64],
+            weights: NDArray[int64], delays: NDArray[int64],
+            weight_scale: int) -> None:
+        """
+        Write synapses with generated (S1615) weights and delays in time
+        steps, in the order the machine would write them.
+        """
+        delay, stage = self.__split_delays(delays)
+        scaled_weights = _rescale_weights(weights, weight_scale)
+        undelayed = stage == 0
+        for offset, max_words, rows, keep in (
+                (self._offset, self._max_row_n_words, pre[undelayed],
+                 undelayed),
+                (self._delayed_offset, self._max_delayed_row_n_words,
+                 self.__delay_rows(pre[~undelayed], stage[~undelayed]),
+                 ~undelayed)):
+            if not len(rows):
+                continue
+            if offset == SYN_REGION_UNUSED:
+                logger.warning(
+                    "{} synapses are for a matrix that does not exist",
+                    len(rows))
+                continue
+            self._write_rows(
+                offset, max_words, rows, post[keep], scaled_weights[keep],
+                delay[keep])
+
+    def _write_rows(
+            self, offset: int, max_row_n_words: int, rows: NDArray[int64],
+            post: NDArray[int64], weights: NDArray[int64],
+            delays: NDArray[int64]) -> None:
+        raise NotImplementedError
+
+    def __split_delays(
+            self, delays: NDArray[int64]) -> Tuple[
+                NDArray[int64], NDArray[int64]]:
+        """
+        The delay within a stage and the delay stage of each delay.
+        """
+        delays = numpy.maximum(delays, 1)
+        stage = (delays - 1) // self._max_delay_per_stage
+        too_big = stage >= self._max_stage
+        stage[too_big] = self._max_stage - 1
+        delays = numpy.where(
+            too_big, stage * self._max_delay_per_stage, delays)
+        # The machine uses a C remainder, which keeps the sign
+        delays = numpy.fmod(delays - 1, self._max_delay_per_stage) + 1
+        return delays, stage
+
+    def __delay_rows(
+            self, pre: NDArray[int64], stage: NDArray[int64]) -> NDArray[
+                int64]:
+        """
+        The row of each delayed synapse, with the rows of each delay core
+        kept together.  This matches the machine in finding the core of the
+        first neuron of each core to be the core before.
+        """
+        per_core = self._n_pre_neurons_per_core
+        core = numpy.maximum(pre - 1, 0) // per_core
+        local_pre = pre - core * per_core
+        n_on_core = numpy.minimum(
+            per_core, self._n_pre_neurons - core * per_core)
+        return (core * per_core * (self._max_stage - 1) +
+                (stage - 1) * n_on_core + local_pre)
+
+    def _synaptic_word(
+            self, post: NDArray[int64], delays: NDArray[int64]) -> NDArray[
+                int64]:
+        """ The synaptic word of each synapse, without the weight. """
+        index_mask = (1 << self._synapse_index_bits) - 1
+        type_mask = (1 << self._synapse_type_bits) - 1
+        delay_mask = (1 << self._delay_bits) - 1
+        return (
+            (post & index_mask) |
+            ((self._synapse_type & type_mask) << self._synapse_index_bits) |
+            ((delays & delay_mask) <<
+             (self._synapse_index_bits + self._synapse_type_bits)))
+
+
+def _row_positions(rows: NDArray[int64]) -> NDArray[int64]:
+    """
+    The position of each item within its row when added in order.
+    """
+    order = numpy.argsort(rows, kind="stable")
+    sorted_rows = rows[order]
+    index = numpy.arange(len(rows), dtype=int64)
+    starts = numpy.concatenate(
+        ([True], sorted_rows[1:] != sorted_rows[:-1]))
+    group_start = numpy.maximum.accumulate(numpy.where(starts, index, 0))
+    positions = numpy.zeros(len(rows), dtype=int64)
+    positions[order] = index - group_start
+    return positions
+
+
+def _rescale_weights(
+        weights: NDArray[int64], weight_scale: int) -> NDArray[int64]:
+    """
+    Scale S1615 weights by an unsigned 32.32 scale, keeping the integer
+    part, as the machine does.
+    """
+    abs_weights = numpy.abs(weights)
+    high = abs_weights * (weight_scale >> 32)
+    low = (abs_weights * (weight_scale & _MASK_32)) >> 32
+    return ((high + low) >> _S1615_SHIFT) & _WEIGHT_MASK
+
+
+def _drop_full(
+        rows: NDArray[int64], max_in_row: int) -> Tuple[
+            NDArray[int64], NDArray[numpy.bool_]]:
+    positions = _row_positions(rows)
+    fits = positions < max_in_row
+    if not numpy.all(fits):
+        logger.warning(
+            "{} synapses were dropped as their rows were full",
+            int(numpy.count_nonzero(~fits)))
+    return positions, fits
+
+
+class _StaticMatrixGenerator(_MatrixGenerator):
+    __slots__ = ()
+
+    def __init__(self, region: NDArray[uint32], words: _Words):
+        super().__init__(region)
+        self._offset = words.next()
+        self._delayed_offset = words.next()
+        self._max_row_n_words = words.next()
+        self._max_delayed_row_n_words = words.next()
+        self._synapse_type = words.next()
+        self._synapse_type_bits = words.next()
+        self._synapse_index_bits = words.next()
+        self._max_stage = words.next()
+        self._max_delay_per_stage = words.next()
+        self._delay_bits = words.next()
+        self._n_pre_neurons = words.next()
+        self._n_pre_neurons_per_core = words.next()
+
+    def _write_rows(
+            self, offset: int, max_row_n_words: int, rows: NDArray[int64],
+            post: NDArray[int64], weights: NDArray[int64],
+            delays: NDArray[int64]) -> None:
+        positions, fits = _drop_full(rows, max_row_n_words)
+        rows = rows[fits]
+        row_starts = offset + rows * (max_row_n_words + _N_ROW_HEADER_WORDS)
+        synaptic_words = self._synaptic_word(post[fits], delays[fits]) | (
+            weights[fits] << _WEIGHT_SHIFT)
+        self._region[
+            row_starts + _N_ROW_HEADER_WORDS + positions[fits]] = (
+                synaptic_words & _MASK_32)
+        used_rows, counts = numpy.unique(rows, return_counts=True)
+        self._region[
+            offset + used_rows * (max_row_n_words + _N_ROW_HEADER_WORDS) +
+            1] = counts
+
+
+class _STDPMatrixGenerator(_MatrixGenerator):
+    __slots__ = (
+        "__max_row_n_synapses", "__max_delayed_row_n_synapses",
+        "__n_half_words_per_pp_row_header", "__n_half_words_per_pp_synapse",
+        "__weight_half_word")
+
+    def __init__(self, region: NDArray[uint32], words: _Words):
+        super().__init__(region)
+        self._offset = words.next()
+        self._delayed_offset = words.next()
+        self.__max_row_n_synapses = words.next()
+        self.__max_delayed_row_n_synapses = words.next()
+        self._max_row_n_words = words.next()
+        self._max_delayed_row_n_words = words.next()
+        self._synapse_type = words.next()
+        self._synapse_type_bits = words.next()
+        self._synapse_index_bits = words.next()
+        self._max_stage = words.next()
+        self._max_delay_per_stage = words.next()
+        self._delay_bits = words.next()
+        self._n_pre_neurons = words.next()
+        self._n_pre_neurons_per_core = words.next()
+        self.__n_half_words_per_pp_row_header = words.next()
+        self.__n_half_words_per_pp_synapse = words.next()
+        self.__weight_half_word = words.next()
+
+        # Every row has a plastic region of the maximum size
+        if self._offset != SYN_REGION_UNUSED:
+            self.__set_up_rows(
+                self._offset, self._n_pre_neurons,
+                self.__max_row_n_synapses, self._max_row_n_words)
+        if self._delayed_offset != SYN_REGION_UNUSED:
+            self.__set_up_rows(
+                self._delayed_offset,
+                self._n_pre_neurons * (self._max_stage - 1),
+                self.__max_delayed_row_n_synapses,
+                self._max_delayed_row_n_words)
+
+    def __plastic_half_words(self, max_row_n_synapses: int) -> int:
+        n_half_words = (
+            self.__n_half_words_per_pp_row_header +
+            self.__n_half_words_per_pp_synapse * max_row_n_synapses)
+        return n_half_words + (n_half_words & 0x1)
+
+    def __set_up_rows(
+            self, offset: int, n_rows: int, max_row_n_synapses: int,
+            max_row_n_words: int) -> None:
+        row_starts = offset + numpy.arange(n_rows, dtype=int64) * (
+            max_row_n_words + _N_ROW_HEADER_WORDS)
+        self._region[row_starts] = (
+            self.__plastic_half_words(max_row_n_synapses) // 2)
+
+    def _write_rows(
+            self, offset: int, max_row_n_words: int, rows: NDArray[int64],
+            post: NDArray[int64], weights: NDArray[int64],
+            delays: NDArray[int64]) -> None:
+        if offset == self._offset:
+            max_row_n_synapses = self.__max_row_n_synapses
+        else:
+            max_row_n_synapses = self.__max_delayed_row_n_synapses
+        positions, fits = _drop_full(rows, max_row_n_synapses)
+        rows = rows[fits]
+        positions = positions[fits]
+        row_stride = max_row_n_words + _N_ROW_HEADER_WORDS
+
+        # Half-words are indexed from the plastic data after the size word
+        half_words = self._region.view(uint16)
+        plastic_starts = (offset + rows * row_stride + 1) * 2
+        n_plastic = self.__plastic_half_words(max_row_n_synapses)
+        half_words[
+            plastic_starts + self.__n_half_words_per_pp_row_header +
+            self.__n_half_words_per_pp_synapse * positions +
+            self.__weight_half_word] = weights[fits]
+
+        # The fixed region has the fixed-fixed and fixed-plastic sizes
+        # and then the fixed-plastic half-words
+        fixed_starts = plastic_starts + n_plastic
+        half_words[fixed_starts + 4 + positions] = self._synaptic_word(
+            post[fits], delays[fits]) & _WEIGHT_MASK
+        used_rows, counts = numpy.unique(rows, return_counts=True)
+        self._region[
+            (offset + used_rows * row_stride + 1) + n_plastic // 2 + 1] = (
+                counts)
+
+
+#: The matrix generators by ID
+_MATRIX_GENERATORS: Dict[
+        int, Callable[[NDArray[uint32], _Words], _MatrixGenerator]] = {
+    MatrixGeneratorID.STATIC_MATRIX.value: _StaticMatrixGenerator,
+    MatrixGeneratorID.STDP_MATRIX.value: _STDPMatrixGenerator
+}
+
+
+def _rescale_delays(
+        delays: NDArray[int64], timestep_per_delay: int) -> NDArray[int64]:
+    """
+    Convert S1615 delays in milliseconds into whole time steps.
+    """
+    steps = (delays * timestep_per_delay) >> _S1615_SHIFT
+    steps[steps < 0] = _S1615_ONE
+    return (steps >> _S1615_SHIFT) & 0xFFFF
+
+
+def expand_synapses_on_host(
+        expander_data: NDArray[uint32],
+        synaptic_matrix_size: int) -> NDArray[uint32]:
+    """
+    Expand the synaptic matrices of one core from the data written for the
+    synapse expander, as the expander would on the machine.
+
+    :param ~numpy.ndarray expander_data:
+        The words of the connection builder region of the core
+    :param int synaptic_matrix_size:
+        The size of the synaptic matrix region of the core in bytes
+    :return: The words of the synaptic matrix region, of which only the
+        generated matrices are filled in
+    :rtype: ~numpy.ndarray
+    :raises SpynnakerException:
+        If the data uses a generator that cannot be emulated
+    """
+    region = numpy.zeros(
+        -(-synaptic_matrix_size // BYTES_PER_WORD), dtype=uint32)
+    words = _Words(expander_data, 4)
+    n_in_edges = words.next()
+    post_slice_start = words.next()
+    post_slice_count = words.next()
+    words.next()  # The post-index, which is not used
+    n_synapse_types = words.next()
+    timestep_per_delay = words.next_s1615()
+    population_rng = MarsKiss64(
+        expander_data[_POP_SEED_INDEX:_POP_SEED_INDEX + 4])
+    core_rng = MarsKiss64(expander_data[_CORE_SEED_INDEX:_CORE_SEED_INDEX + 4])
+    scale_words = _Words(expander_data, _N_CONFIG_WORDS).next_array(
+        n_synapse_types * 2)
+    weight_scales = [
+        int(scale_words[i * 2]) | (int(scale_words[i * 2 + 1]) << 32)
+        for i in range(n_synapse_types)]
+
+    words = _Words(expander_data, _N_CONFIG_WORDS + n_synapse_types * 2)
+    for _ in range(n_in_edges):
+        (pre_lo, pre_hi, post_lo, post_hi, synapse_type, matrix_type,
+         connector_type, weight_type, delay_type) = (
+            int(word) for word in words.next_array(_N_CONNECTION_WORDS))
+        if matrix_type not in _MATRIX_GENERATORS:
+            raise SpynnakerException(
+                f"Matrix generator {matrix_type} cannot be emulated")
+        if connector_type not in _CONNECTION_GENERATORS:
+            raise SpynnakerException(
+                f"Connection generator {connector_type} cannot be emulated")
+        matrix = _MATRIX_GENERATORS[matrix_type](region, words)
+        connector_words = _Words(
+            words.next_array(_N_CONNECTOR_WORDS[connector_type]))
+        connection = _Connection(
+            pre_lo, pre_hi, post_lo, post_hi, post_slice_start,
+            post_slice_count, population_rng, core_rng,
+            _read_param_generator(weight_type, words),
+            _read_param_generator(delay_type, words))
+        pre, post, weights, delays = _CONNECTION_GENERATORS[connector_type](
+            connection, connector_words)
+        matrix.write(
+            pre, post, weights,
+            _rescale_delays(delays, timestep_per_delay),
+            weight_scales[synapse_type])
+    return region
@@ -388,7 +388,8 @@ def convert_to_connections(
         n_pre_atoms: int, max_row_length: int, n_synapse_types: int,
         weight_scales: NDArray[floating], data: Union[bytes, NDArray, None],
         delayed: bool, post_vertex_max_delay_ticks: int,
-        max_atoms_per_core: int) -> ConnectionsArray:
+        max_atoms_per_core: int,
+        row_indices: Optional[NDArray[integer]] = None) -> ConnectionsArray:
     """
     Read the synapses for a given projection synapse information
     object out of the given data and convert to connection data
@@ -412,6 +413,9 @@ def convert_to_connections(
         The maximum delayed ticks supported from post vertex
     :param int max_atoms_per_core:
         The maximum number of atoms on a core
+    :param ~numpy.ndarray row_indices:
+        The index within the whole matrix of each row in the data, if the
+        data is only some of the rows of the matrix
     :return: The connections read from the data; the dtype is
         :py:const:`~.NUMPY_CONNECTORS_DTYPE`
     :rtype: ~numpy.ndarray
@@ -429,12 +433,12 @@ def convert_to_connections(
         # Read static data
         connections = _read_static_data(
             dynamics, n_pre_atoms, n_synapse_types, row_data, delayed,
-            post_vertex_max_delay_ticks, max_atoms_per_core)
+            post_vertex_max_delay_ticks, max_atoms_per_core, row_indices)
     else:
         # Read plastic data
         connections = _read_plastic_data(
             dynamics, n_pre_atoms, n_synapse_types, row_data, delayed,
-            post_vertex_max_delay_ticks, max_atoms_per_core)
+            post_vertex_max_delay_ticks, max_atoms_per_core, row_indices)
 
     # There might still be no connections if the row was all padding
     if not connections.size:
@@ -528,8 +532,8 @@ def _parse_static_data(
 def _read_static_data(
         dynamics: AbstractStaticSynapseDynamics, n_pre_atoms: int,
         n_synapse_types: int, row_data: _RowData, delayed: bool,
-        post_vertex_max_delay_ticks: int,
-        max_atoms_per_core: int) -> ConnectionsArray:
+        post_vertex_max_delay_ticks: int, max_atoms_per_core: int,
+        row_indices: Optional[NDArray[integer]]) -> ConnectionsArray:
     """
     Read static data from row data.
 
@@ -543,6 +547,9 @@ def _read_static_data(
     :param bool delayed: True if data should be considered delayed
     :param int post_vertex_max_delay_ticks: post vertex delay maximum
     :param int max_atoms_per_core: The maximum number of atoms on a core
+    :param ~numpy.ndarray row_indices:
+        The index within the whole matrix of each row, or `None` if the rows
+        are the whole matrix
     :return: the connections read with dtype
         :py:const:`~.NUMPY_CONNECTORS_DTYPE`
     :rtype: list(~numpy.ndarray)
@@ -552,11 +559,11 @@ def _read_static_data(
     ff_size, ff_data = _parse_static_data(row_data, dynamics)
     connections = dynamics.read_static_synaptic_data(
         n_synapse_types, ff_size, ff_data, max_atoms_per_core)
+    if row_indices is not None:
+        connections["source"] = row_indices[connections["source"]]
     if delayed:
-        n_synapses = dynamics.get_n_synapses_in_rows(ff_size)
         connections = _convert_delayed_data(
-            n_synapses, n_pre_atoms, connections,
-            post_vertex_max_delay_ticks)
+            n_pre_atoms, connections, post_vertex_max_delay_ticks)
     return connections
 
 
@@ -595,8 +602,8 @@ def _parse_plastic_data(
 def _read_plastic_data(
         dynamics: AbstractPlasticSynapseDynamics, n_pre_atoms: int,
         n_synapse_types: int, row_data: Optional[_RowData], delayed: bool,
-        post_vertex_max_delay_ticks: int,
-        max_atoms_per_core: int) -> ConnectionsArray:
+        post_vertex_max_delay_ticks: int, max_atoms_per_core: int,
+        row_indices: Optional[NDArray[integer]]) -> ConnectionsArray:
     """
     Read plastic data from raw data.
 
@@ -610,6 +617,9 @@ def _read_plastic_data(
     :param bool delayed: True if data should be considered delayed
     :param int post_vertex_max_delay_ticks: post vertex delay maximum
     :param int max_atoms_per_core: The maximum number of atoms on a core
+    :param ~numpy.ndarray row_indices:
+        The index within the whole matrix of each row, or `None` if the rows
+        are the whole matrix
     :return: the connections read with dtype
         :py:const:`~.NUMPY_CONNECTORS_DTYPE`
     :rtype: list(~numpy.ndarray)
@@ -621,12 +631,11 @@ def _read_plastic_data(
     connections = dynamics.read_plastic_synaptic_data(
         n_synapse_types, pp_size, pp_data, fp_size, fp_data,
         max_atoms_per_core)
-
+    if row_indices is not None:
+        connections["source"] = row_indices[connections["source"]]
     if delayed:
-        n_synapses = dynamics.get_n_synapses_in_rows(pp_size, fp_size)
         connections = _convert_delayed_data(
-            n_synapses, n_pre_atoms, connections,
-            post_vertex_max_delay_ticks)
+            n_pre_atoms, connections, post_vertex_max_delay_ticks)
     return connections
 
 
@@ -649,44 +658,29 @@ def _rescale_connections(
 
 
 def _convert_delayed_data(
-        n_synapses: NDArray[integer], n_pre_atoms: int,
-        delayed_connections: ConnectionsArray,
+        n_pre_atoms: int, delayed_connections: ConnectionsArray,
         post_vertex_max_delay_ticks: int) -> ConnectionsArray:
     """
     Take the delayed_connections and convert the source ids and delay
     values back to global values.
 
-    :param ~numpy.ndarray n_synapses: The number of synapses in each row
     :param int n_pre_atoms: number of atoms in the pre-vertex
     :param ~numpy.ndarray delayed_connections:
         The connections to convert of dtype
-        :py:const:`~.NUMPY_CONNECTORS_DTYPE`
+        :py:const:`~.NUMPY_CONNECTORS_DTYPE`, with the source of each being
+        the row of the delayed matrix that it was read from
     :param int post_vertex_max_delay_ticks: post vertex delay maximum
     :return: The converted connection with the same dtype
     :rtype: ~numpy.ndarray
     """
     # Work out the delay stage of each row; rows are the all the rows
     # from the first delay stage, then all from the second stage and so on
-    synapse_ids = range(len(n_synapses))
-    row_stage = numpy.array([
-        i // n_pre_atoms
-        for i in synapse_ids], dtype=uint32)
-    # Work out the delay for each stage
-    row_min_delay = (row_stage + 1) * post_vertex_max_delay_ticks
-    # Repeat the delay for all connections in the same row
-    connection_min_delay = numpy.concatenate([
-        numpy.repeat(row_min_delay[i], n_synapses[i])
-        for i in synapse_ids])
-    # Repeat the "extra" source id for all connections in the same row;
-    # this converts the row id back to a source neuron id
-    connection_source_extra = numpy.concatenate([
-        numpy.repeat(
-            row_stage[i] * uint32(n_pre_atoms),
-            n_synapses[i])
-        for i in synapse_ids])
-    # Do the conversions
-    delayed_connections["source"] -= connection_source_extra
-    delayed_connections["delay"] += connection_min_delay
+    row_stage = delayed_connections["source"] // uint32(n_pre_atoms)
+    # Convert the row id back to a source neuron id, and add the delay of
+    # the stage
+    delayed_connections["source"] -= row_stage * uint32(n_pre_atoms)
+    delayed_connections["delay"] += (
+        (row_stage + 1) * post_vertex_max_delay_ticks)
     return delayed_connections
 
 
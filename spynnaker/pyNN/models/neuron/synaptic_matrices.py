@@ -17,9 +17,11 @@ from typing import (
     Dict, List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING)
 
 import numpy
-from numpy import floating, uint32
+from numpy import floating, integer, uint32
 from numpy.typing import NDArray
 
+from spinn_utilities.config_holder import get_config_bool
+
 from pacman.model.graphs.common import Slice
 from pacman.model.placements import Placement
 from pacman.model.routing_info import (
@@ -30,6 +32,8 @@ from spinn_front_end_common.interface.ds import (
     DataType, DataSpecificationBase)
 
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spinn_front_end_common.utilities.helpful_functions import (
+    locate_memory_region_for_placement)
 
 from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.models.neuron.master_pop_table import (
@@ -43,6 +47,7 @@ from spynnaker.pyNN.utilities.bit_field_utilities import (
 from spynnaker.pyNN.models.common import PopulationApplicationVertex
 
 from .synaptic_matrix_app import SynapticMatrixApp
+from .synapse_expander_emulator import expand_synapses_on_host
 
 if TYPE_CHECKING:
     from spynnaker.pyNN.models.neuron.abstract_population_vertex import (
@@ -150,6 +155,8 @@ class SynapticMatrices(object):
         "__max_atoms_per_core",
         # The stored master population table data
         "__master_pop_data",
+        # The mean search depth of the master population table
+        "__pop_table_search_depth",
         # The stored generated data
         "__generated_data",
         # The size needed for generated data
@@ -209,6 +216,7 @@ class SynapticMatrices(object):
         self.__generated_data: Optional[NDArray[uint32]] = None
         self.__generated_data_size = 0
         self.__master_pop_data: Optional[NDArray[uint32]] = None
+        self.__pop_table_search_depth = 0.0
         self.__bit_field_size = 0
         self.__bit_field_key_map: Optional[NDArray[uint32]] = None
 
@@ -254,6 +262,16 @@ class SynapticMatrices(object):
         return (self.__on_chip_generated_block_addr -
                 self.__host_generated_block_addr)
 
+    @property
+    def pop_table_search_depth(self) -> float:
+        """
+        The mean number of master population table entries looked at to
+        find the entry for a key, once the data has been generated.
+
+        :rtype: float
+        """
+        return self.__pop_table_search_depth
+
     def generate_data(self) -> None:
         """
         Generates the data if it has not already been done.
@@ -328,6 +346,7 @@ class SynapticMatrices(object):
 
         # Store the master pop table
         self.__master_pop_data = poptable.get_pop_table_data()
+        self.__pop_table_search_depth = poptable.get_mean_search_depth()
 
         # Store bit field data
         self.__bit_field_size = get_sdram_for_bit_field_region(
@@ -411,42 +430,71 @@ class SynapticMatrices(object):
                     reference=connection_builder_ref)
             return
 
-        assert self.__bit_field_key_map is not None
-
         spec.reserve_memory_region(
             region=self.__regions.connection_builder,
             size=self.__generated_data_size, label="ConnectorBuilderRegion",
             reference=connection_builder_ref)
         spec.switch_write_focus(self.__regions.connection_builder)
-        spec.write_value(self.__regions.synaptic_matrix)
-        spec.write_value(self.__regions.pop_table)
-        spec.write_value(self.__regions.bitfield_filter)
+        spec.write_array(self.__synapse_expander_data(post_vertex_slice))
+
+    def __synapse_expander_data(
+            self, post_vertex_slice: Slice) -> NDArray[uint32]:
+        """
+        Get the data for the synapse expander of a core.
+
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex the data is for
+        :rtype: ~numpy.ndarray
+        """
+        assert self.__generated_data is not None
+        assert self.__bit_field_key_map is not None
         if isinstance(self.__app_vertex.synapse_dynamics,
                       AbstractSynapseDynamicsStructural):
-            spec.write_value(self.__regions.structural_dynamics)
+            structural_region = self.__regions.structural_dynamics
         else:
-            spec.write_value(INVALID_REGION_ID)
-        spec.write_value(len(self.__on_machine_matrices))
-        spec.write_value(post_vertex_slice.lo_atom)
-        spec.write_value(post_vertex_slice.n_atoms)
-        spec.write_value(0)  # TODO: The index if needed
-        spec.write_value(self.__n_synapse_types)
-        spec.write_value(DataType.S1615.encode_as_int(
-            SpynnakerDataView.get_simulation_time_step_per_ms()))
-        # Per-Population RNG
-        spec.write_array(self.__app_vertex.pop_seed)
-        # Per-Core RNG
-        spec.write_array(self.__app_vertex.core_seed(post_vertex_slice))
-        for w in self.__weight_scales:
-            # if the weights are high enough and the population size large
-            # enough, then weight_scales < 1 will result in a zero scale
-            # if converted to an int, so we use U3232 here instead (as there
-            # can be scales larger than U1616.max in conductance-based models)
-            dtype = DataType.U3232
-            spec.write_value(data=min(w, dtype.max), data_type=dtype)
-
-        spec.write_array(self.__generated_data)
-        spec.write_array(self.__bit_field_key_map)
+            structural_region = INVALID_REGION_ID
+        header = numpy.array([
+            self.__regions.synaptic_matrix, self.__regions.pop_table,
+            self.__regions.bitfield_filter, structural_region,
+            len(self.__on_machine_matrices), post_vertex_slice.lo_atom,
+            post_vertex_slice.n_atoms,
+            0,  # TODO: The index if needed
+            self.__n_synapse_types,
+            DataType.S1615.encode_as_int(
+                SpynnakerDataView.get_simulation_time_step_per_ms())],
+            dtype=uint32)
+
+        # if the weights are high enough and the population size large
+        # enough, then weight_scales < 1 will result in a zero scale
+        # if converted to an int, so we use U3232 here instead (as there
+        # can be scales larger than U1616.max in conductance-based models)
+        dtype = DataType.U3232
+        weight_scales = numpy.frombuffer(b"".join(
+            dtype.as_bytes(min(w, dtype.max)) for w in self.__weight_scales),
+            dtype=uint32)
+
+        return numpy.concatenate((
+            header,
+            # Per-Population RNG
+            numpy.array(self.__app_vertex.pop_seed, dtype=uint32),
+            # Per-Core RNG
+            numpy.array(
+                self.__app_vertex.core_seed(post_vertex_slice), dtype=uint32),
+            weight_scales, self.__generated_data, self.__bit_field_key_map))
+
+    def __emulate_synapse_expander(
+            self, post_vertex_slice: Slice) -> NDArray[uint32]:
+        """
+        Get the synaptic matrix region of a core as the synapse expander
+        would generate it, with only the generated matrices filled in.
+
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex to generate
+        :rtype: ~numpy.ndarray
+        """
+        return expand_synapses_on_host(
+            self.__synapse_expander_data(post_vertex_slice),
+            self.__all_syn_block_sz)
 
     def __get_app_key_and_mask(
             self, r_info: AppVertexRoutingInfo, n_stages: int,
@@ -517,7 +565,9 @@ class SynapticMatrices(object):
 
     def get_connections_from_machine(
             self, placement: Placement, app_edge: ProjectionApplicationEdge,
-            synapse_info: SynapseInformation) -> Sequence[NDArray]:
+            synapse_info: SynapseInformation,
+            pre_indices: Optional[NDArray[integer]] = None
+            ) -> Sequence[NDArray]:
         """
         Get the synaptic connections from the machine.
 
@@ -527,23 +577,87 @@ class SynapticMatrices(object):
             The application edge of the projection
         :param SynapseInformation synapse_info:
             The synapse information of the projection
+        :param ~numpy.ndarray pre_indices:
+            The indices of the pre-neurons to get the connections from, or
+            `None` for all of them
         :return: A list of arrays of connections, each with dtype
             :py:const:`~.NUMPY_CONNECTORS_DTYPE`
         :rtype: list(~numpy.ndarray)
         """
         matrix = self.__matrices[app_edge, synapse_info]
-        return matrix.get_connections(placement)
+        if (matrix in self.__on_machine_matrices and
+                get_config_bool("Machine", "virtual_board")):
+            return matrix.get_connections(
+                placement, self.__emulate_synapse_expander(
+                    placement.vertex.vertex_slice), pre_indices)
+        return matrix.get_connections(placement, pre_indices=pre_indices)
+
+    def get_changed_rows(
+            self, post_vertex_slice: Slice,
+            app_edge: ProjectionApplicationEdge,
+            synapse_info: SynapseInformation, connections: NDArray,
+            new_connections: NDArray) -> List[Tuple[int, NDArray[uint32]]]:
+        """
+        Get the rows of the synaptic matrices that change when the weights
+        and/or delays of the connections of a projection are changed.
+
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex the matrices are for
+        :param ProjectionApplicationEdge app_edge:
+            The application edge of the projection
+        :param SynapseInformation synapse_info:
+            The synapse information of the projection
+        :param ~numpy.ndarray connections:
+            The connections of the projection as they are now
+        :param ~numpy.ndarray new_connections:
+            The same connections with the new weights and/or delays
+        :return: The offset in the synaptic matrix region of each run of
+            changed rows, and the words of the rows
+        :rtype: list(tuple(int, ~numpy.ndarray))
+        :raises RemapRequiredException:
+            If the new connections don't fit in the space of the matrices
+        """
+        matrix = self.__matrices[app_edge, synapse_info]
+        return matrix.get_changed_rows(
+            post_vertex_slice, connections, new_connections)
+
+    def write_changed_rows(
+            self, placement: Placement,
+            changed_rows: Sequence[Tuple[int, NDArray[uint32]]]):
+        """
+        Write rows from :py:meth:`get_changed_rows` to the synaptic matrix
+        region on the machine.
+
+        :param ~pacman.model.placements.Placement placement:
+            Where the matrices are on the machine
+        :param list(tuple(int, ~numpy.ndarray)) changed_rows:
+            The offset of each run of rows in the region, and the words to
+            write there
+        """
+        synapses_address = locate_memory_region_for_placement(
+            placement, self.__regions.synaptic_matrix)
+        for offset, words in changed_rows:
+            SpynnakerDataView.write_memory(
+                placement.x, placement.y, synapses_address + offset,
+                words.tobytes())
 
     def read_generated_connection_holders(self, placement: Placement):
         """
         Fill in any pre-run connection holders for data which is generated
-        on the machine, after it has been generated.
+        on the machine, after it has been generated.  On a virtual board,
+        the data is generated by emulating the synapse expander.
 
         :param ~pacman.model.placements.Placement placement:
             where the data is to be read from
         """
+        if not self.__on_machine_matrices:
+            return
+        synaptic_data = None
+        if get_config_bool("Machine", "virtual_board"):
+            synaptic_data = self.__emulate_synapse_expander(
+                placement.vertex.vertex_slice)
         for matrix in self.__on_machine_matrices:
-            matrix.read_generated_connection_holders(placement)
+            matrix.read_generated_connection_holders(placement, synaptic_data)
 
     @property
     def gen_on_machine(self) -> bool:
@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from typing import List, Optional, Tuple, TYPE_CHECKING
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy
-from numpy import floating, uint32
+from numpy import floating, int64, integer, uint32
 from numpy.typing import NDArray
 
 from pacman.model.graphs.common import Slice
@@ -26,10 +26,11 @@ from spinn_front_end_common.utilities.helpful_functions import (
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
 from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.exceptions import RemapRequiredException
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamicsStructural)
 from spynnaker.pyNN.models.neural_projections.connectors import (
-    AbstractGenerateConnectorOnHost)
+    AbstractConnector, AbstractGenerateConnectorOnHost)
 
 from .generator_data import GeneratorData
 from .synapse_io import read_all_synapses, convert_to_connections, get_synapses
@@ -38,8 +39,14 @@ if TYPE_CHECKING:
     from spynnaker.pyNN.models.neural_projections import (
         ProjectionApplicationEdge, SynapseInformation)
     from spynnaker.pyNN.models.neuron.synaptic_matrices import AppKeyInfo
+    from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
+        ConnectionsArray)
     from .master_pop_table import MasterPopTableAsBinarySearch
 
+#: Gaps of fewer than this many bytes between rows that are wanted are read
+#: along with the rows rather than starting another read
+_MIN_READ_GAP_BYTES = 1024
+
 
 class SynapticMatrixApp(object):
     """
@@ -378,44 +385,214 @@ class SynapticMatrixApp(object):
             self.__app_edge, self.__synapse_info, self.__max_row_info,
             max_pre_atoms_per_core, self.__max_atoms_per_core)
 
-    def get_connections(self, placement: Placement) -> List[NDArray]:
+    def get_connections(
+            self, placement: Placement,
+            synaptic_data: Optional[NDArray[uint32]] = None,
+            pre_indices: Optional[NDArray[integer]] = None) -> List[NDArray]:
         """
         Get the connections for this matrix from the machine.
 
         :param ~pacman.model.placements.Placement placement:
             Where the matrix is on the machine
+        :param ~numpy.ndarray synaptic_data:
+            The words of the synaptic matrix region to read from instead of
+            the machine, if any
+        :param ~numpy.ndarray pre_indices:
+            The indices of the pre-neurons to get the connections from, or
+            `None` for all of them; only the rows of these neurons are read
         :return: A list of arrays of connections, each with dtype
             :py:const:`~.NUMPY_CONNECTORS_DTYPE`
         :rtype: list(~numpy.ndarray)
         """
+        if synaptic_data is not None:
+            return self.__read_connections(
+                placement, synaptic_data, pre_indices)
         synapses_address = locate_memory_region_for_placement(
             placement, self.__synaptic_matrix_region)
-        return self.__read_connections(placement, synapses_address)
+        return self.__read_connections(
+            placement, synapses_address, pre_indices)
+
+    def get_changed_rows(
+            self, post_vertex_slice: Slice, connections: NDArray,
+            new_connections: NDArray) -> List[Tuple[int, NDArray[uint32]]]:
+        """
+        Get the rows of the matrices of a core that change when the weights
+        and/or delays of connections are changed.  Only the rows of the
+        pre-neurons with changed connections are encoded again.
+
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex of the core
+        :param ~numpy.ndarray connections:
+            The connections of the projection as they are now, with dtype
+            :py:const:`~.NUMPY_CONNECTORS_DTYPE`
+        :param ~numpy.ndarray new_connections:
+            The same connections in the same order, with the new weights
+            and/or delays
+        :return: The offset in the synaptic matrix region of each run of
+            changed rows, and the words of the rows
+        :rtype: list(tuple(int, ~numpy.ndarray))
+        :raises RemapRequiredException:
+            If the new connections don't fit in the space of the matrices
+        """
+        in_slice = numpy.isin(
+            connections["target"], post_vertex_slice.get_raster_ids())
+        changed = in_slice & (
+            (connections["weight"] != new_connections["weight"]) |
+            (connections["delay"] != new_connections["delay"]))
+        if not numpy.any(changed):
+            return []
+        affected = in_slice & numpy.isin(
+            connections["source"], connections["source"][changed])
+
+        old_block = self.__to_synaptic_block(
+            post_vertex_slice, connections[affected])
+        new_block = self.__to_synaptic_block(
+            post_vertex_slice, new_connections[affected])
+        self.__check_block_fits(new_block)
+        old_rows, old_delayed_rows = self.__encode(old_block)
+        new_rows, new_delayed_rows = self.__encode(new_block)
+
+        changed_rows = list()
+        if self.__syn_mat_offset is not None:
+            changed_rows.extend(self.__changed_row_runs(
+                self.__syn_mat_offset, self.__max_row_info.undelayed_max_bytes,
+                old_rows, new_rows))
+        if self.__delay_syn_mat_offset is not None:
+            changed_rows.extend(self.__changed_row_runs(
+                self.__delay_syn_mat_offset,
+                self.__max_row_info.delayed_max_bytes,
+                old_delayed_rows, new_delayed_rows))
+        return changed_rows
+
+    def __to_synaptic_block(
+            self, post_vertex_slice: Slice,
+            connections: NDArray) -> ConnectionsArray:
+        """
+        Convert connections as read from the machine into the form that
+        connectors generate them in.
+        """
+        block = numpy.zeros(
+            len(connections), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+        block["source"] = self.__app_edge.pre_vertex.get_key_ordered_indices(
+            connections["source"].astype(uint32))
+        block["target"] = post_vertex_slice.get_relative_indices(
+            connections["target"])
+        block["weight"] = connections["weight"]
+        block["delay"] = connections["delay"]
+        block["synapse_type"] = self.__synapse_info.synapse_type
+        return block
+
+    def __check_block_fits(self, block: ConnectionsArray):
+        """
+        Check that connections fit in the matrices as they were laid out
+        when the network was mapped.
+
+        :raises RemapRequiredException: If they don't fit
+        """
+        label = self.__app_edge.label
+        weights = numpy.rint(numpy.abs(
+            block["weight"] * self.__weight_scales[
+                self.__synapse_info.synapse_type]))
+        if numpy.any(weights > 0xFFFF):
+            raise RemapRequiredException(
+                f"The weights of {label} are too big for the weight scaling "
+                "of the post-population")
+
+        max_delay = self.__app_edge.post_vertex.splitter.max_support_delay()
+        steps_per_ms = SpynnakerDataView.get_simulation_time_step_per_ms()
+        delays = numpy.rint(block["delay"] * steps_per_ms)
+        delayed = delays > max_delay
+        sources = block["source"]
+        if numpy.any(~delayed):
+            n_synapses = numpy.bincount(sources[~delayed]).max()
+            if (self.__syn_mat_offset is None or n_synapses >
+                    self.__max_row_info.undelayed_max_n_synapses):
+                raise RemapRequiredException(
+                    f"The undelayed rows of {label} would be too long")
+        if numpy.any(delayed):
+            n_stages = self.__app_edge.n_delay_stages
+            stages = numpy.floor(
+                (delays[delayed] - 1.0) / max_delay).astype(int64)
+            if (self.__delay_syn_mat_offset is None or
+                    stages.max() > n_stages):
+                raise RemapRequiredException(
+                    f"The delays of {label} need more delay stages than "
+                    "there are")
+            n_synapses = numpy.bincount(
+                sources[delayed].astype(int64) * (n_stages + 1) +
+                stages).max()
+            if n_synapses > self.__max_row_info.delayed_max_n_synapses:
+                raise RemapRequiredException(
+                    f"The delayed rows of {label} would be too long")
+
+    def __encode(self, block: ConnectionsArray) -> Tuple[NDArray, NDArray]:
+        """
+        Encode connections into the rows of the matrices.
+        """
+        return get_synapses(
+            block, self.__synapse_info, self.__app_edge.n_delay_stages,
+            self.__n_synapse_types, self.__weight_scales, self.__app_edge,
+            self.__max_row_info, self.__app_key_info is not None,
+            self.__delay_app_key_info is not None, self.__max_atoms_per_core)
 
-    def read_generated_connection_holders(self, placement: Placement):
+    @staticmethod
+    def __changed_row_runs(
+            offset: int, row_bytes: int, old_rows: NDArray[uint32],
+            new_rows: NDArray[uint32]) -> List[Tuple[int, NDArray[uint32]]]:
+        """
+        Find the runs of rows that differ between two encodings of a matrix.
+
+        :return: The offset of each run in the region, and its new words
+        :rtype: list(tuple(int, ~numpy.ndarray))
+        """
+        if not row_bytes or not len(new_rows):
+            return []
+        row_words = row_bytes // BYTES_PER_WORD
+        old_rows = old_rows.reshape(-1, row_words)
+        new_rows = new_rows.reshape(-1, row_words)
+        changed = numpy.nonzero(numpy.any(old_rows != new_rows, axis=1))[0]
+        if not len(changed):
+            return []
+        splits = numpy.nonzero(numpy.diff(changed) > 1)[0] + 1
+        return [
+            (offset + int(run[0]) * row_bytes,
+             new_rows[run[0]:run[-1] + 1].reshape(-1))
+            for run in numpy.split(changed, splits)]
+
+    def read_generated_connection_holders(
+            self, placement: Placement,
+            synaptic_data: Optional[NDArray[uint32]] = None):
         """
         Read any pre-run connection holders after data has been generated.
 
         :param ~pacman.model.placements.Placement placement:
             Where the matrix is on the machine
+        :param ~numpy.ndarray synaptic_data:
+            The words of the synaptic matrix region to read from instead of
+            the machine, if any
         """
         if self.__synapse_info.pre_run_connection_holders:
-            connections = self.get_connections(placement)
+            connections = self.get_connections(placement, synaptic_data)
             if connections:
                 conns = numpy.concatenate(connections)
                 for holder in self.__synapse_info.pre_run_connection_holders:
                     holder.add_connections(conns)
 
     def __read_connections(
-            self, placement: Placement,
-            synapses_address: int) -> List[NDArray]:
+            self, placement: Placement, synapses: Union[int, NDArray[uint32]],
+            pre_indices: Optional[NDArray[integer]]) -> List[NDArray]:
         """
         Read connections from an address on the machine.
 
         :param ~pacman.model.placements.Placement placement:
             Where the matrix is on the machine
-        :param int synapses_address:
-            The base address of the synaptic matrix region
+        :param synapses:
+            The base address of the synaptic matrix region, or the words of
+            the region
+        :type synapses: int or ~numpy.ndarray
+        :param ~numpy.ndarray pre_indices:
+            The indices of the pre-neurons to read the rows of, or `None` to
+            read all the rows
         :return: A list of arrays of connections, each with dtype
             :py:const:`~.NUMPY_CONNECTORS_DTYPE`
         :rtype: list(~numpy.ndarray)
@@ -424,58 +601,140 @@ class SynapticMatrixApp(object):
 
         splitter = self.__app_edge.post_vertex.splitter
         vertex_slice = placement.vertex.vertex_slice
+        n_pre_atoms = self.__app_edge.pre_vertex.n_atoms
+
+        # Rows are in the order of the keys of the pre-neurons
+        rows: Optional[NDArray[integer]] = None
+        if pre_indices is not None:
+            rows = numpy.unique(
+                self.__app_edge.pre_vertex.get_key_ordered_indices(
+                    numpy.asarray(pre_indices, dtype=uint32))).astype(int64)
+
         if self.__syn_mat_offset is not None:
+            if rows is None:
+                block = self.__get_block(placement, synapses)
+            else:
+                block = self.__read_rows(
+                    placement, synapses, self.__syn_mat_offset,
+                    self.__max_row_info.undelayed_max_bytes, rows)
             connections.append(convert_to_connections(
-                self.__synapse_info, vertex_slice,
-                self.__app_edge.pre_vertex.n_atoms,
+                self.__synapse_info, vertex_slice, n_pre_atoms,
                 self.__max_row_info.undelayed_max_words,
-                self.__n_synapse_types, self.__weight_scales,
-                self.__get_block(placement, synapses_address), False,
-                splitter.max_support_delay(), self.__max_atoms_per_core))
+                self.__n_synapse_types, self.__weight_scales, block, False,
+                splitter.max_support_delay(), self.__max_atoms_per_core,
+                rows))
 
         if self.__delay_syn_mat_offset is not None:
+            delayed_rows: Optional[NDArray[integer]] = None
+            if rows is None:
+                block = self.__get_delayed_block(placement, synapses)
+            else:
+                # Each delay stage has a row for every pre-neuron
+                stages = numpy.arange(self.__app_edge.n_delay_stages)
+                delayed_rows = (
+                    stages[:, None] * n_pre_atoms + rows).reshape(-1)
+                block = self.__read_rows(
+                    placement, synapses, self.__delay_syn_mat_offset,
+                    self.__max_row_info.delayed_max_bytes, delayed_rows)
             connections.append(convert_to_connections(
-                self.__synapse_info, vertex_slice,
-                self.__app_edge.pre_vertex.n_atoms,
+                self.__synapse_info, vertex_slice, n_pre_atoms,
                 self.__max_row_info.delayed_max_words, self.__n_synapse_types,
-                self.__weight_scales,
-                self.__get_delayed_block(placement, synapses_address), True,
-                splitter.max_support_delay(), self.__max_atoms_per_core))
+                self.__weight_scales, block, True,
+                splitter.max_support_delay(), self.__max_atoms_per_core,
+                delayed_rows))
 
         return connections
 
     def __get_block(
-            self, placement: Placement, synapses_address: int) -> bytes:
+            self, placement: Placement,
+            synapses: Union[int, NDArray[uint32]]) -> bytes:
         """
         Get a block of data for undelayed synapses.
 
         :param Placement placement: Where the matrix is on the machine
-        :param int synapses_address:
-            The base address of the synaptic matrix region
+        :param synapses:
+            The base address of the synaptic matrix region, or the words of
+            the region
+        :type synapses: int or ~numpy.ndarray
         :return: The raw data from the synaptic matrix
         :rtype: bytes
         """
         assert self.__syn_mat_offset is not None
-        address = self.__syn_mat_offset + synapses_address
-        return SpynnakerDataView.read_memory(
-            placement.x, placement.y, address, self.__matrix_size)
+        return self.__read_block(
+            placement, synapses, self.__syn_mat_offset, self.__matrix_size)
 
     def __get_delayed_block(
-            self, placement: Placement, synapses_address: int) -> bytes:
+            self, placement: Placement,
+            synapses: Union[int, NDArray[uint32]]) -> bytes:
         """
         Get a block of data for delayed synapses.
 
         :param ~pacman.model.placements.Placement placement:
             Where the matrix is on the machine
-        :param int synapses_address:
-            The base address of the synaptic matrix region
+        :param synapses:
+            The base address of the synaptic matrix region, or the words of
+            the region
+        :type synapses: int or ~numpy.ndarray
         :return: The raw data from the delayed synaptic matrix
         :rtype: bytes
         """
         assert self.__delay_syn_mat_offset is not None
-        address = self.__delay_syn_mat_offset + synapses_address
-        return SpynnakerDataView.read_memory(
-            placement.x, placement.y, address, self.__delay_matrix_size)
+        return self.__read_block(
+            placement, synapses, self.__delay_syn_mat_offset,
+            self.__delay_matrix_size)
+
+    @classmethod
+    def __read_rows(
+            cls, placement: Placement, synapses: Union[int, NDArray[uint32]],
+            offset: int, row_bytes: int, rows: NDArray[integer]) -> bytes:
+        """
+        Get the data of some of the rows of a matrix, reading each run of
+        rows that are close together in one go.
+
+        :param ~pacman.model.placements.Placement placement:
+            Where the matrix is on the machine
+        :param synapses:
+            The base address of the synaptic matrix region, or the words of
+            the region
+        :type synapses: int or ~numpy.ndarray
+        :param int offset: The offset of the matrix in the region
+        :param int row_bytes: The size of each row of the matrix in bytes
+        :param ~numpy.ndarray rows: The sorted indices of the rows to get
+        :return: The raw data of the rows, in the order given
+        :rtype: bytes
+        """
+        if not len(rows):
+            return b""
+
+        # Split the rows where the gap is too big to read over
+        max_gap = max(_MIN_READ_GAP_BYTES // row_bytes, 1)
+        splits = numpy.nonzero(numpy.diff(rows) > max_gap)[0] + 1
+        run_firsts = rows[numpy.concatenate(([0], splits))]
+        run_lasts = rows[numpy.concatenate((splits - 1, [len(rows) - 1]))]
+
+        # Read the runs and pick out the rows wanted from them
+        data = numpy.frombuffer(b"".join(
+            cls.__read_block(
+                placement, synapses, offset + int(first) * row_bytes,
+                (int(last) - int(first) + 1) * row_bytes)
+            for first, last in zip(run_firsts, run_lasts)),
+            dtype=numpy.uint8).reshape(-1, row_bytes)
+        run_sizes = run_lasts - run_firsts + 1
+        run_starts = numpy.concatenate(([0], numpy.cumsum(run_sizes)[:-1]))
+        run_of_row = numpy.repeat(
+            numpy.arange(len(run_firsts)), numpy.diff(
+                numpy.concatenate((splits, [len(rows)])), prepend=0))
+        positions = rows - run_firsts[run_of_row] + run_starts[run_of_row]
+        return data[positions].tobytes()
+
+    @staticmethod
+    def __read_block(
+            placement: Placement, synapses: Union[int, NDArray[uint32]],
+            offset: int, size: int) -> bytes:
+        if isinstance(synapses, int):
+            return SpynnakerDataView.read_memory(
+                placement.x, placement.y, synapses + offset, size)
+        return synapses.view(numpy.uint8)[offset:offset + size].tobytes()
 
     def get_index(self) -> int:
         """
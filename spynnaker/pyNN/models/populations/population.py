@@ -16,7 +16,7 @@ import inspect
 import logging
 import os
 from typing import (
-    Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple,
+    Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple,
     Type, Union, final, overload, TYPE_CHECKING)
 
 import numpy
@@ -47,7 +47,7 @@ from spynnaker.pyNN.utilities.neo_buffer_database import NeoBufferDatabase
 from spynnaker.pyNN.utilities.utility_calls import get_neo_io
 
 from .population_base import PopulationBase
-from .population_view import PopulationView, IDMixin
+from .population_view import CellSequence, PopulationView, IDMixin
 
 if TYPE_CHECKING:
     from pyNN.neuron.standardmodels.electrodes import NeuronCurrentSource
@@ -552,11 +552,14 @@ class Population(PopulationBase):
         self.__positions = positions
 
     @property
-    def all_cells(self) -> List[IDMixin]:
+    def all_cells(self) -> Sequence[IDMixin]:
         """
+        .. note::
+            Each cell ID is only made when it is asked for.
+
         :rtype: list(IDMixin)
         """
-        return [IDMixin(self, _id) for _id in range(self.__size)]
+        return CellSequence(self, range(self.__size))
 
     @property
     def position_generator(self) -> Callable[[int], NDArray[numpy.floating]]:
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+from collections.abc import Sequence as AbstractSequence
 import logging
 import os
 from typing import (
@@ -19,7 +20,7 @@ from typing import (
     overload, TYPE_CHECKING)
 
 import numpy
-from numpy import bool_, integer
+from numpy import bool_, int64, integer
 from numpy.typing import NDArray
 from typing_extensions import TypeAlias
 
@@ -72,6 +73,8 @@ class PopulationView(PopulationBase):
     __slots__ = (
         "__annotations",
         "__indexes",
+        "__index_array",
+        "__index_lookup",
         "__label",
         "__mask",
         "__parent",
@@ -117,6 +120,9 @@ class PopulationView(PopulationBase):
         else:
             self.__population = parent
             self.__indexes = ids
+        # Made when first needed
+        self.__index_array: Optional[NDArray[int64]] = None
+        self.__index_lookup: Optional[NDArray[int64]] = None
         self.__mask = selector
         self.__label = label
         self.__annotations: Dict[str, Any] = dict()
@@ -211,9 +217,12 @@ class PopulationView(PopulationBase):
         An array containing the cell IDs of all neurons in the
         Population (all MPI nodes).
 
+        .. note::
+            Each cell ID is only made when it is asked for.
+
         :rtype: list(IDMixin)
         """
-        return [IDMixin(self.__population, idx) for idx in self.__indexes]
+        return CellSequence(self.__population, self.__indexes)
 
     @property
     def _indexes(self) -> Tuple[int, ...]:
@@ -459,12 +468,40 @@ class PopulationView(PopulationBase):
         :param id:
         :type id: int or list(int)
         :rtype: int or list(int)
+        :raises ValueError: If an ID is not in the view
         """
         if isinstance(id, int):
-            return self.__indexes.index(id)
-        return [self.__indexes.index(idx) for idx in id]
+            return int(self.__ids_to_indices(numpy.array([id]))[0])
+        return self.__ids_to_indices(_as_index_array(id)).tolist()
+
+    def __ids_to_indices(self, ids: NDArray[int64]) -> NDArray[int64]:
+        """
+        Look up the positions in the view of IDs.  Where an ID is in the
+        view more than once, its first position is used.
+        """
+        if self.__index_lookup is None:
+            indexes = self.__get_index_array()
+            lookup = numpy.full(self.__population.size, -1, dtype=int64)
+            # Reversed so that the first of any repeated index wins
+            lookup[indexes[::-1]] = numpy.arange(len(indexes) - 1, -1, -1)
+            self.__index_lookup = lookup
+        in_range = (ids >= 0) & (ids < len(self.__index_lookup))
+        indices = numpy.full(len(ids), -1, dtype=int64)
+        indices[in_range] = self.__index_lookup[ids[in_range]]
+        if numpy.any(indices < 0):
+            raise ValueError(
+                f"{ids[indices < 0][0]} is not in the view {self.__label}")
+        return indices
 
-    def index_in_grandparent(self, indices: Iterable[int]) -> List[int]:
+    def __get_index_array(self) -> NDArray[int64]:
+        """
+        Get the indices of the view in the grandparent as a numpy array.
+        """
+        if self.__index_array is None:
+            self.__index_array = _as_index_array(self.__indexes)
+        return self.__index_array
+
+    def index_in_grandparent(self, indices: Iterable[int]) -> Sequence[int]:
         """
         Given an array of indices, return the indices in the parent
         population at the root of the tree.
@@ -472,7 +509,11 @@ class PopulationView(PopulationBase):
         :param list(int) indices:
         :rtype: list(int)
         """
-        return [self.__indexes[index] for index in indices]
+        # A range of a range is still a range
+        if (isinstance(indices, range) and indices.step > 0 and
+                isinstance(self.__indexes, range)):
+            return self.__indexes[indices.start:indices.stop:indices.step]
+        return self.__get_index_array()[_as_index_array(indices)].tolist()
 
     def initialize(self, **initial_values: Values):
         """
@@ -671,13 +712,14 @@ class PopulationView(PopulationBase):
         # self.__indexes is likely a range too so test direct first
         if self.__indexes == cont:
             return True
-        return tuple(self.__indexes) == tuple(cont)
+        return bool(numpy.all(numpy.diff(self.__get_index_array()) == 1))
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, PopulationView):
             return False
-        return (self.__vertex == other._vertex and
-                self._indexes == other._indexes)
+        # pylint: disable=protected-access
+        return (self.__vertex == other._vertex and numpy.array_equal(
+            self.__get_index_array(), other.__get_index_array()))
 
     def __str__(self) -> str:
         return str(self.__vertex) + str(self.__indexes)
@@ -686,6 +728,74 @@ class PopulationView(PopulationBase):
         return repr(self.__vertex) + str(self.__indexes)
 
 
+def _as_index_array(indices: Iterable[int]) -> NDArray[int64]:
+    """
+    Convert indices to a numpy array without looking at each in Python
+    where possible.
+
+    :param iterable(int) indices:
+    :rtype: ~numpy.ndarray
+    """
+    if isinstance(indices, range):
+        return numpy.arange(
+            indices.start, indices.stop, indices.step, dtype=int64)
+    if not isinstance(indices, (numpy.ndarray, AbstractSequence)):
+        indices = list(indices)
+    return numpy.asarray(indices, dtype=int64).reshape(-1)
+
+
+class CellSequence(AbstractSequence):
+    """
+    The cell IDs of some of the neurons of a Population, each made only
+    when it is asked for.
+    """
+    __slots__ = (
+        "__population",
+        "__indexes")
+
+    def __init__(self, population: Population, indexes: Sequence[int]):
+        """
+        :param ~spynnaker.pyNN.models.populations.Population population:
+            The population the cells are in
+        :param list(int) indexes: The indices of the cells in the population
+        """
+        self.__population = population
+        self.__indexes = indexes
+
+    @overload
+    def __getitem__(self, index: int) -> 'IDMixin':
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List['IDMixin']:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [IDMixin(self.__population, idx)
+                    for idx in self.__indexes[index]]
+        return IDMixin(self.__population, self.__indexes[index])
+
+    def __iter__(self) -> Iterator['IDMixin']:
+        for idx in self.__indexes:
+            yield IDMixin(self.__population, idx)
+
+    def __len__(self) -> int:
+        return len(self.__indexes)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CellSequence):
+            # pylint: disable=protected-access
+            return (self.__population is other.__population and
+                    numpy.array_equal(self.__indexes, other.__indexes))
+        if not isinstance(other, AbstractSequence):
+            return False
+        return len(self) == len(other) and all(
+            cell == other_cell for cell, other_cell in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+
 class IDMixin(PopulationView):
     """
     Implementation of PyNN IDMixin.
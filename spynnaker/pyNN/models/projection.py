@@ -19,10 +19,11 @@ from typing import (
     cast, TYPE_CHECKING)
 
 import numpy
-from numpy import void
+from numpy import floating, integer, void
 from numpy.typing import NDArray
 from typing_extensions import Literal, TypeAlias
 
+from pyNN.random import RandomDistribution
 from pyNN.recording.files import StandardTextFile, BaseFile
 from pyNN.space import Space as PyNNSpace
 
@@ -31,21 +32,28 @@ from spinn_utilities.log import FormatAdapter
 from spinn_utilities.logger_utils import warn_once
 
 from pacman.model.graphs.application import ApplicationVertex
+from pacman.utilities.algorithm_utilities\
+    .partition_algorithm_utilities import get_multidimensional_slices
 
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
 from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.exceptions import (
+    SpynnakerException, SynapticConfigurationException)
 from spynnaker.pyNN.models.abstract_models import (
     AbstractAcceptsIncomingSynapses)
 from spynnaker.pyNN.models.neural_projections import (
     SynapseInformation, ProjectionApplicationEdge)
 from spynnaker.pyNN.models.neural_projections.connectors import (
-    FromListConnector)
+    AbstractGenerateConnectorOnHost, FromListConnector)
 from spynnaker.pyNN.models.neuron import (
-    AbstractPopulationVertex, ConnectionHolder)
+    AbstractPopulationVertex, ConnectionHolder, ConnectionStatistics)
 from spynnaker.pyNN.models.populations import Population, PopulationView
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
-    SynapseDynamicsStatic, AbstractHasParameterNames)
+    SynapseDynamicsStatic, AbstractHasParameterNames,
+    AbstractSynapseDynamicsStructural)
+from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
+    NUMPY_CONNECTORS_DTYPE)
 from spynnaker.pyNN.models.spike_source import SpikeSourcePoissonVertex
 from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
 from spynnaker._version import __version__
@@ -60,11 +68,6 @@ if TYPE_CHECKING:
 logger = FormatAdapter(logging.getLogger(__name__))
 
 
-def _we_dont_do_this_now(*args):  # pylint: disable=unused-argument
-    # pragma: no cover
-    raise NotImplementedError("sPyNNaker does not currently do this")
-
-
 class Projection(object):
     """
     A container for all the connections of a given type (same synapse type and
@@ -237,13 +240,19 @@ class Projection(object):
     def get(self, attribute_names: Union[str, Sequence[str]],
             format: str,  # @ReservedAssignment
             gather: Literal[True] = True, with_address: bool = True,
-            multiple_synapses: Literal['last'] = 'last'):
+            multiple_synapses: Literal['last'] = 'last',
+            pre_neurons: Optional[Sequence[int]] = None):
         """
         Get a parameter/attribute of the projection.
 
         .. note::
             SpiNNaker always gathers.
 
+        .. note::
+            ``pre_neurons`` is a sPyNNaker extension; when given after a
+            run, only the synaptic rows of those neurons are read from the
+            machine, which is much quicker when only a few are wanted.
+
         :param attribute_names: list of attributes to gather
         :type attribute_names: str or iterable(str)
         :param str format: ``"list"`` or ``"array"``
@@ -254,6 +263,10 @@ class Projection(object):
             What to do with the data if format="array" and if the multiple
             source-target pairs with the same values exist.  Currently only
             "last" is supported
+        :param pre_neurons:
+            The indices of the pre-neurons to get the connections from, or
+            `None` to get the connections from all of them
+        :type pre_neurons: list(int) or None
         :return: values selected
         """
         # pylint: disable=too-many-arguments
@@ -264,8 +277,17 @@ class Projection(object):
                 "sPyNNaker only recognises multiple_synapses == last")
         an = [attribute_names] if isinstance(attribute_names, str) else list(
             attribute_names)
-
-        return self.__get_data(an, format, with_address, notify=None)
+        pre_indices = None
+        if pre_neurons is not None:
+            pre_indices = numpy.unique(numpy.asarray(pre_neurons, dtype=int))
+            n_pre_atoms = self.__projection_edge.pre_vertex.n_atoms
+            if len(pre_indices) and (
+                    pre_indices[0] < 0 or pre_indices[-1] >= n_pre_atoms):
+                raise ConfigurationException(
+                    f"pre_neurons must be between 0 and {n_pre_atoms - 1}")
+
+        return self.__get_data(
+            an, format, with_address, notify=None, pre_indices=pre_indices)
 
     def save(
             self, attribute_names: Union[str, Sequence[str]],
@@ -317,7 +339,8 @@ class Projection(object):
             self, attribute_names: List[str],
             format: str,  # @ReservedAssignment
             with_address: bool,
-            notify: Optional[Callable[[ConnectionHolder], None]]):
+            notify: Optional[Callable[[ConnectionHolder], None]],
+            pre_indices: Optional[NDArray[integer]] = None):
         """
         Internal data getter to add notify option.
 
@@ -326,6 +349,7 @@ class Projection(object):
         :param str format: ``"list"`` or ``"array"``
         :param bool with_address:
         :param callable(ConnectionHolder,None) notify:
+        :param ~numpy.ndarray pre_indices:
         :return: values selected
         """
         # fix issue with 1 versus many
@@ -358,7 +382,8 @@ class Projection(object):
 
         # Return the connection data
         return self._get_synaptic_data(
-            format == "list", data_items, fixed_values, notify=notify)
+            format == "list", data_items, fixed_values, notify=notify,
+            pre_indices=pre_indices)
 
     @staticmethod
     def __save_callback(save_file: Union[str, BaseFile],
@@ -461,12 +486,15 @@ class Projection(object):
     def _get_synaptic_data(
             self, as_list: bool, data_to_get: List[str],
             fixed_values: List[Tuple[str, int]],
-            notify: Optional[Callable[[ConnectionHolder], None]]):
+            notify: Optional[Callable[[ConnectionHolder], None]],
+            pre_indices: Optional[NDArray[integer]] = None):
         """
         :param bool as_list:
         :param list(str) data_to_get:
         :param list(tuple(str,int)) fixed_values:
         :param callable(ConnectionHolder,None) notify:
+        :param ~numpy.ndarray pre_indices:
+            The pre-neurons to get the connections of, or `None` for all
         :rtype: ConnectionHolder
         """
         post_vertex = self.__projection_edge.post_vertex
@@ -474,9 +502,14 @@ class Projection(object):
 
         # If in virtual board mode, the connection data should be set
         if self.__virtual_connection_list is not None:
+            virtual_connections = self.__virtual_connection_list
+            if pre_indices is not None and virtual_connections:
+                conns = numpy.concatenate(virtual_connections)
+                virtual_connections = [
+                    conns[numpy.isin(conns["source"], pre_indices)]]
             connection_holder = ConnectionHolder(
                 data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
-                self.__virtual_connection_list, fixed_values=fixed_values,
+                virtual_connections, fixed_values=fixed_values,
                 notify=notify)
             connection_holder.finish()
             return connection_holder
@@ -490,6 +523,9 @@ class Projection(object):
         # If we haven't run, add the holder to get connections, and return it
         # and set up a callback for after run to fill in this connection holder
         if not SpynnakerDataView.is_ran_ever():
+            if pre_indices is not None:
+                raise ConfigurationException(
+                    "pre_neurons can only be used once run has been called")
             self.__synapse_information.add_pre_run_connection_holder(
                 connection_holder)
             return connection_holder
@@ -497,39 +533,242 @@ class Projection(object):
         # Otherwise, get the connections now, as we have ran and therefore can
         # get them
         connections = post_vertex.get_connections_from_machine(
-            self.__projection_edge, self.__synapse_information)
+            self.__projection_edge, self.__synapse_information, pre_indices)
         if connections is not None:
             connection_holder.add_connections(connections)
             connection_holder.finish()
         return connection_holder
 
-    def _clear_cache(self) -> None:
+    def _clear_cache(self, all_connections: bool = True) -> None:
+        """
+        Clear the connections of this projection read from the machine.
+
+        :param bool all_connections:
+            If False, the connections are only cleared if they can have been
+            changed by running
+        """
+        s_dynamics = self.__synapse_information.synapse_dynamics
+        if not all_connections and not s_dynamics.changes_during_run:
+            return
+        self.__synapse_information.clear_delay_maximum()
         post_vertex = self.__projection_edge.post_vertex
         if isinstance(post_vertex, AbstractAcceptsIncomingSynapses):
-            post_vertex.clear_connection_cache()
+            post_vertex.clear_connection_cache(self.__synapse_information)
 
     # -----------------------------------------------------------------
 
-    def set(self, **attributes):  # @UnusedVariable
-        # pylint: disable=unused-argument
+    def set(self, **attributes: Any) -> None:
         """
-        .. warning::
-            Not implemented.
+        Change the weights and/or delays of the existing connections.
+
+        This can only be done once :py:func:`run` has been called, and only
+        for projections with static synapses.  Only the rows of the
+        synaptic matrices that change are written to the machine again.
+
+        .. note::
+            The values are replaced by those of the connector if the
+            synaptic data is generated again, such as when the network is
+            mapped again.
+
+        :param attributes:
+            ``weight`` and/or ``delay``; each is a single value, a
+            :py:class:`~pyNN.random.RandomDistribution`, an array with a value
+            for each connection in the order :py:meth:`get` returns them in
+            with ``format="list"``, or an array of shape (number of
+            pre-neurons, number of post-neurons)
+        :raises ConfigurationException:
+            If the attributes or values are not valid, or if called before
+            :py:func:`run`
+        :raises SpynnakerException:
+            If some of the new weights are positive and some negative
+        :raises SynapticConfigurationException:
+            If the synapses of the projection cannot be changed
+        :raises ~spynnaker.pyNN.exceptions.RemapRequiredException:
+            If the new values don't fit in the space the synaptic matrices
+            were given when the network was mapped; nothing is changed
         """
-        _we_dont_do_this_now()
+        unknown = set(attributes) - {"weight", "delay"}
+        if unknown:
+            raise ConfigurationException(
+                f"Only weight and delay can be set, not {sorted(unknown)}")
+        if not SpynnakerDataView.is_ran_ever():
+            raise ConfigurationException(
+                "Projection.set can only be used once run has been called")
+        s_dynamics = self.__synapse_information.synapse_dynamics
+        post_vertex = self.__projection_edge.post_vertex
+        if (not isinstance(s_dynamics, SynapseDynamicsStatic) or
+                isinstance(s_dynamics, AbstractSynapseDynamicsStructural) or
+                not isinstance(post_vertex, AbstractPopulationVertex)):
+            raise SynapticConfigurationException(
+                "Only the connections of projections with static synapses "
+                "can be changed")
+
+        # Get the connections as they are now
+        if self.__virtual_connection_list is not None:
+            connections = numpy.concatenate(
+                [numpy.zeros(0, dtype=NUMPY_CONNECTORS_DTYPE)] +
+                self.__virtual_connection_list)
+        else:
+            connections = post_vertex.get_connections_from_machine(
+                self.__projection_edge, self.__synapse_information)
+
+        new_connections = connections.copy()
+        if "weight" in attributes:
+            weights = self.__get_new_values(
+                "weight", attributes["weight"], connections)
+            if len(weights) and numpy.amin(weights) < 0 < numpy.amax(weights):
+                raise SpynnakerException(
+                    "Weights must be either all positive or all negative in "
+                    f"projection {self.__projection_edge.pre_vertex.label}->"
+                    f"{self.__projection_edge.post_vertex.label}")
+            # As made by connectors, the sign is given by the synapse type
+            new_connections["weight"] = numpy.abs(weights)
+        if "delay" in attributes:
+            # Delays are whole time steps on the machine
+            steps_per_ms = SpynnakerDataView.get_simulation_time_step_per_ms()
+            delays = numpy.rint(self.__get_new_values(
+                "delay", attributes["delay"], connections) * steps_per_ms)
+            if numpy.any(delays < 1):
+                raise ConfigurationException(
+                    "Delays must be at least one time step")
+            new_connections["delay"] = delays / steps_per_ms
+
+        post_vertex.set_connections_on_machine(
+            self.__projection_edge, self.__synapse_information,
+            connections, new_connections)
+        if self.__virtual_connection_list is not None:
+            self.__virtual_connection_list[:] = [new_connections]
+
+    def __get_new_values(
+            self, name: str, value: Any,
+            connections: NDArray) -> NDArray[floating]:
+        """
+        Get a new value of an attribute for each connection.
 
-    def size(self, gather=True):  # @UnusedVariable
+        :param str name: The name of the attribute
+        :param value: The value(s) given to :py:meth:`set`
+        :param ~numpy.ndarray connections: The connections to get values for
+        :rtype: ~numpy.ndarray
+        """
+        n_connections = len(connections)
+        if isinstance(value, RandomDistribution):
+            if not n_connections:
+                return numpy.zeros(0)
+            return numpy.asarray(
+                value.next(n_connections), dtype=float).reshape(n_connections)
+        values = numpy.asarray(value, dtype=float)
+        if values.ndim == 0:
+            return numpy.full(n_connections, values)
+        if values.shape == (n_connections, ):
+            # The values are in the order of the list from get
+            new_values = numpy.empty(n_connections)
+            new_values[numpy.lexsort(
+                (connections["target"], connections["source"]))] = values
+            return new_values
+        if values.shape == (self.__projection_edge.pre_vertex.n_atoms,
+                            self.__projection_edge.post_vertex.n_atoms):
+            new_values = values[connections["source"], connections["target"]]
+            if numpy.any(numpy.isnan(new_values)):
+                raise ConfigurationException(
+                    f"A {name} of NaN was given for an existing connection")
+            return new_values
+        raise ConfigurationException(
+            f"There are {n_connections} connections, so {values.shape} is "
+            f"not a valid shape for the {name}s")
+
+    def size(self, gather: bool = True) -> int:  # @UnusedVariable
         # pylint: disable=unused-argument
         """
         Return the total number of connections.
 
+        The connections are counted a block at a time, without being
+        gathered up; see :py:meth:`get_statistics`.
+
         .. note::
             SpiNNaker always gathers.
-        .. warning::
-            Not implemented.
 
         :param bool gather:
             If False, only get the number of connections locally.
+        :rtype: int
+        """
+        return self.get_statistics().n_connections
+
+    def get_statistics(
+            self, weight_bins: Optional[Sequence[float]] = None,
+            delay_bins: Optional[Sequence[float]] = None
+            ) -> ConnectionStatistics:
+        """
+        Get statistics of the connections: how many there are, the range
+        and mean of the weights and delays, histograms of them, and the
+        number of connections to each post-neuron.
+
+        Once :py:func:`run` has been called, the synaptic rows are read from
+        the machine a block of pre-neurons at a time, so the connections
+        are never all held at once.  Before then, the connections are made
+        by the connector one post-core at a time; with random connectors
+        these are not the connections that will be made on the machine.
+        The random number generators are put back as they were, so this
+        doesn't change the connections made on the host by :py:func:`run`.
+
+        :param weight_bins:
+            The edges of the bins of the weight histogram, or `None` for no
+            weight histogram
+        :type weight_bins: list(float) or None
+        :param delay_bins:
+            The edges of the bins of the delay histogram, or `None` for no
+            delay histogram
+        :type delay_bins: list(float) or None
+        :rtype: ConnectionStatistics
+        :raises ConfigurationException:
+            If called before :py:func:`run` with a connector that can't make
+            the connections on the host
+        """
+        post_vertex = self.__projection_edge.post_vertex
+        statistics = ConnectionStatistics(
+            post_vertex.n_atoms, weight_bins, delay_bins)
+
+        # Before a run, the virtual board connection list is still empty
+        if not SpynnakerDataView.is_ran_ever():
+            self.__add_connector_statistics(statistics)
+        # If in virtual board mode, the connection data should be set
+        elif self.__virtual_connection_list is not None:
+            for connections in self.__virtual_connection_list:
+                statistics.add_connections(connections)
+        elif isinstance(post_vertex, AbstractPopulationVertex):
+            post_vertex.add_connection_statistics(
+                self.__projection_edge, self.__synapse_information,
+                statistics)
+        else:
+            statistics.add_connections(
+                post_vertex.get_connections_from_machine(
+                    self.__projection_edge, self.__synapse_information))
+        return statistics
+
+    def __add_connector_statistics(self, statistics: ConnectionStatistics):
+        """
+        Add the connections made by the connector on the host to statistics,
+        one post-slice at a time.
         """
-        # TODO
-        _we_dont_do_this_now()
+        connector = self.__synapse_information.connector
+        if not isinstance(connector, AbstractGenerateConnectorOnHost):
+            raise ConfigurationException(
+                f"The connections of {connector} can only be counted once "
+                "run has been called")
+        pre_vertex = self.__projection_edge.pre_vertex
+        post_slices = get_multidimensional_slices(
+            self.__projection_edge.post_vertex)
+        with connector.keep_random_state(self.__synapse_information):
+            for post_slice in post_slices:
+                block = connector.create_synaptic_block(
+                    post_slices, post_slice,
+                    self.__synapse_information.synapse_type,
+                    self.__synapse_information)
+                connections = numpy.zeros(
+                    len(block), dtype=NUMPY_CONNECTORS_DTYPE)
+                connections["source"] = (
+                    pre_vertex.get_raster_ordered_indices(block["source"]))
+                connections["target"] = post_slice.get_raster_indices(
+                    block["target"])
+                connections["weight"] = block["weight"]
+                connections["delay"] = block["delay"]
+                statistics.add_connections(connections)
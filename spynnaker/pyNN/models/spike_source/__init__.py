@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .csr_spike_times import CSRSpikeTimes
 from .spike_source_array import SpikeSourceArray
 from .spike_source_array_vertex import SpikeSourceArrayVertex
 from .spike_source_from_file import SpikeSourceFromFile
@@ -21,7 +22,7 @@ from .spike_source_poisson_machine_vertex import (
     SpikeSourcePoissonMachineVertex)
 from .spike_source_poisson_vertex import SpikeSourcePoissonVertex
 
-__all__ = ["SpikeSourceArray", "SpikeSourceArrayVertex",
+__all__ = ["CSRSpikeTimes", "SpikeSourceArray", "SpikeSourceArrayVertex",
            "SpikeSourceFromFile", "SpikeSourcePoisson",
            "SpikeSourcePoissonMachineVertex", "SpikeSourcePoissonVariable",
            "SpikeSourcePoissonVertex"]
@@ -0,0 +1,260 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import List, Sequence
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_utilities.ranged.abstract_sized import AbstractSized, Selector
+
+from spynnaker.pyNN.exceptions import SpynnakerException
+
+
+class CSRSpikeTimes(AbstractSized):
+    """
+    Compressed (CSR) storage of the spike times of a set of neurons.
+
+    All the spike times are held in one flat array, with the times of
+    neuron ``i`` being ``times[offsets[i]:offsets[i + 1]]``.  This avoids
+    the cost of one Python list or array object per neuron when there are
+    very many neurons, each with only a few spikes.
+    """
+
+    __slots__ = (
+        "__times",
+        "__offsets")
+
+    def __init__(self, times: ArrayLike, offsets: ArrayLike):
+        """
+        :param times: The flat array of all spike times
+        :type times: ~numpy.ndarray or list(float)
+        :param offsets:
+            The start of the times of each neuron in the flat array, with an
+            extra final element equal to the number of times
+        :type offsets: ~numpy.ndarray or list(int)
+        :raises SpynnakerException: If the offsets are not consistent
+        """
+        times_a = numpy.asarray(times)
+        if times_a.dtype.kind not in "iuf":
+            times_a = times_a.astype(numpy.float64)
+        offsets_a = numpy.asarray(offsets, dtype=numpy.int64)
+        if times_a.ndim != 1 or offsets_a.ndim != 1:
+            raise SpynnakerException(
+                "CSR spike times and offsets must be 1-dimensional")
+        if len(offsets_a) < 1 or offsets_a[0] != 0:
+            raise SpynnakerException(
+                "CSR spike time offsets must start with 0")
+        if offsets_a[-1] != len(times_a):
+            raise SpynnakerException(
+                f"The last CSR spike time offset {offsets_a[-1]} does not "
+                f"match the number of spike times {len(times_a)}")
+        if numpy.any(numpy.diff(offsets_a) < 0):
+            raise SpynnakerException(
+                "CSR spike time offsets must not decrease")
+        super().__init__(len(offsets_a) - 1)
+        self.__times = times_a
+        self.__offsets = offsets_a
+
+    @classmethod
+    def from_lists(cls, spike_times: Sequence[ArrayLike]) -> CSRSpikeTimes:
+        """
+        Build from a list with one list of spike times per neuron.
+
+        :param list(list(float)) spike_times:
+        :rtype: CSRSpikeTimes
+        """
+        counts = numpy.fromiter(
+            (len(times) for times in spike_times), dtype=numpy.int64,
+            count=len(spike_times))
+        offsets = numpy.zeros(len(counts) + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+        if offsets[-1]:
+            times = numpy.concatenate(
+                [numpy.asarray(t, dtype=numpy.float64) for t in spike_times])
+        else:
+            times = numpy.zeros(0, dtype=numpy.float64)
+        return cls(times, offsets)
+
+    @classmethod
+    def from_neuron_ids(
+            cls, n_neurons: int, neuron_ids: ArrayLike,
+            times: ArrayLike) -> CSRSpikeTimes:
+        """
+        Build from parallel arrays of neuron IDs and spike times, in any
+        order.  The times of each neuron are sorted.
+
+        :param int n_neurons: The number of neurons
+        :param ~numpy.ndarray neuron_ids: The neuron of each spike
+        :param ~numpy.ndarray times: The time of each spike
+        :rtype: CSRSpikeTimes
+        """
+        ids = numpy.asarray(neuron_ids, dtype=numpy.int64)
+        times_a = numpy.asarray(times)
+        if ids.shape != times_a.shape:
+            raise SpynnakerException(
+                "The neuron IDs and times must have the same shape")
+        if len(ids) and (ids.min() < 0 or ids.max() >= n_neurons):
+            raise SpynnakerException(
+                f"Neuron IDs must be in the range 0 to {n_neurons - 1}")
+        order = numpy.lexsort((times_a, ids))
+        offsets = numpy.zeros(n_neurons + 1, dtype=numpy.int64)
+        numpy.cumsum(
+            numpy.bincount(ids, minlength=n_neurons), out=offsets[1:])
+        return cls(times_a[order], offsets)
+
+    @classmethod
+    def from_shared(
+            cls, n_neurons: int, spike_times: ArrayLike) -> CSRSpikeTimes:
+        """
+        Build where every neuron has the same spike times.
+
+        :param int n_neurons: The number of neurons
+        :param list(float) spike_times: The times of every neuron
+        :rtype: CSRSpikeTimes
+        """
+        times = numpy.atleast_1d(numpy.asarray(spike_times))
+        if times.dtype.kind not in "iuf":
+            times = times.astype(numpy.float64)
+        offsets = numpy.arange(n_neurons + 1, dtype=numpy.int64) * len(times)
+        return cls(numpy.tile(times, n_neurons), offsets)
+
+    @property
+    def times(self) -> NDArray:
+        """
+        The flat array of all the spike times.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times
+
+    @property
+    def offsets(self) -> NDArray[numpy.int64]:
+        """
+        The offsets of the times of each neuron in :py:attr:`times`.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__offsets
+
+    @property
+    def n_neurons(self) -> int:
+        """
+        The number of neurons.
+
+        :rtype: int
+        """
+        return len(self.__offsets) - 1
+
+    @property
+    def counts(self) -> NDArray[numpy.int64]:
+        """
+        The number of spike times of each neuron.
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.diff(self.__offsets)
+
+    @property
+    def neuron_ids(self) -> NDArray[numpy.int64]:
+        """
+        The neuron of each spike time in :py:attr:`times`.
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.repeat(
+            numpy.arange(self.n_neurons, dtype=numpy.int64), self.counts)
+
+    def __getitem__(self, neuron_id: int) -> NDArray:
+        start, end = self.__offsets[neuron_id:neuron_id + 2]
+        return self.__times[start:end]
+
+    def with_times(self, times: NDArray) -> CSRSpikeTimes:
+        """
+        A copy with the same offsets but different (e.g. converted) times.
+
+        :param ~numpy.ndarray times: The new flat times
+        :rtype: CSRSpikeTimes
+        """
+        return CSRSpikeTimes(times, self.__offsets)
+
+    def select(self, ids: ArrayLike) -> CSRSpikeTimes:
+        """
+        The spike times of a subset of the neurons, in the order given.
+
+        :param ~numpy.ndarray ids: The neurons to select
+        :rtype: CSRSpikeTimes
+        """
+        ids_a = numpy.asarray(ids, dtype=numpy.int64)
+        counts = self.counts[ids_a]
+        offsets = numpy.zeros(len(ids_a) + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+        # Index of each output time in the input, as the input start of its
+        # neuron plus its position within the neuron
+        source = numpy.arange(offsets[-1], dtype=numpy.int64) + numpy.repeat(
+            self.__offsets[ids_a] - offsets[:-1], counts)
+        return CSRSpikeTimes(self.__times[source], offsets)
+
+    def select_by(self, selector: Selector) -> CSRSpikeTimes:
+        """
+        The spike times of the neurons picked out by a selector.
+
+        :param selector: See
+            :py:meth:`~spinn_utilities.ranged.AbstractSized.selector_to_ids`
+        :rtype: CSRSpikeTimes
+        """
+        if selector is None:
+            return self
+        return self.select(self.selector_to_ids(selector))
+
+    def replace(self, ids: ArrayLike, other: CSRSpikeTimes) -> CSRSpikeTimes:
+        """
+        A copy with the times of some neurons replaced.
+
+        :param ~numpy.ndarray ids: The neurons to replace
+        :param CSRSpikeTimes other:
+            The new times of the neurons, one for each ID
+        :rtype: CSRSpikeTimes
+        """
+        ids_a = numpy.asarray(ids, dtype=numpy.int64)
+        if other.n_neurons != len(ids_a):
+            raise SpynnakerException(
+                f"{other.n_neurons} sets of spike times given to replace "
+                f"those of {len(ids_a)} neurons")
+        # Append the new times and point the replaced neurons at them
+        counts = self.counts
+        starts = self.__offsets[:-1].copy()
+        counts[ids_a] = other.counts
+        starts[ids_a] = other.offsets[:-1] + len(self.__times)
+        times = numpy.concatenate((self.__times, other.times))
+        offsets = numpy.zeros(self.n_neurons + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+        source = numpy.arange(offsets[-1], dtype=numpy.int64) + numpy.repeat(
+            starts - offsets[:-1], counts)
+        return CSRSpikeTimes(times[source], offsets)
+
+    def split(self) -> List[NDArray]:
+        """
+        The spike times of each neuron as separate arrays.  These are views
+        on :py:attr:`times`, so no times are copied.
+
+        :rtype: list(~numpy.ndarray)
+        """
+        if self.n_neurons == 0:
+            return []
+        return numpy.split(self.__times, self.__offsets[1:-1])
+
+    def __repr__(self) -> str:
+        return (f"CSRSpikeTimes(n_neurons={self.n_neurons}, "
+                f"n_times={len(self.__times)})")
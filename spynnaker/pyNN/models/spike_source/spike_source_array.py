@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional
+from typing import Optional, Union
 from spinn_utilities.overrides import overrides
 from pacman.model.partitioner_splitters import AbstractSplitterCommon
 from spynnaker.pyNN.models.abstract_pynn_model import AbstractPyNNModel
 from spynnaker.pyNN.models.common.types import Spikes
+from .csr_spike_times import CSRSpikeTimes
 from .spike_source_array_vertex import SpikeSourceArrayVertex
 
 
@@ -27,7 +28,15 @@ class SpikeSourceArray(AbstractPyNNModel):
     default_population_parameters = {
         "splitter": None, "n_colour_bits": None}
 
-    def __init__(self, spike_times: Optional[Spikes] = None):
+    def __init__(
+            self, spike_times: Optional[Union[Spikes, CSRSpikeTimes]] = None):
+        """
+        :param spike_times:
+            The spike times; either one list for all neurons, a list of
+            lists with one per neuron, or a
+            :py:class:`~spynnaker.pyNN.models.spike_source.CSRSpikeTimes`
+            holding the times of all neurons compactly
+        """
         if spike_times is None:
             spike_times = []
         self.__spike_times = spike_times
@@ -51,5 +60,5 @@ class SpikeSourceArray(AbstractPyNNModel):
             n_colour_bits)
 
     @property
-    def _spike_times(self) -> Spikes:
+    def _spike_times(self) -> Union[Spikes, CSRSpikeTimes]:
         return self.__spike_times
@@ -35,6 +35,7 @@ from pacman.model.resources import AbstractSDRAM
 from spinn_front_end_common.utility_models import ReverseIpTagMultiCastSource
 
 from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.exceptions import SpynnakerException
 from spynnaker.pyNN.models.abstract_models import SupportsStructure
 from spynnaker.pyNN.models.common import (
     ParameterHolder, PopulationApplicationVertex)
@@ -43,6 +44,7 @@ from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN.utilities.buffer_data_type import BufferDataType
 from spynnaker.pyNN.utilities.ranged import SpynnakerRangedList
 
+from .csr_spike_times import CSRSpikeTimes
 from .spike_source_array_machine_vertex import SpikeSourceArrayMachineVertex
 
 if TYPE_CHECKING:
@@ -61,6 +63,12 @@ _DoubleList: TypeAlias = Union[
     Sequence[Sequence[_Number]], NDArray[numpy.integer]]
 
 
+def _is_csr(
+        value: Union[Spikes, CSRSpikeTimes]) -> TypeGuard[CSRSpikeTimes]:
+    # USE before _is_double_list as a CSRSpikeTimes is also indexable!
+    return isinstance(value, CSRSpikeTimes)
+
+
 def _is_double_list(value: Spikes) -> TypeGuard[_DoubleList]:
     return not isinstance(value, (float, int)) and bool(len(value)) and \
         hasattr(value[0], "__len__")
@@ -106,13 +114,15 @@ class SpikeSourceArrayVertex(
         "__model",
         "__structure",
         "_spike_times",
+        "__csr_ticks",
         "__n_colour_bits")
 
     #: ID of the recording region used for recording transmitted spikes.
     SPIKE_RECORDING_REGION_ID = 0
 
     def __init__(
-            self, n_neurons: int, spike_times: Spikes, label: str,
+            self, n_neurons: int, spike_times: Union[Spikes, CSRSpikeTimes],
+            label: str,
             max_atoms_per_core: Union[int, Tuple[int, ...]],
             model: SpikeSourceArray,
             splitter: Optional[AbstractSplitterCommon],
@@ -124,16 +134,31 @@ class SpikeSourceArrayVertex(
 
         if spike_times is None:
             spike_times = []
-        self._spike_times = SpynnakerRangedList(
-            n_neurons, spike_times,
-            use_list_as_value=not _is_double_list(spike_times))
-
         time_step = SpynnakerDataView.get_simulation_time_step_us()
 
+        # CSR spike times are kept (and sent) as CSR; the parent vertex
+        # then holds no send buffer times
+        self._spike_times: Union[SpynnakerRangedList, CSRSpikeTimes]
+        self.__csr_ticks: Optional[CSRSpikeTimes] = None
+        if _is_csr(spike_times):
+            if spike_times.n_neurons != n_neurons:
+                raise SpynnakerException(
+                    f"CSR spike times for {spike_times.n_neurons} neurons "
+                    f"given to a SpikeSourceArray of {n_neurons} neurons")
+            self._spike_times = spike_times
+            self.__csr_ticks = spike_times.with_times(
+                _as_numpy_ticks(spike_times.times, time_step))
+            send_buffer_times = None
+        else:
+            self._spike_times = SpynnakerRangedList(
+                n_neurons, spike_times,
+                use_list_as_value=not _is_double_list(spike_times))
+            send_buffer_times = _send_buffer_times(spike_times, time_step)
+
         super().__init__(
             n_keys=n_neurons, label=label,
             max_atoms_per_core=max_atoms_per_core,
-            send_buffer_times=_send_buffer_times(spike_times, time_step),
+            send_buffer_times=send_buffer_times,
             send_buffer_partition_id=constants.SPIKE_PARTITION_ID,
             splitter=splitter)
 
@@ -160,8 +185,20 @@ class SpikeSourceArrayVertex(
             assert sdram == machine_vertex.sdram_required
         return machine_vertex
 
-    def _check_spike_density(self, spike_times: Spikes):
-        if _is_double_list(spike_times):
+    @overrides(ReverseIpTagMultiCastSource._filtered_send_buffer_times)
+    def _filtered_send_buffer_times(self, vertex_slice: Slice):
+        if self.__csr_ticks is None:
+            return super()._filtered_send_buffer_times(vertex_slice)
+        ticks = self.__csr_ticks.select(vertex_slice.get_raster_ids())
+        if not len(ticks.times):
+            return None
+        return ticks.split()
+
+    def _check_spike_density(
+            self, spike_times: Union[Spikes, CSRSpikeTimes]):
+        if _is_csr(spike_times):
+            self._check_density_csr(spike_times)
+        elif _is_double_list(spike_times):
             self._check_density_double_list(spike_times)
         elif _is_single_list(spike_times):
             self._check_density_single_list(spike_times)
@@ -201,6 +238,19 @@ class SpikeSourceArrayVertex(
                 "For example at time {}, {} spikes will be sent",
                 val, count)
 
+    def _check_density_csr(self, spike_times: CSRSpikeTimes):
+        if not len(spike_times.times):
+            logger.warning("SpikeSourceArray has no spike times")
+            return
+        values, counts = numpy.unique(spike_times.times, return_counts=True)
+        top = numpy.argmax(counts)
+        if counts[top] > TOO_MANY_SPIKES:
+            logger.warning(
+                "Danger of SpikeSourceArray sending too many spikes "
+                "at the same time. "
+                "For example at time {}, {} spikes will be sent",
+                values[top], counts[top])
+
     @overrides(SupportsStructure.set_structure)
     def set_structure(self, structure: BaseStructure):
         self.__structure = structure
@@ -250,6 +300,75 @@ class SpikeSourceArrayVertex(
                         self, current_time, float(id_time))
                     return
 
+    def _check_spikes_csr(self, spike_times: CSRSpikeTimes):
+        """
+        Checks if there is one or more spike_times before the current time.
+
+        Logs a warning for the first one found
+
+        :param CSRSpikeTimes spike_times:
+        """
+        current_time = SpynnakerDataView.get_current_run_time_ms()
+        too_early = spike_times.times < current_time
+        if too_early.any():
+            logger.warning(
+                "SpikeSourceArray {} has spike_times that are lower "
+                "than the current time {} For example {} - "
+                "these will be ignored.",
+                self, current_time,
+                float(spike_times.times[numpy.argmax(too_early)]))
+
+    def __as_csr(self, spike_times: Union[Spikes, CSRSpikeTimes],
+                 n_neurons: int) -> CSRSpikeTimes:
+        """
+        Convert spike times given for a number of neurons to CSR.
+        """
+        if _is_csr(spike_times):
+            csr = spike_times
+        elif _is_double_list(spike_times):
+            csr = CSRSpikeTimes.from_lists(spike_times)
+        elif _is_single_list(spike_times):
+            return CSRSpikeTimes.from_shared(n_neurons, spike_times)
+        elif _is_singleton(spike_times):
+            return CSRSpikeTimes.from_shared(n_neurons, [spike_times])
+        else:
+            return CSRSpikeTimes.from_shared(n_neurons, [])
+        if csr.n_neurons != n_neurons:
+            raise SpynnakerException(
+                f"Spike times for {csr.n_neurons} neurons given to set "
+                f"those of {n_neurons} neurons")
+        return csr
+
+    def __set_csr_spike_times(
+            self, spike_times: Union[Spikes, CSRSpikeTimes],
+            selector: Selector):
+        """
+        Set the spike times of (some of) the neurons, keeping them as CSR.
+        """
+        current = self._spike_times
+        if not _is_csr(current):
+            current = CSRSpikeTimes.from_lists(current.get_values(None))
+        if selector is None:
+            new_times = self.__as_csr(spike_times, self.n_atoms)
+            all_times = new_times
+        else:
+            ids = current.selector_to_ids(selector)
+            new_times = self.__as_csr(spike_times, len(ids))
+            all_times = current.replace(ids, new_times)
+        self._check_spikes_csr(new_times)
+
+        # Move any send buffer times out of the parent
+        if self.send_buffer_times is not None:
+            self.send_buffer_times = None
+        time_step = SpynnakerDataView.get_simulation_time_step_us()
+        self._spike_times = all_times
+        self.__csr_ticks = all_times.with_times(
+            _as_numpy_ticks(all_times.times, time_step))
+        for vertex in self.machine_vertices:
+            vertex.send_buffer_times = self._filtered_send_buffer_times(
+                vertex.vertex_slice)
+        self._check_density_csr(all_times)
+
     def __set_spike_buffer_times(self, spike_times: Spikes):
         """
         Set the spike source array's buffer spike times.
@@ -271,6 +390,8 @@ class SpikeSourceArrayVertex(
     def __read_parameter(self, name: str, selector: Selector):
         # pylint: disable=unused-argument
         # This can only be spike times
+        if _is_csr(self._spike_times):
+            return self._spike_times.select_by(selector).split()
         return self._spike_times.get_values(selector)
 
     @overrides(PopulationApplicationVertex.get_parameter_values)
@@ -281,8 +402,12 @@ class SpikeSourceArrayVertex(
 
     @overrides(PopulationApplicationVertex.set_parameter_values)
     def set_parameter_values(
-            self, name: str, value: Spikes, selector: Selector = None):
+            self, name: str, value: Union[Spikes, CSRSpikeTimes],
+            selector: Selector = None):
         self._check_parameters(name, {"spike_times"})
+        if _is_csr(value) or _is_csr(self._spike_times):
+            self.__set_csr_spike_times(value, selector)
+            return
         self.__set_spike_buffer_times(value)
         self._spike_times.set_value_by_selector(
             selector, value, use_list_as_value=not _is_double_list(value))
@@ -401,7 +401,7 @@ class SpikeSourcePoissonVertex(
         # If we have just run, we need to read parameters to avoid overwrite
         if SpynnakerDataView().is_ran_last():
             self.__read_parameters_now()
-        for m_vertex in self.machine_vertices:
+        for m_vertex in self._get_machine_vertices_for_selector(selector):
             m_vertex.set_rate_changed()
 
         # Must be parameter without the s
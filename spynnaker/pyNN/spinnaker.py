@@ -45,8 +45,8 @@ from spynnaker.pyNN.models.recorder import Recorder
 from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
 from spynnaker.pyNN.extra_algorithms import (
-    delay_support_adder, neuron_expander, synapse_expander,
-    redundant_packet_count_report,
+    auto_atoms_per_core, delay_support_adder, emulate_synapse_expander,
+    neuron_expander, synapse_expander, redundant_packet_count_report,
     spynnaker_neuron_graph_network_specification_report)
 from spynnaker.pyNN.extra_algorithms.connection_holder_finisher import (
     finish_connection_holders)
@@ -151,9 +151,14 @@ class SpiNNaker(AbstractSpinnakerBase, pynn_control.BaseState):
         self.__flush_post_vertex_caches()
 
     def __flush_post_vertex_caches(self) -> None:
+        # Connections that can't change while running are kept unless the
+        # synaptic data is going to be made again
+        all_connections = (
+            self.__writer.get_requires_mapping() or
+            self.__writer.get_requires_data_generation())
         # pylint: disable=protected-access
         for projection in self.__writer.iterate_projections():
-            projection._clear_cache()
+            projection._clear_cache(all_connections)
 
     def run(self, run_time: Optional[float], sync_time: float = 0.0):
         """
@@ -418,6 +423,16 @@ class SpiNNaker(AbstractSpinnakerBase, pynn_control.BaseState):
                 return
             synapse_expander()
 
+    def _execute_emulate_synapse_expander(self) -> None:
+        with FecTimer("Emulate synapse expander", TimerWork.SYNAPSE) as timer:
+            if timer.skip_if_cfg_false(
+                    "Simulation", "emulate_synapse_expander"):
+                return
+            if not get_config_bool("Machine", "virtual_board"):
+                timer.skip("The synapse expander is run on the machine")
+                return
+            emulate_synapse_expander()
+
     def _execute_neuron_expander(self) -> None:
         with FecTimer("Neuron expander", TimerWork.SYNAPSE) as timer:
             if timer.skip_if_virtual_board():
@@ -432,6 +447,7 @@ class SpiNNaker(AbstractSpinnakerBase, pynn_control.BaseState):
     def _do_extra_load_algorithms(self) -> None:
         self._execute_neuron_expander()
         self._execute_synapse_expander()
+        self._execute_emulate_synapse_expander()
         self._execute_finish_connection_holders()
 
     def _report_write_network_graph(self) -> None:
@@ -463,6 +479,20 @@ class SpiNNaker(AbstractSpinnakerBase, pynn_control.BaseState):
     def _execute_splitter_selector(self) -> None:
         with FecTimer("Spynnaker splitter selector", TimerWork.OTHER):
             spynnaker_splitter_selector()
+        self._execute_auto_atoms_per_core()
+
+    def _execute_auto_atoms_per_core(self) -> None:
+        """
+        Runs, times and logs the choice of atoms per core if required.
+
+        This must be done after the splitters are selected but before the
+        delay extensions are added, as the delays supported by each core
+        depend on the number of atoms on it.
+        """
+        with FecTimer("Auto atoms per core", TimerWork.OTHER) as timer:
+            if timer.skip_if_cfg_false("Mapping", "auto_atoms_per_core"):
+                return
+            auto_atoms_per_core()
 
     @overrides(AbstractSpinnakerBase._execute_delay_support_adder,
                extend_doc=False)
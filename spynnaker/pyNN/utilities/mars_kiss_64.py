@@ -0,0 +1,306 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+import numpy
+from numpy import uint32, uint64
+from numpy.typing import NDArray
+
+_MASK_32 = 0xFFFFFFFF
+_MASK_32_U64 = uint64(_MASK_32)
+
+#: The multiplier and increment of the linear congruential part
+_LCG_MULTIPLIER = 314527869
+_LCG_INCREMENT = 1234567
+
+#: The multiplier of the multiply-with-carry part
+_MWC_MULTIPLIER = 4294584393
+
+#: The multiply-with-carry part is a multiplicative generator modulo this
+_MWC_MODULUS = (_MWC_MULTIPLIER << 32) - 1
+
+#: Runs of at most this many values are made one at a time
+_MIN_VECTOR_VALUES = 64
+
+#: The most steps to make each chunk of values in; longer runs are made
+#: with more chunks
+_MAX_STEPS = 256
+
+#: The fewest extra values to make when more are needed
+_MIN_BUFFER_EXTEND = 1024
+
+#: The most extra values to make ahead of those asked for; more are made
+#: ahead each time values are asked for, up to this amount
+_MAX_BUFFER_EXTEND = 1 << 20
+
+
+def _xorshift(y: int) -> int:
+    y ^= (y << 5) & _MASK_32
+    y ^= y >> 7
+    y ^= (y << 22) & _MASK_32
+    return y
+
+
+def _compose_linear(
+        first: Sequence[int], second: Sequence[int]) -> List[int]:
+    """
+    The linear map (over GF(2)) of applying ``first`` and then ``second``,
+    each given as the images of the 32 single bits.
+    """
+    return [_apply_linear(second, image) for image in first]
+
+
+def _apply_linear(images: Sequence[int], value: int) -> int:
+    result = 0
+    bit = 0
+    while value:
+        if value & 1:
+            result ^= images[bit]
+        value >>= 1
+        bit += 1
+    return result
+
+
+class MarsKiss64(object):
+    """
+    The ``mars_kiss64`` random number generator used by the SpiNNaker
+    binaries, giving exactly the same stream of values from the same seed.
+
+    Long runs of values are made with numpy by jumping ahead to the start of
+    a number of chunks of the run and then stepping all the chunks together.
+    Values made ahead of those asked for are kept until they are used.
+    """
+
+    __slots__ = (
+        # The state after the last value made (not the last value used)
+        "__x", "__y", "__z", "__c",
+        # Values made but not yet used
+        "__buffer",
+        # The index of the next value to use in the buffer
+        "__buffer_pos",
+        # The number of values to make next time more are needed
+        "__extend")
+
+    def __init__(self, seed: Sequence[int]):
+        """
+        :param list(int) seed:
+            The four seed words, in the order that they are written for the
+            binaries (x, y, z, c)
+        """
+        self.__x, self.__y, self.__z, self.__c = (int(s) for s in seed)
+        self.__buffer = numpy.zeros(0, dtype=uint32)
+        self.__buffer_pos = 0
+        self.__extend = _MIN_BUFFER_EXTEND
+
+    def next(self) -> int:
+        """
+        Get the next value.
+
+        :rtype: int
+        """
+        if self.__buffer_pos < len(self.__buffer):
+            value = int(self.__buffer[self.__buffer_pos])
+            self.__buffer_pos += 1
+            return value
+        self.__x = (_LCG_MULTIPLIER * self.__x + _LCG_INCREMENT) & _MASK_32
+        self.__y = _xorshift(self.__y)
+        t = _MWC_MULTIPLIER * self.__z + self.__c
+        self.__c = t >> 32
+        self.__z = t & _MASK_32
+        return (self.__x + self.__y + self.__z) & _MASK_32
+
+    def peek(self, n_values: int) -> NDArray[uint32]:
+        """
+        Get the next values without using them up.
+
+        :param int n_values: The number of values to get
+        :rtype: ~numpy.ndarray
+        """
+        available = len(self.__buffer) - self.__buffer_pos
+        if available < n_values:
+            extra = self.__generate(max(n_values - available, self.__extend))
+            self.__extend = min(self.__extend * 2, _MAX_BUFFER_EXTEND)
+            self.__buffer = numpy.concatenate(
+                (self.__buffer[self.__buffer_pos:], extra))
+            self.__buffer_pos = 0
+        return self.__buffer[self.__buffer_pos:self.__buffer_pos + n_values]
+
+    def skip(self, n_values: int) -> None:
+        """
+        Use up values without looking at them.
+
+        :param int n_values: The number of values to skip
+        """
+        available = len(self.__buffer) - self.__buffer_pos
+        if n_values <= available:
+            self.__buffer_pos += n_values
+            return
+        self.__buffer = numpy.zeros(0, dtype=uint32)
+        self.__buffer_pos = 0
+        self.__jump(n_values - available)
+
+    def take(self, n_values: int) -> NDArray[uint32]:
+        """
+        Get and use up the next values.
+
+        :param int n_values: The number of values to get
+        :rtype: ~numpy.ndarray
+        """
+        values = self.peek(n_values)
+        self.__buffer_pos += n_values
+        return values
+
+    def __generate(self, n_values: int) -> NDArray[uint32]:
+        """
+        Make values following the state, and move the state on past them.
+        """
+        if n_values <= _MIN_VECTOR_VALUES:
+            values = numpy.zeros(n_values, dtype=uint32)
+            for i in range(n_values):
+                values[i] = self.next()
+            return values
+
+        # Work out the state at the start of each chunk, doubling the
+        # number of chunks known each time
+        n_steps = min(int(numpy.ceil(numpy.sqrt(n_values))), _MAX_STEPS)
+        n_chunks = -(-n_values // n_steps)
+        x = numpy.array([self.__x], dtype=uint64)
+        y = numpy.array([self.__y], dtype=uint64)
+        mwc = [(self.__c << 32) + self.__z]
+        while len(x) < n_chunks:
+            jump = _jump(len(x) * n_steps)
+            x = numpy.concatenate((x, jump.apply_lcg(x)))
+            y = numpy.concatenate((y, jump.apply_xorshift(y)))
+            mwc.extend(jump.apply_mwc(mwc))
+        x = x[:n_chunks]
+        y = y[:n_chunks]
+        z = numpy.array(
+            [v & _MASK_32 for v in mwc[:n_chunks]], dtype=uint64)
+        c = numpy.array([v >> 32 for v in mwc[:n_chunks]], dtype=uint64)
+
+        # Step all the chunks along together
+        values = numpy.zeros((n_steps, n_chunks), dtype=uint64)
+        lcg_multiplier = uint64(_LCG_MULTIPLIER)
+        lcg_increment = uint64(_LCG_INCREMENT)
+        mwc_multiplier = uint64(_MWC_MULTIPLIER)
+        for step in range(n_steps):
+            x = (lcg_multiplier * x + lcg_increment) & _MASK_32_U64
+            y ^= (y << uint64(5)) & _MASK_32_U64
+            y ^= y >> uint64(7)
+            y ^= (y << uint64(22)) & _MASK_32_U64
+            t = mwc_multiplier * z + c
+            c = t >> uint64(32)
+            z = t & _MASK_32_U64
+            values[step] = (x + y + z) & _MASK_32_U64
+
+        self.__jump(n_values)
+        return values.T.reshape(-1)[:n_values].astype(uint32)
+
+    def __jump(self, n_values: int) -> None:
+        """
+        Move the state on without making the values.
+        """
+        self.__x, self.__y, self.__z, self.__c = _jump(n_values).apply(
+            self.__x, self.__y, self.__z, self.__c)
+
+
+@lru_cache(maxsize=64)
+def _jump(n_steps: int) -> _Jump:
+    """
+    The change in state over a number of steps; the same numbers of steps
+    tend to be used over and over, so these are kept.
+    """
+    return _Jump(n_steps)
+
+
+class _Jump(object):
+    """
+    The change in state of the generator over a fixed number of steps.
+    """
+
+    __slots__ = ("__lcg", "__xorshift", "__mwc")
+
+    def __init__(self, n_steps: int):
+        # The linear congruential part is an affine map (a, b): ax + b
+        lcg = (1, 0)
+        step_lcg = (_LCG_MULTIPLIER, _LCG_INCREMENT)
+
+        # The xorshift part is linear over GF(2)
+        xorshift = [1 << bit for bit in range(32)]
+        step_xorshift = [_xorshift(1 << bit) for bit in range(32)]
+
+        # The multiply-with-carry part multiplies c * 2^32 + z
+        self.__mwc = pow(_MWC_MULTIPLIER, n_steps, _MWC_MODULUS)
+
+        while n_steps:
+            if n_steps & 1:
+                lcg = self.__compose_lcg(lcg, step_lcg)
+                xorshift = _compose_linear(xorshift, step_xorshift)
+            step_lcg = self.__compose_lcg(step_lcg, step_lcg)
+            step_xorshift = _compose_linear(step_xorshift, step_xorshift)
+            n_steps >>= 1
+        self.__lcg = lcg
+        self.__xorshift = xorshift
+
+    @staticmethod
+    def __compose_lcg(
+            first: Tuple[int, int], second: Tuple[int, int]) -> Tuple[
+                int, int]:
+        return ((first[0] * second[0]) & _MASK_32,
+                (first[1] * second[0] + second[1]) & _MASK_32)
+
+    def apply(self, x: int, y: int, z: int, c: int) -> Tuple[
+            int, int, int, int]:
+        """
+        Get the state after the steps from the given state.
+
+        :rtype: tuple(int, int, int, int)
+        """
+        x = int(x)
+        y = int(y)
+        x = (self.__lcg[0] * x + self.__lcg[1]) & _MASK_32
+        y = _apply_linear(self.__xorshift, y)
+        mwc = ((int(c) << 32) + int(z)) * self.__mwc % _MWC_MODULUS
+        return x, y, mwc & _MASK_32, mwc >> 32
+
+    def apply_lcg(self, x: NDArray[uint64]) -> NDArray[uint64]:
+        """
+        Get the linear congruential part of many states after the steps.
+
+        :rtype: ~numpy.ndarray
+        """
+        return (uint64(self.__lcg[0]) * x + uint64(self.__lcg[1])) & (
+            _MASK_32_U64)
+
+    def apply_xorshift(self, y: NDArray[uint64]) -> NDArray[uint64]:
+        """
+        Get the xorshift part of many states after the steps.
+
+        :rtype: ~numpy.ndarray
+        """
+        result = numpy.zeros_like(y)
+        for bit, image in enumerate(self.__xorshift):
+            result ^= ((y >> uint64(bit)) & uint64(1)) * uint64(image)
+        return result
+
+    def apply_mwc(self, mwc: List[int]) -> List[int]:
+        """
+        Get the multiply-with-carry part (c * 2^32 + z) of many states after
+        the steps.
+
+        :rtype: list(int)
+        """
+        return [value * self.__mwc % _MWC_MODULUS for value in mwc]
@@ -0,0 +1,436 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tracing of the time and memory used by each phase of a simulation.
+
+Use as::
+
+    with PhaseTracer() as tracer:
+        sim.setup(1.0)
+        ...
+        sim.run(1000)
+        sim.end()
+    tracer.write_chrome_trace("phases.json")
+    print(tracer.summary())
+
+The trace file can be opened in ``chrome://tracing`` or Perfetto, and read
+back in with :py:meth:`PhaseTracer.read_chrome_trace` to compare with a
+later run using :py:meth:`PhaseTracer.regressions`.
+"""
+from __future__ import annotations
+import json
+import os
+import time
+import tracemalloc
+from typing import (
+    Callable, Dict, List, Optional, Tuple, TYPE_CHECKING)
+
+from spinn_utilities.exceptions import SpiNNUtilsException
+from spinn_front_end_common.interface.provenance import FecTimer
+
+from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.exceptions import SpynnakerException
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+#: The names of the items counted at the end of each phase, and how to count
+#: them
+_ITEM_COUNTERS: Dict[str, Callable[[], int]] = {
+    "vertices": SpynnakerDataView.get_n_vertices,
+    "edges": lambda: sum(
+        len(partition.edges)
+        for partition in SpynnakerDataView.iterate_partitions()),
+    "projections": SpynnakerDataView.get_n_projections,
+    "machine_vertices": SpynnakerDataView.get_n_machine_vertices,
+    "placements": SpynnakerDataView.get_n_placements,
+}
+
+_NS_PER_US = 1000.0
+_NS_PER_MS = 1000000.0
+_BYTES_PER_MIB = 1024.0 * 1024.0
+
+
+class PhaseRecord(object):
+    """
+    The time, memory and number of items of one phase of a simulation.
+    """
+
+    __slots__ = (
+        # The name of the phase
+        "name",
+
+        # The name of the type of work the phase does
+        "work",
+
+        # The run the phase was part of, or None if before the first run
+        "run",
+
+        # The time the phase started, in ns since tracing started
+        "start",
+
+        # The wall clock time the phase took, in ns
+        "wall",
+
+        # The CPU time the phase took, in ns
+        "cpu",
+
+        # The most Python memory traced during the phase in bytes, or None
+        # if memory was not traced
+        "peak_memory",
+
+        # The number of each type of item at the end of the phase
+        "counts",
+
+        # Why the phase was skipped or failed, or None if it completed
+        "note")
+
+    def __init__(
+            self, name: str, work: str, run: Optional[int], start: int,
+            wall: int = 0, cpu: int = 0, peak_memory: Optional[int] = None,
+            counts: Optional[Dict[str, int]] = None,
+            note: Optional[str] = None):
+        # pylint: disable=too-many-arguments
+        self.name = name
+        self.work = work
+        self.run = run
+        self.start = start
+        self.wall = wall
+        self.cpu = cpu
+        self.peak_memory = peak_memory
+        self.counts: Dict[str, int] = counts or {}
+        self.note = note
+
+
+class _OpenPhase(object):
+    """
+    A phase which has started but not yet ended.
+    """
+
+    __slots__ = (
+        # The timer timing the phase
+        "timer",
+
+        # The record to fill in when the phase ends
+        "record",
+
+        # The CPU time when the phase started, in ns
+        "cpu_start",
+
+        # The most memory traced so far during the phase
+        "peak_memory")
+
+    def __init__(self, timer: FecTimer, record: PhaseRecord, cpu_start: int):
+        self.timer = timer
+        self.record = record
+        self.cpu_start = cpu_start
+        self.peak_memory = 0
+
+
+class PhaseTracer(object):
+    """
+    Records the wall clock time, CPU time, peak Python memory and number of
+    items of each phase of the simulation timed by a
+    :py:class:`~spinn_front_end_common.interface.provenance.FecTimer`,
+    while used as a context manager.
+
+    .. note::
+        Tracing Python memory slows Python down a lot, so can be turned off.
+    """
+
+    # The tracer that is currently active
+    _active: Optional[PhaseTracer] = None
+
+    __slots__ = (
+        # The phases recorded, in the order they started
+        "__phases",
+
+        # The phases which have started but not ended
+        "__open",
+
+        # Whether to trace Python memory
+        "__trace_memory",
+
+        # Whether this tracer started tracemalloc, so should stop it
+        "__started_tracemalloc",
+
+        # The perf counter time when tracing started in ns
+        "__start",
+
+        # The FecTimer methods replaced while tracing
+        "__originals")
+
+    def __init__(self, trace_memory: bool = True):
+        """
+        :param bool trace_memory:
+            Whether to record the peak Python memory of each phase
+        """
+        self.__phases: List[PhaseRecord] = list()
+        self.__open: List[_OpenPhase] = list()
+        self.__trace_memory = trace_memory
+        self.__started_tracemalloc = False
+        self.__start = 0
+        self.__originals: Optional[Tuple[Callable, Callable]] = None
+
+    def __enter__(self) -> PhaseTracer:
+        if PhaseTracer._active is not None:
+            raise SpynnakerException("A PhaseTracer is already active")
+        PhaseTracer._active = self
+        if self.__trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracemalloc = True
+        self.__start = time.perf_counter_ns()
+
+        # pylint: disable=protected-access
+        original_enter = FecTimer.__enter__
+        original_insert = FecTimer._insert_timing
+        self.__originals = (original_enter, original_insert)
+
+        def traced_enter(timer: FecTimer):
+            self.__start_phase(timer)
+            return original_enter(timer)
+
+        def traced_insert_timing(
+                timer: FecTimer, time_taken: timedelta,
+                skip_reason: Optional[str]):
+            self.__end_phase(timer, skip_reason)
+            original_insert(timer, time_taken, skip_reason)
+
+        setattr(FecTimer, "__enter__", traced_enter)
+        setattr(FecTimer, "_insert_timing", traced_insert_timing)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        assert self.__originals is not None
+        setattr(FecTimer, "__enter__", self.__originals[0])
+        setattr(FecTimer, "_insert_timing", self.__originals[1])
+        self.__originals = None
+        self.__open.clear()
+        if self.__started_tracemalloc:
+            tracemalloc.stop()
+            self.__started_tracemalloc = False
+        PhaseTracer._active = None
+        return False
+
+    def __start_phase(self, timer: FecTimer):
+        # pylint: disable=protected-access
+        work = timer._work
+        record = PhaseRecord(
+            timer._algorithm, work.work_name, _run_number(),
+            time.perf_counter_ns() - self.__start)
+        if self.__trace_memory:
+            # The phases already open keep the peak so far
+            self.__update_open_peaks(tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self.__open.append(_OpenPhase(timer, record, time.process_time_ns()))
+        self.__phases.append(record)
+
+    def __end_phase(self, timer: FecTimer, note: Optional[str]):
+        index = next((i for i in range(len(self.__open) - 1, -1, -1)
+                      if self.__open[i].timer is timer), None)
+        if index is None:
+            return
+        phase = self.__open.pop(index)
+        record = phase.record
+        record.wall = time.perf_counter_ns() - self.__start - record.start
+        record.cpu = time.process_time_ns() - phase.cpu_start
+        record.note = note
+        record.counts = _count_items()
+        if self.__trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            record.peak_memory = max(phase.peak_memory, peak)
+            self.__update_open_peaks(peak)
+
+    def __update_open_peaks(self, peak: int):
+        for phase in self.__open:
+            phase.peak_memory = max(phase.peak_memory, peak)
+
+    @property
+    def phases(self) -> Tuple[PhaseRecord, ...]:
+        """
+        The phases recorded, in the order they started.
+
+        :rtype: tuple(PhaseRecord)
+        """
+        return tuple(self.__phases)
+
+    def write_chrome_trace(self, path: str):
+        """
+        Write the phases as a Chrome trace event JSON file, which can be
+        viewed in ``chrome://tracing`` or Perfetto.
+
+        :param str path: The file to write to
+        """
+        events = list()
+        for record in self.__phases:
+            args: Dict[str, object] = {
+                "run": record.run, "cpu_ms": record.cpu / _NS_PER_MS,
+                "peak_memory": record.peak_memory, "note": record.note}
+            args.update(record.counts)
+            events.append({
+                "name": record.name, "cat": record.work, "ph": "X",
+                "ts": record.start / _NS_PER_US,
+                "dur": record.wall / _NS_PER_US,
+                "pid": os.getpid(), "tid": 1, "args": args})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    @classmethod
+    def read_chrome_trace(cls, path: str) -> PhaseTracer:
+        """
+        Read the phases from a file written by :py:meth:`write_chrome_trace`,
+        for example to compare with using :py:meth:`regressions`.
+
+        :param str path: The file to read
+        :rtype: PhaseTracer
+        """
+        with open(path, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+        tracer = cls()
+        for event in events:
+            args = dict(event["args"])
+            tracer.__phases.append(PhaseRecord(
+                event["name"], event["cat"], args.pop("run"),
+                int(round(event["ts"] * _NS_PER_US)),
+                int(round(event["dur"] * _NS_PER_US)),
+                int(round(args.pop("cpu_ms") * _NS_PER_MS)),
+                args.pop("peak_memory"), counts=args,
+                note=args.pop("note")))
+        return tracer
+
+    def __totals(self) -> Dict[Tuple[Optional[int], str], List[PhaseRecord]]:
+        """
+        The records of each phase of each run, in the order first seen.
+        """
+        totals: Dict[Tuple[Optional[int], str], List[PhaseRecord]] = dict()
+        for record in self.__phases:
+            totals.setdefault((record.run, record.name), list()).append(
+                record)
+        return totals
+
+    def summary(self) -> str:
+        """
+        A table of the time and memory used by each phase of each run.
+        Phases done more than once in a run are added together, with the
+        largest peak memory and the counts at the end of the last one.
+
+        :rtype: str
+        """
+        header = ("Run", "Phase", "Calls", "Wall (ms)", "CPU (ms)",
+                  "Peak (MiB)") + tuple(_ITEM_COUNTERS)
+        rows = [header]
+        for (run, name), records in self.__totals().items():
+            peaks = [r.peak_memory for r in records
+                     if r.peak_memory is not None]
+            counts = records[-1].counts
+            rows.append((
+                "" if run is None else str(run), name, str(len(records)),
+                f"{sum(r.wall for r in records) / _NS_PER_MS:.3f}",
+                f"{sum(r.cpu for r in records) / _NS_PER_MS:.3f}",
+                f"{max(peaks) / _BYTES_PER_MIB:.3f}" if peaks else "") +
+                tuple(str(counts.get(item, "")) for item in _ITEM_COUNTERS))
+        widths = [max(len(row[i]) for row in rows)
+                  for i in range(len(header))]
+        return "\n".join(
+            "  ".join(cell.ljust(width) if i < 2 else cell.rjust(width)
+                      for i, (cell, width) in enumerate(zip(row, widths)))
+            for row in rows)
+
+    def write_summary(self, path: str):
+        """
+        Write the :py:meth:`summary` table to a file.
+
+        :param str path: The file to write to
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.summary())
+            f.write("\n")
+
+    def regressions(
+            self, baseline: PhaseTracer, ratio: float = 1.5,
+            min_ms: float = 10.0) -> List[Tuple[str, float, float]]:
+        """
+        Find the phases that took much longer than in a baseline.
+        The wall clock times of each phase are added up over all runs.
+
+        :param PhaseTracer baseline: The phases to compare to
+        :param float ratio:
+            How many times longer than the baseline a phase must take
+        :param float min_ms:
+            How many ms longer than the baseline a phase must take, so that
+            short phases with noisy times are not flagged
+        :return: The name of each phase found, the ms it took in the
+            baseline and the ms it took now
+        :rtype: list(tuple(str, float, float))
+        """
+        return find_regressions(
+            baseline.wall_ms_by_phase(), self.wall_ms_by_phase(),
+            ratio, min_ms)
+
+    def wall_ms_by_phase(self) -> Dict[str, float]:
+        """
+        The wall clock time of each phase in ms, added up over all runs.
+
+        :rtype: dict(str, float)
+        """
+        totals: Dict[str, float] = dict()
+        for record in self.__phases:
+            totals[record.name] = (
+                totals.get(record.name, 0.0) + record.wall / _NS_PER_MS)
+        return totals
+
+
+def find_regressions(
+        before: Dict[str, float], now: Dict[str, float], ratio: float = 1.5,
+        min_ms: float = 10.0) -> List[Tuple[str, float, float]]:
+    """
+    Find the phases that took much longer than before.
+    Phases that were not done before are ignored.
+
+    :param dict(str,float) before: The ms each phase took before
+    :param dict(str,float) now: The ms each phase took now
+    :param float ratio:
+        How many times longer than before a phase must take
+    :param float min_ms: How many ms longer than before a phase must take
+    :return: The name of each phase found, the ms it took before and the
+        ms it took now
+    :rtype: list(tuple(str, float, float))
+    """
+    return [(name, before[name], time_now)
+            for name, time_now in now.items()
+            if name in before and time_now > before[name] * ratio and
+            time_now - before[name] >= min_ms]
+
+
+def _run_number() -> Optional[int]:
+    """
+    Get the number of the current run, or None if not known yet.
+    """
+    try:
+        return SpynnakerDataView.get_run_number()
+    except SpiNNUtilsException:
+        return None
+
+
+def _count_items() -> Dict[str, int]:
+    """
+    Count each type of item that currently exists.
+    """
+    counts = dict()
+    for item, counter in _ITEM_COUNTERS.items():
+        try:
+            counts[item] = counter()
+        except SpiNNUtilsException:
+            pass
+    return counts
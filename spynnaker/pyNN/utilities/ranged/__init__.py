@@ -13,4 +13,5 @@
 # limitations under the License.
 
 from .spynnaker_ranged_list import SpynnakerRangedList
-__all__ = ["SpynnakerRangedList"]
+from .spynnaker_range_dictionary import SpynnakerRangeDictionary
+__all__ = ["SpynnakerRangeDictionary", "SpynnakerRangedList"]
@@ -0,0 +1,40 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spinn_utilities.overrides import overrides
+from spinn_utilities.ranged.abstract_list import T
+from spinn_utilities.ranged.range_dictionary import RangeDictionary
+from spinn_utilities.ranged.ranged_list import RangedList
+from .spynnaker_ranged_list import SpynnakerRangedList
+
+
+class SpynnakerRangeDictionary(RangeDictionary[T]):
+    """
+    A :py:class:`~spinn_utilities.ranged.RangeDictionary` that holds its
+    values in :py:class:`SpynnakerRangedList` objects, so that values that
+    differ for many elements are held as numpy arrays.
+    """
+
+    __slots__ = ()
+
+    @overrides(RangeDictionary.list_factory)
+    def list_factory(self, size: int, value: T, key: str) -> RangedList[T]:
+        return SpynnakerRangedList(size, value, key)
+
+    @overrides(RangeDictionary.copy)
+    def copy(self) -> RangeDictionary[T]:
+        copy: SpynnakerRangeDictionary[T] = SpynnakerRangeDictionary(
+            self._size)
+        copy.copy_into(self)
+        return copy
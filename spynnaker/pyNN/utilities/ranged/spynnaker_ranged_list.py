@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, List, Optional, Sequence, Union
+from typing import (
+    Callable, Iterator, List, Optional, Sequence, Tuple, Union, cast)
+import numpy
+from numpy.typing import NDArray
 from typing_extensions import TypeAlias
 from pyNN.random import RandomDistribution
 from spinn_utilities.overrides import overrides
+from spinn_utilities.ranged.abstract_sized import Selector
 from spinn_utilities.ranged.ranged_list import RangedList
-from spinn_utilities.ranged.abstract_list import IdsType, T
+from spinn_utilities.ranged.abstract_list import AbstractList, IdsType, T
 
 # The type of things we consider to be a list of values
 _ListType: TypeAlias = Union[Callable[[int], T], Sequence[T],
@@ -25,11 +29,52 @@ _ListType: TypeAlias = Union[Callable[[int], T], Sequence[T],
 # The type of value arguments in several places
 _ValueType: TypeAlias = Optional[Union[T, _ListType]]
 
+#: Lists with at least this many ranges are stored as arrays if they have
+#: more ranges than the size divided by :py:const:`_DENSE_SIZE_PER_RANGE`
+_MIN_DENSE_RANGES = 16
+
+#: Lists with fewer elements than this per range are stored as arrays
+_DENSE_SIZE_PER_RANGE = 8
+
+#: The kinds of numpy array that can be stored as arrays
+_DENSE_KINDS = "iuf"
+
+
+def _as_dense(values: object) -> Optional[NDArray]:
+    """
+    Get values as a one-dimensional numeric array, if they can be.
+
+    :rtype: ~numpy.ndarray or None
+    """
+    if isinstance(values, numpy.ndarray):
+        array = values
+    else:
+        try:
+            array = numpy.asarray(values)
+        except ValueError:
+            # Values that don't make a proper array
+            return None
+    if array.ndim != 1 or array.dtype.kind not in _DENSE_KINDS:
+        return None
+    return array
+
+
+def _is_number(value: object) -> bool:
+    """
+    Whether a single value can be put in a numeric array.
+    """
+    return (isinstance(value, (int, float, numpy.integer, numpy.floating))
+            and not isinstance(value, (bool, numpy.bool_)))
+
 
 class SpynnakerRangedList(RangedList):
     """
     Adds support for :py:class:`~spynnaker.pyNN.RandomDistribution` to
     :py:class:`~spinn_utilities.ranged.RangedList`.
+
+    Lists of numbers that have a different value for many of the elements
+    (such as after random initialisation or reading back from the machine)
+    are held as a numpy array rather than as ranges or a list of objects.
     """
 
     @overrides(RangedList.listness_check)
@@ -47,3 +92,204 @@ class SpynnakerRangedList(RangedList):
             return value.next(n=size)
 
         return super().as_list(value, size, ids)
+
+    @property
+    def is_dense(self) -> bool:
+        """
+        Whether the values are held as a numpy array.
+
+        :rtype: bool
+        """
+        return (not self._ranged_based and
+                isinstance(self._ranges, numpy.ndarray))
+
+    def get_values_as_array(
+            self, ids: Optional[IdsType] = None) -> Optional[NDArray]:
+        """
+        Get the values as a numpy array, if they are held as one.
+
+        :param ids: The IDs to get the values of, or `None` for all of them
+        :type ids: ~numpy.ndarray or list(int) or None
+        :return: A copy of the values, or `None` if not held as an array
+        :rtype: ~numpy.ndarray or None
+        """
+        if not self.is_dense:
+            return None
+        values = cast(NDArray, self._ranges)
+        if ids is None:
+            return values.copy()
+        return values[numpy.asarray(ids, dtype=numpy.intp)]
+
+    def __make_dense(self) -> None:
+        """
+        Hold the values as an array if they are all numbers.
+        """
+        if self._ranged_based:
+            ranges = cast(List[Tuple[int, int, T]], self._ranges)
+            values = _as_dense([value for _, _, value in ranges])
+            if values is not None:
+                self._ranges = numpy.repeat(
+                    values, [stop - start for start, stop, _ in ranges])
+                self._ranged_based = False
+        elif not isinstance(self._ranges, numpy.ndarray):
+            values = _as_dense(self._ranges)
+            if values is not None and len(values) == self._size:
+                self._ranges = values
+
+    def __make_list(self) -> None:
+        """
+        Hold the values as a list of objects instead of as an array.
+        """
+        self._ranges = cast(NDArray, self._ranges).tolist()
+
+    def __check_fragmented(self) -> None:
+        """
+        Hold the values as an array if they have been split into too many
+        ranges.
+        """
+        if self._ranged_based and len(self._ranges) >= max(
+                _MIN_DENSE_RANGES, self._size // _DENSE_SIZE_PER_RANGE):
+            self.__make_dense()
+
+    def __store(self, index: Union[int, slice, NDArray], values: object
+                ) -> bool:
+        """
+        Store values in the array; if they can't be stored, the values are
+        changed to be held as a list.
+
+        :return: Whether the values were stored
+        """
+        array = cast(NDArray, self._ranges)
+        if _is_number(values):
+            new_values = numpy.asarray([values])
+        else:
+            new_values = _as_dense(values)
+        if new_values is None:
+            self.__make_list()
+            return False
+        dtype = numpy.result_type(array, new_values)
+        if dtype != array.dtype:
+            array = array.astype(dtype)
+            self._ranges = array
+        if _is_number(values):
+            array[index] = new_values[0]
+        else:
+            array[index] = new_values
+        return True
+
+    @overrides(RangedList.set_value)
+    def set_value(self, value: _ValueType, use_list_as_value=False):
+        if (not use_list_as_value and isinstance(value, numpy.ndarray) and
+                _as_dense(value) is not None and len(value) == self._size):
+            self._ranges = value.copy()
+            self._ranged_based = False
+            return
+        super().set_value(value, use_list_as_value=use_list_as_value)
+        if not self._ranged_based:
+            self.__make_dense()
+
+    @overrides(RangedList.set_value_by_id)
+    def set_value_by_id(self, the_id: int, value: T):
+        if self.is_dense:
+            the_id = self._check_id_in_range(the_id)
+            if self.__store(the_id, value):
+                return
+        super().set_value_by_id(the_id, value)
+        self.__check_fragmented()
+
+    @overrides(RangedList.set_value_by_slice)
+    def set_value_by_slice(
+            self, slice_start: int, slice_stop: int, value: _ValueType,
+            use_list_as_value=False):
+        if self.is_dense and (use_list_as_value or not self.is_list(
+                value, size=slice_stop - slice_start)):
+            slice_start, slice_stop = self._check_slice_in_range(
+                slice_start, slice_stop)
+            if self.__store(slice(slice_start, slice_stop), value):
+                return
+        super().set_value_by_slice(
+            slice_start, slice_stop, value,
+            use_list_as_value=use_list_as_value)
+        self.__check_fragmented()
+
+    @overrides(RangedList.set_value_by_ids)
+    def set_value_by_ids(
+            self, ids: IdsType, value: _ValueType, use_list_as_value=False):
+        if self.is_dense and (use_list_as_value or not self.is_list(
+                value, len(ids))):
+            if self.__store(numpy.asarray(ids, dtype=numpy.intp), value):
+                return
+        super().set_value_by_ids(
+            ids, value, use_list_as_value=use_list_as_value)
+
+    @overrides(RangedList._set_values_list)
+    def _set_values_list(self, ids: IdsType, value: _ListType):
+        values = self.as_list(value=value, size=len(ids), ids=ids)
+        if not self.is_dense and len(ids) >= max(
+                _MIN_DENSE_RANGES, self._size // _DENSE_SIZE_PER_RANGE):
+            # Setting this many values is likely to split up the ranges
+            self.__make_dense()
+        if self.is_dense and self.__store(
+                numpy.asarray(ids, dtype=numpy.intp), values):
+            return
+        for id_value, val in zip(ids, values):
+            self.set_value_by_id(id_value, val)
+
+    @overrides(AbstractList.get_values)
+    def get_values(self, selector: Selector = None) -> Sequence[T]:
+        if not self.is_dense:
+            return super().get_values(selector)
+        values = cast(NDArray, self._ranges)
+        if selector is None:
+            return values.tolist()
+        return values[numpy.asarray(
+            self.selector_to_ids(selector), dtype=numpy.intp)].tolist()
+
+    @overrides(RangedList.iter_ranges)
+    def iter_ranges(self) -> Iterator[Tuple[int, int, T]]:
+        if not self.is_dense:
+            yield from super().iter_ranges()
+            return
+        yield from self.__iter_dense_ranges(numpy.arange(self._size))
+
+    @overrides(AbstractList.iter_ranges_by_ids)
+    def iter_ranges_by_ids(
+            self, ids: IdsType) -> Iterator[Tuple[int, int, T]]:
+        if not self.is_dense:
+            yield from super().iter_ranges_by_ids(ids)
+            return
+        yield from self.__iter_dense_ranges(
+            numpy.asarray(ids, dtype=numpy.intp))
+
+    def __iter_dense_ranges(
+            self, ids: NDArray) -> Iterator[Tuple[int, int, T]]:
+        """
+        Get the ranges of consecutive IDs that have the same value, when
+        the values are held as an array.
+        """
+        if not len(ids):
+            return
+        values = cast(NDArray, self._ranges)[ids]
+        breaks = numpy.flatnonzero(
+            (numpy.diff(ids) != 1) | (values[1:] != values[:-1])) + 1
+        starts = numpy.concatenate(([0], breaks))
+        stops = numpy.concatenate((breaks, [len(ids)]))
+        for start, stop in zip(starts, stops):
+            yield (int(ids[start]), int(ids[stop - 1]) + 1, values[start])
+
+    @overrides(RangedList.copy_into)
+    def copy_into(self, other: RangedList[T]):
+        if isinstance(other, SpynnakerRangedList) and other.is_dense:
+            self._ranged_based = False
+            self._ranges = other.get_values_as_array()
+            return
+        if self.is_dense:
+            self.__make_list()
+        super().copy_into(other)
+
+    @overrides(RangedList.copy)
+    def copy(self) -> RangedList[T]:
+        clone: SpynnakerRangedList = SpynnakerRangedList(
+            self._size, self._default, self._key)
+        clone.copy_into(self)
+        return clone
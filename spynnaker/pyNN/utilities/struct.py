@@ -24,13 +24,16 @@ from typing_extensions import TypeAlias
 from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.ranged.abstract_list import AbstractList
 from spinn_utilities.ranged.range_dictionary import RangeDictionary
+from spinn_utilities.ranged.ranged_list import RangedList
 
 from pacman.model.graphs.common import Slice
 
 from spinn_front_end_common.interface.ds import DataType
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
-from spynnaker.pyNN.utilities.utility_calls import convert_to
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangedList
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to, convert_to_array)
 from spynnaker.pyNN.models.common.param_generator_data import (
     get_generator_type, param_generator_id, param_generator_params,
     type_has_generator)
@@ -195,6 +198,11 @@ class Struct(object):
         """
         # If there is a list of values, convert it
         ids = vertex_slice.get_raster_ids()
+        if isinstance(all_vals, SpynnakerRangedList):
+            dense_values = all_vals.get_values_as_array(ids)
+            if dense_values is not None:
+                data[name] = convert_to_array(dense_values, data_type)
+                return
         data_pos = 0
         for start, stop, value in all_vals.iter_ranges_by_ids(ids):
             # Get the values and convert to the correct data type
@@ -363,15 +371,11 @@ class Struct(object):
             The values to update with the read data
         :param int data_offset:
             Index of the byte at the start of the valid data.
-        :param int offset:
-            The first index into values to write to.
-        :param array_size:
-            The number of structure copies to read, or `None` if this is a
+        :param vertex_slice:
+            The slice of atoms that the data is for, or `None` if this is a
             non-repeating structure.
-        :type array_size: int or None
+        :type vertex_slice: ~pacman.model.graphs.common.Slice or None
         """
-        n_items = 1
-        ids = numpy.zeros([0], dtype=integer)
         if vertex_slice is None:
             if self.__repeat_type != StructRepeat.GLOBAL:
                 raise ValueError(
@@ -379,22 +383,80 @@ class Struct(object):
         elif self.__repeat_type == StructRepeat.GLOBAL:
             raise ValueError("Global Structures do not have a slice")
         else:
-            n_items = vertex_slice.n_atoms
-            ids = vertex_slice.get_raster_ids()
+            self.read_slices_data([(data, data_offset, vertex_slice)], values)
+            return
 
         if not self.__fields:
             return
 
         # Read in the data values
         numpy_data = numpy.frombuffer(
-            data, offset=data_offset, dtype=self.numpy_dtype, count=n_items)
+            data, offset=data_offset, dtype=self.numpy_dtype, count=1)
+        for data_type, name in self.fields:
+            # Ignore fields that can't be set
+            if name in values:
+                values[name] = data_type.decode_numpy_array(
+                    numpy_data[name])[0]
+
+    def read_slices_data(
+            self, data: Sequence[Tuple[bytes, int, Slice]],
+            values: RangeDictionary):
+        """
+        Read the data of a repeating structure for several slices together
+        and write to values.
+
+        :param data:
+            The data to be read, the index of the byte at the start of the
+            valid data within it, and the slice of atoms it is for, for each
+            slice
+        :type data: list(tuple(bytes, int, ~pacman.model.graphs.common.Slice))
+        :param ~spinn_utilities.ranged.RangeDictionary values:
+            The values to update with the read data
+        """
+        if self.__repeat_type == StructRepeat.GLOBAL:
+            raise ValueError("Global Structures do not have a slice")
+        if not self.__fields or not data:
+            return
+
+        # Read in the data values of all the slices as one array
+        numpy_data = numpy.concatenate([
+            numpy.frombuffer(
+                block, offset=data_offset, dtype=self.numpy_dtype,
+                count=vertex_slice.n_atoms)
+            for block, data_offset, vertex_slice in data])
+        ids = numpy.concatenate([
+            vertex_slice.get_raster_ids() for _, _, vertex_slice in data])
 
         for data_type, name in self.fields:
             # Ignore fields that can't be set
             if name in values:
-                # Get the data to set for this item
-                value = data_type.decode_numpy_array(numpy_data[name])
-                if self.__repeat_type == StructRepeat.GLOBAL:
-                    values[name] = value[0]
-                else:
-                    values[name].set_value_by_ids(ids, value)
+                _set_values_by_ids(
+                    values[name], ids,
+                    data_type.decode_numpy_array(numpy_data[name]))
+
+
+def _set_values_by_ids(
+        values: RangedList, ids: NDArray[integer], new_values: NDArray):
+    """
+    Set the values of a ranged list for the given IDs, replacing the whole
+    list in one go if the IDs cover all of it.
+
+    :param ~spinn_utilities.ranged.RangedList values: The list to update
+    :param ~numpy.ndarray ids: The IDs to set the values of
+    :param ~numpy.ndarray new_values: The values to set
+    """
+    n_values = len(values)
+    if len(ids) != n_values or not len(ids):
+        values.set_value_by_ids(ids, new_values)
+        return
+    covered = numpy.zeros(n_values, dtype=bool)
+    covered[ids] = True
+    if not covered.all():
+        values.set_value_by_ids(ids, new_values)
+        return
+    dense = numpy.empty(n_values, dtype=new_values.dtype)
+    dense[ids] = new_values
+    if numpy.all(dense == dense[0]):
+        values.set_value(dense[0])
+    else:
+        values.set_value(dense)
@@ -19,7 +19,7 @@ import logging
 import os
 import math
 from math import isnan
-from typing import List, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 import neo
 import numpy
@@ -71,6 +71,48 @@ STATS_BY_NAME = {
     'randint': RandomStatsRandIntImpl(),
     'vonmises': RandomStatsVonmisesImpl()}
 
+#: The maximum number of statistics to keep before starting again
+_MAX_CACHED_STATS = 4096
+
+# Statistics already worked out, by distribution, query and arguments; the
+# same distributions tend to be asked the same things for every vertex
+_stats_cache: Dict[Hashable, Any] = dict()
+
+
+def _stats_key(distribution: RandomDistribution, query: str,
+               args: Tuple[float, ...]) -> Optional[Hashable]:
+    """
+    Get the key of a query on a distribution in the cache, or `None` if
+    it can't be cached (e.g. because parameters are arrays).
+    """
+    key = (distribution.name, tuple(sorted(distribution.parameters.items())),
+           query, args)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_stat(distribution: RandomDistribution, query: str, *args: float):
+    """
+    Get a statistic of a distribution, using the cache where possible.
+
+    :param ~spynnaker.pyNN.RandomDistribution distribution:
+    :param str query: The method of the statistics object to call
+    :param args: The arguments to the method after the distribution
+    """
+    key = _stats_key(distribution, query, args)
+    if key is not None and key in _stats_cache:
+        return _stats_cache[key]
+    stats = STATS_BY_NAME[distribution.name]
+    value = getattr(stats, query)(distribution, *args)
+    if key is not None:
+        if len(_stats_cache) >= _MAX_CACHED_STATS:
+            _stats_cache.clear()
+        _stats_cache[key] = value
+    return value
+
 
 def check_directory_exists_and_create_if_not(filename: str):
     """
@@ -131,6 +173,44 @@ def convert_to(value, data_type: DataType) -> uint32:
         data_type.struct_encoding)
 
 
+def convert_to_array(values, data_type: DataType) -> NDArray:
+    """
+    Convert values to a given data type all together; for data types of up
+    to 32 bits, this gives the same values as using :py:func:`convert_to` on
+    each value.  Wider data types are converted a value at a time with
+    :py:func:`convert_to`, as their values don't fit in a float.
+
+    :param values: The values to convert
+    :type values: list(float) or ~numpy.ndarray
+    :param ~data_specification.enums.DataType data_type:
+        The data type to convert to
+    :return: The converted data, with the numpy type of the data type
+    :rtype: ~numpy.ndarray
+    """
+    values = numpy.asarray(values)
+    encoding = numpy.dtype(data_type.struct_encoding)
+    if data_type.size > 4:
+        return numpy.array(
+            [convert_to(value, data_type) for value in values.flat],
+            dtype=encoding).reshape(values.shape)
+    if data_type.scale != 1:
+        out_of_range = numpy.logical_or(
+            values < float(data_type.min), values > float(data_type.max))
+        if out_of_range.any():
+            raise ValueError(
+                f"value {values[out_of_range][0]:f} cannot be converted to "
+                f"{data_type.__doc__}: out of range")
+        # The scales are all powers of two and the scaled values fit in a
+        # float, so this is exact and rounds in the same way as the scaling
+        # of each value on its own
+        return numpy.round(values * float(data_type.scale)).astype(encoding)
+    if encoding.kind == "f":
+        return numpy.round(values).astype(encoding)
+    if values.dtype.kind in "iu":
+        return values.astype(encoding)
+    return numpy.trunc(values).astype(encoding)
+
+
 def read_in_data_from_file(
         file_path: str, min_atom: int, max_atom: int,
         min_time: float, max_time: float, extra: bool = False) -> NDArray:
@@ -270,8 +350,8 @@ def get_probability_within_range(distribution, lower, upper):
     :param float lower:
     :param float upper:
     """
-    stats = STATS_BY_NAME[distribution.name]
-    return stats.cdf(distribution, upper) - stats.cdf(distribution, lower)
+    return (_get_stat(distribution, "cdf", upper) -
+            _get_stat(distribution, "cdf", lower))
 
 
 def get_maximum_probable_value(distribution, n_items, chance=(1.0 / 100.0)):
@@ -283,9 +363,8 @@ def get_maximum_probable_value(distribution, n_items, chance=(1.0 / 100.0)):
     :param int n_items:
     :param float chance:
     """
-    stats = STATS_BY_NAME[distribution.name]
     prob = 1.0 - (chance / float(n_items))
-    return stats.ppf(distribution, prob)
+    return _get_stat(distribution, "ppf", prob)
 
 
 def get_minimum_probable_value(distribution, n_items, chance=(1.0 / 100.0)):
@@ -295,9 +374,8 @@ def get_minimum_probable_value(distribution, n_items, chance=(1.0 / 100.0)):
 
     :param ~spynnaker.pyNN.RandomDistribution distribution:
     """
-    stats = STATS_BY_NAME[distribution.name]
     prob = chance / float(n_items)
-    return stats.ppf(distribution, prob)
+    return _get_stat(distribution, "ppf", prob)
 
 
 def get_mean(distribution):
@@ -306,8 +384,7 @@ def get_mean(distribution):
 
     :param ~spynnaker.pyNN.RandomDistribution distribution:
     """
-    stats = STATS_BY_NAME[distribution.name]
-    return stats.mean(distribution)
+    return _get_stat(distribution, "mean")
 
 
 def get_standard_deviation(distribution):
@@ -316,8 +393,7 @@ def get_standard_deviation(distribution):
 
     :param ~spynnaker.pyNN.RandomDistribution distribution:
     """
-    stats = STATS_BY_NAME[distribution.name]
-    return stats.std(distribution)
+    return _get_stat(distribution, "std")
 
 
 def get_variance(distribution):
@@ -326,8 +402,7 @@ def get_variance(distribution):
 
     :param ~spynnaker.pyNN.RandomDistribution distribution:
     """
-    stats = STATS_BY_NAME[distribution.name]
-    return stats.var(distribution)
+    return _get_stat(distribution, "var")
 
 
 def high(distribution):
@@ -21,6 +21,8 @@ from types import ModuleType
 from neo import SpikeTrain, Block, Segment, AnalogSignal
 import numpy as np
 import quantities
+from spynnaker.plot_utils import (
+    bin_indices, bin_points, decimate, axes_pixels)
 plt: ModuleType
 try:
     from pyNN.utility.plotting import repeat
@@ -60,6 +62,73 @@ def _handle_options(axes, options):
         axes.set_xlim(options.pop("xlim"))
 
 
+def _plot_label(axes, label):
+    """
+    Adds a label to the top right of a plot.
+
+    :param ~matplotlib.axes.Axes axes: An Axes in a matplotlib figure
+    :param str label: Label for the graph
+    """
+    if label:
+        plt.text(0.95, 0.95, label,
+                 transform=axes.transAxes, ha='right', va='top',
+                 bbox=dict(facecolor='white', alpha=1.0))
+
+
+def _rasterise(axes, n_points, options):
+    """
+    Decides if there are too many points to plot one by one, so they
+    should be binned into an image the size of the axes.
+
+    Removes the `rasterise` option which can be `True` or `False` to
+    force the choice.
+
+    :param ~matplotlib.axes.Axes axes: An Axes in a matplotlib figure
+    :param int n_points: The number of points to plot
+    :param dict options: All options the plotter can be configured with
+    :rtype: bool
+    """
+    rasterise = options.pop("rasterise", None)
+    if rasterise is None:
+        width, height = axes_pixels(axes)
+        return n_points > width * height
+    return bool(rasterise)
+
+
+def _spike_image_shape(axes, min_index, max_index):
+    """
+    Works out the number of neuron rows and time columns of a spike image.
+
+    :param ~matplotlib.axes.Axes axes: An Axes in a matplotlib figure
+    :param int min_index: The lowest neuron ID to plot
+    :param int max_index: The highest neuron ID to plot
+    :rtype: tuple(int, int)
+    """
+    width, height = axes_pixels(axes)
+    return min(height, int(max_index - min_index) + 1), width
+
+
+def _plot_spike_counts(axes, counts, time_range, min_index, max_index,
+                       label=''):
+    """
+    Plots the number of spikes in each pixel as an image.
+
+    :param ~matplotlib.axes.Axes axes: An Axes in a matplotlib figure
+    :param ~numpy.ndarray counts: Spike counts by neuron bin then time bin
+    :param tuple(float,float) time_range: The times covered by the counts
+    :param int min_index: The lowest neuron ID covered by the counts
+    :param int max_index: The highest neuron ID covered by the counts
+    :param str label: Label for the graph
+    """
+    axes.imshow(
+        np.ma.masked_equal(counts, 0), cmap='Blues', vmin=0,
+        interpolation='nearest', origin='lower', aspect='auto',
+        extent=(time_range[0], time_range[1],
+                min_index - 0.5, max_index + 0.5))
+    axes.set_ylim(-0.5 + min_index, max_index + 0.5)
+    _plot_label(axes, label)
+
+
 def _plot_spikes(axes, spike_times, neurons, label='', **options):
     """
     Plots the spikes based on two lists.
@@ -75,10 +144,7 @@ def _plot_spikes(axes, spike_times, neurons, label='', **options):
         min_index = min(neurons)
         axes.plot(spike_times, neurons, 'b.', **options)
         axes.set_ylim(-0.5 + min_index, max_index + 0.5)
-    if label:
-        plt.text(0.95, 0.95, label,
-                 transform=axes.transAxes, ha='right', va='top',
-                 bbox=dict(facecolor='white', alpha=1.0))
+    _plot_label(axes, label)
 
 
 def plot_spiketrains(axes, spiketrains, label='', **options):
@@ -93,6 +159,9 @@ def plot_spiketrains(axes, spiketrains, label='', **options):
     # pylint: disable=c-extension-no-member
     axes.set_xlim(0, spiketrains[0].t_stop / quantities.ms)
     _handle_options(axes, options)
+    if _rasterise(axes, sum(len(x) for x in spiketrains), options):
+        _plot_spike_train_counts(axes, spiketrains, label)
+        return
     neurons = np.concatenate(
         [np.repeat(x.annotations['source_index'], len(x))
          for x in spiketrains])
@@ -100,6 +169,33 @@ def plot_spiketrains(axes, spiketrains, label='', **options):
     _plot_spikes(axes, spike_times, neurons, label=label, **options)
 
 
+def _plot_spike_train_counts(axes, spiketrains, label=''):
+    """
+    Plot the number of spikes in each pixel of a raster plot, one spike
+    train at a time so the spikes are never all held together.
+
+    :param ~matplotlib.axes.Axes axes: An Axes in a matplotlib figure
+    :param list(~neo.core.SpikeTrain) spiketrains: List of spike times
+    :param str label: Label for the graph
+    """
+    sources = np.array(
+        [x.annotations['source_index'] for x in spiketrains])
+    min_index = int(sources.min())
+    max_index = int(sources.max())
+    shape = _spike_image_shape(axes, min_index, max_index)
+    time_range = (0, float(spiketrains[0].t_stop / quantities.ms))
+    rows = bin_indices(
+        sources, (min_index - 0.5, max_index + 0.5), shape[0])
+    counts = np.zeros(shape, dtype=np.int64)
+    for row, spiketrain in zip(rows, spiketrains):
+        columns = bin_indices(
+            spiketrain.rescale(quantities.ms).magnitude, time_range,
+            shape[1])
+        counts[row] += np.bincount(
+            columns[columns >= 0], minlength=shape[1])
+    _plot_spike_counts(axes, counts, time_range, min_index, max_index, label)
+
+
 def plot_spikes_numpy(axes, spikes, label='', **options):
     """
     Plot all spikes.
@@ -112,6 +208,17 @@ def plot_spikes_numpy(axes, spikes, label='', **options):
     _handle_options(axes, options)
     neurons = spikes[:, 0]
     spike_times = spikes[:, 1]
+    if _rasterise(axes, len(spikes), options):
+        min_index = int(neurons.min())
+        max_index = int(neurons.max())
+        time_range = (float(spike_times.min()), float(spike_times.max()))
+        counts = bin_points(
+            spike_times, neurons, time_range,
+            (min_index - 0.5, max_index + 0.5),
+            _spike_image_shape(axes, min_index, max_index))
+        _plot_spike_counts(
+            axes, counts, time_range, min_index, max_index, label)
+        return
     _plot_spikes(axes, spike_times, neurons, label=label, **options)
 
 
@@ -127,16 +234,38 @@ def _heat_plot(axes, neurons, times, values, label='', **options):
     :param options: plotting options
     """
     _handle_options(axes, options)
-    info_array = np.empty((max(neurons)+1, max(times)+1))
-    info_array[:] = np.nan
-    info_array[neurons, times] = values
+    shape = (max(neurons)+1, max(times)+1)
+    width, height = axes_pixels(axes)
+    if shape[0] <= height and shape[1] <= width:
+        info_array = np.empty(shape)
+        info_array[:] = np.nan
+        info_array[neurons, times] = values
+    else:
+        # Too big to see every value, so show the mean of each pixel
+        ranges = ((-0.5, shape[1] - 0.5), (-0.5, shape[0] - 0.5))
+        shape = (min(shape[0], height), min(shape[1], width))
+        sums = bin_points(times, neurons, *ranges, shape, values=values)
+        counts = bin_points(times, neurons, *ranges, shape)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            info_array = sums / counts
+    _heat_map(axes, info_array, (
+        -0.5, max(times) + 0.5, -0.5, max(neurons) + 0.5), label)
+
+
+def _heat_map(axes, info_array, extent, label=''):
+    """
+    Plots an array of values, which may be binned, as a heat map.
+
+    :param ~matplotlib.axes.Axes axes: An Axes in a matplotlib figure
+    :param ~numpy.ndarray info_array: Values by neuron bin then time bin
+    :param tuple(float,float,float,float) extent:
+        The times then neuron IDs covered by the array
+    :param str label: Label for the graph
+    """
     heat_map = axes.imshow(info_array, cmap='hot', interpolation='none',
-                           origin='lower', aspect='auto')
+                           origin='lower', aspect='auto', extent=extent)
     axes.figure.colorbar(heat_map)
-    if label:
-        plt.text(0.95, 0.95, label,
-                 transform=axes.transAxes, ha='right', va='top',
-                 bbox=dict(facecolor='white', alpha=1.0))
+    _plot_label(axes, label)
 
 
 def heat_plot_numpy(axes, data, label='', **options):
@@ -166,6 +295,10 @@ def heat_plot_neo(axes, signal_array, label='', **options):
     if label is None:
         label = signal_array.name
     n_neurons = signal_array.shape[-1]
+    width, height = axes_pixels(axes)
+    if len(signal_array) > width or n_neurons > height:
+        _heat_plot_signal(axes, signal_array, label, **options)
+        return
     xs = list(range(n_neurons))
     times = signal_array.times / signal_array.sampling_period
     times = np.rint(times.magnitude).astype(int)
@@ -176,6 +309,27 @@ def heat_plot_neo(axes, signal_array, label='', **options):
     _heat_plot(axes, neurons, all_times, values, label=label, **options)
 
 
+def _heat_plot_signal(axes, signal_array, label='', **options):
+    """
+    Plots the mean of the values of a signal in each pixel as a heat map,
+    without making arrays of the neurons and times of every value.
+
+    :param ~matplotlib.axes.Axes axes: An Axes in a matplotlib figure
+    :param ~neo.core.AnalogSignal signal_array: Neo Signal array object
+    :param str label: Label for the graph
+    :param options: plotting options
+    """
+    _handle_options(axes, options)
+    times = signal_array.times / signal_array.sampling_period
+    times = np.rint(times.magnitude).astype(int)
+    width, height = axes_pixels(axes)
+    magnitude = signal_array.magnitude
+    info_array = decimate(magnitude.T, (height, width))
+    _heat_map(axes, info_array, (
+        times[0] - 0.5, times[-1] + 0.5, -0.5, magnitude.shape[1] - 0.5),
+        label)
+
+
 def plot_segment(axes, segment, label='', **options):
     """
     Plots a segment into a plot of spikes or a heat map.
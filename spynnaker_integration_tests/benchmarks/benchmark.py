@@ -0,0 +1,274 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Runs synthetic networks of growing size through mapping and data
+generation on a virtual board, recording the time and memory of each phase,
+and times the index mapping of views and the handling of the parameters of
+a population of growing size.
+Networks of many delayed projections can also be run, to time the adding
+of delay extensions.
+
+Run as::
+
+    python -m spynnaker_integration_tests.benchmarks --scales 1 2 4 \\
+        --output results.json --compare baseline.json
+
+or, for 50176 delayed projections::
+
+    python -m spynnaker_integration_tests.benchmarks --scales \\
+        --delay-populations 224 --no-memory
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from spinn_utilities.config_holder import set_config
+import pyNN.spiNNaker as sim
+from spynnaker.pyNN.utilities.phase_tracer import (
+    PhaseTracer, find_regressions)
+from .parameter_benchmark import (
+    PARAMETER_NEURONS_PER_SCALE, benchmark_parameters)
+from .synthetic_network import build_delay_network, build_network
+from .view_benchmark import VIEW_NEURONS_PER_SCALE, benchmark_views
+
+#: The default seed of the random numbers of the networks
+DEFAULT_SEED = 42
+
+#: How long each network is run for in ms
+_RUN_TIME = 100
+
+#: What the size of the results of each kind of network is called
+_SIZE_OF = {"results": "scale", "delay_results": "populations"}
+
+
+def _use_virtual_board():
+    """
+    Make sure the simulation is on a virtual board which is just big
+    enough for the network, whatever the cfg files say.
+    """
+    set_config("Machine", "virtual_board", "True")
+    set_config("Machine", "version", "5")
+    set_config("Machine", "width", "None")
+    set_config("Machine", "height", "None")
+    set_config("Machine", "json_path", "None")
+
+
+def setup_simulation():
+    """
+    Set up a simulation on a virtual board for a synthetic network.
+    """
+    sim.setup(1.0)
+    _use_virtual_board()
+    # The distributions of the network are seeded for the connections made
+    # on the host; those made on the machine use the population seeds
+    # instead, so only warn about the seeds they ignore
+    set_config("Simulation", "error_on_non_spynnaker_pynn", "False")
+
+
+def benchmark_scale(
+        scale: int, seed: int = DEFAULT_SEED,
+        trace_memory: bool = True, views: bool = True,
+        params: bool = True) -> Dict[str, Any]:
+    """
+    Build, map and generate the data of a network of the given scale.
+
+    :param int scale: How big a network to build
+    :param int seed: The seed of all the random numbers used
+    :param bool trace_memory: Whether to record the peak memory of phases
+    :param bool views: Whether to also time PopulationView operations,
+        which are added to the phases but not to the total
+    :param bool params: Whether to also time the handling of parameters,
+        which are added to the phases but not to the total
+    :return: The size of the network and the time and memory of each phase
+    :rtype: dict
+    """
+    with PhaseTracer(trace_memory=trace_memory) as tracer:
+        setup_simulation()
+        network = build_network(scale, seed)
+        sim.run(_RUN_TIME)
+        sim.end()
+    phases = _phases(tracer)
+    total_ms = sum(phase["wall_ms"] for phase in phases.values())
+    if views:
+        phases.update(benchmark_views(scale * VIEW_NEURONS_PER_SCALE, seed))
+    if params:
+        phases.update(benchmark_parameters(
+            scale * PARAMETER_NEURONS_PER_SCALE, seed))
+    return {"scale": scale, "network": network, "phases": phases,
+            "total_ms": total_ms}
+
+
+def benchmark_delays(
+        n_populations: int, seed: int = DEFAULT_SEED,
+        trace_memory: bool = True) -> Dict[str, Any]:
+    """
+    Build, map and generate the data of a network with a delayed
+    projection from each of the given number of populations to each.
+
+    :param int n_populations: The number of populations
+    :param int seed: The seed of the delays
+    :param bool trace_memory: Whether to record the peak memory of phases
+    :return: The size of the network and the time and memory of each phase
+    :rtype: dict
+    """
+    with PhaseTracer(trace_memory=trace_memory) as tracer:
+        setup_simulation()
+        network = build_delay_network(n_populations, seed)
+        sim.run(_RUN_TIME)
+        sim.end()
+    phases = _phases(tracer)
+    return {"populations": n_populations, "network": network,
+            "phases": phases,
+            "total_ms": sum(phase["wall_ms"] for phase in phases.values())}
+
+
+def _phases(tracer: PhaseTracer) -> Dict[str, Dict[str, Any]]:
+    """
+    Add up the time and memory of each phase that a tracer recorded.
+    """
+    phases: Dict[str, Dict[str, Any]] = dict()
+    for record in tracer.phases:
+        phase = phases.setdefault(record.name, {
+            "wall_ms": 0.0, "cpu_ms": 0.0, "peak_memory": None})
+        phase["wall_ms"] += record.wall / 1000000.0
+        phase["cpu_ms"] += record.cpu / 1000000.0
+        if record.peak_memory is not None:
+            phase["peak_memory"] = max(
+                phase["peak_memory"] or 0, record.peak_memory)
+    return phases
+
+
+def run_benchmarks(
+        scales: Sequence[int], seed: int = DEFAULT_SEED,
+        trace_memory: bool = True, views: bool = True, params: bool = True,
+        delay_populations: Sequence[int] = ()) -> Dict[str, Any]:
+    """
+    Benchmark networks of each of the given scales.
+
+    :param list(int) scales: The scales of network to build
+    :param int seed: The seed of all the random numbers used
+    :param bool trace_memory: Whether to record the peak memory of phases
+    :param bool views: Whether to also time PopulationView operations
+    :param bool params: Whether to also time the handling of parameters
+    :param list(int) delay_populations:
+        The numbers of populations of delay networks to build as well
+    :return: The results, which can be saved as JSON
+    :rtype: dict
+    """
+    return {"seed": seed, "results": [
+        benchmark_scale(scale, seed, trace_memory, views, params)
+        for scale in scales], "delay_results": [
+        benchmark_delays(n_populations, seed, trace_memory)
+        for n_populations in delay_populations]}
+
+
+def compare_benchmarks(
+        baseline: Dict[str, Any], results: Dict[str, Any],
+        ratio: float = 1.5, min_ms: float = 10.0,
+        kind: str = "results") -> List[Tuple[int, str, float, float]]:
+    """
+    Find the phases that took much longer than in a baseline, for each
+    size of network in both.
+
+    :param dict baseline: The results to compare with
+    :param dict results: The new results
+    :param float ratio:
+        How many times longer than the baseline a phase must take
+    :param float min_ms: How many ms longer than the baseline a phase must
+        take, so that short phases with noisy times are not flagged
+    :param str kind: Which networks to compare; "results" for the
+        synthetic networks or "delay_results" for the delay networks
+    :return: The size, name, ms before and ms now of each slower phase
+    :rtype: list(tuple(int, str, float, float))
+    """
+    size = _SIZE_OF[kind]
+    before = {result[size]: result for result in baseline.get(kind, [])}
+    found = list()
+    for result in results[kind]:
+        if result[size] not in before:
+            continue
+        old = before[result[size]]
+        found.extend(
+            (result[size], name, old_ms, new_ms)
+            for name, old_ms, new_ms in find_regressions(
+                {name: phase["wall_ms"]
+                 for name, phase in old["phases"].items()},
+                {name: phase["wall_ms"]
+                 for name, phase in result["phases"].items()},
+                ratio, min_ms))
+    return found
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmarks from the command line.
+
+    :param list(str) args: The arguments, or `None` to use `sys.argv`
+    :return: 1 if any phase is slower than in the baseline, else 0
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", type=int, nargs="*", default=[1, 2, 4],
+                        help="the scales of network to build")
+    parser.add_argument("--delay-populations", type=int, nargs="*",
+                        default=[],
+                        help="the numbers of populations of delay networks "
+                        "to build, each with a projection from every "
+                        "population to every population")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="do not trace memory, which slows Python")
+    parser.add_argument("--no-views", action="store_true",
+                        help="do not time PopulationView operations")
+    parser.add_argument("--no-params", action="store_true",
+                        help="do not time the handling of parameters")
+    parser.add_argument("--output", help="the JSON file to write to")
+    parser.add_argument("--compare", help="a JSON file to compare with")
+    parser.add_argument("--ratio", type=float, default=1.5,
+                        help="how many times slower a phase must be")
+    parser.add_argument("--min-ms", type=float, default=10.0,
+                        help="how many ms slower a phase must be")
+    options = parser.parse_args(args)
+
+    results = run_benchmarks(
+        options.scales, options.seed, not options.no_memory,
+        not options.no_views, not options.no_params,
+        options.delay_populations)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    for result in results["results"]:
+        print(f"scale {result['scale']}: {result['network']} "
+              f"took {result['total_ms']:.1f} ms")
+    for result in results["delay_results"]:
+        print(f"delays {result['populations']}: {result['network']} "
+              f"took {result['total_ms']:.1f} ms")
+    if not options.compare:
+        return 0
+    with open(options.compare, encoding="utf-8") as f:
+        baseline = json.load(f)
+    found = False
+    for kind, prefix in (("results", "scale"), ("delay_results", "delays")):
+        slower = compare_benchmarks(
+            baseline, results, options.ratio, options.min_ms, kind)
+        for size, name, old_ms, new_ms in slower:
+            print(f"{prefix} {size}: {name} took {new_ms:.1f} ms "
+                  f"not {old_ms:.1f} ms")
+        found = found or bool(slower)
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Times the setting, getting and writing of a parameter of a large
+population with a different value for each neuron, as held by a plain
+RangedList and as a dense SpynnakerRangedList.
+"""
+
+from typing import Any, Dict
+import numpy
+from spinn_utilities.ranged.ranged_list import RangedList
+from spinn_front_end_common.interface.ds import DataType
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_list import (
+    SpynnakerRangedList)
+from spynnaker.pyNN.utilities.struct import Struct
+from .view_benchmark import timed
+
+#: The number of neurons with parameters at scale 1
+PARAMETER_NEURONS_PER_SCALE = 250000
+
+
+def benchmark_parameters(
+        n_neurons: int, seed: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Time setting every other value of a list of random values, getting
+    them all back and writing them with a structure, for a list of each
+    kind.  A plain RangedList holds the values as a list of objects, while
+    a SpynnakerRangedList holds them as a numpy array.
+
+    :param int n_neurons: The number of values in each list
+    :param int seed: The seed of the values
+    :return: The wall and CPU ms of each operation, named as phases are
+    :rtype: dict(str, dict)
+    """
+    rng = numpy.random.default_rng(seed)
+    times: Dict[str, Dict[str, Any]] = dict()
+    values = rng.uniform(-70.0, -50.0, n_neurons).tolist()
+    ids = numpy.arange(0, n_neurons, 2)
+    new_values = rng.uniform(-70.0, -50.0, len(ids)).tolist()
+    struct = Struct([(DataType.S1615, "v")])
+    vertex_slice = Slice(0, n_neurons - 1)
+    for list_type in (RangedList, SpynnakerRangedList):
+        name = f"Parameters {list_type.__name__}"
+        ranged = list_type(n_neurons, values, key="v")
+        with timed(times, f"{name} set_value_by_ids"):
+            ranged.set_value_by_ids(ids, new_values)
+        with timed(times, f"{name} get_values"):
+            ranged.get_values()
+        with timed(times, f"{name} Struct.get_data"):
+            struct.get_data({"v": ranged}, vertex_slice)
+    return times
@@ -0,0 +1,215 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Builds synthetic networks that use every connector type, STDP, structural
+plasticity, selective recording and long delays, at a given scale, and
+networks of many small populations with many delayed projections.
+"""
+
+from typing import Dict, List
+import csa  # type: ignore[import]
+import numpy
+from pyNN.random import NumpyRNG, RandomDistribution
+from pyNN.space import Grid2D
+import pyNN.spiNNaker as sim
+
+#: The number of neurons in most populations at scale 1; a multiple of 8
+NEURONS_PER_SCALE = 64
+
+#: The side of the square image fed to the convolution of each group
+_IMAGE_SIDE = 8
+
+#: The number of neurons in each population of a delay network
+DELAY_NEURONS = 8
+
+#: The longest delay of a projection of a delay network in ms
+_MAX_DELAY = 144
+
+
+def _stdp(rng: NumpyRNG) -> sim.STDPMechanism:
+    return sim.STDPMechanism(
+        timing_dependence=sim.SpikePairRule(
+            tau_plus=20.0, tau_minus=20.0, A_plus=0.01, A_minus=0.012),
+        weight_dependence=sim.AdditiveWeightDependence(w_min=0.0, w_max=2.0),
+        weight=RandomDistribution("uniform", (0.1, 1.0), rng=rng),
+        delay=RandomDistribution("uniform", (1.0, 10.0), rng=rng))
+
+
+def _structural(
+        grid: List[int], seed: int) -> sim.StructuralMechanismStatic:
+    return sim.StructuralMechanismStatic(
+        partner_selection=sim.LastNeuronSelection(),
+        formation=sim.DistanceDependentFormation(grid, 1.0),
+        elimination=sim.RandomByWeightElimination(0.5, 0.2, 0.2),
+        f_rew=1000, initial_weight=0.5, initial_delay=2.0, s_max=8,
+        seed=seed, weight=0.5, delay=2.0)
+
+
+def _add_group(group: int, n_neurons: int, seed: int) -> Dict[str, int]:
+    """
+    Add one group of populations and the projections onto them.
+
+    :return: The number of populations, neurons and projections added
+    """
+    # pylint: disable=too-many-locals
+    # Connections made on the machine use the seed of the post-population
+    # and those made on the host use rng, as do the weights and delays
+    # made with them, so they are the same each time
+    pop_seed = seed * 1000 + group
+    rng = NumpyRNG(seed=pop_seed)
+    py_rng = numpy.random.default_rng(pop_seed)
+    n_inh = n_neurons // 4
+    # 2D populations are split into 4 by 4 squares, so have sides that
+    # are multiples of 4
+    side = 4 * max(1, int(numpy.sqrt(n_neurons)) // 4)
+    kernel_shape = [8, n_neurons // 8]
+    label = f"g{group}_"
+
+    spike_times = [
+        sorted(py_rng.choice(100, size=3, replace=False).tolist())
+        for _ in range(n_neurons)]
+    sources = sim.Population(
+        n_neurons, sim.SpikeSourceArray(spike_times=spike_times),
+        label=label + "array")
+    poisson = sim.Population(
+        n_neurons, sim.SpikeSourcePoisson(rate=10.0),
+        label=label + "poisson", seed=pop_seed)
+    exc = sim.Population(
+        side * side, sim.IF_curr_exp(), label=label + "exc",
+        structure=Grid2D(1.0), seed=pop_seed)
+    inh = sim.Population(n_inh, sim.IF_cond_exp(), label=label + "inh",
+                         seed=pop_seed)
+    izh = sim.Population(n_neurons, sim.Izhikevich(), label=label + "izh",
+                         seed=pop_seed)
+    image = sim.Population(
+        _IMAGE_SIDE * _IMAGE_SIDE, sim.SpikeSourcePoisson(rate=5.0),
+        label=label + "image", structure=Grid2D(1.0), seed=pop_seed)
+    conv_conn = sim.ConvolutionConnector(
+        numpy.arange(9, dtype=float).reshape(3, 3) - 4.0, padding=(1, 1))
+    conv_side = conv_conn.get_post_shape((_IMAGE_SIDE, _IMAGE_SIDE))
+    conv = sim.Population(
+        conv_side[0] * conv_side[1], sim.IF_curr_exp(), label=label + "conv",
+        structure=Grid2D(conv_side[0] / conv_side[1]))
+    dense = sim.Population(10, sim.IF_curr_exp(), label=label + "dense")
+    for pop in (exc, image, conv):
+        pop.set_max_atoms_per_core((4, 4))
+
+    # Only record some of the neurons
+    exc[0:side * side // 2].record("spikes")
+    izh[::8].record("v")
+    inh.record(["spikes", "gsyn_exc"])
+
+    weights = RandomDistribution(
+        "normal_clipped", (0.5, 0.1, 0.0, 1.0), rng=rng)
+    long_delays = RandomDistribution("uniform", (1.0, 144.0), rng=rng)
+    from_list = [
+        (int(pre), int(post), float(w), float(d)) for pre, post, w, d in zip(
+            py_rng.integers(0, n_neurons, n_neurons * 4),
+            py_rng.integers(0, n_inh, n_neurons * 4),
+            py_rng.uniform(0.1, 1.0, n_neurons * 4),
+            py_rng.integers(1, 30, n_neurons * 4))]
+    projections = [
+        (poisson, exc, sim.FixedProbabilityConnector(0.1, rng=rng),
+         sim.StaticSynapse(weight=weights, delay=long_delays)),
+        (sources, inh, sim.OneToOneConnector(), sim.StaticSynapse()),
+        (sources, inh, sim.FromListConnector(
+            from_list, column_names=["weight", "delay"]), None),
+        (sources, izh, sim.ArrayConnector(
+            py_rng.random((n_neurons, n_neurons)) < 0.05),
+         sim.StaticSynapse(weight=0.5, delay=long_delays)),
+        (exc, exc, sim.DistanceDependentProbabilityConnector(
+            "exp(-d)", allow_self_connections=False, rng=rng), _stdp(rng)),
+        (exc, inh, sim.FixedNumberPreConnector(10, rng=rng),
+         sim.StaticSynapse(weight=weights, delay=long_delays)),
+        (inh, izh, sim.FixedNumberPostConnector(10, rng=rng),
+         sim.StaticSynapse(weight=weights, delay=2.0)),
+        (exc, izh, sim.FixedTotalNumberConnector(n_neurons * 5, rng=rng),
+         sim.StaticSynapse(weight=weights, delay=long_delays)),
+        (izh, izh, sim.IndexBasedProbabilityConnector(
+            "exp(-abs(i - j))", rng=rng), _stdp(rng)),
+        (inh, inh, sim.AllToAllConnector(allow_self_connections=False),
+         sim.StaticSynapse(weight=weights, delay=long_delays)),
+        (poisson, izh, sim.KernelConnector(
+            kernel_shape, kernel_shape, [3, 3],
+            weight_kernel=numpy.full((3, 3), 0.2),
+            delay_kernel=numpy.full((3, 3), 3.0)), None),
+        (exc, exc, sim.SmallWorldConnector(
+            degree=2.0, rewiring=0.1, rng=rng), sim.StaticSynapse()),
+        (sources, izh, sim.CSAConnector(csa.oneToOne), sim.StaticSynapse()),
+        (poisson, inh, sim.FromListConnector([]),
+         _structural([4, n_inh // 4], pop_seed)),
+        (image, conv, conv_conn, sim.Convolution()),
+        (image, dense, sim.PoolDenseConnector(
+            py_rng.uniform(-1.0, 1.0, (_IMAGE_SIDE, _IMAGE_SIDE, 10))),
+         sim.PoolDense()),
+    ]
+    for pre, post, connector, synapse in projections:
+        if synapse is None:
+            sim.Projection(pre, post, connector)
+        else:
+            sim.Projection(pre, post, connector, synapse)
+    populations = (sources, poisson, exc, inh, izh, image, conv, dense)
+    return {
+        "populations": len(populations),
+        "neurons": sum(pop.size for pop in populations),
+        "projections": len(projections)}
+
+
+def build_network(scale: int, seed: int) -> Dict[str, int]:
+    """
+    Add a synthetic network to the current simulation.  The network is a
+    group of populations per unit of scale, with the number of neurons in
+    each also growing with the scale.
+
+    :param int scale: How big a network to build
+    :param int seed: The seed of all the random numbers used
+    :return: The number of populations, neurons and projections added
+    :rtype: dict(str, int)
+    """
+    totals = {"populations": 0, "neurons": 0, "projections": 0}
+    # Some connectors draw from the generator of numpy itself
+    numpy.random.seed(seed)
+    for group in range(scale):
+        for item, count in _add_group(
+                group, scale * NEURONS_PER_SCALE, seed).items():
+            totals[item] += count
+    return totals
+
+
+def build_delay_network(n_populations: int, seed: int) -> Dict[str, int]:
+    """
+    Add a network of small populations to the current simulation, with a
+    projection from each population to each, so that the number of
+    projections is the square of the number of populations.  Each
+    projection has its own delay of up to 144 ms, so most of them need
+    delay extensions with different numbers of stages.
+
+    :param int n_populations: The number of populations
+    :param int seed: The seed of the delays
+    :return: The number of populations, neurons and projections added
+    :rtype: dict(str, int)
+    """
+    py_rng = numpy.random.default_rng(seed)
+    pops = [
+        sim.Population(DELAY_NEURONS, sim.IF_curr_exp(), label=f"d{i}")
+        for i in range(n_populations)]
+    for pre in pops:
+        for post, delay in zip(
+                pops, py_rng.integers(1, _MAX_DELAY + 1, n_populations)):
+            sim.Projection(pre, post, sim.OneToOneConnector(),
+                           sim.StaticSynapse(weight=0.5, delay=float(delay)))
+    return {
+        "populations": n_populations,
+        "neurons": n_populations * DELAY_NEURONS,
+        "projections": n_populations * n_populations}
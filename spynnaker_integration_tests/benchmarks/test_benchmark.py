@@ -0,0 +1,112 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import json
+import os
+import tempfile
+import numpy
+import pyNN.spiNNaker as sim
+from spinnaker_testbase import BaseTestCase
+from spynnaker.pyNN.data import SpynnakerDataView
+from .benchmark import (
+    compare_benchmarks, main, run_benchmarks, setup_simulation)
+from .synthetic_network import build_network
+
+
+def _connections(seed):
+    setup_simulation()
+    build_network(1, seed)
+    sim.run(0)
+    connections = [
+        numpy.array(projection.get(["weight", "delay"], "list"))
+        for projection in SpynnakerDataView.iterate_projections()]
+    sim.end()
+    return connections
+
+
+class TestBenchmark(BaseTestCase):
+
+    def test_small_network(self):
+        results = run_benchmarks([1], trace_memory=False)
+        result = results["results"][0]
+        self.assertEqual(
+            {"populations": 8, "neurons": 410, "projections": 16},
+            result["network"])
+        for name in ("DelaySupportAdder", "Splitter partitioner",
+                     "Graph data specification writer"):
+            self.assertIn(name, result["phases"])
+            self.assertIsNone(result["phases"][name]["peak_memory"])
+        for name in ("PopulationView create", "PopulationView id_to_index",
+                     "PopulationView index_in_grandparent",
+                     "PopulationView all_cells"):
+            self.assertIn(name, result["phases"])
+        for list_type in ("RangedList", "SpynnakerRangedList"):
+            for operation in ("set_value_by_ids", "get_values",
+                              "Struct.get_data"):
+                self.assertIn(f"Parameters {list_type} {operation}",
+                              result["phases"])
+        results = json.loads(json.dumps(results))
+        self.assertEqual([], compare_benchmarks(results, results))
+
+        slower = copy.deepcopy(results)
+        phase = slower["results"][0]["phases"]["Splitter partitioner"]
+        before = phase["wall_ms"]
+        phase["wall_ms"] = before * 3 + 100
+        self.assertEqual(
+            [(1, "Splitter partitioner", before, before * 3 + 100)],
+            compare_benchmarks(results, slower))
+
+    def test_delay_network(self):
+        results = run_benchmarks(
+            [], trace_memory=False, delay_populations=[6])
+        self.assertEqual([], results["results"])
+        result = results["delay_results"][0]
+        self.assertEqual(
+            {"populations": 6, "neurons": 48, "projections": 36},
+            result["network"])
+        self.assertIn("DelaySupportAdder", result["phases"])
+        results = json.loads(json.dumps(results))
+        self.assertEqual([], compare_benchmarks(
+            results, results, kind="delay_results"))
+
+        slower = copy.deepcopy(results)
+        phase = slower["delay_results"][0]["phases"]["DelaySupportAdder"]
+        before = phase["wall_ms"]
+        phase["wall_ms"] = before * 3 + 100
+        self.assertEqual(
+            [(6, "DelaySupportAdder", before, before * 3 + 100)],
+            compare_benchmarks(results, slower, kind="delay_results"))
+
+    def test_same_network(self):
+        first = _connections(7)
+        self.assertTrue(any(len(connections) for connections in first))
+        for connections, again in zip(first, _connections(7)):
+            self.assertTrue(numpy.array_equal(connections, again))
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = os.path.join(tmp, "baseline.json")
+            self.assertEqual(0, main(
+                ["--scales", "1", "--no-memory", "--no-params",
+                 "--output", baseline]))
+            with open(baseline, encoding="utf-8") as f:
+                results = json.load(f)
+            for phase in results["results"][0]["phases"].values():
+                phase["wall_ms"] = 0.0
+            with open(baseline, "w", encoding="utf-8") as f:
+                json.dump(results, f)
+            self.assertEqual(1, main(
+                ["--scales", "1", "--no-memory", "--no-views", "--no-params",
+                 "--compare", baseline, "--min-ms", "0"]))
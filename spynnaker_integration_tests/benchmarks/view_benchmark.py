@@ -0,0 +1,83 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Times the index mapping of PopulationViews of a large population, which
+does not appear in the phases of a run.
+"""
+
+from contextlib import contextmanager
+import time
+from typing import Any, Dict, Iterator
+import numpy
+import pyNN.spiNNaker as sim
+from spynnaker.pyNN.models.populations import PopulationView
+
+#: The number of neurons in the viewed population at scale 1
+VIEW_NEURONS_PER_SCALE = 250000
+
+#: The number of IDs looked up by id_to_index
+_N_IDS = 1000
+
+#: How far apart the cells read from all_cells are
+_CELL_STEP = 1000
+
+
+@contextmanager
+def timed(times: Dict[str, Dict[str, Any]], name: str) -> Iterator[None]:
+    """
+    Time the code in the context, adding it to the times with the given
+    name.
+
+    :param dict(str, dict) times: Where to add the time
+    :param str name: The name of the time, as a phase would be named
+    """
+    wall = time.perf_counter_ns()
+    cpu = time.process_time_ns()
+    yield
+    times[name] = {
+        "wall_ms": (time.perf_counter_ns() - wall) / 1000000.0,
+        "cpu_ms": (time.process_time_ns() - cpu) / 1000000.0,
+        "peak_memory": None}
+
+
+def benchmark_views(n_neurons: int, seed: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Time making views of views of a population, and mapping between the
+    IDs and indices of the views.  This only needs the population to be
+    made, not run.
+
+    :param int n_neurons: The number of neurons in the population
+    :param int seed: The seed of the order of the shuffled view
+    :return: The wall and CPU ms of each operation, named as phases are
+    :rtype: dict(str, dict)
+    """
+    rng = numpy.random.default_rng(seed)
+    times: Dict[str, Dict[str, Any]] = dict()
+    sim.setup(1.0)
+    pop = sim.Population(n_neurons, sim.IF_curr_exp(), label="viewed")
+    with timed(times, "PopulationView create"):
+        evens = pop[::2]
+        shuffled = PopulationView(
+            evens, rng.permutation(len(evens)), label="shuffled")
+        thirds = shuffled[::3]
+    ids = rng.choice(numpy.arange(0, n_neurons, 2), _N_IDS).tolist()
+    with timed(times, "PopulationView id_to_index"):
+        shuffled.id_to_index(ids)
+    with timed(times, "PopulationView index_in_grandparent"):
+        thirds.index_in_grandparent(range(len(thirds)))
+    with timed(times, "PopulationView all_cells"):
+        cells = shuffled.all_cells
+        _ = [cells[i].id for i in range(0, len(cells), _CELL_STEP)]
+    sim.end()
+    return times
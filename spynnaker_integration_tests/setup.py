@@ -15,6 +15,7 @@
 from setuptools import setup
 
 packages = ["spynnaker_integration_tests",
+            "spynnaker_integration_tests.benchmarks",
             "spynnaker_integration_tests.scripts"]
 
 setup(
@@ -0,0 +1,190 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from pyNN.space import Grid2D
+from spinn_utilities.config_holder import set_config
+from pacman.model.graphs.common import MDSlice, Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+import pyNN.spiNNaker as p
+
+
+def _setup():
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    SpynnakerDataWriter.mock()
+
+
+def _pop(shape):
+    return p.Population(
+        shape[0] * shape[1], p.IF_curr_exp(),
+        structure=Grid2D(shape[0] / shape[1]))
+
+
+def _slices(shape, n_x, n_y):
+    """ Split a 2D shape into MDSlices of at most n_x by n_y atoms
+    """
+    slices = list()
+    lo_atom = 0
+    for y in range(0, shape[1], n_y):
+        for x in range(0, shape[0], n_x):
+            sub = (min(n_x, shape[0] - x), min(n_y, shape[1] - y))
+            n_atoms = sub[0] * sub[1]
+            slices.append(MDSlice(
+                lo_atom, lo_atom + n_atoms - 1, sub, (x, y), shape))
+            lo_atom += n_atoms
+    return slices
+
+
+def _as_set(blocks, post_slice):
+    post_ids = post_slice.get_raster_ids()
+    return {(int(b["source"]), int(post_ids[b["target"]]), float(b["weight"]),
+             int(b["synapse_type"]))
+            for block in blocks for b in block}
+
+
+def _reference_convolution(pre_shape, post_shape, kernel, strides, padding,
+                           pool_stride):
+    """ Work out the connections by processing a spike from each pre-neuron
+        in turn, one kernel position at a time.
+    """
+    k_w, k_h = kernel.shape
+    flat = kernel.flatten()
+    conns = set()
+    for pre_id in range(pre_shape[0] * pre_shape[1]):
+        x = pre_id % pre_shape[0]
+        y = pre_id // pre_shape[0]
+        post_x = (x // pool_stride[0] - k_w // 2 + padding[0]) // strides[0]
+        post_y = (y // pool_stride[1] - k_h // 2 + padding[1]) // strides[1]
+        for k_row in range(k_h):
+            for k_col in range(k_w):
+                t_x = post_x + k_col - k_w // 2
+                t_y = post_y + k_row - k_h // 2
+                weight = flat[k_row * k_w + k_col]
+                if (0 <= t_x < post_shape[0] and 0 <= t_y < post_shape[1]
+                        and weight != 0):
+                    conns.add((pre_id, t_x + t_y * post_shape[0],
+                               float(weight), 0 if weight > 0 else 1))
+    return conns
+
+
+@pytest.mark.parametrize(
+    "pre_shape, kernel_shape, strides, padding, pool_shape", [
+        ((7, 5), (3, 3), (1, 1), (0, 0), (1, 1)),
+        ((8, 8), (3, 3), (1, 1), (1, 1), (1, 1)),
+        ((9, 7), (3, 3), (2, 1), (0, 0), (1, 1)),
+        ((10, 8), (5, 3), (1, 1), (1, 1), (1, 1)),
+        ((12, 12), (3, 3), (1, 1), (1, 1), (2, 2)),
+        ((16, 10), (3, 5), (2, 2), (1, 2), (2, 1)),
+    ])
+def test_convolution(pre_shape, kernel_shape, strides, padding, pool_shape):
+    _setup()
+    kernel = numpy.arange(
+        numpy.prod(kernel_shape), dtype=float).reshape(kernel_shape) - 4.0
+    conn = p.ConvolutionConnector(
+        kernel, strides=strides, padding=padding, pool_shape=pool_shape)
+    post_shape = conn.get_post_shape(pre_shape)
+    proj = p.Projection(_pop(pre_shape), _pop(post_shape), conn,
+                        p.Convolution())
+    synapse_info = proj._synapse_information
+    expected = _reference_convolution(
+        pre_shape, post_shape, conn.kernel_weights, strides, padding,
+        pool_shape)
+    assert expected
+
+    # The same connections whether done in one slice or many, and in chunks
+    found = set()
+    for post_slice in _slices(post_shape, 3, 2):
+        blocks = list(conn.expand_connections(
+            synapse_info, post_slice, chunk_size=7))
+        found.update(_as_set(blocks, post_slice))
+    assert found == expected
+    assert all(delay == 1.0 for delay in numpy.concatenate(list(
+        conn.expand_connections(
+            synapse_info, _slices(post_shape, 100, 100)[0])))["delay"])
+
+
+def test_convolution_weight_scales():
+    _setup()
+    pre_shape = (6, 6)
+    conn = p.ConvolutionConnector(
+        [[0.3, -0.01, 1.24], [0.0, 2.0, -0.7], [0.004, 0.5, -1.0]])
+    post_shape = conn.get_post_shape(pre_shape)
+    post = _pop(post_shape)
+    proj = p.Projection(_pop(pre_shape), post, conn, p.Convolution())
+    synapse_info = proj._synapse_information
+    post_slice = _slices(post_shape, 100, 100)[0]
+    weight_scales = numpy.array([10.0, 20.0])
+
+    conns = numpy.concatenate(post._vertex.synapse_dynamics.get_connections(
+        synapse_info, post_slice, weight_scales))
+    # The weights are as seen on the machine, and those that round to 0
+    # (0.004 and -0.01 here) are left out
+    assert set(numpy.unique(conns["weight"])) == {
+        0.3, 1.2, 2.0, -0.7, 0.5, -1.0}
+    assert numpy.all(conns["target"] < post._vertex.n_atoms)
+    assert len(conns) == len(_reference_convolution(
+        pre_shape, post_shape,
+        numpy.array([[0.3, 0.0, 1.24], [0.0, 2.0, -0.7], [0.0, 0.5, -1.0]]),
+        (1, 1), (0, 0), (1, 1)))
+
+    # Only the connections from the asked-for pre-neurons are worked out
+    pre_indices = numpy.array([0, 7, 35])
+    some = numpy.concatenate(post._vertex.synapse_dynamics.get_connections(
+        synapse_info, post_slice, weight_scales, pre_indices))
+    assert numpy.array_equal(
+        some, conns[numpy.isin(conns["source"], pre_indices)])
+
+
+def _reference_pool_dense(pre_shape, post_slice, weights, pool_stride):
+    """ Look up the weights of each pre-neuron after pooling in turn
+    """
+    pooled_shape = tuple(s // pool_stride for s in pre_shape)
+    post_weights = weights[:, :, post_slice.lo_atom:post_slice.hi_atom + 1]
+    conns = set()
+    for pre_id in range(pre_shape[0] * pre_shape[1]):
+        x = (pre_id % pre_shape[0]) // pool_stride
+        y = (pre_id // pre_shape[0]) // pool_stride
+        if x >= pooled_shape[0] or y >= pooled_shape[1]:
+            continue
+        for post_index in range(post_slice.n_atoms):
+            weight = post_weights[x, y, post_index]
+            if weight != 0:
+                conns.add((pre_id, post_slice.lo_atom + post_index,
+                           float(weight), 0 if weight > 0 else 1))
+    return conns
+
+
+@pytest.mark.parametrize("pre_shape, pool_shape", [
+    ((4, 6), None), ((8, 8), 2), ((9, 7), 2), ((12, 6), 3)])
+def test_pool_dense(pre_shape, pool_shape):
+    _setup()
+    n_post = 10
+    pool_stride = 1 if pool_shape is None else pool_shape
+    pooled_shape = (pre_shape[0] // pool_stride, pre_shape[1] // pool_stride)
+    weights = (numpy.arange(numpy.prod(pooled_shape) * n_post) % 7) - 3.0
+    weights = weights.reshape(pooled_shape + (n_post, ))
+    conn = p.PoolDenseConnector(weights, pool_shape=pool_shape)
+    post = p.Population(n_post, p.IF_curr_exp())
+    proj = p.Projection(_pop(pre_shape), post, conn, p.PoolDense())
+    synapse_info = proj._synapse_information
+
+    area = 1 if pool_shape is None else pool_shape * pool_shape
+    for post_slice in (Slice(0, 3), Slice(4, 9)):
+        blocks = list(conn.expand_connections(
+            synapse_info, post_slice, chunk_size=5))
+        assert _as_set(blocks, post_slice) == _reference_pool_dense(
+            pre_shape, post_slice, weights / area, pool_stride)
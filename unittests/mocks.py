@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy
 from spinn_utilities.overrides import overrides
+from spinn_front_end_common.interface.ds import DataType
 from spynnaker.pyNN.models.populations import Population
 
 
@@ -47,3 +49,36 @@ class MockVertex(object):
 
     def get_key_ordered_indices(self, indices):
         return indices
+
+
+class MockDataSpecification(object):
+    """ Records what is written to a data specification, without a
+        database.
+    """
+
+    def __init__(self):
+        # All the data written, in order
+        self.data = b""
+        # The regions written to
+        self.regions = set()
+        self.ended = False
+
+    def comment(self, comment):
+        pass
+
+    def reserve_memory_region(self, region, size, label=None):
+        pass
+
+    def switch_write_focus(self, region):
+        self.regions.add(region)
+
+    def write_value(self, data, data_type=DataType.UINT32):
+        data_type.check_value(data)
+        self.data += data_type.as_bytes(data)
+
+    def write_array(self, array_values, data_type=DataType.UINT32):
+        self.data += numpy.array(
+            array_values, dtype=data_type.numpy_typename).tobytes()
+
+    def end_specification(self):
+        self.ended = True
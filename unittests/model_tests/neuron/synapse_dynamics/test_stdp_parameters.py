@@ -0,0 +1,116 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import numpy
+import pytest
+from spinn_front_end_common.interface.ds import DataType
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.plasticity.stdp.common import (
+    STDP_FIXED_POINT_ONE, get_exp_lut_array, get_exp_dist_lut_array,
+    get_s1615_array)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
+    TimingDependenceSpikePair, TimingDependencePfisterSpikeTriplet)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
+    WeightDependenceAdditive, WeightDependenceMultiplicative,
+    WeightDependenceAdditiveTriplet)
+from unittests.mocks import MockDataSpecification
+
+
+def _reference_exp_lut(time_step, time_constant, shift=0):
+    """ The lookup table worked out one value at a time. """
+    l_ambda = time_step / float(time_constant)
+    size = math.log(STDP_FIXED_POINT_ONE) / l_ambda
+    size, extra = divmod(size / (1 << shift), 2)
+    size = (int(size) + (extra > 0)) * 2
+    values = [int(math.floor(
+        math.exp(-(i << shift) * l_ambda) * STDP_FIXED_POINT_ONE))
+        for i in range(size)]
+    return numpy.array([size, shift] + values, dtype="<u2").tobytes()
+
+
+def _reference_weight_data(values, n_synapse_types):
+    """ The weight dependence data written one value at a time. """
+    spec = MockDataSpecification()
+    for _ in range(n_synapse_types):
+        for value in values:
+            spec.write_value(value, data_type=DataType.S1615)
+    return spec.data
+
+
+@pytest.mark.parametrize("time_constant,shift", [
+    (20.0, 0), (16.8, 0), (101.0, 0), (5.0, 2), (700.0, 2)])
+def test_exp_lut(time_constant, shift):
+    unittest_setup()
+    lut = get_exp_lut_array(1.0, time_constant, shift)
+    assert lut.tobytes() == _reference_exp_lut(1.0, time_constant, shift)
+    assert not lut.flags.writeable
+
+
+def test_exp_lut_computed_once():
+    unittest_setup()
+    get_exp_lut_array.cache_clear()
+    rules = [TimingDependenceSpikePair(tau_plus=20.0, tau_minus=25.0)
+             for _ in range(10)]
+    rules.append(TimingDependencePfisterSpikeTriplet(
+        tau_plus=20.0, tau_minus=25.0, tau_x=30.0, tau_y=35.0,
+        A_plus=0.01, A_minus=0.01))
+    # tau_plus and tau_minus, then tau_x and tau_y of the triplet rule
+    assert get_exp_lut_array.cache_info().misses == 4
+    datas = set()
+    for rule in rules[:10]:
+        spec = MockDataSpecification()
+        rule.write_parameters(spec, 1.0, numpy.ones(2))
+        datas.add(spec.data)
+    assert datas == {_reference_exp_lut(1.0, 20.0) +
+                     _reference_exp_lut(1.0, 25.0)}
+
+
+def test_exp_dist_lut():
+    unittest_setup()
+    for mean in (1.0, 20.0, 33.3):
+        indices = numpy.arange(STDP_FIXED_POINT_ONE)
+        expected = (numpy.log(
+            1.0 - indices / float(STDP_FIXED_POINT_ONE)) * -mean).astype(
+                numpy.uint16)
+        assert numpy.array_equal(get_exp_dist_lut_array(mean), expected)
+
+
+@pytest.mark.parametrize("scale", [1.0, 64.0, 1000.0])
+@pytest.mark.parametrize("n_synapse_types", [1, 2, 3])
+def test_weight_dependence_data(scale, n_synapse_types):
+    unittest_setup()
+    get_s1615_array.cache_clear()
+    scales = numpy.ones(n_synapse_types)
+    for rule, values in (
+            (WeightDependenceAdditive(0.1, 2.5),
+             (0.1 * scale, 2.5 * scale, 0.01 * scale, 0.01 * scale)),
+            (WeightDependenceMultiplicative(0.125, 3.0),
+             (0.125 * scale, 3.0 * scale, 0.01, 0.01)),
+            (WeightDependenceAdditiveTriplet(0.0, 1.5, 0.02, 0.03),
+             (0.0, 1.5 * scale, 0.01 * 1.5 * scale, 0.01 * 1.5 * scale,
+              0.02 * 1.5 * scale, 0.03 * 1.5 * scale))):
+        rule.set_a_plus_a_minus(0.01, 0.01)
+        datas = set()
+        for _ in range(5):
+            spec = MockDataSpecification()
+            rule.write_parameters(spec, scale, scales, 1)
+            datas.add(spec.data)
+        assert datas == {_reference_weight_data(values, n_synapse_types)}
+    assert get_s1615_array.cache_info().misses == 3
+
+
+def test_s1615_out_of_range():
+    unittest_setup()
+    with pytest.raises(ValueError):
+        get_s1615_array((1.0, 70000.0))
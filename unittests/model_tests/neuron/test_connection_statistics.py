@@ -0,0 +1,109 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import numpy
+from spinn_utilities.config_holder import set_config
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.models.neuron import ConnectionStatistics
+from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
+    NUMPY_CONNECTORS_DTYPE)
+import pyNN.spiNNaker as p
+
+
+def _connections(n_pre, n_post, seed):
+    rng = numpy.random.default_rng(seed)
+    sources, targets = numpy.nonzero(rng.random((n_pre, n_post)) < 0.3)
+    connections = numpy.zeros(len(sources), dtype=NUMPY_CONNECTORS_DTYPE)
+    connections["source"] = sources
+    connections["target"] = targets
+    connections["weight"] = rng.uniform(0, 5, len(sources))
+    connections["delay"] = rng.integers(1, 16, len(sources))
+    return connections
+
+
+def test_statistics_in_blocks():
+    unittest_setup()
+    connections = _connections(50, 40, 3)
+    weight_bins = numpy.linspace(0, 5, 11)
+    delay_bins = numpy.arange(1, 17)
+    statistics = ConnectionStatistics(40, weight_bins, delay_bins)
+    for block in numpy.array_split(connections, 7):
+        statistics.add_connections(block)
+
+    assert statistics.n_connections == len(connections)
+    assert statistics.weight_min == connections["weight"].min()
+    assert statistics.weight_max == connections["weight"].max()
+    assert math.isclose(
+        statistics.weight_mean, connections["weight"].mean())
+    assert statistics.delay_min == connections["delay"].min()
+    assert statistics.delay_max == connections["delay"].max()
+    assert math.isclose(statistics.delay_mean, connections["delay"].mean())
+    counts, bins = statistics.weight_histogram
+    assert numpy.array_equal(
+        counts, numpy.histogram(connections["weight"], weight_bins)[0])
+    assert numpy.array_equal(bins, weight_bins)
+    counts, _ = statistics.delay_histogram
+    assert numpy.array_equal(
+        counts, numpy.histogram(connections["delay"], delay_bins)[0])
+    assert numpy.array_equal(
+        statistics.in_degree,
+        numpy.bincount(connections["target"], minlength=40))
+
+
+def test_no_connections():
+    unittest_setup()
+    statistics = ConnectionStatistics(10)
+    statistics.add_connections(numpy.zeros(0, dtype=NUMPY_CONNECTORS_DTYPE))
+    assert statistics.n_connections == 0
+    assert math.isnan(statistics.weight_mean)
+    assert math.isnan(statistics.delay_max)
+    assert statistics.weight_histogram is None
+    assert statistics.delay_histogram is None
+    assert not numpy.any(statistics.in_degree)
+
+
+def test_projection_statistics_before_run():
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    # Set up rather than mocked, as nothing has been run
+    writer = SpynnakerDataWriter.setup()
+    writer.set_up_timings_and_delay(1000, 1, 1)
+    connections = _connections(30, 25, 5)
+    from_list = [
+        (int(c["source"]), int(c["target"]), float(c["weight"]),
+         float(c["delay"])) for c in connections]
+    pre = p.Population(30, p.IF_curr_exp())
+    post = p.Population(25, p.IF_curr_exp())
+    post.set_max_atoms_per_core(10)
+    proj = p.Projection(pre, post, p.FromListConnector(from_list))
+    assert proj.size() == len(connections)
+
+    statistics = proj.get_statistics(weight_bins=[0, 1, 2, 3, 4, 5])
+    assert math.isclose(statistics.weight_max, connections["weight"].max())
+    assert numpy.array_equal(
+        statistics.weight_histogram[0],
+        numpy.histogram(connections["weight"], [0, 1, 2, 3, 4, 5])[0])
+    assert numpy.array_equal(
+        statistics.in_degree,
+        numpy.bincount(connections["target"], minlength=25))
+
+    proj = p.Projection(pre, post, p.AllToAllConnector(),
+                        p.StaticSynapse(weight=0.5, delay=2.0))
+    statistics = proj.get_statistics()
+    assert statistics.n_connections == 30 * 25
+    assert statistics.weight_mean == 0.5
+    assert statistics.delay_min == statistics.delay_max == 2.0
+    assert numpy.all(statistics.in_degree == 30)
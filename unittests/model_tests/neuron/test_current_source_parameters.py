@@ -0,0 +1,148 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections.abc import Container
+from typing import Sequence
+import numpy
+from spinn_utilities.config_holder import set_config
+from pacman.operations.partition_algorithms import splitter_partitioner
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    SplitterAbstractPopulationVertexFixed)
+from spynnaker.pyNN.models.current_sources import CurrentSourceIDs
+from spynnaker.pyNN.utilities.utility_calls import convert_to
+import pyNN.spiNNaker as p
+from unittests.mocks import MockDataSpecification
+
+
+def _in_selector(n, selector):
+    if isinstance(selector, Container):
+        return n in selector
+    return n == selector
+
+
+def _reference_data(m_vertex):
+    """ The current source data as written one value at a time. """
+    # pylint: disable=protected-access
+    spec = MockDataSpecification()
+    app_vertex = m_vertex.app_vertex
+    id_list = app_vertex.current_source_id_list
+    raster_ids = m_vertex.vertex_slice.get_raster_ids()
+    current_sources = list()
+    for source in app_vertex.current_sources:
+        if source not in current_sources and any(
+                _in_selector(n, id_list[source]) for n in raster_ids):
+            current_sources.append(source)
+    current_sources.sort(key=lambda x: x.current_source_id)
+
+    spec.write_value(len(current_sources))
+    if not current_sources:
+        return spec.data
+    cs_index_array = [0, 0, 0, 0, 0]
+    neuron_current_sources = [[0] for _ in raster_ids]
+    for source in current_sources:
+        cs_id = source.current_source_id
+        for i, n in enumerate(raster_ids):
+            if _in_selector(n, id_list[source]):
+                neuron_current_sources[i][0] += 1
+                neuron_current_sources[i].append(cs_id)
+                neuron_current_sources[i].append(cs_index_array[cs_id])
+        cs_index_array[cs_id] += 1
+    for values in neuron_current_sources:
+        for value in values:
+            spec.write_value(value)
+    for n in range(1, len(cs_index_array)):
+        spec.write_value(cs_index_array[n])
+    for source in current_sources:
+        types = source.parameter_types
+        for key, value in source.parameters.items():
+            if source.current_source_id == (
+                    CurrentSourceIDs.STEP_CURRENT_SOURCE.value):
+                spec.write_value(len(value))
+                for v in value:
+                    spec.write_value(
+                        data=convert_to(v, types[key]).view("uint32"))
+            elif isinstance(value, Sequence):
+                for v in value:
+                    spec.write_value(data=convert_to(v, types[key]).item())
+            else:
+                spec.write_value(data=convert_to(value, types[key]).item())
+    return spec.data
+
+
+def _setup():
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    SpynnakerDataWriter.mock()
+
+
+def _data(pop):
+    # pylint: disable=protected-access
+    splitter_partitioner()
+    for m_vertex in pop._vertex.machine_vertices:
+        spec = MockDataSpecification()
+        m_vertex._write_current_source_parameters(spec)
+        yield m_vertex, spec.data
+
+
+def test_same_as_reference():
+    _setup()
+    pop = p.Population(
+        100, p.IF_curr_exp(), label="pop",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    pop.set_max_atoms_per_core(30)
+    p.DCSource(amplitude=0.5, start=10, stop=50).inject_into(pop)
+    p.DCSource(amplitude=1.25, start=0, stop=20).inject_into(pop[5:40])
+    p.ACSource(
+        start=5, stop=80, amplitude=0.75, offset=0.125, frequency=10,
+        phase=90).inject_into(pop[[1, 3, 35, 70, 99]])
+    p.StepCurrentSource(
+        times=[10, 20, 30, 40], amplitudes=[0.5, 1.5, 0.25, 0.0]).inject_into(
+            pop[50:])
+    p.NoisyCurrentSource(
+        mean=0.5, stdev=0.25, start=0, stop=100, dt=1.0).inject_into(
+            pop[60:65])
+    n_checked = 0
+    for m_vertex, data in _data(pop):
+        assert data == _reference_data(m_vertex)
+        n_checked += 1
+    assert n_checked == 4
+
+
+def test_no_sources():
+    _setup()
+    pop = p.Population(
+        10, p.IF_curr_exp(), label="pop",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    pop.set_max_atoms_per_core(5)
+    p.DCSource(amplitude=0.5, start=10, stop=50).inject_into(pop[0:2])
+    datas = [data for _, data in _data(pop)]
+    assert len(datas[1]) == 4
+    assert numpy.frombuffer(datas[1], dtype="<u4")[0] == 0
+
+
+def test_negative_amplitude():
+    _setup()
+    pop = p.Population(
+        10, p.IF_curr_exp(), label="pop",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    p.DCSource(amplitude=-1.5, start=10, stop=50).inject_into(pop)
+    (_, data), = _data(pop)
+    words = numpy.frombuffer(data, dtype="<u4")
+    # count, 10 x (1 source, id, index), 4 type counts, then amplitude
+    amplitude = words[1 + 10 * 3 + 4].view("<i4")
+    assert amplitude == -1.5 * 32768
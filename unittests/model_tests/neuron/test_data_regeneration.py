@@ -0,0 +1,151 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy
+from spinn_utilities.config_holder import set_config
+from pacman.operations.partition_algorithms import splitter_partitioner
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    SplitterAbstractPopulationVertexFixed,
+    SplitterAbstractPopulationVertexNeuronsSynapses)
+import pyNN.spiNNaker as p
+from unittests.mocks import MockDataSpecification
+
+
+def _population(splitter):
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    SpynnakerDataWriter.mock()
+    pop = p.Population(
+        100, p.IF_curr_exp(), label="pop",
+        additional_parameters={"splitter": splitter})
+    pop.set_max_atoms_per_core(30)
+    return pop
+
+
+def _neuron_vertices(pop):
+    splitter_partitioner()
+    # pylint: disable=protected-access
+    return sorted(
+        pop._vertex.splitter.get_out_going_vertices(None),
+        key=lambda m_vertex: m_vertex.vertex_slice.lo_atom)
+
+
+def _rewrite(m_vertex):
+    spec = MockDataSpecification()
+    if m_vertex.reload_required():
+        m_vertex.regenerate_data_specification(spec, None)
+    return spec
+
+
+def test_selector_vertices():
+    pop = _population(SplitterAbstractPopulationVertexFixed())
+    m_vertices = _neuron_vertices(pop)
+    assert len(m_vertices) == 4
+    # pylint: disable=protected-access
+    vertex = pop._vertex
+    assert set(vertex._get_machine_vertices_for_selector(None)) == set(
+        vertex.machine_vertices)
+    assert list(vertex._get_machine_vertices_for_selector(
+        slice(5, 10))) == [m_vertices[0]]
+    assert set(vertex._get_machine_vertices_for_selector(
+        [1, 95])) == {m_vertices[0], m_vertices[3]}
+    mask = numpy.zeros(100, dtype=bool)
+    mask[40:70] = True
+    assert set(vertex._get_machine_vertices_for_selector(
+        mask)) == {m_vertices[1], m_vertices[2]}
+
+
+def test_selector_vertices_large():
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    SpynnakerDataWriter.mock()
+    pop = p.Population(
+        1000000, p.IF_curr_exp(), label="pop",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    pop.set_max_atoms_per_core(256)
+    m_vertices = _neuron_vertices(pop)
+    assert len(m_vertices) == 3907
+    # pylint: disable=protected-access
+    vertex = pop._vertex
+    selected = list(vertex._get_machine_vertices_for_selector(
+        slice(None, None, 10)))
+    assert len(selected) == 3907
+    assert list(vertex._get_machine_vertices_for_selector(
+        slice(256 * 100 + 5, 256 * 101 + 5))) == m_vertices[100:102]
+    assert list(vertex._get_machine_vertices_for_selector(
+        [999999])) == [m_vertices[-1]]
+    assert not list(vertex._get_machine_vertices_for_selector([]))
+
+
+def _check_regions_rewritten(splitter):
+    pop = _population(splitter)
+    source = p.DCSource(amplitude=0.5, start=10, stop=50)
+    source.inject_into(pop)
+    m_vertices = _neuron_vertices(pop)
+    # pylint: disable=protected-access
+    regions = m_vertices[0]._neuron_regions
+    for m_vertex in m_vertices:
+        m_vertex.set_reload_required(False)
+    assert not any(m_vertex.reload_required() for m_vertex in m_vertices)
+
+    # Only the neuron data of the vertices asked for
+    m_vertices[1].set_do_neuron_regeneration()
+    specs = [_rewrite(m_vertex) for m_vertex in m_vertices]
+    assert [spec.regions for spec in specs] == [
+        set(), {regions.neuron_params, regions.neuron_recording}, set(),
+        set()]
+    assert specs[1].ended
+    assert not any(m_vertex.reload_required() for m_vertex in m_vertices)
+
+    # Only the current sources
+    source.set_parameters(amplitude=1.5)
+    for m_vertex in m_vertices:
+        assert _rewrite(m_vertex).regions == {regions.current_source_params}
+    assert not any(m_vertex.reload_required() for m_vertex in m_vertices)
+
+
+def test_regions_rewritten():
+    _check_regions_rewritten(SplitterAbstractPopulationVertexFixed())
+
+
+def test_regions_rewritten_neurons_synapses():
+    _check_regions_rewritten(
+        SplitterAbstractPopulationVertexNeuronsSynapses(1))
+
+
+def test_static_connections_kept():
+    pop = _population(SplitterAbstractPopulationVertexFixed())
+    static = p.Projection(
+        pop, pop, p.OneToOneConnector(), p.StaticSynapse(weight=1.0))
+    plastic = p.Projection(
+        pop, pop, p.OneToOneConnector(), p.STDPMechanism(
+            timing_dependence=p.SpikePairRule(),
+            weight_dependence=p.AdditiveWeightDependence(),
+            weight=1.0))
+    # pylint: disable=protected-access
+    vertex = pop._vertex
+    cache = vertex._AbstractPopulationVertex__connection_cache
+    for proj in (static, plastic):
+        cache[proj._projection_edge, proj._synapse_information] = \
+            numpy.zeros(0)
+
+    for proj in (static, plastic):
+        proj._clear_cache(all_connections=False)
+    assert list(cache) == [
+        (static._projection_edge, static._synapse_information)]
+
+    static._clear_cache()
+    assert not cache
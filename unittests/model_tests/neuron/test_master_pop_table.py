@@ -0,0 +1,151 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import numpy
+import pytest
+from pacman.model.routing_info import BaseKeyAndMask
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.exceptions import SynapticConfigurationException
+from spynnaker.pyNN.models.neuron.master_pop_table import (
+    MasterPopTableAsBinarySearch, _MasterPopEntryCType, _AddressListEntryCType)
+
+
+def _reference_data(entries):
+    """ The table as written by filling in ctypes structures.
+
+    :param entries:
+        dict of key to ((mask, core_mask, core_shift, n_neurons,
+        n_colour_bits), list of (address, row_length) or None if invalid)
+    """
+    n_addresses = sum(len(addresses) for _, addresses in entries.values())
+    pop_table = (_MasterPopEntryCType * len(entries))()
+    address_list = (_AddressListEntryCType * n_addresses)()
+    start = 0
+    for i, key in enumerate(sorted(entries)):
+        (mask, core_mask, core_shift, n_neurons, n_colour_bits), addresses = \
+            entries[key]
+        entry = pop_table[i]
+        entry.key = key
+        entry.mask = mask
+        entry.start = start
+        entry.count = len(addresses)
+        entry.n_colour_bits = n_colour_bits
+        entry.core_mask = core_mask
+        entry.n_words = int(math.ceil(n_neurons / 32))
+        entry.n_neurons = n_neurons
+        entry.mask_shift = core_shift
+        for address in addresses:
+            if address is None:
+                address_list[start].address = (1 << 24) - 1
+            else:
+                address_list[start].address = address[0] // 16
+                address_list[start].row_length = address[1] - 1
+            start += 1
+    return (numpy.array([len(entries), n_addresses], dtype="<u4").tobytes() +
+            bytes(pop_table) + bytes(address_list))
+
+
+def _fill(table, entries, rng):
+    """ Add the entries to the table, mixing up the keys but keeping the
+        order of the addresses of each key.
+    """
+    keys = [key for key, (_, addresses) in entries.items()
+            for _ in addresses]
+    rng.shuffle(keys)
+    addresses = {key: iter(key_addresses)
+                 for key, (_, key_addresses) in entries.items()}
+    for key in keys:
+        address = next(addresses[key])
+        (mask, core_mask, core_shift, n_neurons, n_colour_bits), _ = \
+            entries[key]
+        key_and_mask = BaseKeyAndMask(key, mask)
+        if address is None:
+            table.add_invalid_application_entry(
+                key_and_mask, core_mask, core_shift, n_neurons, n_colour_bits)
+        else:
+            table.add_application_entry(
+                address[0], address[1], key_and_mask, core_mask, core_shift,
+                n_neurons, n_colour_bits)
+
+
+def _random_entries(rng, n_entries):
+    entries = dict()
+    for i, key in enumerate(rng.choice(1 << 20, n_entries, replace=False)):
+        addresses = [
+            None if rng.random() < 0.2 else
+            (int(rng.integers(0, 1 << 20)) * 16, int(rng.integers(1, 256)))
+            for _ in range(rng.integers(1, 5))]
+        entries[int(key) << 11] = (
+            (0xFFFFF800, int(rng.integers(0, 16)), 7,
+             int(rng.integers(1, 256)), i % 8), addresses)
+    return entries
+
+
+@pytest.mark.parametrize("n_entries", [0, 1, 2, 17, 300])
+def test_same_as_reference(n_entries):
+    unittest_setup()
+    rng = numpy.random.default_rng(n_entries)
+    entries = _random_entries(rng, n_entries)
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    _fill(table, entries, rng)
+    assert table.get_pop_table_data().tobytes() == _reference_data(entries)
+
+
+def test_entry_index():
+    unittest_setup()
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    key_and_mask = BaseKeyAndMask(0x1000, 0xFFFFF000)
+    other = BaseKeyAndMask(0x2000, 0xFFFFF000)
+    assert table.add_application_entry(0, 10, key_and_mask, 0, 0, 100, 0) == 0
+    assert table.add_application_entry(64, 10, other, 0, 0, 100, 0) == 0
+    assert table.add_invalid_application_entry(
+        key_and_mask, 0, 0, 100, 0) == 1
+    assert table.add_application_entry(
+        128, 10, key_and_mask, 0, 0, 100, 0) == 2
+    with pytest.raises(SynapticConfigurationException):
+        table.add_application_entry(256, 10, key_and_mask, 0, 0, 50, 0)
+
+
+def _reference_depth(n_entries, target):
+    """ The number of entries looked at by the search in the C code. """
+    imin = 0
+    imax = n_entries
+    depth = 0
+    while imin < imax:
+        depth += 1
+        imid = (imin + imax) >> 1
+        if imid == target:
+            return depth
+        if imid < target:
+            imin = imid + 1
+        else:
+            imax = imid
+    raise AssertionError("Not found")
+
+
+@pytest.mark.parametrize("n_entries", [0, 1, 2, 3, 10, 64, 100])
+def test_mean_search_depth(n_entries):
+    unittest_setup()
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    for i in range(n_entries):
+        table.add_application_entry(
+            0, 10, BaseKeyAndMask(i << 11, 0xFFFFF800), 0, 0, 100, 0)
+    expected = 0.0
+    if n_entries:
+        expected = numpy.mean(
+            [_reference_depth(n_entries, i) for i in range(n_entries)])
+    assert table.get_mean_search_depth() == pytest.approx(expected)
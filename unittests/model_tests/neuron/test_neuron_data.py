@@ -0,0 +1,179 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import struct
+import numpy
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+from spinn_utilities.ranged import RangedList
+from spinnman.transceiver.mockable_transceiver import MockableTransceiver
+from spinnman.transceiver import Transceiver
+from pacman.model.placements import Placement
+from pacman.operations.partition_algorithms import splitter_partitioner
+from spinn_front_end_common.utilities.helpful_functions import (
+    get_region_base_address_offset)
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    SplitterAbstractPopulationVertexFixed)
+from spynnaker.pyNN.models.neuron.population_machine_neurons import (
+    PopulationMachineNeurons)
+from spynnaker.pyNN.utilities.struct import StructRepeat
+import pyNN.spiNNaker as p
+
+N_NEURONS = 100
+
+
+class _MockTransceiverMemory(MockableTransceiver):
+    """ Memory made of blocks of data, counting the blocks read. """
+
+    def __init__(self):
+        super().__init__()
+        self.blocks = dict()
+        self.n_reads = 0
+
+    @overrides(Transceiver.get_region_base_address)
+    def get_region_base_address(self, x: int, y: int, p: int):
+        return p << 20
+
+    @overrides(MockableTransceiver.read_memory)
+    def read_memory(
+            self, x: int, y: int, base_address: int, length: int,
+            cpu: int = 0) -> bytearray:
+        self.n_reads += 1
+        return bytearray(self.blocks[base_address][:length])
+
+    @overrides(MockableTransceiver.read_word)
+    def read_word(
+            self, x: int, y: int, base_address: int, cpu: int = 0) -> int:
+        datum, = struct.unpack("<I", self.blocks[base_address])
+        return datum
+
+
+def _data(values, vertex_slice, structs):
+    """ The neuron data of a slice made from the given values. """
+    return numpy.concatenate([
+        s.get_data(values) if s.repeat_type == StructRepeat.GLOBAL
+        else s.get_data(values, vertex_slice) for s in structs]).tobytes()
+
+
+def _setup():
+    """ Make a population on a number of cores, and put neuron data for it
+        in the memory of a fake transceiver with different values from those
+        of the population.  The values are chosen so that they are exact
+        after going through the machine.
+    """
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    writer = SpynnakerDataWriter.mock()
+    pop = p.Population(
+        N_NEURONS, p.IF_curr_exp(
+            tau_m=[10.0 + i * 0.25 for i in range(N_NEURONS)],
+            v_thresh=-50.0, v=[-65.0 + i * 0.125 for i in range(N_NEURONS)]),
+        label="pop", additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    pop.set_max_atoms_per_core(30)
+    splitter_partitioner()
+    # pylint: disable=protected-access
+    app_vertex = pop._vertex
+    structs = app_vertex.neuron_impl.structs
+    values = {
+        key: values[key]
+        for values in (app_vertex.parameters, app_vertex.state_variables)
+        for key in values.keys()}
+    values["v_thresh"] = -55.0
+    values["v"] = RangedList(
+        N_NEURONS, [-70.0 + i * 0.0625 for i in range(N_NEURONS)])
+
+    transceiver = _MockTransceiverMemory()
+    writer.set_transceiver(transceiver)
+    placements = list()
+    for i, m_vertex in enumerate(sorted(
+            app_vertex.machine_vertices,
+            key=lambda m_vertex: m_vertex.vertex_slice.lo_atom)):
+        placement = Placement(m_vertex, 0, 0, i + 1)
+        placements.append(placement)
+        base = transceiver.get_region_base_address(0, 0, i + 1)
+        data = _data(values, m_vertex.vertex_slice, structs)
+        for region, address in (
+                (m_vertex._neuron_regions.neuron_params, base + 0x1000),
+                (m_vertex._neuron_regions.initial_values, base + 0x8000)):
+            transceiver.blocks[get_region_base_address_offset(
+                base, region)] = struct.pack("<I", address)
+            transceiver.blocks[address] = data
+    return pop, placements, transceiver
+
+
+def test_read_all():
+    pop, placements, transceiver = _setup()
+    # pylint: disable=protected-access
+    app_vertex = pop._vertex
+    PopulationMachineNeurons.read_all_parameters_from_machine(placements)
+    assert transceiver.n_reads == len(placements)
+    v_thresh = app_vertex.parameters["v_thresh"]
+    assert v_thresh.range_based()
+    assert list(v_thresh.iter_ranges()) == [(0, N_NEURONS, -55.0)]
+    assert numpy.array_equal(
+        app_vertex.state_variables["v"],
+        [-70.0 + i * 0.0625 for i in range(N_NEURONS)])
+    assert numpy.array_equal(
+        app_vertex.parameters["tau_m"],
+        [10.0 + i * 0.25 for i in range(N_NEURONS)])
+    # The initial values are not touched
+    assert app_vertex.initial_state_variables["v"][0] == -65.0
+
+
+def test_read_all_initial():
+    pop, placements, _ = _setup()
+    # pylint: disable=protected-access
+    app_vertex = pop._vertex
+    PopulationMachineNeurons.read_all_initial_parameters_from_machine(
+        placements)
+    assert numpy.array_equal(
+        app_vertex.initial_state_variables["v"],
+        [-70.0 + i * 0.0625 for i in range(N_NEURONS)])
+    assert app_vertex.state_variables["v"][0] == -65.0
+
+
+def test_same_as_one_at_a_time():
+    pop, placements, _ = _setup()
+    # pylint: disable=protected-access
+    app_vertex = pop._vertex
+    for placement in placements:
+        placement.vertex.read_parameters_from_machine(placement)
+    one_at_a_time = {
+        key: list(app_vertex.parameters[key])
+        for key in app_vertex.parameters.keys()}
+    pop, placements, _ = _setup()
+    app_vertex = pop._vertex
+    PopulationMachineNeurons.read_all_parameters_from_machine(placements)
+    assert one_at_a_time == {
+        key: list(app_vertex.parameters[key])
+        for key in app_vertex.parameters.keys()}
+
+
+def test_read_some():
+    pop, placements, _ = _setup()
+    # pylint: disable=protected-access
+    app_vertex = pop._vertex
+    PopulationMachineNeurons.read_all_parameters_from_machine(placements[1:3])
+    vertex_slice = placements[1].vertex.vertex_slice
+    v = numpy.array(app_vertex.state_variables["v"])
+    read = numpy.zeros(N_NEURONS, dtype=bool)
+    read[vertex_slice.lo_atom:placements[2].vertex.vertex_slice.hi_atom + 1] \
+        = True
+    # The values are chosen so they are exact after going through the machine
+    assert numpy.array_equal(
+        v[read], [-70.0 + i * 0.0625 for i in range(N_NEURONS) if read[i]])
+    assert numpy.array_equal(
+        v[~read], [-65.0 + i * 0.125 for i in range(N_NEURONS) if not read[i]])
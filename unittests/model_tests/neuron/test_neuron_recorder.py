@@ -11,6 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
+import numpy
+from pacman.model.graphs.common import Slice, MDSlice
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement
 from spinn_front_end_common.interface.ds import DataType
 from spynnaker.pyNN.config_setup import unittest_setup
 from spynnaker.pyNN.models.common import NeuronRecorder
@@ -50,3 +55,147 @@ def test_recording_variables():
     nr.set_recording("gsyn_inh", True)
     assert ["v", "gsyn_inh"] == list(nr.recording_variables)
     assert [0, 2] == list(nr.recorded_region_ids)
+
+
+def _recorder(n_neurons):
+    recordables = ["v", "gsyn_exc"]
+    data_types = {"v": DataType.S1615, "gsyn_exc": DataType.S1615}
+    return NeuronRecorder(
+        recordables, data_types, ["spikes"], n_neurons, [], [], [], [])
+
+
+def _expected_indices(indexes, vertex_slice):
+    """ The local recording index of each neuron, done one at a time.
+    """
+    n_indices = vertex_slice.n_atoms + (vertex_slice.n_atoms % 2)
+    ids = [i for i in vertex_slice.get_raster_ids() if i in indexes]
+    local = [ids.index(i) if i in ids else len(ids)
+             for i in vertex_slice.get_raster_ids()]
+    local.extend([len(ids)] * (n_indices - len(local)))
+    return ids, numpy.array(local, dtype="uint16").view("uint32")
+
+
+def _expected_generator_indices(indexes, vertex_slice):
+    """ The run-length encoded recording of the neurons, done one at a time.
+    """
+    items = []
+    last = None
+    for i in vertex_slice.get_raster_ids():
+        recorded = i in indexes
+        if recorded == last:
+            items[-1][0] += 1
+        else:
+            items.append([1, recorded])
+        last = recorded
+    n_recorded = sum(n for n, recorded in items if recorded)
+    if not n_recorded:
+        return [0xFFFFFFFF, 1, 0x7FFFFFFF]
+    return [n_recorded, len(items)] + [
+        n | (0x80000000 if recorded else 0) for n, recorded in items]
+
+
+def test_selective_recording_data():
+    unittest_setup()
+    rng = numpy.random.default_rng(7)
+    n_neurons = 1000
+    nr = _recorder(n_neurons)
+    v_indexes = set(int(i) for i in rng.choice(n_neurons, 300, replace=False))
+    spike_indexes = set(range(0, 100)) | set(range(250, 260)) | {999}
+    nr.set_recording("v", True, indexes=v_indexes)
+    nr.set_recording("spikes", True, indexes=spike_indexes)
+
+    for vertex_slice in [Slice(0, 99), Slice(100, 248), Slice(250, 260),
+                         Slice(500, 999), Slice(261, 261)]:
+        expected = []
+        v_ids, v_local = _expected_indices(v_indexes, vertex_slice)
+        expected.extend([1 if v_ids else 0, len(v_ids), 4])
+        expected.extend(v_local if v_ids else numpy.zeros(
+            len(v_local), dtype="uint32"))
+        expected.extend([0, 0, 4])
+        expected.extend(numpy.zeros(len(v_local), dtype="uint32"))
+        s_ids, s_local = _expected_indices(spike_indexes, vertex_slice)
+        expected.extend([1 if s_ids else 0, len(s_ids)])
+        expected.extend(s_local if s_ids else numpy.zeros(
+            len(s_local), dtype="uint32"))
+        assert numpy.array_equal(
+            numpy.array(expected, dtype="uint32"), nr._get_data(vertex_slice))
+
+        assert v_ids == list(nr.neurons_recording("v", vertex_slice))
+        assert s_ids == list(nr.neurons_recording("spikes", vertex_slice))
+
+        expected = [2, 1, 1, 4]
+        expected.extend(_expected_generator_indices(v_indexes, vertex_slice))
+        expected.extend([0, 4, 0, 0])
+        expected.append(1)
+        expected.extend(
+            _expected_generator_indices(spike_indexes, vertex_slice))
+        assert numpy.array_equal(
+            numpy.array(expected, dtype="uint32"),
+            nr.get_generator_data(vertex_slice))
+
+    assert 100 == nr._max_recording_per_slice("spikes", 100)
+    assert 10 == nr._max_recording_per_slice("spikes", 10)
+    assert max(
+        len([i for i in v_indexes if i // 128 == core])
+        for core in range(8)) == nr._max_recording_per_slice("v", 128)
+
+
+def test_selective_recording_md_slice():
+    unittest_setup()
+    nr = _recorder(64)
+    indexes = {0, 9, 10, 17, 18, 19, 63}
+    nr.set_recording("v", True, indexes=indexes)
+    vertex_slice = MDSlice(8, 15, (4, 2), (0, 1), (8, 8))
+    ids, local = _expected_indices(indexes, vertex_slice)
+    assert numpy.array_equal(local, nr._get_data(vertex_slice)[3:7])
+    assert ids == list(nr.neurons_recording("v", vertex_slice))
+    assert numpy.array_equal(
+        _expected_generator_indices(indexes, vertex_slice),
+        nr.get_generator_data(vertex_slice)[4:-7])
+
+
+def _expected_fragment(expected_rows, n_neurons, times, rate, data):
+    """ Fill in the missing rows, one row at a time.
+    """
+    fragment = numpy.full((expected_rows, n_neurons), numpy.nan)
+    for i in range(expected_rows):
+        rows = numpy.flatnonzero(times == i * rate)
+        if len(rows):
+            fragment[i] = data[rows[0]]
+    return fragment
+
+
+def test_process_missing_data(caplog):
+    unittest_setup()
+    rng = numpy.random.default_rng(3)
+    placement = Placement(SimpleMachineVertex(None), 0, 0, 1)
+    n_neurons = 5
+    rate = 2
+    expected_rows = 1000
+    times = numpy.arange(expected_rows) * rate
+
+    # Drop some rows, repeat some others and add a time after the end
+    times = numpy.delete(times, [0, 17, 18, 19, 500, 999])
+    times = numpy.sort(numpy.concatenate((times, [40, 40, 602])))
+    times = numpy.append(times, expected_rows * rate).astype("int32")
+    data = rng.random((len(times), n_neurons))
+    # Make the repeats different so the one chosen can be checked
+    data[numpy.flatnonzero(times == 40)] = [[1.0] * 5, [2.0] * 5, [3.0] * 5]
+
+    with caplog.at_level(logging.WARNING):
+        fragment = NeuronRecorder._process_missing_data(
+            "", placement, expected_rows, n_neurons, times.reshape(-1, 1),
+            rate, "pop", data, 3)
+    expected = _expected_fragment(
+        expected_rows, n_neurons, times, rate, data)
+    assert numpy.array_equal(expected, fragment, equal_nan=True)
+    assert numpy.isnan(fragment[[0, 17, 18, 19, 500, 999]]).all()
+    assert numpy.array_equal([1.0] * 5, fragment[20])
+    assert not numpy.isnan(numpy.delete(
+        fragment, [0, 17, 18, 19, 500, 999], axis=0)).any()
+
+    # The repeated times are reported together
+    warnings = [record.getMessage() for record in caplog.records]
+    assert 1 == len(warnings)
+    assert "2 times" in warnings[0]
+    assert "first at time 40" in warnings[0]
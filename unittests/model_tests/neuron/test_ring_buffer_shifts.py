@@ -0,0 +1,106 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import pytest
+from spinn_utilities.config_holder import set_config
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.models.neuron.abstract_population_vertex import (
+    AbstractPopulationVertex, _Stats)
+from spynnaker.pyNN.utilities.running_stats import RunningStats
+import pyNN.spiNNaker as p
+
+
+def _reference_max_weights(stats):
+    """ The maximum weights worked out one projection at a time. """
+    n_types = stats.n_synapse_types
+    running_totals = [RunningStats() for _ in range(n_types)]
+    delay_running_totals = [RunningStats() for _ in range(n_types)]
+    rate_stats = [RunningStats() for _ in range(n_types)]
+    total_weights = [0.0] * n_types
+    biggest_weight = [0.0] * n_types
+    for (s_type, n_conns, w_mean, w_var, w_max, d_var, spikes_per_tick,
+         spikes_per_second) in stats.details:
+        running_totals[s_type].add_items(
+            w_mean * stats.w_scale, w_var * stats.w_scale_sq, n_conns)
+        biggest_weight[s_type] = max(
+            biggest_weight[s_type], w_max * stats.w_scale)
+        delay_running_totals[s_type].add_items(0.0, d_var, n_conns)
+        rate_stats[s_type].add_items(spikes_per_second, 0, n_conns)
+        total_weights[s_type] += spikes_per_tick * (w_max * n_conns)
+
+    max_weights = list()
+    for s_type in range(n_types):
+        if delay_running_totals[s_type].variance == 0.0:
+            max_weights.append(
+                max(total_weights[s_type], biggest_weight[s_type]))
+            continue
+        totals = running_totals[s_type]
+        # pylint: disable=protected-access
+        w_max = AbstractPopulationVertex._ring_buffer_expected_upper_bound(
+            totals.mean, totals.standard_deviation, rate_stats[s_type].mean,
+            totals.n_items, stats.ring_buffer_sigma)
+        w_max = min(w_max, total_weights[s_type])
+        max_weights.append(max(w_max, biggest_weight[s_type]))
+    return max_weights
+
+
+def _post_population(n_projections, random_delays):
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    SpynnakerDataWriter.mock()
+    sources = [
+        p.Population(20, p.SpikeSourcePoisson(rate=10.0 * (i + 1)))
+        for i in range(3)]
+    sources.append(p.Population(20, p.IF_curr_exp()))
+    post = p.Population(50, p.IF_curr_exp())
+    for i in range(n_projections):
+        delay = (p.RandomDistribution("uniform", [1, 1 + (i % 5) * 2])
+                 if random_delays and i % 3 else 1.0 + (i % 4))
+        weight = (p.RandomDistribution("normal_clipped", [
+                      0.5 + (i % 7) * 0.25, 0.1, 0, 10])
+                  if i % 2 else 0.25 * (i % 9 + 1))
+        connector = (p.FixedProbabilityConnector(0.1 + (i % 5) * 0.2)
+                     if i % 4 else p.OneToOneConnector())
+        p.Projection(
+            sources[i % len(sources)], post, connector,
+            p.StaticSynapse(weight=weight, delay=delay),
+            receptor_type="excitatory" if i % 3 else "inhibitory")
+    # pylint: disable=protected-access
+    return post._vertex
+
+
+@pytest.mark.parametrize("n_projections,random_delays", [
+    (0, True), (1, True), (2, False), (40, False), (40, True)])
+def test_same_as_reference(n_projections, random_delays):
+    vertex = _post_population(n_projections, random_delays)
+    stats = _Stats(vertex.neuron_impl, 10.0, 5.0)
+    for proj in vertex.incoming_projections:
+        stats.add_projection(proj)
+    assert list(stats.get_max_weights()) == pytest.approx(
+        _reference_max_weights(stats), rel=1e-9)
+
+
+def test_shifts():
+    vertex = _post_population(40, True)
+    stats = _Stats(
+        vertex.neuron_impl, vertex.spikes_per_second,
+        vertex.ring_buffer_sigma)
+    for proj in vertex.incoming_projections:
+        stats.add_projection(proj)
+    shifts = list()
+    for w in _reference_max_weights(stats):
+        shift = 0 if w <= 0 else int(math.ceil(max(0, math.log2(w))))
+        shifts.append(shift + 1 if 2 ** shift <= w else shift)
+    assert vertex.get_ring_buffer_shifts() == shifts
@@ -14,7 +14,10 @@
 
 from testfixtures import LogCapture
 import unittest
-from spynnaker.pyNN.models.spike_source import SpikeSourceArrayVertex
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.models.spike_source import (
+    CSRSpikeTimes, SpikeSourceArrayVertex)
 import pyNN.spiNNaker as sim
 
 
@@ -105,3 +108,71 @@ class TestSpikeSourceArrayVertex(unittest.TestCase):
                     self.assertIn("109", msg)
                     found = True
             self.assertTrue(found)
+
+    def test_csr(self):
+        spike_list = [[1, 2, 6], [], [3, 7, 8, 9], [10]]
+        csr = CSRSpikeTimes.from_lists(spike_list)
+        self.assertEqual(4, csr.n_neurons)
+        self.assertSequenceEqual([0, 3, 3, 7, 8], list(csr.offsets))
+        v_list = SpikeSourceArrayVertex(
+            n_neurons=4, spike_times=spike_list,
+            label="test", max_atoms_per_core=None, model=None,
+            splitter=None, n_colour_bits=None)
+        v_csr = SpikeSourceArrayVertex(
+            n_neurons=4, spike_times=csr,
+            label="test", max_atoms_per_core=None, model=None,
+            splitter=None, n_colour_bits=None)
+        self.assertIsNone(v_csr.send_buffer_times)
+        for vertex_slice in [Slice(0, 3), Slice(1, 2), Slice(3, 3)]:
+            expected = v_list._filtered_send_buffer_times(vertex_slice)
+            found = v_csr._filtered_send_buffer_times(vertex_slice)
+            self.assertEqual(len(expected), len(found))
+            for e, f in zip(expected, found):
+                self.assertSequenceEqual(list(e), list(f))
+        self.assertIsNone(v_csr._filtered_send_buffer_times(Slice(1, 1)))
+        values = v_csr.get_parameter_values("spike_times", [0, 2])
+        self.assertSequenceEqual([1, 2, 6], list(values[0]))
+        self.assertSequenceEqual([3, 7, 8, 9], list(values[1]))
+
+    def test_csr_set(self):
+        csr = CSRSpikeTimes.from_neuron_ids(
+            3, [2, 0, 2, 1], [5.0, 4.0, 1.0, 3.0])
+        self.assertSequenceEqual([4.0, 3.0, 1.0, 5.0], list(csr.times))
+        v = SpikeSourceArrayVertex(
+            n_neurons=3, spike_times=[[1], [11], [22]],
+            label="test", max_atoms_per_core=None, model=None,
+            splitter=None, n_colour_bits=None)
+        v.set_parameter_values("spike_times", csr)
+        v.set_parameter_values("spike_times", [[7, 8]], [1])
+        v.set_parameter_values("spike_times", 9, [0, 2])
+        values = v.get_parameter_values("spike_times")
+        self.assertSequenceEqual(
+            [[9], [7, 8], [9]], [list(times) for times in values])
+        with self.assertRaises(SpynnakerException):
+            v.set_parameter_values("spike_times", [[1], [2]])
+
+    def test_csr_big(self):
+        csr = CSRSpikeTimes.from_shared(200, [5, 17])
+        with LogCapture() as lc:
+            SpikeSourceArrayVertex(
+                n_neurons=200, spike_times=csr,
+                label="test", max_atoms_per_core=None, model=None,
+                splitter=None, n_colour_bits=None)
+            found = False
+            for record in lc.records:
+                msg = str(record.msg)
+                if "too many spikes" in msg:
+                    self.assertIn("200", msg)
+                    found = True
+            self.assertTrue(found)
+
+    def test_csr_bad(self):
+        with self.assertRaises(SpynnakerException):
+            CSRSpikeTimes([1, 2, 3], [0, 2])
+        with self.assertRaises(SpynnakerException):
+            CSRSpikeTimes([1, 2, 3], [0, 3, 2, 3])
+        with self.assertRaises(SpynnakerException):
+            SpikeSourceArrayVertex(
+                n_neurons=3, spike_times=CSRSpikeTimes([1], [0, 1]),
+                label="test", max_atoms_per_core=None, model=None,
+                splitter=None, n_colour_bits=None)
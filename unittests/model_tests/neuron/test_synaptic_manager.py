@@ -48,7 +48,8 @@ from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
     .formation import DistanceDependentFormation
 from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
     .elimination import RandomByWeightElimination
-from spynnaker.pyNN.exceptions import SynapticConfigurationException
+from spynnaker.pyNN.exceptions import (
+    RemapRequiredException, SynapticConfigurationException)
 from spynnaker.pyNN.models.neuron.builds.if_curr_exp_base import IFCurrExpBase
 from spynnaker.pyNN.extra_algorithms.splitter_components import (
     SplitterAbstractPopulationVertexFixed)
@@ -106,6 +107,8 @@ def test_write_data_spec():
     set_config("Machine", "version", 5)
     writer = SpynnakerDataWriter.mock()
     # UGLY but the mock transceiver NEED generate_on_machine to be False
+    generate_on_machine = AbstractGenerateConnectorOnMachine.\
+        generate_on_machine
     AbstractGenerateConnectorOnMachine.generate_on_machine = say_false
 
     set_config("Machine", "enable_advanced_monitor_support", "False")
@@ -220,6 +223,8 @@ def test_write_data_spec():
         assert all(list_delays == connections_4["delay"])
     finally:
         shutil.rmtree(report_folder, ignore_errors=True)
+        AbstractGenerateConnectorOnMachine.generate_on_machine = \
+            generate_on_machine
 
 
 def test_set_synapse_dynamics():
@@ -508,3 +513,251 @@ def test_pop_based_master_pop_table_standard(
 
     assert n_entries == expected_n_entries
     assert n_addresses == expected_n_addresses
+
+
+class _MockTransceiverCountReads(_MockTransceiverinOut):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bytes_read = 0
+
+    @overrides(MockableTransceiver.read_memory)
+    def read_memory(
+            self, x: int, y: int, base_address: int, length: int,
+            cpu: int = 0) -> bytearray:
+        self.bytes_read += length
+        return super().read_memory(x, y, base_address, length, cpu)
+
+
+@pytest.mark.parametrize("synapse_type", [
+    p.StaticSynapse,
+    lambda: p.STDPMechanism(
+        timing_dependence=p.SpikePairRule(),
+        weight_dependence=p.AdditiveWeightDependence())])
+def test_read_pre_neuron_rows(synapse_type):
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    writer = SpynnakerDataWriter.mock()
+    # UGLY but the mock transceiver NEED generate_on_machine to be False
+    generate_on_machine = AbstractGenerateConnectorOnMachine.\
+        generate_on_machine
+    AbstractGenerateConnectorOnMachine.generate_on_machine = say_false
+
+    set_config("Machine", "enable_advanced_monitor_support", "False")
+    set_config("Java", "use_java", "False")
+
+    n_pre = 100
+    n_post = 100
+    rng = numpy.random.default_rng(5)
+    from_list = [
+        (pre, post, float(rng.integers(1, 8)), float(rng.integers(1, 200)))
+        for pre in range(n_pre) for post in range(n_post)
+        if rng.random() < 0.1]
+    pre_pop = p.Population(
+        n_pre, p.IF_curr_exp(), label="Pre",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    post_pop = p.Population(
+        n_post, p.IF_curr_exp(), label="Post",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    post_pop.set_max_atoms_per_core(n_post)
+    proj = p.Projection(
+        pre_pop, post_pop, p.FromListConnector(from_list), synapse_type())
+
+    writer.set_plan_n_timesteps(100)
+    d_vertices, d_edges = delay_support_adder()
+    for vertex in d_vertices:
+        writer.add_vertex(vertex)
+    for edge in d_edges:
+        writer.add_edge(edge, constants.SPIKE_PARTITION_ID)
+    splitter_partitioner()
+    allocator = ZonedRoutingInfoAllocator()
+    writer.set_routing_infos(allocator.allocate([]))
+
+    post_vertex = next(iter(post_pop._vertex.machine_vertices))
+    post_vertex_slice = post_vertex.vertex_slice
+    placement = Placement(post_vertex, 0, 0, 3)
+
+    regions = SynapseRegions(
+        synapse_params=5, synapse_dynamics=6, structural_dynamics=7,
+        bitfield_filter=8,
+        synaptic_matrix=1, pop_table=3, connection_builder=4)
+    references = SynapseRegions(
+        synapse_params=None, synapse_dynamics=None, structural_dynamics=None,
+        bitfield_filter=None, synaptic_matrix=None, pop_table=None,
+        connection_builder=None)
+    synaptic_matrices = SynapticMatrices(
+        post_pop._vertex, regions, max_atoms_per_core=n_post,
+        weight_scales=[32, 32], all_syn_block_sz=1000000)
+    synaptic_matrices.generate_data()
+
+    with DsSqlliteDatabase() as ds_db:
+        spec = DataSpecificationGenerator(0, 0, 3, post_vertex, ds_db)
+        synaptic_matrices.write_synaptic_data(
+            spec, post_vertex_slice, references)
+
+    transceiver = _MockTransceiverCountReads()
+    writer.set_transceiver(transceiver)
+    load_application_data_specs()
+
+    try:
+        edge = proj._projection_edge
+        info = proj._synapse_information
+        assert edge.n_delay_stages > 0
+        all_conns = numpy.concatenate(
+            synaptic_matrices.get_connections_from_machine(
+                placement, edge, info))
+        assert len(all_conns) == len(from_list)
+        full_bytes_read = transceiver.bytes_read
+
+        # Single rows, runs of rows, rows at the ends and no rows
+        for pre_indices in ([0], [n_pre - 1], [3, 4, 5, 60, 99],
+                            list(range(0, n_pre, 7)), []):
+            transceiver.bytes_read = 0
+            conns = numpy.concatenate(
+                synaptic_matrices.get_connections_from_machine(
+                    placement, edge, info, numpy.array(pre_indices)))
+            expected = all_conns[numpy.isin(all_conns["source"], pre_indices)]
+            assert numpy.array_equal(
+                numpy.sort(conns, order=["source", "target", "delay"]),
+                numpy.sort(expected, order=["source", "target", "delay"]))
+            assert transceiver.bytes_read < full_bytes_read
+    finally:
+        AbstractGenerateConnectorOnMachine.generate_on_machine = \
+            generate_on_machine
+
+
+class _MockTransceiverCountWrites(_MockTransceiverinOut):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bytes_written = 0
+
+    @overrides(MockableTransceiver.write_memory)
+    def write_memory(
+            self, x: int, y: int, base_address: int,
+            data: Union[BinaryIO, bytes, int, str], *,
+            n_bytes: Optional[int] = None, offset: int = 0, cpu: int = 0,
+            get_sum: bool = False) -> Tuple[int, int]:
+        if isinstance(data, bytes):
+            self.bytes_written += len(data)
+        return super().write_memory(
+            x, y, base_address, data, n_bytes=n_bytes, offset=offset,
+            cpu=cpu, get_sum=get_sum)
+
+
+def test_change_rows():
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    writer = SpynnakerDataWriter.mock()
+    # UGLY but the mock transceiver NEED generate_on_machine to be False
+    generate_on_machine = AbstractGenerateConnectorOnMachine.\
+        generate_on_machine
+    AbstractGenerateConnectorOnMachine.generate_on_machine = say_false
+
+    set_config("Machine", "enable_advanced_monitor_support", "False")
+    set_config("Java", "use_java", "False")
+
+    n_pre = 100
+    n_post = 100
+    rng = numpy.random.default_rng(7)
+    from_list = [
+        (pre, post, float(rng.integers(1, 8)), float(rng.integers(1, 200)))
+        for pre in range(n_pre) for post in range(n_post)
+        if rng.random() < 0.1]
+    pre_pop = p.Population(
+        n_pre, p.IF_curr_exp(), label="Pre",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    post_pop = p.Population(
+        n_post, p.IF_curr_exp(), label="Post",
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    post_pop.set_max_atoms_per_core(n_post)
+    proj = p.Projection(
+        pre_pop, post_pop, p.FromListConnector(from_list), p.StaticSynapse())
+
+    writer.set_plan_n_timesteps(100)
+    d_vertices, d_edges = delay_support_adder()
+    for vertex in d_vertices:
+        writer.add_vertex(vertex)
+    for edge in d_edges:
+        writer.add_edge(edge, constants.SPIKE_PARTITION_ID)
+    splitter_partitioner()
+    allocator = ZonedRoutingInfoAllocator()
+    writer.set_routing_infos(allocator.allocate([]))
+
+    post_vertex = next(iter(post_pop._vertex.machine_vertices))
+    post_vertex_slice = post_vertex.vertex_slice
+    placement = Placement(post_vertex, 0, 0, 3)
+
+    regions = SynapseRegions(
+        synapse_params=5, synapse_dynamics=6, structural_dynamics=7,
+        bitfield_filter=8,
+        synaptic_matrix=1, pop_table=3, connection_builder=4)
+    references = SynapseRegions(
+        synapse_params=None, synapse_dynamics=None, structural_dynamics=None,
+        bitfield_filter=None, synaptic_matrix=None, pop_table=None,
+        connection_builder=None)
+    synaptic_matrices = SynapticMatrices(
+        post_pop._vertex, regions, max_atoms_per_core=n_post,
+        weight_scales=[32, 32], all_syn_block_sz=1000000)
+    synaptic_matrices.generate_data()
+
+    with DsSqlliteDatabase() as ds_db:
+        spec = DataSpecificationGenerator(0, 0, 3, post_vertex, ds_db)
+        synaptic_matrices.write_synaptic_data(
+            spec, post_vertex_slice, references)
+
+    transceiver = _MockTransceiverCountWrites()
+    writer.set_transceiver(transceiver)
+    load_application_data_specs()
+
+    def get_connections():
+        return numpy.sort(numpy.concatenate(
+            synaptic_matrices.get_connections_from_machine(
+                placement, edge, info)), order=["source", "target", "delay"])
+
+    try:
+        edge = proj._projection_edge
+        info = proj._synapse_information
+        assert edge.n_delay_stages > 0
+        conns = get_connections()
+        assert len(conns) == len(from_list)
+
+        # New weights for some rows, and the delays of a row swapped around
+        # so that each delay stage keeps the same number of synapses
+        new_conns = conns.copy()
+        new_conns["weight"][numpy.isin(conns["source"], [3, 4])] = 6.5
+        row_7 = numpy.nonzero(conns["source"] == 7)[0]
+        new_conns["delay"][row_7] = conns["delay"][row_7[::-1]]
+        changed_rows = synaptic_matrices.get_changed_rows(
+            post_vertex_slice, edge, info, conns, new_conns)
+        assert changed_rows
+        transceiver.bytes_written = 0
+        synaptic_matrices.write_changed_rows(placement, changed_rows)
+        assert 0 < transceiver.bytes_written < len(conns) * 4
+        assert numpy.array_equal(
+            get_connections(),
+            numpy.sort(new_conns, order=["source", "target", "delay"]))
+
+        # Nothing changed means nothing to write
+        assert not synaptic_matrices.get_changed_rows(
+            post_vertex_slice, edge, info, new_conns, new_conns)
+
+        # Delays that need more delay stages, and weights that need a
+        # different weight scale, need the network to be mapped again
+        too_long = new_conns.copy()
+        too_long["delay"] = 1000.0
+        with pytest.raises(RemapRequiredException):
+            synaptic_matrices.get_changed_rows(
+                post_vertex_slice, edge, info, new_conns, too_long)
+        too_big = new_conns.copy()
+        too_big["weight"][0] = 1e6
+        with pytest.raises(RemapRequiredException):
+            synaptic_matrices.get_changed_rows(
+                post_vertex_slice, edge, info, new_conns, too_big)
+    finally:
+        AbstractGenerateConnectorOnMachine.generate_on_machine = \
+            generate_on_machine
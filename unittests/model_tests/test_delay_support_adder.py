@@ -0,0 +1,123 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import unittest
+from spinn_utilities.config_holder import set_config
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.extra_algorithms import delay_support_adder
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    SplitterAbstractPopulationVertexFixed)
+from spynnaker.pyNN.models.neural_projections import (
+    DelayedApplicationEdge, DelayAfferentApplicationEdge)
+import pyNN.spiNNaker as p
+
+N_POPS = 20
+N_NEURONS = 256
+
+
+class _CountingConnector(p.OneToOneConnector):
+    """ Counts how many times the maximum delay is asked for.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.n_delay_maximum = 0
+
+    def get_delay_maximum(self, synapse_info):
+        self.n_delay_maximum += 1
+        return super().get_delay_maximum(synapse_info)
+
+
+def _pop(label):
+    pop = p.Population(
+        N_NEURONS, p.IF_curr_exp(), label=label,
+        additional_parameters={
+            "splitter": SplitterAbstractPopulationVertexFixed()})
+    # All the neurons on one core limits the delay supported by the core
+    pop.set_max_atoms_per_core(N_NEURONS)
+    return pop
+
+
+class TestDelaySupportAdder(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+        self.writer = SpynnakerDataWriter.mock()
+
+    def test_shared_delay_vertex(self):
+        pre = _pop("pre")
+        posts = [_pop(f"post{i}") for i in range(3)]
+        p.Projection(pre, posts[0], p.OneToOneConnector(),
+                     p.StaticSynapse(delay=1.0))
+        p.Projection(pre, posts[1], p.OneToOneConnector(),
+                     p.StaticSynapse(delay=40.0))
+        p.Projection(pre, posts[1], p.OneToOneConnector(),
+                     p.StaticSynapse(delay=100.0))
+        p.Projection(pre, posts[2], p.OneToOneConnector(),
+                     p.StaticSynapse(delay=70.0))
+        self.writer.set_plan_n_timesteps(100)
+        d_vertices, d_edges = delay_support_adder()
+
+        # One delay vertex is shared by all the delayed edges, with enough
+        # stages for the longest delay
+        self.assertEqual(1, len(d_vertices))
+        d_vertex = d_vertices[0]
+        max_delay = posts[1]._vertex.splitter.max_support_delay()
+        self.assertEqual(max_delay, d_vertex.delay_per_stage)
+        self.assertEqual(
+            math.ceil(100 / max_delay) - 1, d_vertex.n_delay_stages)
+        self.assertEqual(
+            1, sum(isinstance(edge, DelayAfferentApplicationEdge)
+                   for edge in d_edges))
+        delayed = [edge for edge in d_edges
+                   if isinstance(edge, DelayedApplicationEdge)]
+        self.assertEqual(
+            {posts[1]._vertex, posts[2]._vertex},
+            {edge.post_vertex for edge in delayed})
+        self.assertEqual(delayed, list(d_vertex.outgoing_edges))
+
+    def test_many_projections(self):
+        pops = [_pop(f"pop{i}") for i in range(N_POPS)]
+        connectors = list()
+        for i, pre in enumerate(pops):
+            for j, post in enumerate(pops):
+                connector = _CountingConnector()
+                connectors.append(connector)
+                p.Projection(pre, post, connector, p.StaticSynapse(
+                    delay=1 + (i + j) % 100))
+        self.writer.set_plan_n_timesteps(100)
+        d_vertices, d_edges = delay_support_adder()
+
+        max_delay = pops[0]._vertex.splitter.max_support_delay()
+        needed = {(i, j) for i in range(N_POPS) for j in range(N_POPS)
+                  if 1 + (i + j) % 100 > max_delay}
+        self.assertTrue(needed)
+        self.assertEqual(len({i for i, _ in needed}), len(d_vertices))
+        self.assertEqual(len(d_vertices) + len(needed), len(d_edges))
+        for d_vertex in d_vertices:
+            i = int(d_vertex.source_vertex.label[3:])
+            longest = max(1 + (i + j) % 100 for j in range(N_POPS))
+            self.assertEqual(
+                math.ceil(longest / max_delay) - 1, d_vertex.n_delay_stages)
+
+        # The delays of each projection are only worked out once
+        for connector in connectors:
+            self.assertEqual(1, connector.n_delay_maximum)
+
+
+if __name__ == '__main__':
+    unittest.main()
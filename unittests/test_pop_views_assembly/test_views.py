@@ -153,3 +153,39 @@ class Test_IDMixin(BaseTestCase):
             pass  # Acceptable, but better if it worked
         with pytest.raises(ConfigurationException):
             sim.Projection(pop, "SOMETHING WIERD", sim.OneToOneConnector())
+
+    def test_large_view_of_view(self):
+        sim.setup(timestep=1.0)
+        n_neurons = 1000000
+        pop = sim.Population(n_neurons, sim.IF_curr_exp(), label="big")
+        evens = pop[::2]
+        reverse = PopulationView(
+            evens, list(range(len(evens) - 1, -1, -1)), label="reverse")
+        tail = reverse[10:20]
+
+        # Ranges of ranges stay as ranges
+        self.assertIsInstance(evens[5:10]._indexes, tuple)
+        self.assertEqual(tuple(range(10, 20, 2)), evens[5:10]._indexes)
+        self.assertEqual(
+            tuple(range(n_neurons - 22, n_neurons - 42, -2)), tail._indexes)
+
+        ids = [0, 2, 999998, 500000]
+        self.assertEqual([0, 1, 499999, 250000], evens.id_to_index(ids))
+        self.assertEqual(
+            [499999, 499998, 0, 249999], reverse.id_to_index(ids))
+        self.assertEqual(5, tail.id_to_index(n_neurons - 32))
+        with pytest.raises(ValueError):
+            evens.id_to_index(3)
+        with pytest.raises(ValueError):
+            tail.id_to_index([n_neurons - 22, n_neurons])
+
+        # The cells are only made when asked for
+        cells = reverse.all_cells
+        self.assertEqual(len(evens), len(cells))
+        self.assertEqual(n_neurons - 2, cells[0].id)
+        self.assertEqual(
+            [n_neurons - 4, n_neurons - 6], [c.id for c in cells[1:3]])
+        self.assertEqual(n_neurons, len(pop.all_cells))
+        self.assertEqual(reverse, PopulationView(pop, reverse._indexes))
+        self.assertNotEqual(reverse, evens)
+        sim.end()
@@ -0,0 +1,89 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.external_devices_models.push_bot.ethernet import (
+    PushBotRetinaDecoder)
+from spynnaker.pyNN.external_devices_models.push_bot.parameters import (
+    PushBotRetinaResolution)
+
+
+def _reference_events(data):
+    """ Byte-at-a-time decode of a whole stream into 16-bit events
+    """
+    events = []
+    i = 0
+    while i < len(data):
+        if data[i] & 0x80:
+            if i + 1 < len(data):
+                events.append(data[i] | (data[i + 1] << 8))
+            i += 2
+        else:
+            i += 1
+    return events
+
+
+def _reference_ids(events, bits):
+    add_shift = 7 - bits
+    mask = (2 ** bits) - 1
+    return [
+        (((e >> (add_shift + 8)) & mask) |
+         (((e >> add_shift) & mask) << bits) |
+         (((e >> 7) & 1) << (bits * 2))) for e in events]
+
+
+class TestPushBotRetinaDecoder(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_single_packet(self):
+        decoder = PushBotRetinaDecoder()
+        # Noise, an event, an event whose second byte has the top bit set,
+        # then the start of an event
+        data = bytes([0x01, 0x85, 0x03, 0x80, 0x91, 0x7F, 0x82])
+        ids = decoder.decode(data)
+        self.assertSequenceEqual(
+            _reference_ids([0x0385, 0x9180], 7), list(ids))
+
+    def test_split_event(self):
+        decoder = PushBotRetinaDecoder()
+        self.assertEqual(0, len(decoder.decode(bytes([0x85]))))
+        self.assertEqual(0, len(decoder.decode(b"")))
+        ids = decoder.decode(bytes([0x92, 0x86, 0x04]))
+        self.assertSequenceEqual(
+            _reference_ids([0x9285, 0x0486], 7), list(ids))
+        decoder.decode(bytes([0x87]))
+        decoder.reset()
+        self.assertEqual(0, len(decoder.decode(bytes([0x05]))))
+
+    def test_recorded_stream(self):
+        rng = numpy.random.default_rng(42)
+        for resolution in PushBotRetinaResolution:
+            bits = resolution.value.bits_per_coordinate
+            stream = rng.integers(0, 256, 10000, dtype=numpy.uint8).tobytes()
+            cuts = numpy.sort(rng.integers(0, len(stream), 50))
+            packets = [stream[a:b] for a, b in zip(
+                numpy.concatenate(([0], cuts)),
+                numpy.concatenate((cuts, [len(stream)])))]
+            decoder = PushBotRetinaDecoder(resolution)
+            ids = decoder.decode_packets(packets)
+            self.assertSequenceEqual(
+                _reference_ids(_reference_events(stream), bits), list(ids))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+import numpy
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections.spif_live_spikes_connection import (
+    SPIFLiveSpikesConnection)
+
+_MAPPINGS = {
+    "pop_a": {0x10000 + i: i for i in range(10)},
+    "pop_b": {0x20000 + i: i for i in range(5)},
+    "pop_c": {}}
+
+
+class _FakeDatabase(object):
+    def get_configuration_parameter_value(self, name):
+        return 1000.0
+
+    def get_key_to_atom_id_mapping(self, label):
+        return _MAPPINGS[label]
+
+
+class TestSPIFLiveSpikesConnection(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def _received(self, packet, use_numpy, use_callback_thread=False):
+        received = list()
+        conn = SPIFLiveSpikesConnection(
+            ["pop_a", "pop_b"], "127.0.0.1", local_host="127.0.0.1",
+            local_port=None, use_numpy=use_numpy,
+            use_callback_thread=use_callback_thread)
+        try:
+            conn.add_receive_callback(
+                "pop_a", lambda label, ids: received.append(
+                    ("atoms", label, list(ids))))
+            conn.add_receive_callback(
+                "pop_b", lambda label, keys: received.append(
+                    ("keys", label, list(keys))), translate_key=False)
+            # pylint: disable=protected-access
+            conn._SPIFLiveSpikesConnection__read_database_callback(
+                _FakeDatabase())
+            conn._SPIFLiveSpikesConnection__handle_packet(packet)
+        finally:
+            conn.close()
+        return received
+
+    def test_numpy_matches_list(self):
+        keys = [0x10003, 0x20001, 0x10009, 0x99999, 0x10000, 0x20004, 5]
+        packet = struct.pack(f"<{len(keys)}I", *keys)
+        expected = self._received(packet, False)
+        self.assertEqual(
+            [("atoms", "pop_a", [3, 9, 0]),
+             ("keys", "pop_b", [0x20001, 0x20004])], expected)
+        self.assertEqual(expected, self._received(packet, True))
+        self.assertEqual(expected, self._received(packet, True, True))
+
+    def test_numpy_arrays(self):
+        received = list()
+        conn = SPIFLiveSpikesConnection(
+            ["pop_a"], "127.0.0.1", local_host="127.0.0.1", local_port=None,
+            use_numpy=True)
+        try:
+            conn.add_receive_callback(
+                "pop_a", lambda label, ids: received.append(ids))
+            # pylint: disable=protected-access
+            conn._SPIFLiveSpikesConnection__read_database_callback(
+                _FakeDatabase())
+            keys = numpy.arange(0x10000, 0x1000A, dtype="<u4")
+            conn._SPIFLiveSpikesConnection__handle_packet(keys.tobytes())
+        finally:
+            conn.close()
+        self.assertEqual(1, len(received))
+        self.assertIsInstance(received[0], numpy.ndarray)
+        self.assertSequenceEqual(list(range(10)), list(received[0]))
+
+    def test_numpy_no_keys(self):
+        received = list()
+        conn = SPIFLiveSpikesConnection(
+            ["pop_c"], "127.0.0.1", local_host="127.0.0.1", local_port=None,
+            use_numpy=True)
+        try:
+            conn.add_receive_callback(
+                "pop_c", lambda label, ids: received.append(ids))
+            # pylint: disable=protected-access
+            conn._SPIFLiveSpikesConnection__read_database_callback(
+                _FakeDatabase())
+            conn._SPIFLiveSpikesConnection__handle_packet(
+                struct.pack("<2I", 0x10000, 0x20000))
+        finally:
+            conn.close()
+        self.assertEqual([], received)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+from threading import Thread
+from time import perf_counter, sleep
+import unittest
+import numpy
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import SpynnakerLiveSpikesConnection
+
+
+class _FakeDatabase(object):
+    def __init__(self, time_scale_factor):
+        self.__time_scale_factor = time_scale_factor
+
+    def get_configuration_parameter_value(self, name):
+        if name == "time_scale_factor":
+            return self.__time_scale_factor
+        return 1000.0
+
+
+class _UDPConnection(SpynnakerLiveSpikesConnection):
+    """
+    Sends to a local UDP socket standing in for the board.
+    """
+    __slots__ = ("board", "sender", "received", "send_delay")
+
+    def __init__(self, time_scale_factor, send_delay=0.0):
+        super().__init__(
+            send_labels=["pop"], local_host="127.0.0.1", local_port=None)
+        self.board = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.board.bind(("127.0.0.1", 0))
+        self.board.settimeout(2.0)
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.received = list()
+        self.send_delay = send_delay
+        # pylint: disable=protected-access
+        self._atom_id_to_key["pop"] = {i: 0x1000 + i for i in range(100)}
+        self._SpynnakerLiveSpikesConnection__read_database_callback(
+            _FakeDatabase(time_scale_factor))
+
+    def send_eieio_message(self, message, label):
+        self.sender.sendto(message.bytestring, self.board.getsockname())
+        self.received.append((perf_counter(), self.board.recv(1024)))
+        sleep(self.send_delay)
+
+    def start(self):
+        # pylint: disable=protected-access
+        self._SpynnakerLiveSpikesConnection__send_schedules("pop", self)
+
+    def stop(self):
+        # pylint: disable=protected-access
+        self._SpynnakerLiveSpikesConnection__stop_schedules("pop", self)
+
+    def close(self):
+        super().close()
+        self.board.close()
+        self.sender.close()
+
+
+def _packets(keys, eieio_type, max_keys):
+    packets = list()
+    for start in range(0, len(keys), max_keys):
+        message = EIEIODataMessage.create(eieio_type)
+        for key in keys[start:start + max_keys]:
+            message.add_key(key)
+        packets.append(message.bytestring)
+    return packets
+
+
+class TestSpynnakerLiveSpikesConnection(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_schedule(self):
+        conn = _UDPConnection(time_scale_factor=10)
+        try:
+            spikes = [(20.5, 7), (20.0, 3)] + [(0.2, i) for i in range(300)]
+            schedule = conn.schedule_spikes("pop", spikes)
+            self.assertEqual(302, schedule.n_spikes)
+            conn.start()
+            self.assertTrue(schedule.wait(0))
+            self.assertEqual(2, schedule.n_sent)
+            self.assertEqual([], schedule.dropped_batches)
+            self.assertEqual([], schedule.late_batches)
+            self.assertEqual(
+                _packets(list(range(300)), EIEIOType.KEY_16_BIT, 127) +
+                _packets([7, 3], EIEIOType.KEY_16_BIT, 127),
+                [data for _, data in conn.received])
+            # Timestep 20 at 10 times slower than real time
+            self.assertGreater(
+                conn.received[-1][0] - conn.received[0][0], 0.19)
+        finally:
+            conn.close()
+
+    def test_full_keys_late(self):
+        conn = _UDPConnection(time_scale_factor=1, send_delay=0.05)
+        try:
+            dropping = conn.schedule_spikes(
+                "pop", numpy.array([[0.0, i] for i in range(100)] + [
+                    [1.0, 5]]), send_full_keys=True, max_late_ms=50.0)
+            late = conn.schedule_spikes(
+                "pop", [(2.0, 6)], send_full_keys=True)
+            conn.start()
+            self.assertEqual(
+                _packets([0x1000 + i for i in range(100)],
+                         EIEIOType.KEY_32_BIT, 63) +
+                _packets([0x1006], EIEIOType.KEY_32_BIT, 63),
+                [data for _, data in conn.received])
+            self.assertEqual(1, dropping.n_sent)
+            self.assertEqual([1.0], dropping.dropped_batches)
+            self.assertEqual([2.0], [t for t, _ in late.late_batches])
+            self.assertGreater(late.late_batches[0][1], 50.0)
+        finally:
+            conn.close()
+
+    def test_stop_and_cancel(self):
+        conn = _UDPConnection(time_scale_factor=1)
+        try:
+            schedule = conn.schedule_spikes("pop", [(0.0, 1), (5000.0, 2)])
+            cancelled = conn.schedule_spikes("pop", [(0.0, 3)])
+            cancelled.cancel()
+            thread = Thread(target=conn.start)
+            thread.start()
+            while not schedule.n_sent:
+                sleep(0.01)
+            conn.stop()
+            self.assertTrue(schedule.wait(2.0))
+            thread.join()
+            self.assertEqual([5000.0], schedule.dropped_batches)
+            self.assertEqual([0.0], cancelled.dropped_batches)
+            self.assertEqual(1, len(conn.received))
+        finally:
+            conn.close()
+
+    def test_bad_spikes(self):
+        conn = _UDPConnection(time_scale_factor=1)
+        try:
+            with self.assertRaises(ConfigurationException):
+                conn.schedule_spikes("other", [(0.0, 1)])
+            with self.assertRaises(ConfigurationException):
+                conn.schedule_spikes("pop", [(-1.0, 1)])
+            with self.assertRaises(ConfigurationException):
+                conn.schedule_spikes("pop", [(0.0, 0x10000)])
+            with self.assertRaises(ConfigurationException):
+                conn.schedule_spikes("pop", [(0.0, 100)], send_full_keys=True)
+            # pylint: disable=protected-access
+            del conn._atom_id_to_key["pop"][50]
+            with self.assertRaises(ConfigurationException):
+                conn.schedule_spikes("pop", [(0.0, 50)], send_full_keys=True)
+        finally:
+            conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
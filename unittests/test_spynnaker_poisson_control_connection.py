@@ -0,0 +1,99 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+from spinn_front_end_common.interface.ds import DataType
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import SpynnakerPoissonControlConnection
+
+
+class _CapturingConnection(SpynnakerPoissonControlConnection):
+    __slots__ = ("sent", )
+
+    def __init__(self):
+        super().__init__(
+            poisson_labels=["poisson"], local_host="127.0.0.1",
+            local_port=None)
+        self.sent = list()
+        # pylint: disable=protected-access
+        self._atom_id_to_key["poisson_control"] = {
+            i: 0x1000 + i for i in range(100)}
+
+    def send_eieio_message(self, message, label):
+        self.sent.append((label, message.bytestring))
+
+
+def _expected(id_rates):
+    packets = list()
+    for start in range(0, len(id_rates), 31):
+        message = EIEIODataMessage.create(EIEIOType.KEY_PAYLOAD_32_BIT)
+        for nid, rate in id_rates[start:start + 31]:
+            message.add_key_and_payload(
+                0x1000 + nid, DataType.S1615.encode_as_int(rate))
+        packets.append(("poisson_control", message.bytestring))
+    return packets
+
+
+class TestSpynnakerPoissonControlConnection(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_set_rates(self):
+        id_rates = [(i, i * 0.75) for i in range(40)]
+        conn = _CapturingConnection()
+        try:
+            conn.set_rates("poisson", id_rates)
+            self.assertEqual(_expected(id_rates), conn.sent)
+            conn.sent.clear()
+            conn.set_rates_array(
+                "poisson", numpy.arange(40), numpy.arange(40) * 0.75)
+            self.assertEqual(_expected(id_rates), conn.sent)
+            conn.sent.clear()
+            conn.set_rate("poisson", 3, 10.5)
+            self.assertEqual(_expected([(3, 10.5)]), conn.sent)
+            with self.assertRaises(ConfigurationException):
+                conn.set_rate("poisson", 100, 1.0)
+            # An atom with no key is not sent to the neuron with key 0
+            # pylint: disable=protected-access
+            conn._atom_id_to_key["poisson_control"] = {
+                i: 0x1000 + i for i in range(100) if i != 50}
+            conn.sent.clear()
+            with self.assertRaises(ConfigurationException):
+                conn.set_rate("poisson", 50, 1.0)
+            self.assertEqual([], conn.sent)
+        finally:
+            conn.close()
+
+    def test_coalesce(self):
+        conn = _CapturingConnection()
+        try:
+            conn.set_rates_array("poisson", [5, 6, 5], [1.0, 2.0, 3.0])
+            self.assertEqual(_expected([(6, 2.0), (5, 3.0)]), conn.sent)
+            conn.sent.clear()
+            with conn.batched_rates():
+                conn.set_rate("poisson", 7, 1.0)
+                conn.set_rates("poisson", [(8, 2.0), (7, 4.0)])
+                self.assertEqual([], conn.sent)
+            self.assertEqual(_expected([(8, 2.0), (7, 4.0)]), conn.sent)
+        finally:
+            conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from spinn_utilities.config_holder import set_config
+import pyNN.spiNNaker as sim
+from spinnaker_testbase import BaseTestCase
+from spynnaker.pyNN.data import SpynnakerDataView
+
+
+class TestAutoAtomsPerCore(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_no_input(self):
+        sim.setup(timestep=1.0)
+        set_config("Mapping", "auto_atoms_per_core", True)
+        pop = sim.Population(1000, sim.IF_curr_exp(), label="pop")
+        vertex = pop._Population__vertex
+        sim.run(10)
+        # Nothing limits the atoms per core, so the default is used
+        self.assertEqual(256, vertex.auto_max_atoms_per_core)
+        self.assertEqual(4, len(vertex.machine_vertices))
+        report = os.path.join(
+            SpynnakerDataView.get_run_dir_path(), "auto_atoms_per_core.rpt")
+        with open(report, encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn("Chose 256 atoms per core", text)
+        self.assertIn("Ring buffer shifts [0, 0] for any atoms per core", text)
+        sim.end()
+
+    def test_busy_input(self):
+        sim.setup(timestep=1.0)
+        set_config("Mapping", "auto_atoms_per_core", True)
+        source = sim.Population(
+            1000, sim.SpikeSourcePoisson(rate=100), label="source")
+        pop = sim.Population(1000, sim.IF_curr_exp(), label="pop")
+        sim.Projection(source, pop, sim.AllToAllConnector(),
+                       sim.StaticSynapse(weight=0.01))
+        vertex = pop._Population__vertex
+        sim.run(10)
+        # The synaptic events would take too long with all the atoms on
+        # a core
+        self.assertLess(vertex.auto_max_atoms_per_core, 256)
+        self.assertEqual(
+            vertex.auto_max_atoms_per_core, vertex.get_max_atoms_per_core())
+        for m_vertex in vertex.machine_vertices:
+            self.assertLessEqual(
+                m_vertex.vertex_slice.n_atoms,
+                vertex.auto_max_atoms_per_core)
+        sim.end()
+
+    def test_user_max(self):
+        sim.setup(timestep=1.0)
+        set_config("Mapping", "auto_atoms_per_core", True)
+        pop = sim.Population(1000, sim.IF_curr_exp(), label="pop")
+        pop.set_max_atoms_per_core(100)
+        vertex = pop._Population__vertex
+        sim.run(10)
+        # The user maximum is the largest that will be chosen
+        self.assertEqual(100, vertex.auto_max_atoms_per_core)
+        sim.end()
+
+    def test_off(self):
+        sim.setup(timestep=1.0)
+        pop = sim.Population(1000, sim.IF_curr_exp(), label="pop")
+        vertex = pop._Population__vertex
+        sim.run(10)
+        self.assertIsNone(vertex.auto_max_atoms_per_core)
+        sim.end()
@@ -0,0 +1,104 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import tracemalloc
+import pytest
+from spinn_front_end_common.interface.provenance import FecTimer
+import pyNN.spiNNaker as sim
+from spinnaker_testbase import BaseTestCase
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.utilities.phase_tracer import PhaseTracer
+
+
+class TestPhaseTracer(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def _simulate(self, n_neurons, trace_memory=True):
+        with PhaseTracer(trace_memory=trace_memory) as tracer:
+            sim.setup(1.0)
+            pop1 = sim.Population(n_neurons, sim.IF_curr_exp(), label="pop1")
+            pop2 = sim.Population(n_neurons, sim.IF_curr_exp(), label="pop2")
+            sim.Projection(pop1, pop2, sim.OneToOneConnector())
+            sim.Projection(pop2, pop1, sim.AllToAllConnector(),
+                           sim.StaticSynapse(delay=20))
+            sim.run(10)
+            sim.run(10)
+            sim.end()
+        return tracer
+
+    def test_trace(self):
+        enter = FecTimer.__enter__
+        tracer = self._simulate(10)
+        # Tracing stops when the tracer exits
+        self.assertIs(enter, FecTimer.__enter__)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        by_name = {}
+        for record in tracer.phases:
+            by_name.setdefault(record.name, []).append(record)
+        for name in ("DelaySupportAdder", "Application Placer",
+                     "Write Neo Metadata", "Synapse expander"):
+            self.assertIn(name, by_name)
+        adder = by_name["DelaySupportAdder"][0]
+        self.assertEqual(1, adder.run)
+        self.assertGreater(adder.wall, 0)
+        self.assertGreater(adder.peak_memory, 0)
+        self.assertEqual(2, adder.counts["vertices"])
+        self.assertEqual(2, adder.counts["projections"])
+        self.assertEqual(2, by_name["Application Placer"][0].counts["edges"])
+        # Skipped on a virtual board, and says why
+        self.assertEqual(
+            "virtual_board", by_name["Synapse expander"][0].note)
+        self.assertEqual({1, 2}, {r.run for r in by_name["Control Sync"]})
+        starts = [record.start for record in tracer.phases]
+        self.assertEqual(sorted(starts), starts)
+
+        summary = tracer.summary().splitlines()
+        self.assertIn("Phase", summary[0])
+        self.assertTrue(any(
+            "DelaySupportAdder" in line for line in summary))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+            tracer.write_chrome_trace(path)
+            with open(path, encoding="utf-8") as f:
+                events = json.load(f)["traceEvents"]
+            self.assertEqual(len(tracer.phases), len(events))
+            self.assertTrue(all(event["ph"] == "X" for event in events))
+            read = PhaseTracer.read_chrome_trace(path)
+        self.assertEqual(tracer.summary(), read.summary())
+        self.assertEqual([], tracer.regressions(read))
+
+    def test_regressions(self):
+        baseline = self._simulate(10, trace_memory=False)
+        self.assertIsNone(baseline.phases[0].peak_memory)
+        tracer = self._simulate(10, trace_memory=False)
+        self.assertEqual([], tracer.regressions(
+            baseline, ratio=1e9, min_ms=0))
+        # Any phase that took any time is slower than no time at all
+        for record in baseline.phases:
+            record.wall = 0
+        found = tracer.regressions(baseline, min_ms=0)
+        self.assertIn("Application Placer", [name for name, _, _ in found])
+        self.assertTrue(all(before == 0.0 for _, before, _ in found))
+
+    def test_only_one_active(self):
+        with PhaseTracer(trace_memory=False):
+            with pytest.raises(SpynnakerException):
+                with PhaseTracer():
+                    pass
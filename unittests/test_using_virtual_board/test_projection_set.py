@@ -0,0 +1,106 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pyNN.spiNNaker as sim
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinnaker_testbase import BaseTestCase
+from spynnaker.pyNN.exceptions import (
+    RemapRequiredException, SpynnakerException,
+    SynapticConfigurationException)
+
+N_NEURONS = 10
+
+
+class TestProjectionSet(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def _projection(self, synapse_type=None):
+        sim.setup(1.0)
+        pop1 = sim.Population(N_NEURONS, sim.IF_curr_exp(), label="pop1")
+        pop2 = sim.Population(N_NEURONS, sim.IF_curr_exp(), label="pop2")
+        if synapse_type is None:
+            synapse_type = sim.StaticSynapse(weight=2.0, delay=4.0)
+        return sim.Projection(
+            pop1, pop2, sim.AllToAllConnector(), synapse_type=synapse_type)
+
+    def test_set_weight_and_delay(self):
+        proj = self._projection()
+        sim.run(0)
+        proj.set(weight=1.5, delay=3.0)
+        weights, delays = proj.get(["weight", "delay"], "array")
+        self.assertTrue(numpy.allclose(weights, 1.5))
+        self.assertTrue(numpy.allclose(delays, 3.0))
+
+        # A value per connection, in the order of the list
+        values = numpy.arange(N_NEURONS * N_NEURONS) / 10.0
+        proj.set(weight=values)
+        conns = proj.get(["weight"], "list")
+        self.assertTrue(numpy.allclose([w for _, _, w in conns], values))
+
+        # A matrix indexed by source and target
+        matrix = numpy.add.outer(
+            numpy.arange(N_NEURONS) % 4, numpy.arange(N_NEURONS) / 100.0)
+        proj.set(delay=matrix + 1.0)
+        self.assertTrue(numpy.allclose(
+            proj.get("delay", "array"), numpy.rint(matrix + 1.0)))
+        self.assertTrue(numpy.allclose(proj.get("weight", "array"), (
+            values.reshape(N_NEURONS, N_NEURONS))))
+
+        # Negative weights are held as the machine holds them
+        proj.set(weight=-0.5)
+        self.assertTrue(numpy.allclose(proj.get("weight", "array"), 0.5))
+        sim.end()
+
+    def test_remap_required(self):
+        proj = self._projection()
+        sim.run(0)
+        max_delay = proj.post._vertex.splitter.max_support_delay()
+
+        # There is no delay extension, so long delays don't fit
+        with self.assertRaises(RemapRequiredException):
+            proj.set(delay=max_delay + 10.0)
+        # Weights too big for the weight scaling don't fit either
+        with self.assertRaises(RemapRequiredException):
+            proj.set(weight=1e6)
+        self.assertTrue(numpy.allclose(proj.get("weight", "array"), 2.0))
+        self.assertTrue(numpy.allclose(proj.get("delay", "array"), 4.0))
+        sim.end()
+
+    def test_not_allowed(self):
+        proj = self._projection()
+        with self.assertRaises(ConfigurationException):
+            proj.set(weight=1.0)
+        sim.run(0)
+        with self.assertRaises(ConfigurationException):
+            proj.set(tau_plus=1.0)
+        with self.assertRaises(ConfigurationException):
+            proj.set(weight=[1.0, 2.0])
+        with self.assertRaises(ConfigurationException):
+            proj.set(delay=0.1)
+        weights = numpy.ones((N_NEURONS, N_NEURONS))
+        weights[0, 0] = -1.0
+        with self.assertRaises(SpynnakerException):
+            proj.set(weight=weights)
+        self.assertTrue(numpy.allclose(proj.get("weight", "array"), 2.0))
+        sim.end()
+
+        proj = self._projection(sim.STDPMechanism(
+            timing_dependence=sim.SpikePairRule(),
+            weight_dependence=sim.AdditiveWeightDependence()))
+        sim.run(0)
+        with self.assertRaises(SynapticConfigurationException):
+            proj.set(weight=1.0)
+        sim.end()
@@ -0,0 +1,81 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from pyNN.random import NumpyRNG
+import pyNN.spiNNaker as sim
+from spinnaker_testbase import BaseTestCase
+
+
+class TestProjectionStatistics(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_statistics_after_run(self):
+        sim.setup(1.0)
+        pop1 = sim.Population(20, sim.IF_curr_exp(), label="pop1")
+        pop2 = sim.Population(15, sim.IF_curr_exp(), label="pop2")
+        proj = sim.Projection(
+            pop1, pop2, sim.FixedProbabilityConnector(0.4),
+            synapse_type=sim.StaticSynapse(
+                weight=sim.RandomDistribution("uniform", (0.5, 2.0)),
+                delay=sim.RandomDistribution("uniform", (1.0, 5.0))))
+        sim.run(0)
+        conns = numpy.array(proj.get(["weight", "delay"], "list"))
+        weight_bins = numpy.linspace(0.5, 2.0, 7)
+        statistics = proj.get_statistics(weight_bins=weight_bins)
+        self.assertEqual(len(conns), proj.size())
+        self.assertEqual(len(conns), statistics.n_connections)
+        self.assertAlmostEqual(conns[:, 2].mean(), statistics.weight_mean)
+        self.assertEqual(conns[:, 3].max(), statistics.delay_max)
+        self.assertTrue(numpy.array_equal(
+            numpy.histogram(conns[:, 2], weight_bins)[0],
+            statistics.weight_histogram[0]))
+        self.assertTrue(numpy.array_equal(
+            numpy.bincount(conns[:, 1].astype(int), minlength=15),
+            statistics.in_degree))
+        sim.end()
+
+    def test_size_before_run(self):
+        sim.setup(1.0)
+        pop1 = sim.Population(20, sim.IF_curr_exp(), label="pop1")
+        pop2 = sim.Population(15, sim.IF_curr_exp(), label="pop2")
+        proj = sim.Projection(pop1, pop2, sim.AllToAllConnector())
+        self.assertEqual(300, proj.size())
+        sim.run(0)
+        self.assertEqual(300, proj.size())
+        sim.end()
+
+    def __connections(self, count_before_run):
+        sim.setup(1.0)
+        pop1 = sim.Population(20, sim.IF_curr_exp(), label="pop1")
+        pop2 = sim.Population(15, sim.IF_curr_exp(), label="pop2")
+        proj = sim.Projection(
+            pop1, pop2, sim.IndexBasedProbabilityConnector(
+                "exp(-abs(i - j) / 5)", rng=NumpyRNG(1)),
+            synapse_type=sim.StaticSynapse(
+                weight=sim.RandomDistribution(
+                    "uniform", (0.5, 2.0), rng=NumpyRNG(2)),
+                delay=sim.RandomDistribution(
+                    "uniform", (1.0, 5.0), rng=NumpyRNG(3))))
+        if count_before_run:
+            self.assertGreater(proj.size(), 0)
+        sim.run(0)
+        conns = numpy.array(proj.get(["weight", "delay"], "list"))
+        sim.end()
+        return conns
+
+    def test_size_before_run_keeps_connections(self):
+        self.assertTrue(numpy.array_equal(
+            self.__connections(False), self.__connections(True)))
@@ -0,0 +1,194 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+from unittest import mock
+import numpy
+from spinn_utilities.overrides import overrides
+from spinnman.transceiver import Transceiver
+from spinnman.transceiver.mockable_transceiver import MockableTransceiver
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.abstract_spinnaker_base import (
+    AbstractSpinnakerBase)
+from spinn_front_end_common.interface.ds import DsSqlliteDatabase
+from spinn_front_end_common.interface.interface_functions import (
+    load_application_data_specs, reload_dsg_regions)
+import pyNN.spiNNaker as sim
+from spinnaker_testbase import BaseTestCase
+
+_SDRAM_START = 0x60000000
+
+
+class _BoardMemory(MockableTransceiver):
+    """ The SDRAM of a board, counting the writes to each address. """
+
+    def __init__(self):
+        super().__init__()
+        self.blocks = dict()
+        self.base_addresses = dict()
+        self.writes = Counter()
+
+    @overrides(MockableTransceiver.malloc_sdram)
+    def malloc_sdram(
+            self, x: int, y: int, size: int, app_id: int, tag: int = 0):
+        start = max((start + len(block) for (bx, by, start), block in
+                     self.blocks.items() if (bx, by) == (x, y)),
+                    default=_SDRAM_START)
+        self.blocks[x, y, start] = bytearray(size)
+        return start
+
+    @overrides(MockableTransceiver.write_user)
+    def write_user(self, x: int, y: int, p: int, user, value: int):
+        self.base_addresses[x, y, p] = value
+
+    @overrides(Transceiver.get_region_base_address)
+    def get_region_base_address(self, x: int, y: int, p: int):
+        return self.base_addresses[x, y, p]
+
+    def __find(self, x, y, address):
+        for (bx, by, start), block in self.blocks.items():
+            if (bx, by) == (x, y) and (
+                    start <= address < start + len(block)):
+                return block, address - start
+        raise KeyError(f"No memory at {x}, {y}, {address:#x}")
+
+    @overrides(MockableTransceiver.write_memory)
+    def write_memory(
+            self, x: int, y: int, base_address: int, data, *,
+            n_bytes=None, offset=0, cpu=0, get_sum=False):
+        if isinstance(data, int):
+            data = data.to_bytes(4, "little")
+        if n_bytes is None:
+            n_bytes = len(data) - offset
+        block, pos = self.__find(x, y, base_address)
+        block[pos:pos + n_bytes] = data[offset:offset + n_bytes]
+        self.writes[x, y, base_address] += 1
+        return -1, -1
+
+    @overrides(MockableTransceiver.read_memory)
+    def read_memory(
+            self, x: int, y: int, base_address: int, length: int,
+            cpu: int = 0) -> bytearray:
+        block, pos = self.__find(x, y, base_address)
+        return bytearray(block[pos:pos + length])
+
+    @overrides(MockableTransceiver.read_word)
+    def read_word(
+            self, x: int, y: int, base_address: int, cpu: int = 0) -> int:
+        return int.from_bytes(
+            self.read_memory(x, y, base_address, 4), "little")
+
+
+class TestReloadChangedRegions(BaseTestCase):
+    """ Runs on a virtual board, but loads and reloads the data into the
+        memory of a fake board as if the board were real.
+    """
+
+    # NO unittest_setup() as sim.setup is called
+
+    def setUp(self):
+        super().setUp()
+        self.__memory = _BoardMemory()
+
+        def load(simulator):
+            # pylint: disable=protected-access
+            if not simulator._data_writer.has_transceiver():
+                simulator._data_writer.set_transceiver(self.__memory)
+            load_application_data_specs()
+
+        patches = [
+            mock.patch.object(
+                AbstractSpinnakerBase,
+                "_execute_load_application_data_specification", load),
+            mock.patch.object(
+                AbstractSpinnakerBase, "_execute_dsg_region_reloader",
+                lambda _simulator: reload_dsg_regions())]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def __regions_written(self):
+        """ The vertex and region of each region written to, with how many
+            times it was written.
+        """
+        vertices = {(placement.x, placement.y, placement.p): placement.vertex
+                    for placement in FecDataView.iterate_placemements()}
+        regions = dict()
+        with DsSqlliteDatabase() as ds_database:
+            for x, y, p in list(ds_database.get_ds_cores()):
+                for region, pointer, _ in (
+                        ds_database.get_region_pointers_and_content(x, y, p)):
+                    regions[x, y, pointer] = (vertices[x, y, p], region)
+        return {regions[address]: count
+                for address, count in self.__memory.writes.items()}
+
+    def test_reload_changed_regions(self):
+        sim.setup(1.0)
+        pop = sim.Population(100, sim.IF_curr_exp(), label="pop")
+        pop.set_max_atoms_per_core(25)
+        source = sim.Population(
+            100, sim.SpikeSourcePoisson(rate=10.0), label="source")
+        source.set_max_atoms_per_core(25)
+        static = sim.Projection(
+            source, pop, sim.OneToOneConnector(),
+            sim.StaticSynapse(weight=1.0))
+        plastic = sim.Projection(
+            pop, pop, sim.OneToOneConnector(), sim.STDPMechanism(
+                timing_dependence=sim.SpikePairRule(),
+                weight_dependence=sim.AdditiveWeightDependence(),
+                weight=0.5))
+        sim.run(10)
+        self.assertTrue(self.__memory.writes)
+
+        # Connections as if they had been read from the machine
+        # pylint: disable=protected-access
+        cache = pop._vertex._AbstractPopulationVertex__connection_cache
+        for proj in (static, plastic):
+            cache[proj._projection_edge, proj._synapse_information] = \
+                numpy.zeros(0)
+
+        self.__memory.writes.clear()
+        pop[0:10].set(tau_m=5.0)
+        source[60:70].set(rate=20.0)
+        sim.run(10)
+
+        # Only the regions of the cores of the neurons that were set
+        pop_core = min(pop._vertex.machine_vertices,
+                       key=lambda m_vertex: m_vertex.vertex_slice.lo_atom)
+        source_core, = [
+            m_vertex for m_vertex in source._vertex.machine_vertices
+            if m_vertex.vertex_slice.lo_atom <= 60 <=
+            m_vertex.vertex_slice.hi_atom]
+        neuron_regions = pop_core._neuron_regions
+        self.assertEqual({
+            (pop_core, neuron_regions.neuron_params): 1,
+            (pop_core, neuron_regions.neuron_recording): 1,
+            # Poisson rates are written for the machine to expand
+            (source_core,
+             source_core._PoissonSpikeSourceRegions.EXPANDER_REGION): 1},
+            self.__regions_written())
+        self.assertEqual([5.0] * 10, list(pop[0:10].get("tau_m")))
+        self.assertEqual([20.0] * 10, [
+            float(rate) for rate in source[60:70].get("rate")])
+
+        # Only the connections that running can change are forgotten
+        self.assertEqual(
+            [(static._projection_edge, static._synapse_information)],
+            list(cache))
+
+        # Nothing changed, so nothing is written
+        self.__memory.writes.clear()
+        sim.run(10)
+        self.assertEqual({}, self.__regions_written())
+        sim.end()
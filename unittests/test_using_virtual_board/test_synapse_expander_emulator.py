@@ -0,0 +1,91 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy
+from spinn_utilities.config_holder import set_config
+import pyNN.spiNNaker as sim
+from spinnaker_testbase import BaseTestCase
+
+N_NEURONS = 50
+
+
+def _connections(emulate, connectors):
+    """
+    Run with the given connectors and get the connections made, either
+    on host or by emulating the synapse expander.
+    """
+    sim.setup(timestep=1.0)
+    set_config("Simulation", "emulate_synapse_expander", emulate)
+    pre = sim.Population(
+        N_NEURONS, sim.SpikeSourceArray(spike_times=[]), label="pre")
+    post = sim.Population(N_NEURONS, sim.IF_curr_exp(), label="post")
+    post.set_max_atoms_per_core(16)
+    projections = [
+        sim.Projection(pre, post, connector, synapse_type)
+        for connector, synapse_type in connectors]
+    sim.run(1)
+    connections = [
+        numpy.array(sorted(proj.get(["weight", "delay"], "list")))
+        for proj in projections]
+    sim.end()
+    return connections
+
+
+class TestSynapseExpanderEmulator(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_same_as_host(self):
+        # Delays over 16 need delay stages, and 100 is too big to represent
+        connectors = [
+            (connector, synapse_type)
+            for connector in [
+                sim.OneToOneConnector(), sim.AllToAllConnector()]
+            for synapse_type in [
+                sim.StaticSynapse(weight=0.5, delay=3.0),
+                sim.StaticSynapse(weight=0.75, delay=40.0),
+                sim.StaticSynapse(weight=0.25, delay=100.0)]]
+        connectors.append((sim.AllToAllConnector(), sim.STDPMechanism(
+            timing_dependence=sim.SpikePairRule(),
+            weight_dependence=sim.AdditiveWeightDependence(),
+            weight=0.5, delay=20.0)))
+        emulated = _connections(True, connectors)
+        on_host = _connections(False, connectors)
+        for emulated_conns, host_conns in zip(emulated, on_host):
+            self.assertGreater(len(emulated_conns), 0)
+            self.assertTrue(numpy.array_equal(emulated_conns, host_conns))
+
+    def test_random_connectors(self):
+        weights = sim.RandomDistribution("uniform", (0.1, 1.0))
+        delays = sim.RandomDistribution("uniform", (1.0, 30.0))
+        synapse_type = sim.StaticSynapse(weight=weights, delay=delays)
+        fixed_prob, fixed_total, fixed_pre, fixed_post = _connections(True, [
+            (sim.FixedProbabilityConnector(0.5), synapse_type),
+            (sim.FixedTotalNumberConnector(300), synapse_type),
+            (sim.FixedNumberPreConnector(5), synapse_type),
+            (sim.FixedNumberPostConnector(7), synapse_type)])
+
+        n_pairs = N_NEURONS * N_NEURONS
+        self.assertAlmostEqual(len(fixed_prob) / n_pairs, 0.5, delta=0.05)
+        self.assertEqual(300, len(fixed_total))
+        self.assertEqual(
+            [5] * N_NEURONS,
+            list(numpy.bincount(fixed_pre[:, 1].astype(int))))
+        self.assertEqual(
+            [7] * N_NEURONS,
+            list(numpy.bincount(fixed_post[:, 0].astype(int))))
+        for conns in (fixed_prob, fixed_total, fixed_pre, fixed_post):
+            self.assertTrue(numpy.all(conns[:, 2] >= 0.09))
+            self.assertTrue(numpy.all(conns[:, 2] <= 1.0))
+            self.assertTrue(numpy.all(conns[:, 3] >= 1.0))
+            self.assertTrue(numpy.all(conns[:, 3] <= 30.0))
@@ -0,0 +1,71 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.mars_kiss_64 import MarsKiss64
+
+SEED = [123456789, 987654321, 43219876, 6543217]
+
+
+def _reference(seed, n_values):
+    """ The generator as written in the binaries, one value at a time. """
+    x, y, z, c = seed
+    values = []
+    for _ in range(n_values):
+        x = (314527869 * x + 1234567) & 0xFFFFFFFF
+        y ^= (y << 5) & 0xFFFFFFFF
+        y ^= y >> 7
+        y ^= (y << 22) & 0xFFFFFFFF
+        t = 4294584393 * z + c
+        c = t >> 32
+        z = t & 0xFFFFFFFF
+        values.append((x + y + z) & 0xFFFFFFFF)
+    return values
+
+
+class TestMarsKiss64(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_next(self):
+        rng = MarsKiss64(SEED)
+        self.assertEqual(
+            _reference(SEED, 100), [rng.next() for _ in range(100)])
+
+    def test_take(self):
+        expected = _reference(SEED, 25000)
+        rng = MarsKiss64(SEED)
+        values = list(rng.take(20000))
+        values.extend(rng.take(5000))
+        self.assertEqual(expected, values)
+
+    def test_mixed(self):
+        expected = _reference(SEED, 30000)
+        rng = MarsKiss64(SEED)
+        values = [rng.next() for _ in range(10)]
+        self.assertEqual(expected[10:3010], list(rng.peek(3000)))
+        values.extend(rng.take(70))
+        rng.skip(12345)
+        values.extend(expected[80:12425])
+        values.append(rng.next())
+        rng.skip(3)
+        values.extend(expected[12426:12429])
+        values.extend(rng.take(30000 - 12429))
+        self.assertEqual(expected, values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+import quantities
+from neo import AnalogSignal, SpikeTrain
+from spynnaker import plot_utils
+from spynnaker.plot_utils import (
+    axes_pixels, bin_edges, bin_points, decimate, envelope)
+from spynnaker.spynnaker_plotting import (
+    heat_plot_neo, plot_spikes_numpy, plot_spiketrains)
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+plt = matplotlib.pyplot
+
+
+@pytest.fixture
+def axes():
+    figure, axes = plt.subplots()
+    yield axes
+    plt.close(figure)
+
+
+def test_bin_points():
+    rng = numpy.random.default_rng(1)
+    xs = rng.uniform(0, 100, 5000)
+    ys = rng.integers(0, 50, 5000)
+    counts = bin_points(xs, ys, (0, 100), (-0.5, 49.5), (10, 20))
+    expected, _, _ = numpy.histogram2d(
+        ys, xs, bins=(10, 20), range=((-0.5, 49.5), (0, 100)))
+    assert numpy.array_equal(expected, counts)
+
+    # Points outside the ranges are left out and the tops are included
+    counts = bin_points([0, 10, 11, 5], [0, 0, 0, 3], (0, 10), (0, 2), (2, 5))
+    assert counts.sum() == 2
+    assert counts[0, 0] == 1 and counts[0, 4] == 1
+
+    sums = bin_points([1, 2, 9], [0, 0, 1], (0, 10), (0, 1), (1, 2),
+                      values=[1.5, 2.5, 4.0])
+    assert numpy.array_equal([[4.0, 4.0]], sums)
+
+
+def test_decimate_and_envelope():
+    values = numpy.arange(24, dtype=float).reshape(4, 6)
+    assert decimate(values, (10, 10)) is values
+    assert numpy.array_equal(
+        [[3.5, 5.5, 7.5], [15.5, 17.5, 19.5]], decimate(values, (2, 3)))
+    values[0, 0] = numpy.nan
+    assert decimate(values, (2, 3))[0, 0] == 14.0 / 3
+
+    signal = numpy.array([3.0, -1.0, 2.0, numpy.nan, 7.0, 0.0, 5.0])
+    starts, lows, highs = envelope(signal, 3)
+    assert numpy.array_equal([0, 2, 4], starts)
+    assert numpy.array_equal([-1.0, 2.0, 0.0], lows)
+    assert numpy.array_equal([3.0, 2.0, 7.0], highs)
+
+
+def test_plot_spikes_numpy(axes):
+    spikes = numpy.array([[0, 1.0], [3, 2.0], [3, 50.0], [7, 99.0]])
+    plot_spikes_numpy(axes, spikes)
+    assert len(axes.lines) == 1 and not axes.images
+
+    rng = numpy.random.default_rng(2)
+    n_spikes = 50000
+    spikes = numpy.column_stack([
+        rng.integers(0, 100000, n_spikes), rng.uniform(0, 1000, n_spikes)])
+    plot_spikes_numpy(axes, spikes, rasterise=True)
+    image = axes.images[0].get_array()
+    width, height = axes_pixels(axes)
+    assert image.shape == (height, width)
+    assert image.sum() == n_spikes
+
+
+def test_plot_spiketrains(axes):
+    n_neurons = 2000
+    rng = numpy.random.default_rng(3)
+    spiketrains = list()
+    for neuron in range(n_neurons):
+        times = numpy.sort(rng.uniform(0, 500, neuron % 7))
+        spiketrains.append(SpikeTrain(
+            times * quantities.ms, t_stop=500 * quantities.ms,
+            source_index=neuron))
+    plot_spiketrains(axes, spiketrains, rasterise=True)
+    image = axes.images[0].get_array()
+    assert image.shape[0] == min(n_neurons, axes_pixels(axes)[1])
+    assert image.sum() == sum(len(x) for x in spiketrains)
+
+    # The same as binning all the spikes together
+    times = numpy.concatenate([x.magnitude for x in spiketrains])
+    neurons = numpy.repeat(
+        numpy.arange(n_neurons), [len(x) for x in spiketrains])
+    assert numpy.array_equal(
+        bin_points(times, neurons, (0, 500), (-0.5, n_neurons - 0.5),
+                   image.shape), image.filled(0))
+
+
+def test_heat_plot_neo(axes):
+    n_times = 5000
+    n_neurons = 1000
+    values = numpy.tile(numpy.arange(n_neurons, dtype=float), (n_times, 1))
+    signal = AnalogSignal(
+        values, units="mV", sampling_period=1 * quantities.ms)
+    # Sized before the colour bar takes some of the space
+    width, height = axes_pixels(axes)
+    heat_plot_neo(axes, signal)
+    image = axes.images[0].get_array()
+    assert image.shape == (min(n_neurons, height), min(n_times, width))
+    # Each row is the mean of the neurons binned into it
+    assert image[0, 0] < image[-1, 0]
+    assert numpy.allclose(image[:, 0], image[:, -1])
+    first_rows = bin_edges(n_neurons, height)[1]
+    assert image[0, 0] == numpy.mean(numpy.arange(first_rows))
+
+
+def test_line_plot(monkeypatch):
+    monkeypatch.setattr(plot_utils, "_MAX_LINE_POINTS", 1000)
+    monkeypatch.setattr(plt, "show", lambda: None)
+    n_times = 200
+    for n_neurons, n_lines, n_images in ((4, 4, 0), (10, 10, 0), (50, 0, 1)):
+        plt.figure()
+        neurons = numpy.repeat(numpy.arange(n_neurons), n_times)
+        times = numpy.tile(numpy.arange(n_times, dtype=float), n_neurons)
+        data = numpy.column_stack(
+            [neurons, times, numpy.sin(times + neurons)])
+        plot_utils.line_plot(data)
+        axes = plt.gca()
+        assert len(axes.lines) + len(axes.collections) == n_lines
+        assert len(axes.images) == n_images
+        if n_images:
+            assert axes.images[0].get_array().sum() == len(data)
+        plt.close()
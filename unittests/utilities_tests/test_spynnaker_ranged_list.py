@@ -0,0 +1,155 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy
+from spinn_utilities.ranged import RangedList
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.interface.ds import DataType
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.ranged import (
+    SpynnakerRangedList, SpynnakerRangeDictionary)
+from spynnaker.pyNN.utilities.struct import Struct, StructRepeat
+
+N_VALUES = 200
+
+
+def _apply(values, rng, n_operations):
+    """ Do random updates to a list, giving the same updates each time for
+        the same random number generator state.
+    """
+    for _ in range(n_operations):
+        operation = rng.integers(5)
+        start = int(rng.integers(N_VALUES))
+        stop = int(rng.integers(start, N_VALUES + 1))
+        if operation == 0:
+            values.set_value_by_id(start, float(rng.integers(100)))
+        elif operation == 1:
+            values.set_value_by_slice(start, stop, float(rng.integers(100)))
+        elif operation == 2:
+            values.set_value_by_slice(
+                start, stop, [float(v) for v in rng.random(stop - start)])
+        elif operation == 3:
+            ids = numpy.sort(rng.choice(N_VALUES, 20, replace=False))
+            values.set_value_by_ids(ids, list(rng.random(len(ids))))
+        else:
+            values[start:stop] = float(rng.integers(100))
+
+
+class TestSpynnakerRangedList(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_same_as_ranged_list(self):
+        plain = RangedList(N_VALUES, 1.0)
+        dense = SpynnakerRangedList(N_VALUES, 1.0)
+        for seed in range(10):
+            _apply(plain, numpy.random.default_rng(seed), 20)
+            _apply(dense, numpy.random.default_rng(seed), 20)
+            self.assertEqual(list(plain), list(dense))
+            self.assertEqual(plain.get_values(), dense.get_values())
+            self.assertEqual(
+                plain.get_values(slice(10, 50)),
+                dense.get_values(slice(10, 50)))
+            ids = [3, 4, 5, 9, 10, 100, 150, 151]
+            self.assertEqual(
+                list(plain.iter_ranges_by_ids(ids)),
+                list(dense.iter_ranges_by_ids(ids)))
+            self.assertEqual(
+                list(plain.iter_ranges()), list(dense.iter_ranges()))
+        self.assertTrue(dense.is_dense)
+
+    def test_fragmented_becomes_dense(self):
+        values = SpynnakerRangedList(N_VALUES, 0.0)
+        self.assertFalse(values.is_dense)
+        for i in range(0, N_VALUES, 2):
+            values.set_value_by_id(i, float(i))
+        self.assertTrue(values.is_dense)
+        self.assertEqual(
+            [float(i) if i % 2 == 0 else 0.0 for i in range(N_VALUES)],
+            values.get_values())
+
+        # Setting everything to one value goes back to ranges
+        values.set_value(2.0)
+        self.assertFalse(values.is_dense)
+        self.assertEqual([(0, N_VALUES, 2.0)], list(values.iter_ranges()))
+
+    def test_list_values(self):
+        values = SpynnakerRangedList(None, list(range(10)))
+        self.assertTrue(values.is_dense)
+        self.assertEqual(list(range(10)), values.get_values())
+
+        # Floats stored in integer values are kept
+        values.set_value_by_id(3, 0.5)
+        self.assertEqual(0.5, values[3])
+        values.set_value_by_slice(4, 6, 1.5)
+        self.assertEqual([0, 1, 2, 0.5, 1.5, 1.5, 6], values.get_values()[:7])
+        self.assertTrue(numpy.array_equal(
+            [1.5, 6.0], values.get_values_as_array([5, 6])))
+
+        # Things that aren't numbers are stored as a list
+        values.set_value_by_id(7, None)
+        self.assertFalse(values.is_dense)
+        self.assertIsNone(values.get_values_as_array())
+        self.assertEqual(
+            [0, 1, 2, 0.5, 1.5, 1.5, 6, None, 8, 9], values.get_values())
+
+    def test_copy(self):
+        values = SpynnakerRangedList(None, [float(i) for i in range(10)])
+        copy = values.copy()
+        self.assertIsInstance(copy, SpynnakerRangedList)
+        self.assertTrue(copy.is_dense)
+        copy.set_value_by_id(0, 100.0)
+        self.assertEqual(0.0, values[0])
+
+        other = SpynnakerRangedList(10, 5.0)
+        other.copy_into(values)
+        self.assertTrue(other.is_dense)
+        self.assertEqual(values.get_values(), other.get_values())
+        other.copy_into(SpynnakerRangedList(10, 3.0))
+        self.assertFalse(other.is_dense)
+        self.assertEqual([3.0] * 10, other.get_values())
+
+    def test_range_dictionary(self):
+        values = SpynnakerRangeDictionary(10)
+        values["a"] = 1.0
+        values["b"] = [float(i) for i in range(10)]
+        copy = values.copy()
+        self.assertIsInstance(copy, SpynnakerRangeDictionary)
+        self.assertIsInstance(copy["a"], SpynnakerRangedList)
+        self.assertTrue(copy["b"].is_dense)
+        values["b"] = 2.0
+        self.assertEqual([2.0] * 10, values["b"].get_values())
+        self.assertEqual(4.0, copy["b"][4])
+
+    def test_struct_data(self):
+        struct = Struct(
+            [(DataType.S1615, "a"), (DataType.UINT32, "b")],
+            repeat_type=StructRepeat.PER_NEURON)
+        a = [i * 0.3 - 20 for i in range(N_VALUES)]
+        b = [float(i * 3) for i in range(N_VALUES)]
+        vertex_slice = Slice(50, 149)
+        expected = struct.get_data(
+            {"a": RangedList(None, a), "b": RangedList(None, b)},
+            vertex_slice)
+        dense = {"a": SpynnakerRangedList(None, a),
+                 "b": SpynnakerRangedList(None, b)}
+        self.assertTrue(dense["a"].is_dense)
+        self.assertTrue(numpy.array_equal(
+            expected, struct.get_data(dense, vertex_slice)))
+
+
+if __name__ == '__main__':
+    unittest.main()
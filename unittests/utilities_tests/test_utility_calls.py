@@ -15,9 +15,27 @@
 import os
 import shutil
 import unittest
+import numpy
 from pyNN.random import RandomDistribution
+from spinn_front_end_common.interface.ds import DataType
 from spynnaker.pyNN.config_setup import unittest_setup
 from spynnaker.pyNN.utilities import utility_calls
+from spynnaker.pyNN.utilities.random_stats import RandomStatsNormalImpl
+
+
+class _CountingNormalStats(RandomStatsNormalImpl):
+    """ Normal statistics that count the number of times they are used. """
+
+    def __init__(self):
+        self.n_calls = 0
+
+    def mean(self, dist):
+        self.n_calls += 1
+        return super().mean(dist)
+
+    def ppf(self, dist, p):
+        self.n_calls += 1
+        return super().ppf(dist, p)
 
 
 class TestUtilityCalls(unittest.TestCase):
@@ -56,6 +74,44 @@ class TestUtilityCalls(unittest.TestCase):
         self.assertTrue(hasattr(multi_value, "__iter__"))
         self.assertEqual(len(multi_value), 10)
 
+    def test_convert_to_array(self):
+        values = [0.1, 0.25, 0.3, 0.999, 1.0 / 3.0]
+        for data_type in (DataType.S1615, DataType.U032, DataType.S063,
+                          DataType.S3231, DataType.INT32):
+            converted = utility_calls.convert_to_array(values, data_type)
+            self.assertEqual(
+                numpy.dtype(data_type.struct_encoding), converted.dtype)
+            self.assertEqual(
+                [utility_calls.convert_to(value, data_type)
+                 for value in values], converted.tolist())
+        # Too fine for the 53 bits of a float
+        self.assertEqual(
+            922337203685477581,
+            utility_calls.convert_to_array([0.1], DataType.S063)[0])
+
+    def test_stats_cached(self):
+        original = utility_calls.STATS_BY_NAME["normal"]
+        counting = _CountingNormalStats()
+        utility_calls.STATS_BY_NAME["normal"] = counting
+        try:
+            first = RandomDistribution("normal", mu=123.5, sigma=0.25)
+            second = RandomDistribution("normal", mu=123.5, sigma=0.25)
+            other = RandomDistribution("normal", mu=124.5, sigma=0.25)
+            self.assertEqual(123.5, utility_calls.get_mean(first))
+            self.assertEqual(123.5, utility_calls.get_mean(second))
+            self.assertEqual(124.5, utility_calls.get_mean(other))
+            self.assertEqual(2, counting.n_calls)
+
+            maximum = utility_calls.get_maximum_probable_value(first, 100)
+            self.assertEqual(
+                original.ppf(first, 1.0 - 0.01 / 100), maximum)
+            self.assertEqual(
+                maximum, utility_calls.get_maximum_probable_value(second, 100))
+            utility_calls.get_maximum_probable_value(second, 1000)
+            self.assertEqual(4, counting.n_calls)
+        finally:
+            utility_calls.STATS_BY_NAME["normal"] = original
+
 
 if __name__ == '__main__':
     unittest.main()